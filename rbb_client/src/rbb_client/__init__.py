@@ -3,9 +3,13 @@ from __future__ import absolute_import
 # import models into sdk package
 from .models.bag_detailed import BagDetailed
 from .models.bag_extraction_configuration import BagExtractionConfiguration
+from .models.bag_facets import BagFacets
+from .models.bag_registration import BagRegistration
 from .models.bag_store_detailed import BagStoreDetailed
 from .models.bag_store_summary import BagStoreSummary
 from .models.bag_summary import BagSummary
+from .models.bag_task_template import BagTaskTemplate
+from .models.bag_tasks_result import BagTasksResult
 from .models.comment import Comment
 from .models.error import Error
 from .models.file_detailed import FileDetailed
@@ -14,6 +18,8 @@ from .models.file_summary import FileSummary
 from .models.permission import Permission
 from .models.product import Product
 from .models.product_file import ProductFile
+from .models.queue_depth import QueueDepth
+from .models.queue_statistics import QueueStatistics
 from .models.session import Session
 from .models.simulation_detailed import SimulationDetailed
 from .models.simulation_environment_detailed import SimulationEnvironmentDetailed
@@ -21,12 +27,19 @@ from .models.simulation_environment_summary import SimulationEnvironmentSummary
 from .models.simulation_run_detailed import SimulationRunDetailed
 from .models.simulation_run_summary import SimulationRunSummary
 from .models.simulation_summary import SimulationSummary
+from .models.stored_file import StoredFile
 from .models.tag import Tag
+from .models.tag_facet import TagFacet
 from .models.task_detailed import TaskDetailed
+from .models.task_heartbeat import TaskHeartbeat
+from .models.task_log import TaskLog
+from .models.task_status import TaskStatus
 from .models.task_summary import TaskSummary
+from .models.task_type_statistics import TaskTypeStatistics
 from .models.topic import Topic
 from .models.topic_mapping import TopicMapping
 from .models.user import User
+from .models.worker_statistics import WorkerStatistics
 
 # import apis into sdk package
 from .apis.basic_api import BasicApi
@@ -1021,14 +1021,15 @@ class BasicApi(object):
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str worker_name: Name of the worker trying to acquire a task (required)
-        :param str tasks: Tasks that the worker can do (any or a list of tasks) (required)
-        :param str labels: Labels the worker wants to do (required)
+        :param str tasks: Comma separated tasks that the worker can do, empty or any for all tasks (required)
+        :param str labels: Comma separated labels of the worker, a task is only assigned if the worker has all its labels (required)
+        :param int wait: Seconds to wait for a task to be queued if there is none, the server limits this to 25 seconds
         :return: TaskDetailed
                  If the method is called asynchronously,
                  returns the request thread.
         """
 
-        all_params = ['worker_name', 'tasks', 'labels']
+        all_params = ['worker_name', 'tasks', 'labels', 'wait']
         all_params.append('callback')
 
         params = locals()
@@ -1061,6 +1062,8 @@ class BasicApi(object):
             query_params['tasks'] = params['tasks']
         if 'labels' in params:
             query_params['labels'] = params['labels']
+        if 'wait' in params:
+            query_params['wait'] = params['wait']
 
         header_params = {}
 
@@ -1263,6 +1266,143 @@ class BasicApi(object):
                                             callback=params.get('callback'))
         return response
 
+    def get_bag_facets(self, store_name, **kwargs):
+        """
+        Count the bags matching the filter
+        Takes the same filter parameters as list_bags and returns the number of matching bags, per tag and per flag.
+
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please define a `callback` function
+        to be invoked when receiving the response.
+        >>> def callback_function(response):
+        >>>     pprint(response)
+        >>>
+        >>> thread = api.get_bag_facets(store_name, callback=callback_function)
+
+        :param callback function: The callback function
+            for asynchronous request. (optional)
+        :param str store_name: Name of the store (required)
+        :param datetime discovered_gte: 
+        :param datetime discovered_lte: 
+        :param datetime start_time_gte: 
+        :param datetime start_time_lte: 
+        :param datetime end_time_gte: 
+        :param datetime end_time_lte: 
+        :param float duration_gte: 
+        :param float duration_lte: 
+        :param bool meta_available: 
+        :param bool is_extracted: 
+        :param str name: 
+        :param str tags: 
+        :param str tags_mode: How the tags are matched, all (default), any or none
+        :param bool in_trash: 
+        :param str search: Full text search in the bag name, topic names and comment, matches words and word prefixes.
+        :param str topic: Only bags containing a topic with exactly this name
+        :param str topic_prefix: Only bags containing a topic whose name starts with this prefix
+        :param str msg_type: Only bags containing a topic of this message type, e.g. sensor_msgs/PointCloud2
+        :param int topic_msg_count_gte: Only bags containing a matching topic with at least this many messages
+        :param float topic_avg_frequency_gte: Only bags containing a matching topic with at least this average frequency
+        :return: BagFacets
+                 If the method is called asynchronously,
+                 returns the request thread.
+        """
+
+        all_params = ['store_name', 'discovered_gte', 'discovered_lte', 'start_time_gte', 'start_time_lte', 'end_time_gte', 'end_time_lte', 'duration_gte', 'duration_lte', 'meta_available', 'is_extracted', 'name', 'tags', 'tags_mode', 'in_trash', 'search', 'topic', 'topic_prefix', 'msg_type', 'topic_msg_count_gte', 'topic_avg_frequency_gte']
+        all_params.append('callback')
+
+        params = locals()
+        for key, val in iteritems(params['kwargs']):
+            if key not in all_params:
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method get_bag_facets" % key
+                )
+            params[key] = val
+        del params['kwargs']
+
+        # verify the required parameter 'store_name' is set
+        if ('store_name' not in params) or (params['store_name'] is None):
+            raise ValueError("Missing the required parameter `store_name` when calling `get_bag_facets`")
+
+        resource_path = '/stores/{store_name}/bags/facets'.replace('{format}', 'json')
+        path_params = {}
+        if 'store_name' in params:
+            path_params['store_name'] = params['store_name']
+
+        query_params = {}
+        if 'discovered_gte' in params:
+            query_params['discovered_gte'] = params['discovered_gte']
+        if 'discovered_lte' in params:
+            query_params['discovered_lte'] = params['discovered_lte']
+        if 'start_time_gte' in params:
+            query_params['start_time_gte'] = params['start_time_gte']
+        if 'start_time_lte' in params:
+            query_params['start_time_lte'] = params['start_time_lte']
+        if 'end_time_gte' in params:
+            query_params['end_time_gte'] = params['end_time_gte']
+        if 'end_time_lte' in params:
+            query_params['end_time_lte'] = params['end_time_lte']
+        if 'duration_gte' in params:
+            query_params['duration_gte'] = params['duration_gte']
+        if 'duration_lte' in params:
+            query_params['duration_lte'] = params['duration_lte']
+        if 'meta_available' in params:
+            query_params['meta_available'] = params['meta_available']
+        if 'is_extracted' in params:
+            query_params['is_extracted'] = params['is_extracted']
+        if 'name' in params:
+            query_params['name'] = params['name']
+        if 'tags' in params:
+            query_params['tags'] = params['tags']
+        if 'tags_mode' in params:
+            query_params['tags_mode'] = params['tags_mode']
+        if 'in_trash' in params:
+            query_params['in_trash'] = params['in_trash']
+        if 'search' in params:
+            query_params['search'] = params['search']
+        if 'topic' in params:
+            query_params['topic'] = params['topic']
+        if 'topic_prefix' in params:
+            query_params['topic_prefix'] = params['topic_prefix']
+        if 'msg_type' in params:
+            query_params['msg_type'] = params['msg_type']
+        if 'topic_msg_count_gte' in params:
+            query_params['topic_msg_count_gte'] = params['topic_msg_count_gte']
+        if 'topic_avg_frequency_gte' in params:
+            query_params['topic_avg_frequency_gte'] = params['topic_avg_frequency_gte']
+
+        header_params = {}
+
+        form_params = []
+        local_var_files = {}
+
+        body_params = None
+
+        # HTTP header `Accept`
+        header_params['Accept'] = self.api_client.\
+            select_header_accept([])
+        if not header_params['Accept']:
+            del header_params['Accept']
+
+        # HTTP header `Content-Type`
+        header_params['Content-Type'] = self.api_client.\
+            select_header_content_type([])
+
+        # Authentication setting
+        auth_settings = ['basicAuth']
+
+        response = self.api_client.call_api(resource_path, 'GET',
+                                            path_params,
+                                            query_params,
+                                            header_params,
+                                            body=body_params,
+                                            post_params=form_params,
+                                            files=local_var_files,
+                                            response_type='BagFacets',
+                                            auth_settings=auth_settings,
+                                            callback=params.get('callback'))
+        return response
+
     def get_bag_file(self, store_name, bag_name, **kwargs):
         """
         Get rosbag
@@ -1363,12 +1503,14 @@ class BasicApi(object):
             for asynchronous request. (optional)
         :param str store_name: Name of the store (required)
         :param str bag_name: Name of the bag (required)
+        :param bool msg_definitions: Include the full message definition of every topic, true by default. Without it the topics are returned without msg_definition.
+        :param bool product_data: Include the product_data of the products, true by default. Without it only the product headers are returned, the data is available per product.
         :return: BagDetailed
                  If the method is called asynchronously,
                  returns the request thread.
         """
 
-        all_params = ['store_name', 'bag_name']
+        all_params = ['store_name', 'bag_name', 'msg_definitions', 'product_data']
         all_params.append('callback')
 
         params = locals()
@@ -1396,6 +1538,10 @@ class BasicApi(object):
             path_params['bag_name'] = params['bag_name']
 
         query_params = {}
+        if 'msg_definitions' in params:
+            query_params['msg_definitions'] = params['msg_definitions']
+        if 'product_data' in params:
+            query_params['product_data'] = params['product_data']
 
         header_params = {}
 
@@ -1429,6 +1575,95 @@ class BasicApi(object):
                                             callback=params.get('callback'))
         return response
 
+    def get_bag_product(self, store_name, bag_name, uid, **kwargs):
+        """
+        Get a product of a bag including its data
+        
+
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please define a `callback` function
+        to be invoked when receiving the response.
+        >>> def callback_function(response):
+        >>>     pprint(response)
+        >>>
+        >>> thread = api.get_bag_product(store_name, bag_name, uid, callback=callback_function)
+
+        :param callback function: The callback function
+            for asynchronous request. (optional)
+        :param str store_name: Name of the store (required)
+        :param str bag_name: Name of the bag (required)
+        :param int uid: Unique identifier of the product (required)
+        :return: Product
+                 If the method is called asynchronously,
+                 returns the request thread.
+        """
+
+        all_params = ['store_name', 'bag_name', 'uid']
+        all_params.append('callback')
+
+        params = locals()
+        for key, val in iteritems(params['kwargs']):
+            if key not in all_params:
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method get_bag_product" % key
+                )
+            params[key] = val
+        del params['kwargs']
+
+        # verify the required parameter 'store_name' is set
+        if ('store_name' not in params) or (params['store_name'] is None):
+            raise ValueError("Missing the required parameter `store_name` when calling `get_bag_product`")
+        # verify the required parameter 'bag_name' is set
+        if ('bag_name' not in params) or (params['bag_name'] is None):
+            raise ValueError("Missing the required parameter `bag_name` when calling `get_bag_product`")
+        # verify the required parameter 'uid' is set
+        if ('uid' not in params) or (params['uid'] is None):
+            raise ValueError("Missing the required parameter `uid` when calling `get_bag_product`")
+
+        resource_path = '/stores/{store_name}/bags/{bag_name}/products/{uid}'.replace('{format}', 'json')
+        path_params = {}
+        if 'store_name' in params:
+            path_params['store_name'] = params['store_name']
+        if 'bag_name' in params:
+            path_params['bag_name'] = params['bag_name']
+        if 'uid' in params:
+            path_params['uid'] = params['uid']
+
+        query_params = {}
+
+        header_params = {}
+
+        form_params = []
+        local_var_files = {}
+
+        body_params = None
+
+        # HTTP header `Accept`
+        header_params['Accept'] = self.api_client.\
+            select_header_accept([])
+        if not header_params['Accept']:
+            del header_params['Accept']
+
+        # HTTP header `Content-Type`
+        header_params['Content-Type'] = self.api_client.\
+            select_header_content_type([])
+
+        # Authentication setting
+        auth_settings = ['basicAuth']
+
+        response = self.api_client.call_api(resource_path, 'GET',
+                                            path_params,
+                                            query_params,
+                                            header_params,
+                                            body=body_params,
+                                            post_params=form_params,
+                                            files=local_var_files,
+                                            response_type='Product',
+                                            auth_settings=auth_settings,
+                                            callback=params.get('callback'))
+        return response
+
     def get_bag_tags(self, store_name, bag_name, **kwargs):
         """
         List tag from bag
@@ -1604,7 +1839,7 @@ class BasicApi(object):
 
         :param callback function: The callback function
             for asynchronous request. (optional)
-        :param str jobs: Specific cron jobs to trigger
+        :param str jobs: Comma separated cron jobs to trigger (archive_tasks, reclaim_task_leases), all jobs if empty
         :return: None
                  If the method is called asynchronously,
                  returns the request thread.
@@ -2069,6 +2304,80 @@ class BasicApi(object):
                                             callback=params.get('callback'))
         return response
 
+    def get_queue_statistics(self, **kwargs):
+        """
+        Queue depth, wait time and runtime percentiles per task and throughput per worker
+        Aggregates the unfinished tasks and the tasks started or finished in the window, also suggests a number of workers for autoscaling
+
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please define a `callback` function
+        to be invoked when receiving the response.
+        >>> def callback_function(response):
+        >>>     pprint(response)
+        >>>
+        >>> thread = api.get_queue_statistics(callback=callback_function)
+
+        :param callback function: The callback function
+            for asynchronous request. (optional)
+        :param int window: Seconds back from now over which the tasks are aggregated, one hour by default
+        :return: QueueStatistics
+                 If the method is called asynchronously,
+                 returns the request thread.
+        """
+
+        all_params = ['window']
+        all_params.append('callback')
+
+        params = locals()
+        for key, val in iteritems(params['kwargs']):
+            if key not in all_params:
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method get_queue_statistics" % key
+                )
+            params[key] = val
+        del params['kwargs']
+
+
+        resource_path = '/queue/statistics'.replace('{format}', 'json')
+        path_params = {}
+
+        query_params = {}
+        if 'window' in params:
+            query_params['window'] = params['window']
+
+        header_params = {}
+
+        form_params = []
+        local_var_files = {}
+
+        body_params = None
+
+        # HTTP header `Accept`
+        header_params['Accept'] = self.api_client.\
+            select_header_accept([])
+        if not header_params['Accept']:
+            del header_params['Accept']
+
+        # HTTP header `Content-Type`
+        header_params['Content-Type'] = self.api_client.\
+            select_header_content_type([])
+
+        # Authentication setting
+        auth_settings = ['basicAuth']
+
+        response = self.api_client.call_api(resource_path, 'GET',
+                                            path_params,
+                                            query_params,
+                                            header_params,
+                                            body=body_params,
+                                            post_params=form_params,
+                                            files=local_var_files,
+                                            response_type='QueueStatistics',
+                                            auth_settings=auth_settings,
+                                            callback=params.get('callback'))
+        return response
+
     def get_simulation(self, sim_identifier, **kwargs):
         """
         Get simulation
@@ -2559,12 +2868,13 @@ class BasicApi(object):
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str task_identifier:  (required)
+        :param bool log: Include the complete log
         :return: TaskDetailed
                  If the method is called asynchronously,
                  returns the request thread.
         """
 
-        all_params = ['task_identifier']
+        all_params = ['task_identifier', 'log']
         all_params.append('callback')
 
         params = locals()
@@ -2587,6 +2897,8 @@ class BasicApi(object):
             path_params['task_identifier'] = params['task_identifier']
 
         query_params = {}
+        if 'log' in params:
+            query_params['log'] = params['log']
 
         header_params = {}
 
@@ -2620,6 +2932,89 @@ class BasicApi(object):
                                             callback=params.get('callback'))
         return response
 
+    def get_task_log(self, task_identifier, **kwargs):
+        """
+        Read a part of the log of a task
+        Logs are read in parts, continue at next_offset to follow a running task
+
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please define a `callback` function
+        to be invoked when receiving the response.
+        >>> def callback_function(response):
+        >>>     pprint(response)
+        >>>
+        >>> thread = api.get_task_log(task_identifier, callback=callback_function)
+
+        :param callback function: The callback function
+            for asynchronous request. (optional)
+        :param str task_identifier:  (required)
+        :param int offset: Byte position in the log to start reading, negative to read the end of the log
+        :param int limit: Maximum number of bytes to read, 1 MiB by default
+        :return: TaskLog
+                 If the method is called asynchronously,
+                 returns the request thread.
+        """
+
+        all_params = ['task_identifier', 'offset', 'limit']
+        all_params.append('callback')
+
+        params = locals()
+        for key, val in iteritems(params['kwargs']):
+            if key not in all_params:
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method get_task_log" % key
+                )
+            params[key] = val
+        del params['kwargs']
+
+        # verify the required parameter 'task_identifier' is set
+        if ('task_identifier' not in params) or (params['task_identifier'] is None):
+            raise ValueError("Missing the required parameter `task_identifier` when calling `get_task_log`")
+
+        resource_path = '/queue/{task_identifier}/log'.replace('{format}', 'json')
+        path_params = {}
+        if 'task_identifier' in params:
+            path_params['task_identifier'] = params['task_identifier']
+
+        query_params = {}
+        if 'offset' in params:
+            query_params['offset'] = params['offset']
+        if 'limit' in params:
+            query_params['limit'] = params['limit']
+
+        header_params = {}
+
+        form_params = []
+        local_var_files = {}
+
+        body_params = None
+
+        # HTTP header `Accept`
+        header_params['Accept'] = self.api_client.\
+            select_header_accept([])
+        if not header_params['Accept']:
+            del header_params['Accept']
+
+        # HTTP header `Content-Type`
+        header_params['Content-Type'] = self.api_client.\
+            select_header_content_type([])
+
+        # Authentication setting
+        auth_settings = ['basicAuth']
+
+        response = self.api_client.call_api(resource_path, 'GET',
+                                            path_params,
+                                            query_params,
+                                            header_params,
+                                            body=body_params,
+                                            post_params=form_params,
+                                            files=local_var_files,
+                                            response_type='TaskLog',
+                                            auth_settings=auth_settings,
+                                            callback=params.get('callback'))
+        return response
+
     def get_user_account(self, alias, **kwargs):
         """
         Get user information
@@ -2715,6 +3110,7 @@ class BasicApi(object):
         :param str store_name: Name of the store (required)
         :param int limit: 
         :param int offset: 
+        :param str cursor: Opaque cursor returned in the X-Next-Cursor header of the previous page, replaces offset
         :param str ordering: 
         :param datetime discovered_gte: 
         :param datetime discovered_lte: 
@@ -2728,13 +3124,20 @@ class BasicApi(object):
         :param bool is_extracted: 
         :param str name: 
         :param str tags: 
+        :param str tags_mode: How the tags are matched, all (default), any or none
         :param bool in_trash: 
+        :param str search: Full text search in the bag name, topic names and comment, matches words and word prefixes. Without an ordering the results are sorted by relevance.
+        :param str topic: Only bags containing a topic with exactly this name
+        :param str topic_prefix: Only bags containing a topic whose name starts with this prefix
+        :param str msg_type: Only bags containing a topic of this message type, e.g. sensor_msgs/PointCloud2
+        :param int topic_msg_count_gte: Only bags containing a matching topic with at least this many messages
+        :param float topic_avg_frequency_gte: Only bags containing a matching topic with at least this average frequency
         :return: list[BagSummary]
                  If the method is called asynchronously,
                  returns the request thread.
         """
 
-        all_params = ['store_name', 'limit', 'offset', 'ordering', 'discovered_gte', 'discovered_lte', 'start_time_gte', 'start_time_lte', 'end_time_gte', 'end_time_lte', 'duration_gte', 'duration_lte', 'meta_available', 'is_extracted', 'name', 'tags', 'in_trash']
+        all_params = ['store_name', 'limit', 'offset', 'cursor', 'ordering', 'discovered_gte', 'discovered_lte', 'start_time_gte', 'start_time_lte', 'end_time_gte', 'end_time_lte', 'duration_gte', 'duration_lte', 'meta_available', 'is_extracted', 'name', 'tags', 'tags_mode', 'in_trash', 'search', 'topic', 'topic_prefix', 'msg_type', 'topic_msg_count_gte', 'topic_avg_frequency_gte']
         all_params.append('callback')
 
         params = locals()
@@ -2761,6 +3164,8 @@ class BasicApi(object):
             query_params['limit'] = params['limit']
         if 'offset' in params:
             query_params['offset'] = params['offset']
+        if 'cursor' in params:
+            query_params['cursor'] = params['cursor']
         if 'ordering' in params:
             query_params['ordering'] = params['ordering']
         if 'discovered_gte' in params:
@@ -2787,8 +3192,22 @@ class BasicApi(object):
             query_params['name'] = params['name']
         if 'tags' in params:
             query_params['tags'] = params['tags']
+        if 'tags_mode' in params:
+            query_params['tags_mode'] = params['tags_mode']
         if 'in_trash' in params:
             query_params['in_trash'] = params['in_trash']
+        if 'search' in params:
+            query_params['search'] = params['search']
+        if 'topic' in params:
+            query_params['topic'] = params['topic']
+        if 'topic_prefix' in params:
+            query_params['topic_prefix'] = params['topic_prefix']
+        if 'msg_type' in params:
+            query_params['msg_type'] = params['msg_type']
+        if 'topic_msg_count_gte' in params:
+            query_params['topic_msg_count_gte'] = params['topic_msg_count_gte']
+        if 'topic_avg_frequency_gte' in params:
+            query_params['topic_avg_frequency_gte'] = params['topic_avg_frequency_gte']
 
         header_params = {}
 
@@ -2981,6 +3400,7 @@ class BasicApi(object):
             for asynchronous request. (optional)
         :param int limit: 
         :param int offset: 
+        :param str cursor: Opaque cursor returned in the X-Next-Cursor header of the previous page, replaces offset
         :param str ordering: 
         :param str running: Include running tasks, default is true
         :param str finished: Include finished tasks, default is true
@@ -2990,7 +3410,7 @@ class BasicApi(object):
                  returns the request thread.
         """
 
-        all_params = ['limit', 'offset', 'ordering', 'running', 'finished', 'queued']
+        all_params = ['limit', 'offset', 'cursor', 'ordering', 'running', 'finished', 'queued']
         all_params.append('callback')
 
         params = locals()
@@ -3012,6 +3432,8 @@ class BasicApi(object):
             query_params['limit'] = params['limit']
         if 'offset' in params:
             query_params['offset'] = params['offset']
+        if 'cursor' in params:
+            query_params['cursor'] = params['cursor']
         if 'ordering' in params:
             query_params['ordering'] = params['ordering']
         if 'running' in params:
@@ -3289,13 +3711,14 @@ class BasicApi(object):
             for asynchronous request. (optional)
         :param int limit: 
         :param int offset: 
+        :param str cursor: Opaque cursor returned in the X-Next-Cursor header of the previous page, replaces offset
         :param str ordering: 
         :return: list[SimulationSummary]
                  If the method is called asynchronously,
                  returns the request thread.
         """
 
-        all_params = ['limit', 'offset', 'ordering']
+        all_params = ['limit', 'offset', 'cursor', 'ordering']
         all_params.append('callback')
 
         params = locals()
@@ -3317,6 +3740,8 @@ class BasicApi(object):
             query_params['limit'] = params['limit']
         if 'offset' in params:
             query_params['offset'] = params['offset']
+        if 'cursor' in params:
+            query_params['cursor'] = params['cursor']
         if 'ordering' in params:
             query_params['ordering'] = params['ordering']
 
@@ -3588,7 +4013,117 @@ class BasicApi(object):
                  returns the request thread.
         """
 
-        all_params = ['store_name', 'bag_name', 'comment']
+        all_params = ['store_name', 'bag_name', 'comment']
+        all_params.append('callback')
+
+        params = locals()
+        for key, val in iteritems(params['kwargs']):
+            if key not in all_params:
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method new_bag_comment" % key
+                )
+            params[key] = val
+        del params['kwargs']
+
+        # verify the required parameter 'store_name' is set
+        if ('store_name' not in params) or (params['store_name'] is None):
+            raise ValueError("Missing the required parameter `store_name` when calling `new_bag_comment`")
+        # verify the required parameter 'bag_name' is set
+        if ('bag_name' not in params) or (params['bag_name'] is None):
+            raise ValueError("Missing the required parameter `bag_name` when calling `new_bag_comment`")
+        # verify the required parameter 'comment' is set
+        if ('comment' not in params) or (params['comment'] is None):
+            raise ValueError("Missing the required parameter `comment` when calling `new_bag_comment`")
+
+        resource_path = '/stores/{store_name}/bags/{bag_name}/comments'.replace('{format}', 'json')
+        path_params = {}
+        if 'store_name' in params:
+            path_params['store_name'] = params['store_name']
+        if 'bag_name' in params:
+            path_params['bag_name'] = params['bag_name']
+
+        query_params = {}
+
+        header_params = {}
+
+        form_params = []
+        local_var_files = {}
+
+        body_params = None
+        if 'comment' in params:
+            body_params = params['comment']
+
+        # HTTP header `Accept`
+        header_params['Accept'] = self.api_client.\
+            select_header_accept([])
+        if not header_params['Accept']:
+            del header_params['Accept']
+
+        # HTTP header `Content-Type`
+        header_params['Content-Type'] = self.api_client.\
+            select_header_content_type([])
+
+        # Authentication setting
+        auth_settings = ['basicAuth']
+
+        response = self.api_client.call_api(resource_path, 'POST',
+                                            path_params,
+                                            query_params,
+                                            header_params,
+                                            body=body_params,
+                                            post_params=form_params,
+                                            files=local_var_files,
+                                            response_type='Comment',
+                                            auth_settings=auth_settings,
+                                            callback=params.get('callback'))
+        return response
+
+    def new_bag_tasks(self, store_name, template, **kwargs):
+        """
+        Queue a task for every bag matching the filter
+        Takes the same filter parameters as list_bags. The configuration of every task is the configuration of the template with the store and bag name added. Bags for which an equal task is already queued or running are skipped.
+
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please define a `callback` function
+        to be invoked when receiving the response.
+        >>> def callback_function(response):
+        >>>     pprint(response)
+        >>>
+        >>> thread = api.new_bag_tasks(store_name, template, callback=callback_function)
+
+        :param callback function: The callback function
+            for asynchronous request. (optional)
+        :param str store_name: Name of the store (required)
+        :param BagTaskTemplate template: Task created for every matching bag (required)
+        :param bool dry_run: Only count the tasks that would be created
+        :param datetime discovered_gte: 
+        :param datetime discovered_lte: 
+        :param datetime start_time_gte: 
+        :param datetime start_time_lte: 
+        :param datetime end_time_gte: 
+        :param datetime end_time_lte: 
+        :param float duration_gte: 
+        :param float duration_lte: 
+        :param bool meta_available: 
+        :param bool is_extracted: 
+        :param str name: 
+        :param str tags: 
+        :param str tags_mode: How the tags are matched, all (default), any or none
+        :param bool extraction_failure: 
+        :param bool in_trash: 
+        :param str search: Full text search in the bag name, topic names and comment, matches words and word prefixes.
+        :param str topic: Only bags containing a topic with exactly this name
+        :param str topic_prefix: Only bags containing a topic whose name starts with this prefix
+        :param str msg_type: Only bags containing a topic of this message type, e.g. sensor_msgs/PointCloud2
+        :param int topic_msg_count_gte: Only bags containing a matching topic with at least this many messages
+        :param float topic_avg_frequency_gte: Only bags containing a matching topic with at least this average frequency
+        :return: BagTasksResult
+                 If the method is called asynchronously,
+                 returns the request thread.
+        """
+
+        all_params = ['store_name', 'template', 'dry_run', 'discovered_gte', 'discovered_lte', 'start_time_gte', 'start_time_lte', 'end_time_gte', 'end_time_lte', 'duration_gte', 'duration_lte', 'meta_available', 'is_extracted', 'name', 'tags', 'tags_mode', 'extraction_failure', 'in_trash', 'search', 'topic', 'topic_prefix', 'msg_type', 'topic_msg_count_gte', 'topic_avg_frequency_gte']
         all_params.append('callback')
 
         params = locals()
@@ -3596,29 +4131,68 @@ class BasicApi(object):
             if key not in all_params:
                 raise TypeError(
                     "Got an unexpected keyword argument '%s'"
-                    " to method new_bag_comment" % key
+                    " to method new_bag_tasks" % key
                 )
             params[key] = val
         del params['kwargs']
 
         # verify the required parameter 'store_name' is set
         if ('store_name' not in params) or (params['store_name'] is None):
-            raise ValueError("Missing the required parameter `store_name` when calling `new_bag_comment`")
-        # verify the required parameter 'bag_name' is set
-        if ('bag_name' not in params) or (params['bag_name'] is None):
-            raise ValueError("Missing the required parameter `bag_name` when calling `new_bag_comment`")
-        # verify the required parameter 'comment' is set
-        if ('comment' not in params) or (params['comment'] is None):
-            raise ValueError("Missing the required parameter `comment` when calling `new_bag_comment`")
+            raise ValueError("Missing the required parameter `store_name` when calling `new_bag_tasks`")
+        # verify the required parameter 'template' is set
+        if ('template' not in params) or (params['template'] is None):
+            raise ValueError("Missing the required parameter `template` when calling `new_bag_tasks`")
 
-        resource_path = '/stores/{store_name}/bags/{bag_name}/comments'.replace('{format}', 'json')
+        resource_path = '/stores/{store_name}/bags/tasks'.replace('{format}', 'json')
         path_params = {}
         if 'store_name' in params:
             path_params['store_name'] = params['store_name']
-        if 'bag_name' in params:
-            path_params['bag_name'] = params['bag_name']
 
         query_params = {}
+        if 'dry_run' in params:
+            query_params['dry_run'] = params['dry_run']
+        if 'discovered_gte' in params:
+            query_params['discovered_gte'] = params['discovered_gte']
+        if 'discovered_lte' in params:
+            query_params['discovered_lte'] = params['discovered_lte']
+        if 'start_time_gte' in params:
+            query_params['start_time_gte'] = params['start_time_gte']
+        if 'start_time_lte' in params:
+            query_params['start_time_lte'] = params['start_time_lte']
+        if 'end_time_gte' in params:
+            query_params['end_time_gte'] = params['end_time_gte']
+        if 'end_time_lte' in params:
+            query_params['end_time_lte'] = params['end_time_lte']
+        if 'duration_gte' in params:
+            query_params['duration_gte'] = params['duration_gte']
+        if 'duration_lte' in params:
+            query_params['duration_lte'] = params['duration_lte']
+        if 'meta_available' in params:
+            query_params['meta_available'] = params['meta_available']
+        if 'is_extracted' in params:
+            query_params['is_extracted'] = params['is_extracted']
+        if 'name' in params:
+            query_params['name'] = params['name']
+        if 'tags' in params:
+            query_params['tags'] = params['tags']
+        if 'tags_mode' in params:
+            query_params['tags_mode'] = params['tags_mode']
+        if 'extraction_failure' in params:
+            query_params['extraction_failure'] = params['extraction_failure']
+        if 'in_trash' in params:
+            query_params['in_trash'] = params['in_trash']
+        if 'search' in params:
+            query_params['search'] = params['search']
+        if 'topic' in params:
+            query_params['topic'] = params['topic']
+        if 'topic_prefix' in params:
+            query_params['topic_prefix'] = params['topic_prefix']
+        if 'msg_type' in params:
+            query_params['msg_type'] = params['msg_type']
+        if 'topic_msg_count_gte' in params:
+            query_params['topic_msg_count_gte'] = params['topic_msg_count_gte']
+        if 'topic_avg_frequency_gte' in params:
+            query_params['topic_avg_frequency_gte'] = params['topic_avg_frequency_gte']
 
         header_params = {}
 
@@ -3626,8 +4200,8 @@ class BasicApi(object):
         local_var_files = {}
 
         body_params = None
-        if 'comment' in params:
-            body_params = params['comment']
+        if 'template' in params:
+            body_params = params['template']
 
         # HTTP header `Accept`
         header_params['Accept'] = self.api_client.\
@@ -3649,7 +4223,7 @@ class BasicApi(object):
                                             body=body_params,
                                             post_params=form_params,
                                             files=local_var_files,
-                                            response_type='Comment',
+                                            response_type='BagTasksResult',
                                             auth_settings=auth_settings,
                                             callback=params.get('callback'))
         return response
@@ -4070,12 +4644,13 @@ class BasicApi(object):
         :param str bag_name: Name of the bag (required)
         :param object bag: Bag to register (required)
         :param str trigger: Hooks to trigger
+        :param bool detailed: Return the topics and products of the bag, true by default. With false only the summary of the bag is returned.
         :return: BagDetailed
                  If the method is called asynchronously,
                  returns the request thread.
         """
 
-        all_params = ['store_name', 'bag_name', 'bag', 'trigger']
+        all_params = ['store_name', 'bag_name', 'bag', 'trigger', 'detailed']
         all_params.append('callback')
 
         params = locals()
@@ -4108,6 +4683,8 @@ class BasicApi(object):
         query_params = {}
         if 'trigger' in params:
             query_params['trigger'] = params['trigger']
+        if 'detailed' in params:
+            query_params['detailed'] = params['detailed']
 
         header_params = {}
 
@@ -4143,6 +4720,95 @@ class BasicApi(object):
                                             callback=params.get('callback'))
         return response
 
+    def patch_bag_products(self, store_name, bag_name, products, **kwargs):
+        """
+        Add products to a bag, existing products with the same configuration tag and rule are replaced
+        
+
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please define a `callback` function
+        to be invoked when receiving the response.
+        >>> def callback_function(response):
+        >>>     pprint(response)
+        >>>
+        >>> thread = api.patch_bag_products(store_name, bag_name, products, callback=callback_function)
+
+        :param callback function: The callback function
+            for asynchronous request. (optional)
+        :param str store_name: Name of the store (required)
+        :param str bag_name: Name of the bag (required)
+        :param list[Product] products: Products to add or replace (required)
+        :return: list[Product]
+                 If the method is called asynchronously,
+                 returns the request thread.
+        """
+
+        all_params = ['store_name', 'bag_name', 'products']
+        all_params.append('callback')
+
+        params = locals()
+        for key, val in iteritems(params['kwargs']):
+            if key not in all_params:
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method patch_bag_products" % key
+                )
+            params[key] = val
+        del params['kwargs']
+
+        # verify the required parameter 'store_name' is set
+        if ('store_name' not in params) or (params['store_name'] is None):
+            raise ValueError("Missing the required parameter `store_name` when calling `patch_bag_products`")
+        # verify the required parameter 'bag_name' is set
+        if ('bag_name' not in params) or (params['bag_name'] is None):
+            raise ValueError("Missing the required parameter `bag_name` when calling `patch_bag_products`")
+        # verify the required parameter 'products' is set
+        if ('products' not in params) or (params['products'] is None):
+            raise ValueError("Missing the required parameter `products` when calling `patch_bag_products`")
+
+        resource_path = '/stores/{store_name}/bags/{bag_name}/products'.replace('{format}', 'json')
+        path_params = {}
+        if 'store_name' in params:
+            path_params['store_name'] = params['store_name']
+        if 'bag_name' in params:
+            path_params['bag_name'] = params['bag_name']
+
+        query_params = {}
+
+        header_params = {}
+
+        form_params = []
+        local_var_files = {}
+
+        body_params = None
+        if 'products' in params:
+            body_params = params['products']
+
+        # HTTP header `Accept`
+        header_params['Accept'] = self.api_client.\
+            select_header_accept([])
+        if not header_params['Accept']:
+            del header_params['Accept']
+
+        # HTTP header `Content-Type`
+        header_params['Content-Type'] = self.api_client.\
+            select_header_content_type([])
+
+        # Authentication setting
+        auth_settings = ['basicAuth']
+
+        response = self.api_client.call_api(resource_path, 'PATCH',
+                                            path_params,
+                                            query_params,
+                                            header_params,
+                                            body=body_params,
+                                            post_params=form_params,
+                                            files=local_var_files,
+                                            response_type='list[Product]',
+                                            auth_settings=auth_settings,
+                                            callback=params.get('callback'))
+        return response
+
     def patch_task(self, task_identifier, task, **kwargs):
         """
         Partial update of task (this only supports a few fields)
@@ -5331,3 +5997,172 @@ class BasicApi(object):
                                             auth_settings=auth_settings,
                                             callback=params.get('callback'))
         return response
+
+    def register_bags(self, store_name, files, **kwargs):
+        """
+        Register a batch of new bags, bags that already exist are left untouched
+        
+
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please define a `callback` function
+        to be invoked when receiving the response.
+        >>> def callback_function(response):
+        >>>     pprint(response)
+        >>>
+        >>> thread = api.register_bags(store_name, files, callback=callback_function)
+
+        :param callback function: The callback function
+            for asynchronous request. (optional)
+        :param str store_name: Name of the store (required)
+        :param list[StoredFile] files: Bag files found in the store (required)
+        :param str trigger: Hooks to trigger
+        :return: list[BagRegistration]
+                 If the method is called asynchronously,
+                 returns the request thread.
+        """
+
+        all_params = ['store_name', 'files', 'trigger']
+        all_params.append('callback')
+
+        params = locals()
+        for key, val in iteritems(params['kwargs']):
+            if key not in all_params:
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method register_bags" % key
+                )
+            params[key] = val
+        del params['kwargs']
+
+        # verify the required parameter 'store_name' is set
+        if ('store_name' not in params) or (params['store_name'] is None):
+            raise ValueError("Missing the required parameter `store_name` when calling `register_bags`")
+        # verify the required parameter 'files' is set
+        if ('files' not in params) or (params['files'] is None):
+            raise ValueError("Missing the required parameter `files` when calling `register_bags`")
+
+        resource_path = '/stores/{store_name}/bags'.replace('{format}', 'json')
+        path_params = {}
+        if 'store_name' in params:
+            path_params['store_name'] = params['store_name']
+
+        query_params = {}
+        if 'trigger' in params:
+            query_params['trigger'] = params['trigger']
+
+        header_params = {}
+
+        form_params = []
+        local_var_files = {}
+
+        body_params = None
+        if 'files' in params:
+            body_params = params['files']
+
+        # HTTP header `Accept`
+        header_params['Accept'] = self.api_client.\
+            select_header_accept([])
+        if not header_params['Accept']:
+            del header_params['Accept']
+
+        # HTTP header `Content-Type`
+        header_params['Content-Type'] = self.api_client.\
+            select_header_content_type([])
+
+        # Authentication setting
+        auth_settings = ['basicAuth']
+
+        response = self.api_client.call_api(resource_path, 'POST',
+                                            path_params,
+                                            query_params,
+                                            header_params,
+                                            body=body_params,
+                                            post_params=form_params,
+                                            files=local_var_files,
+                                            response_type='list[BagRegistration]',
+                                            auth_settings=auth_settings,
+                                            callback=params.get('callback'))
+        return response
+
+    def task_heartbeat(self, task_identifier, heartbeat, **kwargs):
+        """
+        Report that the worker is still working on the task
+        Appends to the log and renews the lease of the worker, the reply is small and does not grow with the log
+
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please define a `callback` function
+        to be invoked when receiving the response.
+        >>> def callback_function(response):
+        >>>     pprint(response)
+        >>>
+        >>> thread = api.task_heartbeat(task_identifier, heartbeat, callback=callback_function)
+
+        :param callback function: The callback function
+            for asynchronous request. (optional)
+        :param str task_identifier:  (required)
+        :param TaskHeartbeat heartbeat: Log output since the previous heartbeat (required)
+        :return: TaskStatus
+                 If the method is called asynchronously,
+                 returns the request thread.
+        """
+
+        all_params = ['task_identifier', 'heartbeat']
+        all_params.append('callback')
+
+        params = locals()
+        for key, val in iteritems(params['kwargs']):
+            if key not in all_params:
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method task_heartbeat" % key
+                )
+            params[key] = val
+        del params['kwargs']
+
+        # verify the required parameter 'task_identifier' is set
+        if ('task_identifier' not in params) or (params['task_identifier'] is None):
+            raise ValueError("Missing the required parameter `task_identifier` when calling `task_heartbeat`")
+        # verify the required parameter 'heartbeat' is set
+        if ('heartbeat' not in params) or (params['heartbeat'] is None):
+            raise ValueError("Missing the required parameter `heartbeat` when calling `task_heartbeat`")
+
+        resource_path = '/queue/{task_identifier}/heartbeat'.replace('{format}', 'json')
+        path_params = {}
+        if 'task_identifier' in params:
+            path_params['task_identifier'] = params['task_identifier']
+
+        query_params = {}
+
+        header_params = {}
+
+        form_params = []
+        local_var_files = {}
+
+        body_params = None
+        if 'heartbeat' in params:
+            body_params = params['heartbeat']
+
+        # HTTP header `Accept`
+        header_params['Accept'] = self.api_client.\
+            select_header_accept([])
+        if not header_params['Accept']:
+            del header_params['Accept']
+
+        # HTTP header `Content-Type`
+        header_params['Content-Type'] = self.api_client.\
+            select_header_content_type([])
+
+        # Authentication setting
+        auth_settings = ['basicAuth']
+
+        response = self.api_client.call_api(resource_path, 'POST',
+                                            path_params,
+                                            query_params,
+                                            header_params,
+                                            body=body_params,
+                                            post_params=form_params,
+                                            files=local_var_files,
+                                            response_type='TaskStatus',
+                                            auth_settings=auth_settings,
+                                            callback=params.get('callback'))
+        return response
\ No newline at end of file
@@ -3,9 +3,13 @@ from __future__ import absolute_import
 # import models into model package
 from .bag_detailed import BagDetailed
 from .bag_extraction_configuration import BagExtractionConfiguration
+from .bag_facets import BagFacets
+from .bag_registration import BagRegistration
 from .bag_store_detailed import BagStoreDetailed
 from .bag_store_summary import BagStoreSummary
 from .bag_summary import BagSummary
+from .bag_task_template import BagTaskTemplate
+from .bag_tasks_result import BagTasksResult
 from .comment import Comment
 from .error import Error
 from .file_detailed import FileDetailed
@@ -14,6 +18,8 @@ from .file_summary import FileSummary
 from .permission import Permission
 from .product import Product
 from .product_file import ProductFile
+from .queue_depth import QueueDepth
+from .queue_statistics import QueueStatistics
 from .session import Session
 from .simulation_detailed import SimulationDetailed
 from .simulation_environment_detailed import SimulationEnvironmentDetailed
@@ -21,9 +27,16 @@ from .simulation_environment_summary import SimulationEnvironmentSummary
 from .simulation_run_detailed import SimulationRunDetailed
 from .simulation_run_summary import SimulationRunSummary
 from .simulation_summary import SimulationSummary
+from .stored_file import StoredFile
 from .tag import Tag
+from .tag_facet import TagFacet
 from .task_detailed import TaskDetailed
+from .task_heartbeat import TaskHeartbeat
+from .task_log import TaskLog
+from .task_status import TaskStatus
 from .task_summary import TaskSummary
+from .task_type_statistics import TaskTypeStatistics
 from .topic import Topic
 from .topic_mapping import TopicMapping
 from .user import User
+from .worker_statistics import WorkerStatistics
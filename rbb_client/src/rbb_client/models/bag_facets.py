@@ -0,0 +1,219 @@
+# coding: utf-8
+
+"""
+Copyright 2016 SmartBear Software
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Ref: https://github.com/swagger-api/swagger-codegen
+"""
+
+from pprint import pformat
+from six import iteritems
+
+
+class BagFacets(object):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    def __init__(self):
+        """
+        BagFacets - a model defined in Swagger
+
+        :param dict swaggerTypes: The key is attribute name
+                                  and the value is attribute type.
+        :param dict attributeMap: The key is attribute name
+                                  and the value is json key in definition.
+        """
+        self.swagger_types = {
+            'total': 'int',
+            'extracted': 'int',
+            'meta_available': 'int',
+            'extraction_failure': 'int',
+            'tags': 'list[TagFacet]'
+        }
+
+        self.attribute_map = {
+            'total': 'total',
+            'extracted': 'extracted',
+            'meta_available': 'meta_available',
+            'extraction_failure': 'extraction_failure',
+            'tags': 'tags'
+        }
+
+        self._total = None
+        self._extracted = None
+        self._meta_available = None
+        self._extraction_failure = None
+        self._tags = None
+
+    @property
+    def total(self):
+        """
+        Gets the total of this BagFacets.
+        Number of matching bags
+
+        :return: The total of this BagFacets.
+        :rtype: int
+        """
+        return self._total
+
+    @total.setter
+    def total(self, total):
+        """
+        Sets the total of this BagFacets.
+        Number of matching bags
+
+        :param total: The total of this BagFacets.
+        :type: int
+        """
+        self._total = total
+
+    @property
+    def extracted(self):
+        """
+        Gets the extracted of this BagFacets.
+        Number of matching bags that are extracted
+
+        :return: The extracted of this BagFacets.
+        :rtype: int
+        """
+        return self._extracted
+
+    @extracted.setter
+    def extracted(self, extracted):
+        """
+        Sets the extracted of this BagFacets.
+        Number of matching bags that are extracted
+
+        :param extracted: The extracted of this BagFacets.
+        :type: int
+        """
+        self._extracted = extracted
+
+    @property
+    def meta_available(self):
+        """
+        Gets the meta_available of this BagFacets.
+        Number of matching bags with meta data
+
+        :return: The meta_available of this BagFacets.
+        :rtype: int
+        """
+        return self._meta_available
+
+    @meta_available.setter
+    def meta_available(self, meta_available):
+        """
+        Sets the meta_available of this BagFacets.
+        Number of matching bags with meta data
+
+        :param meta_available: The meta_available of this BagFacets.
+        :type: int
+        """
+        self._meta_available = meta_available
+
+    @property
+    def extraction_failure(self):
+        """
+        Gets the extraction_failure of this BagFacets.
+        Number of matching bags that failed to extract
+
+        :return: The extraction_failure of this BagFacets.
+        :rtype: int
+        """
+        return self._extraction_failure
+
+    @extraction_failure.setter
+    def extraction_failure(self, extraction_failure):
+        """
+        Sets the extraction_failure of this BagFacets.
+        Number of matching bags that failed to extract
+
+        :param extraction_failure: The extraction_failure of this BagFacets.
+        :type: int
+        """
+        self._extraction_failure = extraction_failure
+
+    @property
+    def tags(self):
+        """
+        Gets the tags of this BagFacets.
+
+
+        :return: The tags of this BagFacets.
+        :rtype: list[TagFacet]
+        """
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        """
+        Sets the tags of this BagFacets.
+
+
+        :param tags: The tags of this BagFacets.
+        :type: list[TagFacet]
+        """
+        self._tags = tags
+
+    def to_dict(self):
+        """
+        Returns the model properties as a dict
+        """
+        result = {}
+
+        for attr, _ in iteritems(self.swagger_types):
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                result[attr] = list(map(
+                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
+                    value
+                ))
+            elif hasattr(value, "to_dict"):
+                result[attr] = value.to_dict()
+            elif isinstance(value, dict):
+                result[attr] = dict(map(
+                    lambda item: (item[0], item[1].to_dict())
+                    if hasattr(item[1], "to_dict") else item,
+                    value.items()
+                ))
+            else:
+                result[attr] = value
+
+        return result
+
+    def to_str(self):
+        """
+        Returns the string representation of the model
+        """
+        return pformat(self.to_dict())
+
+    def __repr__(self):
+        """
+        For `print` and `pprint`
+        """
+        return self.to_str()
+
+    def __eq__(self, other):
+        """
+        Returns true if both objects are equal
+        """
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        """
+        Returns true if both objects are not equal
+        """
+        return not self == other
@@ -0,0 +1,219 @@
+# coding: utf-8
+
+"""
+Copyright 2016 SmartBear Software
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Ref: https://github.com/swagger-api/swagger-codegen
+"""
+
+from pprint import pformat
+from six import iteritems
+
+
+class BagTaskTemplate(object):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    def __init__(self):
+        """
+        BagTaskTemplate - a model defined in Swagger
+
+        :param dict swaggerTypes: The key is attribute name
+                                  and the value is attribute type.
+        :param dict attributeMap: The key is attribute name
+                                  and the value is json key in definition.
+        """
+        self.swagger_types = {
+            'task': 'str',
+            'description': 'str',
+            'priority': 'int',
+            'worker_labels': 'str',
+            'config': 'object'
+        }
+
+        self.attribute_map = {
+            'task': 'task',
+            'description': 'description',
+            'priority': 'priority',
+            'worker_labels': 'worker_labels',
+            'config': 'config'
+        }
+
+        self._task = None
+        self._description = None
+        self._priority = None
+        self._worker_labels = None
+        self._config = None
+
+    @property
+    def task(self):
+        """
+        Gets the task of this BagTaskTemplate.
+        Name of the task
+
+        :return: The task of this BagTaskTemplate.
+        :rtype: str
+        """
+        return self._task
+
+    @task.setter
+    def task(self, task):
+        """
+        Sets the task of this BagTaskTemplate.
+        Name of the task
+
+        :param task: The task of this BagTaskTemplate.
+        :type: str
+        """
+        self._task = task
+
+    @property
+    def description(self):
+        """
+        Gets the description of this BagTaskTemplate.
+        Description of the tasks, the store and bag name are appended
+
+        :return: The description of this BagTaskTemplate.
+        :rtype: str
+        """
+        return self._description
+
+    @description.setter
+    def description(self, description):
+        """
+        Sets the description of this BagTaskTemplate.
+        Description of the tasks, the store and bag name are appended
+
+        :param description: The description of this BagTaskTemplate.
+        :type: str
+        """
+        self._description = description
+
+    @property
+    def priority(self):
+        """
+        Gets the priority of this BagTaskTemplate.
+        Priority of the tasks
+
+        :return: The priority of this BagTaskTemplate.
+        :rtype: int
+        """
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority):
+        """
+        Sets the priority of this BagTaskTemplate.
+        Priority of the tasks
+
+        :param priority: The priority of this BagTaskTemplate.
+        :type: int
+        """
+        self._priority = priority
+
+    @property
+    def worker_labels(self):
+        """
+        Gets the worker_labels of this BagTaskTemplate.
+        Labels a worker needs to run the tasks
+
+        :return: The worker_labels of this BagTaskTemplate.
+        :rtype: str
+        """
+        return self._worker_labels
+
+    @worker_labels.setter
+    def worker_labels(self, worker_labels):
+        """
+        Sets the worker_labels of this BagTaskTemplate.
+        Labels a worker needs to run the tasks
+
+        :param worker_labels: The worker_labels of this BagTaskTemplate.
+        :type: str
+        """
+        self._worker_labels = worker_labels
+
+    @property
+    def config(self):
+        """
+        Gets the config of this BagTaskTemplate.
+        Configuration of the tasks, the store and bag name are added to it
+
+        :return: The config of this BagTaskTemplate.
+        :rtype: object
+        """
+        return self._config
+
+    @config.setter
+    def config(self, config):
+        """
+        Sets the config of this BagTaskTemplate.
+        Configuration of the tasks, the store and bag name are added to it
+
+        :param config: The config of this BagTaskTemplate.
+        :type: object
+        """
+        self._config = config
+
+    def to_dict(self):
+        """
+        Returns the model properties as a dict
+        """
+        result = {}
+
+        for attr, _ in iteritems(self.swagger_types):
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                result[attr] = list(map(
+                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
+                    value
+                ))
+            elif hasattr(value, "to_dict"):
+                result[attr] = value.to_dict()
+            elif isinstance(value, dict):
+                result[attr] = dict(map(
+                    lambda item: (item[0], item[1].to_dict())
+                    if hasattr(item[1], "to_dict") else item,
+                    value.items()
+                ))
+            else:
+                result[attr] = value
+
+        return result
+
+    def to_str(self):
+        """
+        Returns the string representation of the model
+        """
+        return pformat(self.to_dict())
+
+    def __repr__(self):
+        """
+        For `print` and `pprint`
+        """
+        return self.to_str()
+
+    def __eq__(self, other):
+        """
+        Returns true if both objects are equal
+        """
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        """
+        Returns true if both objects are not equal
+        """
+        return not self == other
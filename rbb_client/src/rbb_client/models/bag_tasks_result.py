@@ -0,0 +1,194 @@
+# coding: utf-8
+
+"""
+Copyright 2016 SmartBear Software
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Ref: https://github.com/swagger-api/swagger-codegen
+"""
+
+from pprint import pformat
+from six import iteritems
+
+
+class BagTasksResult(object):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    def __init__(self):
+        """
+        BagTasksResult - a model defined in Swagger
+
+        :param dict swaggerTypes: The key is attribute name
+                                  and the value is attribute type.
+        :param dict attributeMap: The key is attribute name
+                                  and the value is json key in definition.
+        """
+        self.swagger_types = {
+            'matched': 'int',
+            'created': 'int',
+            'skipped': 'int',
+            'dry_run': 'bool'
+        }
+
+        self.attribute_map = {
+            'matched': 'matched',
+            'created': 'created',
+            'skipped': 'skipped',
+            'dry_run': 'dry_run'
+        }
+
+        self._matched = None
+        self._created = None
+        self._skipped = None
+        self._dry_run = None
+
+    @property
+    def matched(self):
+        """
+        Gets the matched of this BagTasksResult.
+        Number of bags matching the filter
+
+        :return: The matched of this BagTasksResult.
+        :rtype: int
+        """
+        return self._matched
+
+    @matched.setter
+    def matched(self, matched):
+        """
+        Sets the matched of this BagTasksResult.
+        Number of bags matching the filter
+
+        :param matched: The matched of this BagTasksResult.
+        :type: int
+        """
+        self._matched = matched
+
+    @property
+    def created(self):
+        """
+        Gets the created of this BagTasksResult.
+        Number of tasks created
+
+        :return: The created of this BagTasksResult.
+        :rtype: int
+        """
+        return self._created
+
+    @created.setter
+    def created(self, created):
+        """
+        Sets the created of this BagTasksResult.
+        Number of tasks created
+
+        :param created: The created of this BagTasksResult.
+        :type: int
+        """
+        self._created = created
+
+    @property
+    def skipped(self):
+        """
+        Gets the skipped of this BagTasksResult.
+        Number of bags skipped because an equal task is not finished yet
+
+        :return: The skipped of this BagTasksResult.
+        :rtype: int
+        """
+        return self._skipped
+
+    @skipped.setter
+    def skipped(self, skipped):
+        """
+        Sets the skipped of this BagTasksResult.
+        Number of bags skipped because an equal task is not finished yet
+
+        :param skipped: The skipped of this BagTasksResult.
+        :type: int
+        """
+        self._skipped = skipped
+
+    @property
+    def dry_run(self):
+        """
+        Gets the dry_run of this BagTasksResult.
+        No tasks were created, created counts the tasks that would be created
+
+        :return: The dry_run of this BagTasksResult.
+        :rtype: bool
+        """
+        return self._dry_run
+
+    @dry_run.setter
+    def dry_run(self, dry_run):
+        """
+        Sets the dry_run of this BagTasksResult.
+        No tasks were created, created counts the tasks that would be created
+
+        :param dry_run: The dry_run of this BagTasksResult.
+        :type: bool
+        """
+        self._dry_run = dry_run
+
+    def to_dict(self):
+        """
+        Returns the model properties as a dict
+        """
+        result = {}
+
+        for attr, _ in iteritems(self.swagger_types):
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                result[attr] = list(map(
+                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
+                    value
+                ))
+            elif hasattr(value, "to_dict"):
+                result[attr] = value.to_dict()
+            elif isinstance(value, dict):
+                result[attr] = dict(map(
+                    lambda item: (item[0], item[1].to_dict())
+                    if hasattr(item[1], "to_dict") else item,
+                    value.items()
+                ))
+            else:
+                result[attr] = value
+
+        return result
+
+    def to_str(self):
+        """
+        Returns the string representation of the model
+        """
+        return pformat(self.to_dict())
+
+    def __repr__(self):
+        """
+        For `print` and `pprint`
+        """
+        return self.to_str()
+
+    def __eq__(self, other):
+        """
+        Returns true if both objects are equal
+        """
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        """
+        Returns true if both objects are not equal
+        """
+        return not self == other
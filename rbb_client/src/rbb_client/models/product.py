@@ -143,7 +143,7 @@ class Product(object):
     def product_data(self):
         """
         Gets the product_data of this Product.
-        Product data
+        Product data, left out when only the product headers are requested
 
         :return: The product_data of this Product.
         :rtype: object
@@ -154,7 +154,7 @@ class Product(object):
     def product_data(self, product_data):
         """
         Sets the product_data of this Product.
-        Product data
+        Product data, left out when only the product headers are requested
 
         :param product_data: The product_data of this Product.
         :type: object
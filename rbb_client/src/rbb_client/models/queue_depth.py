@@ -0,0 +1,169 @@
+# coding: utf-8
+
+"""
+Copyright 2016 SmartBear Software
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Ref: https://github.com/swagger-api/swagger-codegen
+"""
+
+from pprint import pformat
+from six import iteritems
+
+
+class QueueDepth(object):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    def __init__(self):
+        """
+        QueueDepth - a model defined in Swagger
+
+        :param dict swaggerTypes: The key is attribute name
+                                  and the value is attribute type.
+        :param dict attributeMap: The key is attribute name
+                                  and the value is json key in definition.
+        """
+        self.swagger_types = {
+            'task': 'str',
+            'state': 'int',
+            'count': 'int'
+        }
+
+        self.attribute_map = {
+            'task': 'task',
+            'state': 'state',
+            'count': 'count'
+        }
+
+        self._task = None
+        self._state = None
+        self._count = None
+
+    @property
+    def task(self):
+        """
+        Gets the task of this QueueDepth.
+        Name of the task
+
+        :return: The task of this QueueDepth.
+        :rtype: str
+        """
+        return self._task
+
+    @task.setter
+    def task(self, task):
+        """
+        Sets the task of this QueueDepth.
+        Name of the task
+
+        :param task: The task of this QueueDepth.
+        :type: str
+        """
+        self._task = task
+
+    @property
+    def state(self):
+        """
+        Gets the state of this QueueDepth.
+        State of the tasks
+
+        :return: The state of this QueueDepth.
+        :rtype: int
+        """
+        return self._state
+
+    @state.setter
+    def state(self, state):
+        """
+        Sets the state of this QueueDepth.
+        State of the tasks
+
+        :param state: The state of this QueueDepth.
+        :type: int
+        """
+        self._state = state
+
+    @property
+    def count(self):
+        """
+        Gets the count of this QueueDepth.
+        Number of tasks
+
+        :return: The count of this QueueDepth.
+        :rtype: int
+        """
+        return self._count
+
+    @count.setter
+    def count(self, count):
+        """
+        Sets the count of this QueueDepth.
+        Number of tasks
+
+        :param count: The count of this QueueDepth.
+        :type: int
+        """
+        self._count = count
+
+    def to_dict(self):
+        """
+        Returns the model properties as a dict
+        """
+        result = {}
+
+        for attr, _ in iteritems(self.swagger_types):
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                result[attr] = list(map(
+                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
+                    value
+                ))
+            elif hasattr(value, "to_dict"):
+                result[attr] = value.to_dict()
+            elif isinstance(value, dict):
+                result[attr] = dict(map(
+                    lambda item: (item[0], item[1].to_dict())
+                    if hasattr(item[1], "to_dict") else item,
+                    value.items()
+                ))
+            else:
+                result[attr] = value
+
+        return result
+
+    def to_str(self):
+        """
+        Returns the string representation of the model
+        """
+        return pformat(self.to_dict())
+
+    def __repr__(self):
+        """
+        For `print` and `pprint`
+        """
+        return self.to_str()
+
+    def __eq__(self, other):
+        """
+        Returns true if both objects are equal
+        """
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        """
+        Returns true if both objects are not equal
+        """
+        return not self == other
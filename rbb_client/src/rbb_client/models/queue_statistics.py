@@ -0,0 +1,219 @@
+# coding: utf-8
+
+"""
+Copyright 2016 SmartBear Software
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Ref: https://github.com/swagger-api/swagger-codegen
+"""
+
+from pprint import pformat
+from six import iteritems
+
+
+class QueueStatistics(object):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    def __init__(self):
+        """
+        QueueStatistics - a model defined in Swagger
+
+        :param dict swaggerTypes: The key is attribute name
+                                  and the value is attribute type.
+        :param dict attributeMap: The key is attribute name
+                                  and the value is json key in definition.
+        """
+        self.swagger_types = {
+            'window': 'int',
+            'depth': 'list[QueueDepth]',
+            'tasks': 'list[TaskTypeStatistics]',
+            'workers': 'list[WorkerStatistics]',
+            'suggested_workers': 'int'
+        }
+
+        self.attribute_map = {
+            'window': 'window',
+            'depth': 'depth',
+            'tasks': 'tasks',
+            'workers': 'workers',
+            'suggested_workers': 'suggested_workers'
+        }
+
+        self._window = None
+        self._depth = None
+        self._tasks = None
+        self._workers = None
+        self._suggested_workers = None
+
+    @property
+    def window(self):
+        """
+        Gets the window of this QueueStatistics.
+        Length of the window in seconds
+
+        :return: The window of this QueueStatistics.
+        :rtype: int
+        """
+        return self._window
+
+    @window.setter
+    def window(self, window):
+        """
+        Sets the window of this QueueStatistics.
+        Length of the window in seconds
+
+        :param window: The window of this QueueStatistics.
+        :type: int
+        """
+        self._window = window
+
+    @property
+    def depth(self):
+        """
+        Gets the depth of this QueueStatistics.
+        Number of unfinished tasks per task and state
+
+        :return: The depth of this QueueStatistics.
+        :rtype: list[QueueDepth]
+        """
+        return self._depth
+
+    @depth.setter
+    def depth(self, depth):
+        """
+        Sets the depth of this QueueStatistics.
+        Number of unfinished tasks per task and state
+
+        :param depth: The depth of this QueueStatistics.
+        :type: list[QueueDepth]
+        """
+        self._depth = depth
+
+    @property
+    def tasks(self):
+        """
+        Gets the tasks of this QueueStatistics.
+        Statistics per task over the window
+
+        :return: The tasks of this QueueStatistics.
+        :rtype: list[TaskTypeStatistics]
+        """
+        return self._tasks
+
+    @tasks.setter
+    def tasks(self, tasks):
+        """
+        Sets the tasks of this QueueStatistics.
+        Statistics per task over the window
+
+        :param tasks: The tasks of this QueueStatistics.
+        :type: list[TaskTypeStatistics]
+        """
+        self._tasks = tasks
+
+    @property
+    def workers(self):
+        """
+        Gets the workers of this QueueStatistics.
+        Throughput per worker over the window
+
+        :return: The workers of this QueueStatistics.
+        :rtype: list[WorkerStatistics]
+        """
+        return self._workers
+
+    @workers.setter
+    def workers(self, workers):
+        """
+        Sets the workers of this QueueStatistics.
+        Throughput per worker over the window
+
+        :param workers: The workers of this QueueStatistics.
+        :type: list[WorkerStatistics]
+        """
+        self._workers = workers
+
+    @property
+    def suggested_workers(self):
+        """
+        Gets the suggested_workers of this QueueStatistics.
+        Number of workers needed to keep up with the load of the window and to work off the queued tasks within one window
+
+        :return: The suggested_workers of this QueueStatistics.
+        :rtype: int
+        """
+        return self._suggested_workers
+
+    @suggested_workers.setter
+    def suggested_workers(self, suggested_workers):
+        """
+        Sets the suggested_workers of this QueueStatistics.
+        Number of workers needed to keep up with the load of the window and to work off the queued tasks within one window
+
+        :param suggested_workers: The suggested_workers of this QueueStatistics.
+        :type: int
+        """
+        self._suggested_workers = suggested_workers
+
+    def to_dict(self):
+        """
+        Returns the model properties as a dict
+        """
+        result = {}
+
+        for attr, _ in iteritems(self.swagger_types):
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                result[attr] = list(map(
+                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
+                    value
+                ))
+            elif hasattr(value, "to_dict"):
+                result[attr] = value.to_dict()
+            elif isinstance(value, dict):
+                result[attr] = dict(map(
+                    lambda item: (item[0], item[1].to_dict())
+                    if hasattr(item[1], "to_dict") else item,
+                    value.items()
+                ))
+            else:
+                result[attr] = value
+
+        return result
+
+    def to_str(self):
+        """
+        Returns the string representation of the model
+        """
+        return pformat(self.to_dict())
+
+    def __repr__(self):
+        """
+        For `print` and `pprint`
+        """
+        return self.to_str()
+
+    def __eq__(self, other):
+        """
+        Returns true if both objects are equal
+        """
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        """
+        Returns true if both objects are not equal
+        """
+        return not self == other
@@ -0,0 +1,144 @@
+# coding: utf-8
+
+"""
+Copyright 2016 SmartBear Software
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Ref: https://github.com/swagger-api/swagger-codegen
+"""
+
+from pprint import pformat
+from six import iteritems
+
+
+class StoredFile(object):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    def __init__(self):
+        """
+        StoredFile - a model defined in Swagger
+
+        :param dict swaggerTypes: The key is attribute name
+                                  and the value is attribute type.
+        :param dict attributeMap: The key is attribute name
+                                  and the value is json key in definition.
+        """
+        self.swagger_types = {
+            'name': 'str',
+            'store_data': 'object'
+        }
+
+        self.attribute_map = {
+            'name': 'name',
+            'store_data': 'store_data'
+        }
+
+        self._name = None
+        self._store_data = None
+
+    @property
+    def name(self):
+        """
+        Gets the name of this StoredFile.
+        Unique name of the file in the store, this becomes the name of the bag
+
+        :return: The name of this StoredFile.
+        :rtype: str
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """
+        Sets the name of this StoredFile.
+        Unique name of the file in the store, this becomes the name of the bag
+
+        :param name: The name of this StoredFile.
+        :type: str
+        """
+        self._name = name
+
+    @property
+    def store_data(self):
+        """
+        Gets the store_data of this StoredFile.
+        Data that is specific to the bag store type.
+
+        :return: The store_data of this StoredFile.
+        :rtype: object
+        """
+        return self._store_data
+
+    @store_data.setter
+    def store_data(self, store_data):
+        """
+        Sets the store_data of this StoredFile.
+        Data that is specific to the bag store type.
+
+        :param store_data: The store_data of this StoredFile.
+        :type: object
+        """
+        self._store_data = store_data
+
+    def to_dict(self):
+        """
+        Returns the model properties as a dict
+        """
+        result = {}
+
+        for attr, _ in iteritems(self.swagger_types):
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                result[attr] = list(map(
+                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
+                    value
+                ))
+            elif hasattr(value, "to_dict"):
+                result[attr] = value.to_dict()
+            elif isinstance(value, dict):
+                result[attr] = dict(map(
+                    lambda item: (item[0], item[1].to_dict())
+                    if hasattr(item[1], "to_dict") else item,
+                    value.items()
+                ))
+            else:
+                result[attr] = value
+
+        return result
+
+    def to_str(self):
+        """
+        Returns the string representation of the model
+        """
+        return pformat(self.to_dict())
+
+    def __repr__(self):
+        """
+        For `print` and `pprint`
+        """
+        return self.to_str()
+
+    def __eq__(self, other):
+        """
+        Returns true if both objects are equal
+        """
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        """
+        Returns true if both objects are not equal
+        """
+        return not self == other
@@ -49,6 +49,7 @@ class TaskDetailed(object):
             'success': 'bool',
             'runtime': 'float',
             'worker_labels': 'str',
+            'expected_runtime': 'float',
             'config': 'object',
             'result': 'object',
             'log': 'str'
@@ -67,6 +68,7 @@ class TaskDetailed(object):
             'success': 'success',
             'runtime': 'runtime',
             'worker_labels': 'worker_labels',
+            'expected_runtime': 'expected_runtime',
             'config': 'config',
             'result': 'result',
             'log': 'log'
@@ -84,6 +86,7 @@ class TaskDetailed(object):
         self._success = None
         self._runtime = None
         self._worker_labels = None
+        self._expected_runtime = None
         self._config = None
         self._result = None
         self._log = None
@@ -334,7 +337,7 @@ class TaskDetailed(object):
     def worker_labels(self):
         """
         Gets the worker_labels of this TaskDetailed.
-        Worker that can take this task.
+        Comma separated labels a worker needs to take this task.
 
         :return: The worker_labels of this TaskDetailed.
         :rtype: str
@@ -345,13 +348,35 @@ class TaskDetailed(object):
     def worker_labels(self, worker_labels):
         """
         Sets the worker_labels of this TaskDetailed.
-        Worker that can take this task.
+        Comma separated labels a worker needs to take this task.
 
         :param worker_labels: The worker_labels of this TaskDetailed.
         :type: str
         """
         self._worker_labels = worker_labels
 
+    @property
+    def expected_runtime(self):
+        """
+        Gets the expected_runtime of this TaskDetailed.
+        Expected runtime in seconds, estimated from the earlier runs of the task type. Only for unfinished tasks.
+
+        :return: The expected_runtime of this TaskDetailed.
+        :rtype: float
+        """
+        return self._expected_runtime
+
+    @expected_runtime.setter
+    def expected_runtime(self, expected_runtime):
+        """
+        Sets the expected_runtime of this TaskDetailed.
+        Expected runtime in seconds, estimated from the earlier runs of the task type. Only for unfinished tasks.
+
+        :param expected_runtime: The expected_runtime of this TaskDetailed.
+        :type: float
+        """
+        self._expected_runtime = expected_runtime
+
     @property
     def config(self):
         """
@@ -400,7 +425,7 @@ class TaskDetailed(object):
     def log(self):
         """
         Gets the log of this TaskDetailed.
-        Standard output of the task
+        Standard output of the task, only included on request
 
         :return: The log of this TaskDetailed.
         :rtype: str
@@ -411,7 +436,7 @@ class TaskDetailed(object):
     def log(self, log):
         """
         Sets the log of this TaskDetailed.
-        Standard output of the task
+        Standard output of the task, only included on request
 
         :param log: The log of this TaskDetailed.
         :type: str
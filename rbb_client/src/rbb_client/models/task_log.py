@@ -0,0 +1,194 @@
+# coding: utf-8
+
+"""
+Copyright 2016 SmartBear Software
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Ref: https://github.com/swagger-api/swagger-codegen
+"""
+
+from pprint import pformat
+from six import iteritems
+
+
+class TaskLog(object):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    def __init__(self):
+        """
+        TaskLog - a model defined in Swagger
+
+        :param dict swaggerTypes: The key is attribute name
+                                  and the value is attribute type.
+        :param dict attributeMap: The key is attribute name
+                                  and the value is json key in definition.
+        """
+        self.swagger_types = {
+            'offset': 'int',
+            'next_offset': 'int',
+            'size': 'int',
+            'log': 'str'
+        }
+
+        self.attribute_map = {
+            'offset': 'offset',
+            'next_offset': 'next_offset',
+            'size': 'size',
+            'log': 'log'
+        }
+
+        self._offset = None
+        self._next_offset = None
+        self._size = None
+        self._log = None
+
+    @property
+    def offset(self):
+        """
+        Gets the offset of this TaskLog.
+        Byte position of the returned text in the log
+
+        :return: The offset of this TaskLog.
+        :rtype: int
+        """
+        return self._offset
+
+    @offset.setter
+    def offset(self, offset):
+        """
+        Sets the offset of this TaskLog.
+        Byte position of the returned text in the log
+
+        :param offset: The offset of this TaskLog.
+        :type: int
+        """
+        self._offset = offset
+
+    @property
+    def next_offset(self):
+        """
+        Gets the next_offset of this TaskLog.
+        Byte position to continue reading
+
+        :return: The next_offset of this TaskLog.
+        :rtype: int
+        """
+        return self._next_offset
+
+    @next_offset.setter
+    def next_offset(self, next_offset):
+        """
+        Sets the next_offset of this TaskLog.
+        Byte position to continue reading
+
+        :param next_offset: The next_offset of this TaskLog.
+        :type: int
+        """
+        self._next_offset = next_offset
+
+    @property
+    def size(self):
+        """
+        Gets the size of this TaskLog.
+        Size of the complete log in bytes
+
+        :return: The size of this TaskLog.
+        :rtype: int
+        """
+        return self._size
+
+    @size.setter
+    def size(self, size):
+        """
+        Sets the size of this TaskLog.
+        Size of the complete log in bytes
+
+        :param size: The size of this TaskLog.
+        :type: int
+        """
+        self._size = size
+
+    @property
+    def log(self):
+        """
+        Gets the log of this TaskLog.
+        Part of the log
+
+        :return: The log of this TaskLog.
+        :rtype: str
+        """
+        return self._log
+
+    @log.setter
+    def log(self, log):
+        """
+        Sets the log of this TaskLog.
+        Part of the log
+
+        :param log: The log of this TaskLog.
+        :type: str
+        """
+        self._log = log
+
+    def to_dict(self):
+        """
+        Returns the model properties as a dict
+        """
+        result = {}
+
+        for attr, _ in iteritems(self.swagger_types):
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                result[attr] = list(map(
+                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
+                    value
+                ))
+            elif hasattr(value, "to_dict"):
+                result[attr] = value.to_dict()
+            elif isinstance(value, dict):
+                result[attr] = dict(map(
+                    lambda item: (item[0], item[1].to_dict())
+                    if hasattr(item[1], "to_dict") else item,
+                    value.items()
+                ))
+            else:
+                result[attr] = value
+
+        return result
+
+    def to_str(self):
+        """
+        Returns the string representation of the model
+        """
+        return pformat(self.to_dict())
+
+    def __repr__(self):
+        """
+        For `print` and `pprint`
+        """
+        return self.to_str()
+
+    def __eq__(self, other):
+        """
+        Returns true if both objects are equal
+        """
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        """
+        Returns true if both objects are not equal
+        """
+        return not self == other
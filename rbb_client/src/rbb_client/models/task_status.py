@@ -0,0 +1,169 @@
+# coding: utf-8
+
+"""
+Copyright 2016 SmartBear Software
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Ref: https://github.com/swagger-api/swagger-codegen
+"""
+
+from pprint import pformat
+from six import iteritems
+
+
+class TaskStatus(object):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    def __init__(self):
+        """
+        TaskStatus - a model defined in Swagger
+
+        :param dict swaggerTypes: The key is attribute name
+                                  and the value is attribute type.
+        :param dict attributeMap: The key is attribute name
+                                  and the value is json key in definition.
+        """
+        self.swagger_types = {
+            'state': 'int',
+            'cancellation_requested': 'bool',
+            'lease_lost': 'bool'
+        }
+
+        self.attribute_map = {
+            'state': 'state',
+            'cancellation_requested': 'cancellation_requested',
+            'lease_lost': 'lease_lost'
+        }
+
+        self._state = None
+        self._cancellation_requested = None
+        self._lease_lost = None
+
+    @property
+    def state(self):
+        """
+        Gets the state of this TaskStatus.
+        State of the task.
+
+        :return: The state of this TaskStatus.
+        :rtype: int
+        """
+        return self._state
+
+    @state.setter
+    def state(self, state):
+        """
+        Sets the state of this TaskStatus.
+        State of the task.
+
+        :param state: The state of this TaskStatus.
+        :type: int
+        """
+        self._state = state
+
+    @property
+    def cancellation_requested(self):
+        """
+        Gets the cancellation_requested of this TaskStatus.
+        The worker should stop the task, it was cancelled or given to another worker
+
+        :return: The cancellation_requested of this TaskStatus.
+        :rtype: bool
+        """
+        return self._cancellation_requested
+
+    @cancellation_requested.setter
+    def cancellation_requested(self, cancellation_requested):
+        """
+        Sets the cancellation_requested of this TaskStatus.
+        The worker should stop the task, it was cancelled or given to another worker
+
+        :param cancellation_requested: The cancellation_requested of this TaskStatus.
+        :type: bool
+        """
+        self._cancellation_requested = cancellation_requested
+
+    @property
+    def lease_lost(self):
+        """
+        Gets the lease_lost of this TaskStatus.
+        The task was given to another worker or failed, the worker should discard its result and log
+
+        :return: The lease_lost of this TaskStatus.
+        :rtype: bool
+        """
+        return self._lease_lost
+
+    @lease_lost.setter
+    def lease_lost(self, lease_lost):
+        """
+        Sets the lease_lost of this TaskStatus.
+        The task was given to another worker or failed, the worker should discard its result and log
+
+        :param lease_lost: The lease_lost of this TaskStatus.
+        :type: bool
+        """
+        self._lease_lost = lease_lost
+
+    def to_dict(self):
+        """
+        Returns the model properties as a dict
+        """
+        result = {}
+
+        for attr, _ in iteritems(self.swagger_types):
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                result[attr] = list(map(
+                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
+                    value
+                ))
+            elif hasattr(value, "to_dict"):
+                result[attr] = value.to_dict()
+            elif isinstance(value, dict):
+                result[attr] = dict(map(
+                    lambda item: (item[0], item[1].to_dict())
+                    if hasattr(item[1], "to_dict") else item,
+                    value.items()
+                ))
+            else:
+                result[attr] = value
+
+        return result
+
+    def to_str(self):
+        """
+        Returns the string representation of the model
+        """
+        return pformat(self.to_dict())
+
+    def __repr__(self):
+        """
+        For `print` and `pprint`
+        """
+        return self.to_str()
+
+    def __eq__(self, other):
+        """
+        Returns true if both objects are equal
+        """
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        """
+        Returns true if both objects are not equal
+        """
+        return not self == other
@@ -48,7 +48,8 @@ class TaskSummary(object):
             'task': 'str',
             'success': 'bool',
             'runtime': 'float',
-            'worker_labels': 'str'
+            'worker_labels': 'str',
+            'expected_runtime': 'float'
         }
 
         self.attribute_map = {
@@ -63,7 +64,8 @@ class TaskSummary(object):
             'task': 'task',
             'success': 'success',
             'runtime': 'runtime',
-            'worker_labels': 'worker_labels'
+            'worker_labels': 'worker_labels',
+            'expected_runtime': 'expected_runtime'
         }
 
         self._detail_type = None
@@ -78,6 +80,7 @@ class TaskSummary(object):
         self._success = None
         self._runtime = None
         self._worker_labels = None
+        self._expected_runtime = None
 
     @property
     def detail_type(self):
@@ -325,7 +328,7 @@ class TaskSummary(object):
     def worker_labels(self):
         """
         Gets the worker_labels of this TaskSummary.
-        Worker that can take this task.
+        Comma separated labels a worker needs to take this task.
 
         :return: The worker_labels of this TaskSummary.
         :rtype: str
@@ -336,13 +339,35 @@ class TaskSummary(object):
     def worker_labels(self, worker_labels):
         """
         Sets the worker_labels of this TaskSummary.
-        Worker that can take this task.
+        Comma separated labels a worker needs to take this task.
 
         :param worker_labels: The worker_labels of this TaskSummary.
         :type: str
         """
         self._worker_labels = worker_labels
 
+    @property
+    def expected_runtime(self):
+        """
+        Gets the expected_runtime of this TaskSummary.
+        Expected runtime in seconds, estimated from the earlier runs of the task type. Only for unfinished tasks.
+
+        :return: The expected_runtime of this TaskSummary.
+        :rtype: float
+        """
+        return self._expected_runtime
+
+    @expected_runtime.setter
+    def expected_runtime(self, expected_runtime):
+        """
+        Sets the expected_runtime of this TaskSummary.
+        Expected runtime in seconds, estimated from the earlier runs of the task type. Only for unfinished tasks.
+
+        :param expected_runtime: The expected_runtime of this TaskSummary.
+        :type: float
+        """
+        self._expected_runtime = expected_runtime
+
     def to_dict(self):
         """
         Returns the model properties as a dict
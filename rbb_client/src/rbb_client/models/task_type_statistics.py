@@ -0,0 +1,344 @@
+# coding: utf-8
+
+"""
+Copyright 2016 SmartBear Software
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Ref: https://github.com/swagger-api/swagger-codegen
+"""
+
+from pprint import pformat
+from six import iteritems
+
+
+class TaskTypeStatistics(object):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    def __init__(self):
+        """
+        TaskTypeStatistics - a model defined in Swagger
+
+        :param dict swaggerTypes: The key is attribute name
+                                  and the value is attribute type.
+        :param dict attributeMap: The key is attribute name
+                                  and the value is json key in definition.
+        """
+        self.swagger_types = {
+            'task': 'str',
+            'finished': 'int',
+            'succeeded': 'int',
+            'wait_time_p50': 'float',
+            'wait_time_p90': 'float',
+            'wait_time_p99': 'float',
+            'runtime_mean': 'float',
+            'runtime_p50': 'float',
+            'runtime_p90': 'float',
+            'runtime_p99': 'float'
+        }
+
+        self.attribute_map = {
+            'task': 'task',
+            'finished': 'finished',
+            'succeeded': 'succeeded',
+            'wait_time_p50': 'wait_time_p50',
+            'wait_time_p90': 'wait_time_p90',
+            'wait_time_p99': 'wait_time_p99',
+            'runtime_mean': 'runtime_mean',
+            'runtime_p50': 'runtime_p50',
+            'runtime_p90': 'runtime_p90',
+            'runtime_p99': 'runtime_p99'
+        }
+
+        self._task = None
+        self._finished = None
+        self._succeeded = None
+        self._wait_time_p50 = None
+        self._wait_time_p90 = None
+        self._wait_time_p99 = None
+        self._runtime_mean = None
+        self._runtime_p50 = None
+        self._runtime_p90 = None
+        self._runtime_p99 = None
+
+    @property
+    def task(self):
+        """
+        Gets the task of this TaskTypeStatistics.
+        Name of the task
+
+        :return: The task of this TaskTypeStatistics.
+        :rtype: str
+        """
+        return self._task
+
+    @task.setter
+    def task(self, task):
+        """
+        Sets the task of this TaskTypeStatistics.
+        Name of the task
+
+        :param task: The task of this TaskTypeStatistics.
+        :type: str
+        """
+        self._task = task
+
+    @property
+    def finished(self):
+        """
+        Gets the finished of this TaskTypeStatistics.
+        Number of tasks finished in the window
+
+        :return: The finished of this TaskTypeStatistics.
+        :rtype: int
+        """
+        return self._finished
+
+    @finished.setter
+    def finished(self, finished):
+        """
+        Sets the finished of this TaskTypeStatistics.
+        Number of tasks finished in the window
+
+        :param finished: The finished of this TaskTypeStatistics.
+        :type: int
+        """
+        self._finished = finished
+
+    @property
+    def succeeded(self):
+        """
+        Gets the succeeded of this TaskTypeStatistics.
+        Number of tasks finished successfully in the window
+
+        :return: The succeeded of this TaskTypeStatistics.
+        :rtype: int
+        """
+        return self._succeeded
+
+    @succeeded.setter
+    def succeeded(self, succeeded):
+        """
+        Sets the succeeded of this TaskTypeStatistics.
+        Number of tasks finished successfully in the window
+
+        :param succeeded: The succeeded of this TaskTypeStatistics.
+        :type: int
+        """
+        self._succeeded = succeeded
+
+    @property
+    def wait_time_p50(self):
+        """
+        Gets the wait_time_p50 of this TaskTypeStatistics.
+        Median seconds from creation until a worker started the task, over the tasks started in the window
+
+        :return: The wait_time_p50 of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._wait_time_p50
+
+    @wait_time_p50.setter
+    def wait_time_p50(self, wait_time_p50):
+        """
+        Sets the wait_time_p50 of this TaskTypeStatistics.
+        Median seconds from creation until a worker started the task, over the tasks started in the window
+
+        :param wait_time_p50: The wait_time_p50 of this TaskTypeStatistics.
+        :type: float
+        """
+        self._wait_time_p50 = wait_time_p50
+
+    @property
+    def wait_time_p90(self):
+        """
+        Gets the wait_time_p90 of this TaskTypeStatistics.
+        90th percentile of the wait time in seconds
+
+        :return: The wait_time_p90 of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._wait_time_p90
+
+    @wait_time_p90.setter
+    def wait_time_p90(self, wait_time_p90):
+        """
+        Sets the wait_time_p90 of this TaskTypeStatistics.
+        90th percentile of the wait time in seconds
+
+        :param wait_time_p90: The wait_time_p90 of this TaskTypeStatistics.
+        :type: float
+        """
+        self._wait_time_p90 = wait_time_p90
+
+    @property
+    def wait_time_p99(self):
+        """
+        Gets the wait_time_p99 of this TaskTypeStatistics.
+        99th percentile of the wait time in seconds
+
+        :return: The wait_time_p99 of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._wait_time_p99
+
+    @wait_time_p99.setter
+    def wait_time_p99(self, wait_time_p99):
+        """
+        Sets the wait_time_p99 of this TaskTypeStatistics.
+        99th percentile of the wait time in seconds
+
+        :param wait_time_p99: The wait_time_p99 of this TaskTypeStatistics.
+        :type: float
+        """
+        self._wait_time_p99 = wait_time_p99
+
+    @property
+    def runtime_mean(self):
+        """
+        Gets the runtime_mean of this TaskTypeStatistics.
+        Mean runtime in seconds of the tasks finished in the window
+
+        :return: The runtime_mean of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._runtime_mean
+
+    @runtime_mean.setter
+    def runtime_mean(self, runtime_mean):
+        """
+        Sets the runtime_mean of this TaskTypeStatistics.
+        Mean runtime in seconds of the tasks finished in the window
+
+        :param runtime_mean: The runtime_mean of this TaskTypeStatistics.
+        :type: float
+        """
+        self._runtime_mean = runtime_mean
+
+    @property
+    def runtime_p50(self):
+        """
+        Gets the runtime_p50 of this TaskTypeStatistics.
+        Median runtime in seconds of the tasks finished in the window
+
+        :return: The runtime_p50 of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._runtime_p50
+
+    @runtime_p50.setter
+    def runtime_p50(self, runtime_p50):
+        """
+        Sets the runtime_p50 of this TaskTypeStatistics.
+        Median runtime in seconds of the tasks finished in the window
+
+        :param runtime_p50: The runtime_p50 of this TaskTypeStatistics.
+        :type: float
+        """
+        self._runtime_p50 = runtime_p50
+
+    @property
+    def runtime_p90(self):
+        """
+        Gets the runtime_p90 of this TaskTypeStatistics.
+        90th percentile of the runtime in seconds
+
+        :return: The runtime_p90 of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._runtime_p90
+
+    @runtime_p90.setter
+    def runtime_p90(self, runtime_p90):
+        """
+        Sets the runtime_p90 of this TaskTypeStatistics.
+        90th percentile of the runtime in seconds
+
+        :param runtime_p90: The runtime_p90 of this TaskTypeStatistics.
+        :type: float
+        """
+        self._runtime_p90 = runtime_p90
+
+    @property
+    def runtime_p99(self):
+        """
+        Gets the runtime_p99 of this TaskTypeStatistics.
+        99th percentile of the runtime in seconds
+
+        :return: The runtime_p99 of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._runtime_p99
+
+    @runtime_p99.setter
+    def runtime_p99(self, runtime_p99):
+        """
+        Sets the runtime_p99 of this TaskTypeStatistics.
+        99th percentile of the runtime in seconds
+
+        :param runtime_p99: The runtime_p99 of this TaskTypeStatistics.
+        :type: float
+        """
+        self._runtime_p99 = runtime_p99
+
+    def to_dict(self):
+        """
+        Returns the model properties as a dict
+        """
+        result = {}
+
+        for attr, _ in iteritems(self.swagger_types):
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                result[attr] = list(map(
+                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
+                    value
+                ))
+            elif hasattr(value, "to_dict"):
+                result[attr] = value.to_dict()
+            elif isinstance(value, dict):
+                result[attr] = dict(map(
+                    lambda item: (item[0], item[1].to_dict())
+                    if hasattr(item[1], "to_dict") else item,
+                    value.items()
+                ))
+            else:
+                result[attr] = value
+
+        return result
+
+    def to_str(self):
+        """
+        Returns the string representation of the model
+        """
+        return pformat(self.to_dict())
+
+    def __repr__(self):
+        """
+        For `print` and `pprint`
+        """
+        return self.to_str()
+
+    def __eq__(self, other):
+        """
+        Returns true if both objects are equal
+        """
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        """
+        Returns true if both objects are not equal
+        """
+        return not self == other
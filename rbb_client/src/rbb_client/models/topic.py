@@ -131,7 +131,7 @@ class Topic(object):
     def msg_definition(self):
         """
         Gets the msg_definition of this Topic.
-        Definition of custom messages.
+        Definition of custom messages. Left out when requested without msg_definitions.
 
         :return: The msg_definition of this Topic.
         :rtype: str
@@ -142,7 +142,7 @@ class Topic(object):
     def msg_definition(self, msg_definition):
         """
         Sets the msg_definition of this Topic.
-        Definition of custom messages.
+        Definition of custom messages. Left out when requested without msg_definitions.
 
         :param msg_definition: The msg_definition of this Topic.
         :type: str
@@ -0,0 +1,194 @@
+# coding: utf-8
+
+"""
+Copyright 2016 SmartBear Software
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Ref: https://github.com/swagger-api/swagger-codegen
+"""
+
+from pprint import pformat
+from six import iteritems
+
+
+class WorkerStatistics(object):
+    """
+    NOTE: This class is auto generated by the swagger code generator program.
+    Do not edit the class manually.
+    """
+    def __init__(self):
+        """
+        WorkerStatistics - a model defined in Swagger
+
+        :param dict swaggerTypes: The key is attribute name
+                                  and the value is attribute type.
+        :param dict attributeMap: The key is attribute name
+                                  and the value is json key in definition.
+        """
+        self.swagger_types = {
+            'worker': 'str',
+            'finished': 'int',
+            'succeeded': 'int',
+            'busy': 'float'
+        }
+
+        self.attribute_map = {
+            'worker': 'worker',
+            'finished': 'finished',
+            'succeeded': 'succeeded',
+            'busy': 'busy'
+        }
+
+        self._worker = None
+        self._finished = None
+        self._succeeded = None
+        self._busy = None
+
+    @property
+    def worker(self):
+        """
+        Gets the worker of this WorkerStatistics.
+        Name of the worker
+
+        :return: The worker of this WorkerStatistics.
+        :rtype: str
+        """
+        return self._worker
+
+    @worker.setter
+    def worker(self, worker):
+        """
+        Sets the worker of this WorkerStatistics.
+        Name of the worker
+
+        :param worker: The worker of this WorkerStatistics.
+        :type: str
+        """
+        self._worker = worker
+
+    @property
+    def finished(self):
+        """
+        Gets the finished of this WorkerStatistics.
+        Number of tasks the worker finished in the window
+
+        :return: The finished of this WorkerStatistics.
+        :rtype: int
+        """
+        return self._finished
+
+    @finished.setter
+    def finished(self, finished):
+        """
+        Sets the finished of this WorkerStatistics.
+        Number of tasks the worker finished in the window
+
+        :param finished: The finished of this WorkerStatistics.
+        :type: int
+        """
+        self._finished = finished
+
+    @property
+    def succeeded(self):
+        """
+        Gets the succeeded of this WorkerStatistics.
+        Number of tasks the worker finished successfully in the window
+
+        :return: The succeeded of this WorkerStatistics.
+        :rtype: int
+        """
+        return self._succeeded
+
+    @succeeded.setter
+    def succeeded(self, succeeded):
+        """
+        Sets the succeeded of this WorkerStatistics.
+        Number of tasks the worker finished successfully in the window
+
+        :param succeeded: The succeeded of this WorkerStatistics.
+        :type: int
+        """
+        self._succeeded = succeeded
+
+    @property
+    def busy(self):
+        """
+        Gets the busy of this WorkerStatistics.
+        Fraction of the window the worker spent running the finished tasks
+
+        :return: The busy of this WorkerStatistics.
+        :rtype: float
+        """
+        return self._busy
+
+    @busy.setter
+    def busy(self, busy):
+        """
+        Sets the busy of this WorkerStatistics.
+        Fraction of the window the worker spent running the finished tasks
+
+        :param busy: The busy of this WorkerStatistics.
+        :type: float
+        """
+        self._busy = busy
+
+    def to_dict(self):
+        """
+        Returns the model properties as a dict
+        """
+        result = {}
+
+        for attr, _ in iteritems(self.swagger_types):
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                result[attr] = list(map(
+                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
+                    value
+                ))
+            elif hasattr(value, "to_dict"):
+                result[attr] = value.to_dict()
+            elif isinstance(value, dict):
+                result[attr] = dict(map(
+                    lambda item: (item[0], item[1].to_dict())
+                    if hasattr(item[1], "to_dict") else item,
+                    value.items()
+                ))
+            else:
+                result[attr] = value
+
+        return result
+
+    def to_str(self):
+        """
+        Returns the string representation of the model
+        """
+        return pformat(self.to_dict())
+
+    def __repr__(self):
+        """
+        For `print` and `pprint`
+        """
+        return self.to_str()
+
+    def __eq__(self, other):
+        """
+        Returns true if both objects are equal
+        """
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        """
+        Returns true if both objects are not equal
+        """
+        return not self == other
@@ -0,0 +1,44 @@
+# Configuration of the gunicorn production server, see run-server. The defaults can be changed with the environment
+# variables RBB_BIND, RBB_WORKERS, RBB_THREADS and RBB_MAX_DEQUEUE_WAITERS, the database connection pool with
+# RBB_DB_POOL_SIZE, RBB_DB_MAX_OVERFLOW, RBB_DB_POOL_RECYCLE, RBB_DB_POOL_PRE_PING and RBB_DB_STATEMENT_TIMEOUT.
+
+import os
+
+bind = os.getenv('RBB_BIND') or '0.0.0.0:8080'
+
+# Processes for the CPU bound work (serialization, hashing), threads because workers waiting for a task hold their
+# request open. Every thread holds at most one database connection, keep the pool size plus overflow at least
+# as large as the number of threads.
+workers = int(os.getenv('RBB_WORKERS') or 4)
+threads = int(os.getenv('RBB_THREADS') or 16)
+worker_class = 'gthread'
+
+# Workers waiting for a task hold a thread for up to 25 seconds. At most half of the threads of a process wait, the
+# other pollers get an empty answer right away and the API and UI keep their threads.
+os.environ.setdefault('RBB_MAX_DEQUEUE_WAITERS', str(max(1, threads // 2)))
+
+# Above the longest dequeue long poll
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+# Workers are replaced now and then, so slowly growing memory use does not build up
+max_requests = 10000
+max_requests_jitter = 1000
+
+# The application is loaded once before forking, the workers share its memory
+preload_app = True
+
+
+def post_fork(server, worker):
+    # The database engine was created before the fork, every worker opens its own connections
+    from rbb_server.model.database import Database
+    Database.dispose()
+
+
+def child_exit(server, worker):
+    # Counts of a replaced worker move to the retired total, its file is removed
+    metrics_directory = os.getenv('RBB_METRICS_DIR')
+    if metrics_directory:
+        from rbb_server.helper.metrics import RequestMetrics
+        RequestMetrics.retire(metrics_directory, worker.pid)
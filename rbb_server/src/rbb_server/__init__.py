@@ -27,6 +27,7 @@ import connexion
 from flask_cors import CORS
 from werkzeug.contrib.fixers import ProxyFix
 
+from rbb_server.helper import metrics
 from rbb_server.model.database import Database
 from rbb_swagger_server.encoder import JSONEncoder
 
@@ -50,6 +51,9 @@ if "RBB_BEHIND_PROXY" in os.environ and os.environ["RBB_BEHIND_PROXY"]:
 # Setup link to the database
 Database.init()
 
+# Request latency and SQL statement metrics on /metrics
+metrics.init_app(app.app, Database.get_engine())
+
 @app.app.teardown_appcontext
 def shutdown_session(exception=None):
     Database.get_session().remove()
@@ -28,6 +28,7 @@ import connexion
 from flask_cors import CORS
 from werkzeug.contrib.fixers import ProxyFix
 
+from rbb_server.helper import metrics
 from rbb_server.model.database import Database
 from rbb_swagger_server.encoder import JSONEncoder
 
@@ -64,6 +65,9 @@ if __name__ == '__main__':
     # Setup link to the database
     Database.init(debug=debug_database)
 
+    # Request latency and SQL statement metrics on /metrics, in debug mode slow requests are logged
+    metrics.init_app(app.app, Database.get_engine(), debug=debug_database)
+
     @app.app.teardown_appcontext
     def shutdown_session(exception=None):
         logging.info("Shutdown session...")
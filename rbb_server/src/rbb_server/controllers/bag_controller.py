@@ -27,35 +27,57 @@ import rbb_server.helper.auth as auth
 import rbb_server.helper.database as db_helper
 from flask import redirect
 from rbb_server.helper.error import handle_exception
-from sqlalchemy import and_
+from sqlalchemy import and_, func, null, or_, select, union_all
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm.query import Query
 
-from rbb_server.helper.permissions import Permissions
-from rbb_server.model.database import Database, RosbagStore, Rosbag, RosbagTopic, RosbagProduct, Tag
+from rbb_server.helper.permissions import Permissions, has_permission
+from rbb_server.model.database import Database, File, MessageDefinition, RosbagStore, Rosbag, RosbagTopic, \
+    RosbagProduct, Tag
+from rbb_server.model.rosbag import tag_association_table
 from rbb_server.model.rosbag_comment import RosbagComment
 from rbb_server.model.task import Task, TaskState
 from rbb_server.hooks.new_bag_hook import NewBagHook
 from rbb_server.helper.storage import Storage
 from rbb_swagger_server.models.bag_detailed import BagDetailed
+from rbb_swagger_server.models.bag_registration import BagRegistration
+from rbb_swagger_server.models.bag_task_template import BagTaskTemplate
+from rbb_swagger_server.models.bag_tasks_result import BagTasksResult
+from rbb_swagger_server.models.bag_facets import BagFacets
 from rbb_swagger_server.models.comment import Comment
 from rbb_swagger_server.models.error import Error
+from rbb_swagger_server.models.product import Product
+from rbb_swagger_server.models.stored_file import StoredFile
 from rbb_swagger_server.models.tag import Tag as SwaggerTag
+from rbb_swagger_server.models.tag_facet import TagFacet
 
+# Static paths next to /stores/{store_name}/bags/{bag_name}, a bag with one of these names could not be downloaded
+RESERVED_BAG_NAMES = ("facets", "tasks")
 
-def find_bag_in_database(session, store_name, bag_name):
-    q = session.query(RosbagStore).filter(RosbagStore.name == store_name)  # type: Query
-    if q.count() == 0:
-        return None, Error(code=404, message="Store not found")
-    store = q[0]
 
-    q = session.query(Rosbag).filter(
-        and_(Rosbag.store_id == store.uid, Rosbag.name == bag_name)
-    )  # type: Query
+def find_store_and_bag_in_database(session, store_name, bag_name, options=()):
+    """Looks up a store and a bag in it with a single query, both are None if not found"""
+    q = session.query(RosbagStore, Rosbag)\
+        .outerjoin(Rosbag, and_(Rosbag.store_id == RosbagStore.uid, Rosbag.name == bag_name))\
+        .filter(RosbagStore.name == store_name)\
+        .options(*options)  # type: Query
+
+    result = q.first()
+    if result is None:
+        return None, None
+
+    return result
+
 
-    if q.count() == 0:
+def find_bag_in_database(session, store_name, bag_name, options=()):
+    store, bag = find_store_and_bag_in_database(session, store_name, bag_name, options)
+    if store is None:
+        return None, Error(code=404, message="Store not found")
+
+    if bag is None:
         return None, Error(code=404, message="Bag not found")
 
-    return q[0], None
+    return bag, None
 
 
 @auth.requires_auth_with_permission(Permissions.BagWrite)
@@ -214,7 +236,7 @@ def get_bag_tags(store_name, bag_name, user=None):
 
 
 @auth.requires_auth_with_permission(Permissions.BagWrite)
-def patch_bag_meta(store_name, bag_name, bag, trigger=None, user=None):  # noqa: E501
+def patch_bag_meta(store_name, bag_name, bag, trigger=None, detailed=None, user=None):  # noqa: E501
     """Partial update of bag information (this only supports a few fields)
 
      # noqa: E501
@@ -227,43 +249,53 @@ def patch_bag_meta(store_name, bag_name, bag, trigger=None, user=None):  # noqa:
     :type bag: dict | bytes
     :param trigger: Hooks to trigger
     :type trigger: str
+    :param detailed: Return the topics and products of the bag, true by default
+    :type detailed: bool
 
     :rtype: BagDetailed
     """
     if connexion.request.is_json:
         bag = connexion.request.get_json()
 
+    session = Database.get_session()
     try:
-        session = Database.get_session()
-        bag_model, e = find_bag_in_database(session, store_name, bag_name)
-        if e:
-            return e, e.code
+        return patch_bag_meta_inner(store_name, bag_name, bag, trigger, detailed, user)
+    except Exception as e:
+        session.rollback()
+        return handle_exception(e)
 
-        changed = False
 
-        if 'comment' in bag and isinstance(bag['comment'], str):
-            bag_model.comment = bag['comment']
-            changed = True
+def patch_bag_meta_inner(store_name, bag_name, bag, trigger=None, detailed=None, user=None):
+    session = Database.get_session()
+    bag_model, e = find_bag_in_database(session, store_name, bag_name)
+    if e:
+        return e, e.code
 
-        if 'extraction_failure' in bag:
-            bag_model.extraction_failure = bag['extraction_failure']
-            changed = True
+    changed = False
 
-        if 'in_trash' in bag:
-            bag_model.in_trash = bag['in_trash']
-            changed = True
+    if 'comment' in bag and isinstance(bag['comment'], str):
+        bag_model.comment = bag['comment']
+        changed = True
 
-        if changed:
-            session.commit()
+    if 'extraction_failure' in bag:
+        bag_model.extraction_failure = bag['extraction_failure']
+        changed = True
 
-        return bag_model.to_swagger_model_detailed(user=user)
+    if 'in_trash' in bag:
+        bag_model.in_trash = bag['in_trash']
+        changed = True
 
-    except Exception as e:
-        return handle_exception(e)
+    if changed:
+        session.commit()
+
+    # Callers that ignore the response skip loading every topic and product of the bag
+    if detailed is False:
+        return bag_model.to_swagger_model_summary(user=user)
+    return bag_model.to_swagger_model_detailed(user=user)
 
 
 @auth.requires_auth_with_permission(Permissions.BagRead)
-def get_bag_meta(store_name, bag_name, user=None):
+def get_bag_meta(store_name, bag_name, msg_definitions=None, product_data=None, user=None):
     """
     List products from bag
     
@@ -271,21 +303,158 @@ def get_bag_meta(store_name, bag_name, user=None):
     :type store_name: str
     :param bag_name: Name of the bag
     :type bag_name: str
+    :param msg_definitions: Include the message definitions of the topics (default)
+    :type msg_definitions: bool
+    :param product_data: Include the data of the products (default)
+    :type product_data: bool
 
     :rtype: BagDetailed
     """
     try:
-        session = Database.get_session()
-        bag_model, e = find_bag_in_database(session, store_name, bag_name)
-        if e:
-            return e, e.code
+        return get_bag_meta_inner(store_name, bag_name, msg_definitions, product_data, user)
+    except Exception as e:
+        return handle_exception(e)
+
+
+def get_bag_meta_inner(store_name, bag_name, msg_definitions=None, product_data=None, user=None):
+    session = Database.get_session()
+    msg_definitions = msg_definitions is None or bool(msg_definitions)
+    product_data = product_data is None or bool(product_data)
+
+    # Topics, products and files are loaded up front instead of lazily per product and file
+    bag_model, e = find_bag_in_database(session, store_name, bag_name,
+                                        Rosbag.detailed_query_options(user, msg_definitions, product_data))
+    if e:
+        return e, e.code
+
+    return bag_model.to_swagger_model_detailed(user=user, msg_definitions=msg_definitions,
+                                               product_data=product_data)
+
 
-        return bag_model.to_swagger_model_detailed(user=user)
+@auth.requires_auth_with_permission(Permissions.BagRead)
+def get_bag_product(store_name, bag_name, uid, user=None):
+    """
+    Get a product of a bag including its data
 
+    :param store_name: Name of the store
+    :type store_name: str
+    :param bag_name: Name of the bag
+    :type bag_name: str
+    :param uid: Unique identifier of the product
+    :type uid: int
+
+    :rtype: Product
+    """
+    try:
+        return get_bag_product_inner(store_name, bag_name, uid, user)
     except Exception as e:
         return handle_exception(e)
 
 
+def get_bag_product_inner(store_name, bag_name, uid, user=None):
+    session = Database.get_session()
+    bag_model, e = find_bag_in_database(session, store_name, bag_name)
+    if e:
+        return e, e.code
+
+    product = session.query(RosbagProduct)\
+        .filter(and_(RosbagProduct.bag_id == bag_model.uid, RosbagProduct.uid == uid))\
+        .options(*RosbagProduct.detailed_query_options())\
+        .first()
+    if product is None:
+        return Error(code=404, message="Product not found"), 404
+
+    return product.to_swagger_model_detailed(link_template=File.link_template())
+
+
+@auth.requires_auth_with_permission(Permissions.BagWrite)
+def patch_bag_products(store_name, bag_name, products, user=None):
+    """
+    Add products to a bag, existing products with the same configuration tag and rule are replaced
+
+    :param store_name: Name of the store
+    :type store_name: str
+    :param bag_name: Name of the bag
+    :type bag_name: str
+    :param products: Products to add or replace
+    :type products: list | bytes
+
+    :rtype: List[Product]
+    """
+    if connexion.request.is_json:
+        products = [Product.from_dict(d) for d in connexion.request.get_json()]
+
+    session = Database.get_session()
+    try:
+        return patch_bag_products_inner(store_name, bag_name, products, user)
+    except Exception as e:
+        session.rollback()
+        return handle_exception(e)
+
+
+def patch_bag_products_inner(store_name, bag_name, products, user=None):
+    session = Database.get_session()
+    bag_model, e = find_bag_in_database(session, store_name, bag_name)
+    if e:
+        return e, e.code
+
+    # Only the topics and files referenced by the new products are loaded, not the whole bag
+    topic_names = set()
+    for product in products:
+        for topic_mapping in product.topics:
+            topic_names.add(topic_mapping.original_topic)
+
+    topics = {}
+    if topic_names:
+        q = session.query(RosbagTopic).filter(and_(RosbagTopic.bag_id == bag_model.uid,
+                                                   RosbagTopic.name.in_(topic_names)))
+        topics = {t.name: t for t in q}
+
+    files = RosbagProduct.load_files(session, products)
+
+    # Replaced products are deleted in one statement, their topic and file links cascade in the database
+    configurations = set((p.configuration_tag, p.configuration_rule) for p in products
+                         if p.configuration_tag and p.configuration_rule)
+    if configurations:
+        session.query(RosbagProduct).filter(and_(
+            RosbagProduct.bag_id == bag_model.uid,
+            or_(*[and_(RosbagProduct.configuration_tag == tag, RosbagProduct.configuration_rule == rule)
+                  for tag, rule in configurations])
+        )).delete(synchronize_session=False)
+
+    new_products = []
+    for request_product in products:
+        product = RosbagProduct().from_swagger_model(request_product)
+        product.bag_id = bag_model.uid
+        try:
+            product.topic_mapping_from_swagger_model(request_product, topics)
+        except ValueError as e:
+            session.rollback()
+            return Error(code=400, message="Topics in new product are not all in the bag (%s)" % str(e)), 400
+
+        try:
+            product.file_mapping_from_swagger_model(request_product, files)
+        except ValueError as e:
+            session.rollback()
+            return Error(code=400, message="Files in new product are not all available (%s)" % str(e)), 400
+
+        session.add(product)
+        new_products.append(product)
+
+    session.flush()
+    uids = [p.uid for p in new_products]
+    session.commit()
+
+    if not uids:
+        return []
+
+    q = session.query(RosbagProduct).filter(RosbagProduct.uid.in_(uids))\
+        .options(*RosbagProduct.detailed_query_options())\
+        .order_by(RosbagProduct.uid)
+    link_template = File.link_template()
+    return [p.to_swagger_model_detailed(link_template=link_template) for p in q]
+
+
 @auth.requires_auth_with_permission(Permissions.BagRead)
 def get_bag_file(store_name, bag_name, user=None):
     """
@@ -300,18 +469,12 @@ def get_bag_file(store_name, bag_name, user=None):
     """
     try:
         session = Database.get_session()
-        q = session.query(RosbagStore).filter(RosbagStore.name == store_name)  # type: Query
-        if q.count() == 0:
+        store, bag = find_store_and_bag_in_database(session, store_name, bag_name)
+        if store is None:
             return Error(code=404, message="Store not found"), 404
-        store = q[0]
 
-        q = session.query(Rosbag).filter(
-            and_(Rosbag.store_id == store.uid, Rosbag.name == bag_name)
-        )  # type: Query
-
-        if q.count() == 0:
+        if bag is None:
             return Error(code=404, message="Bag not found"), 404
-        bag = q[0]
 
         # TODO: SOME MORE ROBUST ERROR HANDLING
 
@@ -324,10 +487,56 @@ def get_bag_file(store_name, bag_name, user=None):
         return handle_exception(e)
 
 
+def filter_bags(q, discovered_gte=None, discovered_lte=None, start_time_gte=None, start_time_lte=None,
+                end_time_gte=None, end_time_lte=None, duration_gte=None, duration_lte=None, meta_available=None,
+                is_extracted=None, name=None, tags=None, tags_mode=None, in_trash=None, search=None, topic=None,
+                topic_prefix=None, msg_type=None, topic_msg_count_gte=None, topic_avg_frequency_gte=None):
+    """Applies the bag filters shared by list_bags and get_bag_facets"""
+    if in_trash is None:
+        in_trash = False
+
+    q = db_helper.filter_datetime_lte(q, discovered_lte, Rosbag.discovered)
+    q = db_helper.filter_datetime_gte(q, discovered_gte, Rosbag.discovered)
+
+    q = db_helper.filter_datetime_lte(q, start_time_lte, Rosbag.start_time)
+    q = db_helper.filter_datetime_gte(q, start_time_gte, Rosbag.start_time)
+
+    q = db_helper.filter_datetime_lte(q, end_time_lte, Rosbag.end_time)
+    q = db_helper.filter_datetime_gte(q, end_time_gte, Rosbag.end_time)
+
+    q = db_helper.filter_boolean_eq(q, meta_available, Rosbag.meta_available)
+    q = db_helper.filter_boolean_eq(q, is_extracted, Rosbag.is_extracted)
+    q = db_helper.filter_boolean_eq(q, in_trash, Rosbag.in_trash)
+    q = db_helper.filter_number_gte(q, duration_gte, Rosbag.duration)
+    q = db_helper.filter_number_lte(q, duration_lte, Rosbag.duration)
+    q = db_helper.filter_string(q, name, Rosbag.name)
+    q = db_helper.filter_search(q, search, Rosbag.search_vector)
+    q = db_helper.filter_topics(q, Rosbag.uid, topic, topic_prefix, msg_type, topic_msg_count_gte,
+                                topic_avg_frequency_gte)
+
+    return db_helper.filter_tags(q, tags, tags_mode, Rosbag.uid)
+
+
 @auth.requires_auth_with_permission(Permissions.BagRead)
-def list_bags(store_name, limit=None, offset=None, ordering=None, discovered_gte=None, discovered_lte=None, start_time_gte=None,
-              start_time_lte=None, end_time_gte=None, end_time_lte=None, duration_gte=None, duration_lte=None,
-              meta_available=None, is_extracted=None, name=None, tags=None, in_trash=None, user=None):
+def list_bags(store_name, limit=None, offset=None, cursor=None, ordering=None, discovered_gte=None, discovered_lte=None,
+              start_time_gte=None, start_time_lte=None, end_time_gte=None, end_time_lte=None, duration_gte=None,
+              duration_lte=None, meta_available=None, is_extracted=None, name=None, tags=None, tags_mode=None,
+              in_trash=None, search=None, topic=None, topic_prefix=None, msg_type=None, topic_msg_count_gte=None,
+              topic_avg_frequency_gte=None, user=None):
+    try:
+        return list_bags_inner(store_name, limit, offset, cursor, ordering, discovered_gte, discovered_lte,
+                               start_time_gte, start_time_lte, end_time_gte, end_time_lte, duration_gte, duration_lte,
+                               meta_available, is_extracted, name, tags, tags_mode, in_trash, search, topic,
+                               topic_prefix, msg_type, topic_msg_count_gte, topic_avg_frequency_gte, user)
+    except Exception as e:
+        return handle_exception(e)
+
+
+def list_bags_inner(store_name, limit=None, offset=None, cursor=None, ordering=None, discovered_gte=None,
+                    discovered_lte=None, start_time_gte=None, start_time_lte=None, end_time_gte=None, end_time_lte=None,
+                    duration_gte=None, duration_lte=None, meta_available=None, is_extracted=None, name=None, tags=None,
+                    tags_mode=None, in_trash=None, search=None, topic=None, topic_prefix=None, msg_type=None,
+                    topic_msg_count_gte=None, topic_avg_frequency_gte=None, user=None):
     """
     List bags in store
     
@@ -337,54 +546,313 @@ def list_bags(store_name, limit=None, offset=None, ordering=None, discovered_gte
     :rtype: List[BagSummary]
     """
 
-    if in_trash is None:
-        in_trash = False
+    session = Database.get_session()
+    store = session.query(RosbagStore).filter(RosbagStore.name == store_name).first()
+    if store is None:
+        return Error(code=404, message="Store not found"), 404
+
+    q = session.query(Rosbag).filter(Rosbag.store_id == store.uid) #type: Query
 
     try:
-        session = Database.get_session()
-        q = session.query(RosbagStore).filter(RosbagStore.name == store_name) #type: Query
-        if q.count() == 0:
-            return Error(code=404, message="Store not found"), 404
+        q = filter_bags(q, discovered_gte, discovered_lte, start_time_gte, start_time_lte, end_time_gte, end_time_lte,
+                        duration_gte, duration_lte, meta_available, is_extracted, name, tags, tags_mode, in_trash,
+                        search, topic, topic_prefix, msg_type, topic_msg_count_gte, topic_avg_frequency_gte)
+    except db_helper.UnknownTagsMode as e:
+        return Error(code=400, message=str(e)), 400
+
+    column_mapping = {
+        'discovered': Rosbag.discovered,
+        'start_time': Rosbag.start_time,
+        'end_time': Rosbag.end_time,
+        'name': Rosbag.name,
+        'duration': Rosbag.duration,
+        'size': Rosbag.size
+    }
+
+    # Search results are ordered by relevance unless another ordering is requested
+    by_relevance = not ordering and search and db_helper.search_query(search) is not None
+    if by_relevance:
+        if cursor:
+            return Error(code=400, message="Cursors are not available when ordering by relevance"), 400
+        q = q.order_by(func.ts_rank(Rosbag.search_vector, db_helper.search_query(search)).desc())
+
+    try:
+        q = db_helper.query_pagination_ordering(q, offset, limit, ordering, column_mapping, cursor, Rosbag.uid)
+    except db_helper.InvalidCursor as e:
+        return Error(code=400, message=str(e)), 400
+
+    # Tags are fetched in the same query, unused columns are not fetched at all
+    q = q.options(*Rosbag.summary_query_options(user=user))
+
+    bags = q.all()
+    next_cursor = None
+    if not by_relevance:
+        next_cursor = db_helper.next_page_cursor(bags, limit, ordering, column_mapping, Rosbag.uid)
+
+    return db_helper.paginated_response([p.to_swagger_model_summary(user=user) for p in bags], next_cursor)
+
 
-        q = session.query(Rosbag).filter(Rosbag.store_id == q[0].uid) #type: Query
+@auth.requires_auth_with_permission(Permissions.BagRead)
+def get_bag_facets(store_name, discovered_gte=None, discovered_lte=None, start_time_gte=None, start_time_lte=None,
+                   end_time_gte=None, end_time_lte=None, duration_gte=None, duration_lte=None, meta_available=None,
+                   is_extracted=None, name=None, tags=None, tags_mode=None, in_trash=None, search=None, topic=None,
+                   topic_prefix=None, msg_type=None, topic_msg_count_gte=None, topic_avg_frequency_gte=None, user=None):
+    try:
+        return get_bag_facets_inner(store_name, discovered_gte, discovered_lte, start_time_gte, start_time_lte,
+                                    end_time_gte, end_time_lte, duration_gte, duration_lte, meta_available,
+                                    is_extracted, name, tags, tags_mode, in_trash, search, topic, topic_prefix,
+                                    msg_type, topic_msg_count_gte, topic_avg_frequency_gte, user)
+    except Exception as e:
+        return handle_exception(e)
 
-        q = db_helper.filter_datetime_lte(q, discovered_lte, Rosbag.discovered)
-        q = db_helper.filter_datetime_gte(q, discovered_gte, Rosbag.discovered)
 
-        q = db_helper.filter_datetime_lte(q, start_time_lte, Rosbag.start_time)
-        q = db_helper.filter_datetime_gte(q, start_time_gte, Rosbag.start_time)
+def get_bag_facets_inner(store_name, discovered_gte=None, discovered_lte=None, start_time_gte=None,
+                         start_time_lte=None, end_time_gte=None, end_time_lte=None, duration_gte=None,
+                         duration_lte=None, meta_available=None, is_extracted=None, name=None, tags=None,
+                         tags_mode=None, in_trash=None, search=None, topic=None, topic_prefix=None, msg_type=None,
+                         topic_msg_count_gte=None, topic_avg_frequency_gte=None, user=None):
+    """
+    Count the bags matching the filter
 
-        q = db_helper.filter_datetime_lte(q, end_time_lte, Rosbag.end_time)
-        q = db_helper.filter_datetime_gte(q, end_time_gte, Rosbag.end_time)
+    :param store_name: Name of the store
+    :type store_name: str
 
-        q = db_helper.filter_boolean_eq(q, meta_available, Rosbag.meta_available)
-        q = db_helper.filter_boolean_eq(q, is_extracted, Rosbag.is_extracted)
-        q = db_helper.filter_boolean_eq(q, in_trash, Rosbag.in_trash)
-        q = db_helper.filter_number_gte(q, duration_gte, Rosbag.duration)
-        q = db_helper.filter_number_lte(q, duration_lte, Rosbag.duration)
-        q = db_helper.filter_string(q, name, Rosbag.name)
+    :rtype: BagFacets
+    """
+    session = Database.get_session()
+    store = session.query(RosbagStore).filter(RosbagStore.name == store_name).first()
+    if store is None:
+        return Error(code=404, message="Store not found"), 404
 
-        # Not so efficient but for now good enough tag filtering
-        if tags:
-            tags = [x.strip() for x in tags.split(",") if x.strip()]
-            for tag in tags:
-                q = q.filter(Rosbag.tags.any(Tag.tag == tag))
+    q = session.query(Rosbag).filter(Rosbag.store_id == store.uid) #type: Query
+
+    try:
+        q = filter_bags(q, discovered_gte, discovered_lte, start_time_gte, start_time_lte, end_time_gte, end_time_lte,
+                        duration_gte, duration_lte, meta_available, is_extracted, name, tags, tags_mode, in_trash,
+                        search, topic, topic_prefix, msg_type, topic_msg_count_gte, topic_avg_frequency_gte)
+    except db_helper.UnknownTagsMode as e:
+        return Error(code=400, message=str(e)), 400
+
+    # The totals and the counts per tag are computed in one statement over the matching bags
+    matched = q.with_entities(Rosbag.uid, Rosbag.is_extracted, Rosbag.meta_available, Rosbag.extraction_failure)\
+        .cte("matched")
+
+    counts = [
+        func.count().label("total"),
+        func.count().filter(matched.c.is_extracted).label("extracted"),
+        func.count().filter(matched.c.meta_available).label("meta_available"),
+        func.count().filter(matched.c.extraction_failure).label("extraction_failure")
+    ]
+
+    tags_table = Tag.__table__
+    totals = select([null().label("tag_id"), null().label("tag"), null().label("color")] + counts)\
+        .select_from(matched)
+    per_tag = select([tags_table.c.uid, tags_table.c.tag, tags_table.c.color] + counts)\
+        .select_from(matched
+                     .join(tag_association_table, tag_association_table.c.bag_id == matched.c.uid)
+                     .join(tags_table, tags_table.c.uid == tag_association_table.c.tag_id))\
+        .group_by(tags_table.c.uid, tags_table.c.tag, tags_table.c.color)
+
+    facets = BagFacets(total=0, extracted=0, meta_available=0, extraction_failure=0, tags=[])
+    for row in session.execute(union_all(totals, per_tag)):
+        if row.tag_id is None:
+            facets.total = row.total
+            facets.extracted = row.extracted
+            facets.meta_available = row.meta_available
+            facets.extraction_failure = row.extraction_failure
+        else:
+            facets.tags.append(TagFacet(tag=row.tag, color=row.color, count=row.total))
 
-        q = db_helper.query_pagination_ordering(q, offset, limit, ordering, {
-            'discovered': Rosbag.discovered,
-            'start_time': Rosbag.start_time,
-            'end_time': Rosbag.end_time,
-            'name': Rosbag.name,
-            'duration': Rosbag.duration,
-            'size': Rosbag.size
-        })
+    facets.tags.sort(key=lambda x: (-x.count, x.tag))
+    return facets
 
-        return [p.to_swagger_model_summary(user=user) for p in q]
 
+@auth.requires_auth_with_permission(Permissions.QueueWrite)
+def new_bag_tasks(store_name, template, dry_run=None, discovered_gte=None, discovered_lte=None, start_time_gte=None,
+                  start_time_lte=None, end_time_gte=None, end_time_lte=None, duration_gte=None, duration_lte=None,
+                  meta_available=None, is_extracted=None, name=None, tags=None, tags_mode=None, extraction_failure=None,
+                  in_trash=None, search=None, topic=None, topic_prefix=None, msg_type=None, topic_msg_count_gte=None,
+                  topic_avg_frequency_gte=None, user=None):
+    try:
+        if connexion.request.is_json:
+            template = BagTaskTemplate.from_dict(connexion.request.get_json())  # type: BagTaskTemplate
+
+        return new_bag_tasks_inner(store_name, template, dry_run, discovered_gte, discovered_lte, start_time_gte,
+                                   start_time_lte, end_time_gte, end_time_lte, duration_gte, duration_lte,
+                                   meta_available, is_extracted, name, tags, tags_mode, extraction_failure, in_trash,
+                                   search, topic, topic_prefix, msg_type, topic_msg_count_gte,
+                                   topic_avg_frequency_gte, user)
     except Exception as e:
+        Database.get_session().rollback()
         return handle_exception(e)
 
 
+def new_bag_tasks_inner(store_name, template, dry_run=None, discovered_gte=None, discovered_lte=None,
+                        start_time_gte=None, start_time_lte=None, end_time_gte=None, end_time_lte=None,
+                        duration_gte=None, duration_lte=None, meta_available=None, is_extracted=None, name=None,
+                        tags=None, tags_mode=None, extraction_failure=None, in_trash=None, search=None, topic=None,
+                        topic_prefix=None, msg_type=None, topic_msg_count_gte=None, topic_avg_frequency_gte=None,
+                        user=None, batch_size=1000):
+    """
+    Queue a task for every bag matching the filter
+
+    :param store_name: Name of the store
+    :type store_name: str
+    :param template: Task created for every matching bag
+    :type template: BagTaskTemplate
+    :param dry_run: Only count the tasks that would be created
+    :type dry_run: bool
+
+    :rtype: BagTasksResult
+    """
+    if not has_permission(user, Permissions.BagRead):
+        return Error(code=403, message="Queueing tasks for bags requires permission to read the bags"), 403
+
+    session = Database.get_session()
+    store = session.query(RosbagStore).filter(RosbagStore.name == store_name).first()
+    if store is None:
+        return Error(code=404, message="Store not found"), 404
+
+    q = session.query(Rosbag).filter(Rosbag.store_id == store.uid) #type: Query
+
+    try:
+        q = filter_bags(q, discovered_gte, discovered_lte, start_time_gte, start_time_lte, end_time_gte, end_time_lte,
+                        duration_gte, duration_lte, meta_available, is_extracted, name, tags, tags_mode, in_trash,
+                        search, topic, topic_prefix, msg_type, topic_msg_count_gte, topic_avg_frequency_gte)
+    except db_helper.UnknownTagsMode as e:
+        return Error(code=400, message=str(e)), 400
+
+    q = db_helper.filter_boolean_eq(q, extraction_failure, Rosbag.extraction_failure)
+
+    result = BagTasksResult(matched=0, created=0, skipped=0, dry_run=bool(dry_run))
+    bag_names = [row.name for row in q.with_entities(Rosbag.name).order_by(Rosbag.uid)]
+    result.matched = len(bag_names)
+
+    # The hash has to be the canonical hash of Task.calculate_hash, so the rows are built here and inserted with
+    # one multi-row statement per batch, the unique index on unfinished tasks skips the duplicates
+    created = datetime.utcnow()
+    for i in range(0, len(bag_names), batch_size):
+        values = [bag_task_values(template, store_name, bag_name, created) for bag_name in bag_names[i:i + batch_size]]
+
+        if dry_run:
+            queued = session.query(func.count(Task.uid))\
+                .filter(Task.state < TaskState.Finished)\
+                .filter(Task.task == template.task)\
+                .filter(Task.task_hash.in_([v['task_hash'] for v in values]))\
+                .scalar()
+            result.created += len(values) - queued
+        else:
+            inserted = session.execute(Task.insert_unless_queued(values).returning(Task.uid)).fetchall()
+            result.created += len(inserted)
+
+    result.skipped = result.matched - result.created
+
+    if not dry_run:
+        session.commit()
+
+    return result
+
+
+def bag_task_values(template, store_name, bag_name, created):
+    """Row of the task queue table for one bag, the store and bag name are added to the configuration"""
+    configuration = dict(template.config or {})
+    configuration['store'] = store_name
+    configuration['bag'] = bag_name
+
+    description = "%s (%s/%s)" % (template.description or template.task, store_name, bag_name)
+
+    return dict(
+        priority=template.priority or 0,
+        description=description[:200],
+        assigned_to="",
+        created=created,
+        state=TaskState.Queued,
+        task=template.task,
+        configuration=configuration,
+        result={},
+        success=False,
+        runtime=None,
+        worker_labels=template.worker_labels or "",
+        task_hash=Task.calculate_hash(configuration)
+    )
+
+
+@auth.requires_auth_with_permission(Permissions.BagWrite)
+def register_bags(store_name, files, trigger=None, user=None):
+    """
+    Register a batch of new bags, bags that already exist are left untouched
+
+    :param store_name: Name of the store
+    :type store_name: str
+    :param files: Bag files found in the store
+    :type files: list | bytes
+    :param trigger: Hooks to trigger
+    :type trigger: str
+
+    :rtype: List[BagRegistration]
+    """
+    if connexion.request.is_json:
+        files = [StoredFile.from_dict(d) for d in connexion.request.get_json()]
+
+    session = Database.get_session()
+    try:
+        return register_bags_inner(store_name, files, trigger, user)
+    except Exception as e:
+        session.rollback()
+        return handle_exception(e)
+
+
+def register_bags_inner(store_name, files, trigger=None, user=None):
+    session = Database.get_session()
+    if not has_permission(user, Permissions.StoreSecretAccess):
+        return Error(code=403, message="Registering bags requires access to the store data"), 403
+
+    store = session.query(RosbagStore).filter(RosbagStore.name == store_name).first()
+    if store is None:
+        return Error(code=404, message="Store not found"), 404
+
+    reserved = [f.name for f in files if f.name in RESERVED_BAG_NAMES]
+    if reserved:
+        return Error(code=400, message="Bag name '%s' is reserved" % reserved[0]), 400
+
+    created = {}
+    if files:
+        discovered = datetime.utcnow()
+        values = [dict(
+            store_id=store.uid,
+            name=f.name,
+            store_data=f.store_data,
+            discovered=discovered,
+            is_extracted=False,
+            in_trash=False,
+            extraction_failure=False,
+            meta_available=False,
+            size=0,
+            comment="",
+            search_vector=func.rosbag_search_vector(f.name, "", "")
+        ) for f in files]
+
+        # One multi-row insert for the whole batch, bags that already exist are skipped by the database
+        q = postgresql.insert(Rosbag.__table__).values(values)\
+            .on_conflict_do_nothing(index_elements=[Rosbag.store_id, Rosbag.name])\
+            .returning(Rosbag.uid, Rosbag.name)
+        created = {row.name: row.uid for row in session.execute(q)}
+
+    if created:
+        new_bags = session.query(Rosbag).filter(Rosbag.uid.in_(created.values())).all()
+        NewBagHook.trigger_batch(new_bags, store_name, session, trigger, user)
+
+    session.commit()
+
+    result = []
+    for f in files:
+        # A name that occurs twice in the batch is only created once
+        status = "created" if created.pop(f.name, None) is not None else "exists"
+        result.append(BagRegistration(name=f.name, status=status))
+
+    return result
+
+
 @auth.requires_auth_with_permission(Permissions.BagWrite)
 def put_bag_meta(store_name, bag_name, bag, trigger=None, user=None):
     """
@@ -403,106 +871,113 @@ def put_bag_meta(store_name, bag_name, bag, trigger=None, user=None):
         bag = BagDetailed.from_dict(connexion.request.get_json())
 
     session = Database.get_session()
-    new_bag = False
     try:
-        # Check the store
-        q = session.query(RosbagStore).filter(RosbagStore.name == store_name) # type: Query
-        if q.count() != 1:
-            return Error(code=404, message="Store not found"), 404
-        store = q.first()  # type: RosbagStore
+        return put_bag_meta_inner(store_name, bag_name, bag, trigger, user)
+    except Exception as e:
+        session.rollback()
+        return handle_exception(e)
 
-        # Query existing bag
-        q = session.query(Rosbag).filter(
-            and_(Rosbag.store_id == store.uid, Rosbag.name == bag_name)
-        ) # type: Query
 
-        # Create new bag or use existing
-        bag_model = None
-        if q.count() == 1:
-            # Existing bag
-            bag_model = q.first()
-        else:
-            bag_model = Rosbag()
-            bag_model.store = store
-            new_bag = True
-            session.add(bag_model)
+def put_bag_meta_inner(store_name, bag_name, bag, trigger=None, user=None):
+    session = Database.get_session()
+    new_bag = False
 
-        bag_model.from_swagger_model(bag, user=user)
+    # Check the store and query existing bag
+    store, bag_model = find_store_and_bag_in_database(session, store_name, bag_name)
+    if store is None:
+        return Error(code=404, message="Store not found"), 404
 
-        ## Sync topics
+    # Create new bag or use existing
+    if bag_model is None:
+        if bag_name in RESERVED_BAG_NAMES:
+            return Error(code=400, message="Bag name '%s' is reserved" % bag_name), 400
 
-        request_topics = {}
-        for topic in bag.topics:
-            request_topics[topic.name] = topic
+        bag_model = Rosbag()
+        bag_model.store = store
+        new_bag = True
+        session.add(bag_model)
 
-        # Delete stale topics
-        bag_model.topics[:] = [t for t in bag_model.topics if t.name in request_topics]
+    bag_model.from_swagger_model(bag, user=user)
 
-        # Update existing topics
-        for topic in bag_model.topics:
-            topic.from_swagger_model(request_topics[topic.name])
-            del request_topics[topic.name]
+    # The definitions are shared by all bags, they have to exist before the topics referencing them
+    MessageDefinition.upsert(session, bag.topics)
 
-        # Create new topics products
-        for topic in request_topics:
-            model = RosbagTopic().from_swagger_model(request_topics[topic])
-            bag_model.topics.append(model)
+    ## Sync topics
 
-        ## Sync products
+    request_topics = {}
+    for topic in bag.topics:
+        request_topics[topic.name] = topic
 
-        existing_request_products = {}
-        new_request_products = []
-        for product in bag.products:
-            if product.uid:
-                existing_request_products[int(product.uid)] = product
-            else:
-                new_request_products.append(product)
-
-        # Delete stale products
-        bag_model.products[:] = [p for p in bag_model.products if p.uid in existing_request_products]
-
-        # Update existing products
-        for product in bag_model.products:
-            product.from_swagger_model(existing_request_products[product.uid])
-            try:
-                product.topic_mapping_from_swagger_model(existing_request_products[product.uid], bag_model.topics)
-            except ValueError as e:
-                return Error(code=500, message="Topics in product are not all in the bag"), 500
-
-            try:
-                product.file_mapping_from_swagger_model(existing_request_products[product.uid], session)
-            except ValueError as e:
-                return Error(code=500, message="Files in product are not all available"), 500
-
-        # Create new products
-        for request_product in new_request_products:
-            product = RosbagProduct().from_swagger_model(request_product)
-            bag_model.products.append(product)
-            try:
-                product.topic_mapping_from_swagger_model(request_product, bag_model.topics)
-            except ValueError as e:
-                return Error(code=500, message="Topics in new product are not all in the bag (%s)" % str(e)), 500
-
-            try:
-                product.file_mapping_from_swagger_model(request_product, session)
-            except ValueError as e:
-                return Error(code=500, message="Files in new product are not all available"), 500
+    # Delete stale topics
+    bag_model.topics[:] = [t for t in bag_model.topics if t.name in request_topics]
 
-        session.commit()
+    # Update existing topics
+    for topic in bag_model.topics:
+        topic.from_swagger_model(request_topics[topic.name])
+        del request_topics[topic.name]
 
-        q = session.query(Rosbag).filter(
-            and_(RosbagStore.uid == store.uid, Rosbag.name == bag_name)
-        )
-        fresh_model = q.first()
+    # Create new topics products
+    for topic in request_topics:
+        model = RosbagTopic().from_swagger_model(request_topics[topic])
+        bag_model.topics.append(model)
 
-        if new_bag:
-            fresh_model = NewBagHook.trigger(fresh_model, store_name, session, trigger, user)
+    bag_model.update_search_vector()
 
-        return fresh_model.to_swagger_model_detailed(user), 200
+    ## Sync products
 
-    except Exception as e:
-        session.rollback()
-        return handle_exception(e)
+    topics = {t.name: t for t in bag_model.topics}
+    files = RosbagProduct.load_files(session, bag.products)
+
+    existing_request_products = {}
+    new_request_products = []
+    for product in bag.products:
+        if product.uid:
+            existing_request_products[int(product.uid)] = product
+        else:
+            new_request_products.append(product)
+
+    # Delete stale products
+    bag_model.products[:] = [p for p in bag_model.products if p.uid in existing_request_products]
+
+    # Update existing products
+    for product in bag_model.products:
+        product.from_swagger_model(existing_request_products[product.uid])
+        try:
+            product.topic_mapping_from_swagger_model(existing_request_products[product.uid], topics)
+        except ValueError as e:
+            return Error(code=500, message="Topics in product are not all in the bag"), 500
+
+        try:
+            product.file_mapping_from_swagger_model(existing_request_products[product.uid], files)
+        except ValueError as e:
+            return Error(code=500, message="Files in product are not all available"), 500
+
+    # Create new products
+    for request_product in new_request_products:
+        product = RosbagProduct().from_swagger_model(request_product)
+        bag_model.products.append(product)
+        try:
+            product.topic_mapping_from_swagger_model(request_product, topics)
+        except ValueError as e:
+            return Error(code=500, message="Topics in new product are not all in the bag (%s)" % str(e)), 500
+
+        try:
+            product.file_mapping_from_swagger_model(request_product, files)
+        except ValueError as e:
+            return Error(code=500, message="Files in new product are not all available"), 500
+
+    # The hooks are part of the same transaction as the bag
+    if new_bag:
+        NewBagHook.trigger(bag_model, store_name, session, trigger, user)
+
+    session.commit()
+
+    q = session.query(Rosbag).filter(
+        and_(Rosbag.store_id == store.uid, Rosbag.name == bag_name)
+    ).options(*Rosbag.detailed_query_options(user))
+    fresh_model = q.first()
+
+    return fresh_model.to_swagger_model_detailed(user), 200
 
 
 @auth.requires_auth_with_permission(Permissions.BagCommentWrite)
@@ -20,15 +20,71 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import logging
 
-def get_cron_endpoint(jobs=None):  # noqa: E501
+import rbb_server.helper.auth as auth
+from rbb_server.helper.permissions import Permissions
+from rbb_server.helper.error import handle_exception
+
+from rbb_server import Database
+from rbb_server.controllers.queue_controller import split_list_argument
+from rbb_server.model.database import Task, TaskArchive
+from rbb_swagger_server.models.error import Error
+
+
+def reclaim_task_leases(session):
+    reclaimed = Task.reclaim_expired_leases(session)
+    session.commit()
+
+    if reclaimed:
+        logging.warning("Reclaimed tasks %s from workers with expired leases" % ", ".join(map(str, reclaimed)))
+
+
+# Finished tasks moved to the archive per call, a large backlog is worked off over several calls
+ARCHIVE_BATCH_SIZE = 1000
+
+
+def archive_tasks(session):
+    archived = TaskArchive.archive_finished(session, ARCHIVE_BATCH_SIZE)
+    session.commit()
+
+    if archived:
+        logging.info("Archived %d finished tasks" % len(archived))
+
+
+# Jobs that run on every call of the cron endpoint, unless specific jobs are requested
+cron_jobs = {
+    'archive_tasks': archive_tasks,
+    'reclaim_task_leases': reclaim_task_leases
+}
+
+
+@auth.requires_auth_with_permission(Permissions.QueueWrite)
+def get_cron_endpoint(jobs=None, user=None):  # noqa: E501
+    try:
+        return get_cron_endpoint_inner(jobs, user)
+    except Exception as e:
+        Database.get_session().rollback()
+        return handle_exception(e)
+
+
+def get_cron_endpoint_inner(jobs=None, user=None):
     """Endpoint that should be periodically triggered
 
      # noqa: E501
 
-    :param jobs: Specific cron jobs to trigger
+    :param jobs: Comma separated cron jobs to trigger, all jobs if empty
     :type jobs: str
 
     :rtype: None
     """
-    raise NotImplementedError()
+    job_names = split_list_argument(jobs) or sorted(cron_jobs.keys())
+    for job_name in job_names:
+        if job_name not in cron_jobs:
+            return Error(code=400, message="Unknown cron job '%s'" % job_name), 400
+
+    session = Database.get_session()
+    for job_name in job_names:
+        cron_jobs[job_name](session)
+
+    return None, 204
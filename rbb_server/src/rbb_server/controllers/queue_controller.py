@@ -21,21 +21,34 @@
 # SOFTWARE.
 
 import datetime
+import math
+import os
+import threading
+import time
 from functools import reduce
 
 import connexion
 import rbb_server.helper.auth as auth
 import rbb_server.helper.database as db_helper
-from rbb_server.helper.permissions import Permissions
+from rbb_server.helper.permissions import Permissions, has_permission
 from rbb_server.helper.error import handle_exception
+from rbb_server.helper.notifications import NotificationListener
 from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Query
 
 from rbb_server import Database
-from rbb_server.model.database import Task
+from rbb_server.model.database import Task, TaskHistory, TaskLogChunk, TaskRuntimeEstimate
 from rbb_server.model.task import TaskState
 from rbb_swagger_server.models.error import Error
+from rbb_swagger_server.models.queue_depth import QueueDepth
+from rbb_swagger_server.models.queue_statistics import QueueStatistics
 from rbb_swagger_server.models.task_detailed import TaskDetailed
+from rbb_swagger_server.models.task_heartbeat import TaskHeartbeat
+from rbb_swagger_server.models.task_log import TaskLog
+from rbb_swagger_server.models.task_status import TaskStatus
+from rbb_swagger_server.models.task_type_statistics import TaskTypeStatistics
+from rbb_swagger_server.models.worker_statistics import WorkerStatistics
 
 
 @auth.requires_auth_with_permission(Permissions.QueueWrite)
@@ -117,10 +130,29 @@ def put_task_inner(task_identifier, task, user=None):
     except ValueError:
         return Error(code=400, message="Invalid task identifier"), 400
 
-    q = session.query(Task).filter(Task.uid == int(identifier))  # type: Query
+    # The lock also keeps the reclaim of expired leases away, it skips locked tasks
+    q = session.query(Task).filter(Task.uid == int(identifier)).with_for_update()  # type: Query
     model = q.first()  # type: Task
     if model:
+        # A worker can only finish an unfinished task while it still runs it, after its lease expired the task may be
+        # queued again or given to another worker. Other updates, e.g. edits of queued or finished tasks, are not
+        # restricted.
+        finishing = task.assigned_to and task.state is not None and task.state >= TaskState.Finished
+        if finishing and model.state < TaskState.Finished and not model.is_running_for(task.assigned_to):
+            session.rollback()
+            return Error(code=409, message="Task is not assigned to this worker anymore"), 409
+
+        was_unfinished = model.state < TaskState.Finished
         model.from_swagger_model(task, user=user)
+
+        # Successful runs feed the runtime estimate used for scheduling
+        if was_unfinished and model.state == TaskState.Finished and model.success and model.runtime is not None:
+            TaskRuntimeEstimate.record(session, model.task, model.size_class, model.runtime)
+
+        # The log is left as is, unless a complete new log is given
+        if task.log is not None and has_permission(user, Permissions.QueueResultAccess):
+            TaskLogChunk.replace(session, model.uid, task.log)
+
         session.commit()
 
         # Return a fresh copy from the DB
@@ -143,6 +175,14 @@ def patch_task(task_identifier, task, user=None):  # noqa: E501
 
     :rtype: TaskDetailed
     """
+    try:
+        return patch_task_inner(task_identifier, task, user)
+    except Exception as e:
+        Database.get_session().rollback()
+        return handle_exception(e)
+
+
+def patch_task_inner(task_identifier, task, user=None):
     session = Database.get_session()
 
     try:
@@ -150,60 +190,186 @@ def patch_task(task_identifier, task, user=None):  # noqa: E501
     except ValueError:
         return Error(code=400, message="Invalid task identifier"), 400
 
+    q = session.query(Task).filter(Task.uid == int(identifier)).with_for_update()  # type: Query
+    model = q.first()
+    if model:
+        changed = False
+
+        if 'log_append' in task and isinstance(task['log_append'], str):
+            TaskLogChunk.append(session, model.uid, task['log_append'])
+            changed = True
+
+        # The worker the task is assigned to shows it is still alive, like with a heartbeat
+        if 'assigned_to' in task and model.is_running_for(task['assigned_to']):
+            model.renew_lease()
+            changed = True
+
+        if changed:
+            session.commit()
+        else:
+            session.rollback()
+
+        return model.to_swagger_model_detailed(user=user)
+
+    else:
+        return Error(code=404, message="Task not found"), 404
+
+
+@auth.requires_auth_with_permission(Permissions.QueueWrite)
+def task_heartbeat(task_identifier, heartbeat, user=None):
     try:
-        q = session.query(Task).filter(Task.uid == int(identifier))  # type: Query
-        model = q.first()
-        if model:
-            changed = False
+        if connexion.request.is_json:
+            heartbeat = TaskHeartbeat.from_dict(connexion.request.get_json())  # type: TaskHeartbeat
 
-            if 'log_append' in task and isinstance(task['log_append'], str):
-                model.log += task['log_append']
-                changed = True
+        return task_heartbeat_inner(task_identifier, heartbeat, user)
+    except Exception as e:
+        Database.get_session().rollback()
+        return handle_exception(e)
 
-            if changed:
-                session.commit()
 
-            return model.to_swagger_model_detailed(user=user)
+def task_heartbeat_inner(task_identifier, heartbeat, user=None):
+    """Report that the worker is still working on the task
 
-        else:
+     # noqa: E501
+
+    :param task_identifier:
+    :type task_identifier: str
+    :param heartbeat: Log output since the previous heartbeat
+    :type heartbeat: dict | bytes
+
+    :rtype: TaskStatus
+    """
+    session = Database.get_session()
+
+    try:
+        identifier = int(task_identifier)
+    except ValueError:
+        return Error(code=400, message="Invalid task identifier"), 400
+
+    state = session.execute(Task.heartbeat_statement(identifier, heartbeat.worker_name)).scalar()
+
+    if state is None:
+        state = session.query(Task.state).filter(Task.uid == identifier).scalar()
+        session.rollback()
+        if state is None:
             return Error(code=404, message="Task not found"), 404
 
+        # The lease of the worker expired and the task was queued again, given to another worker or failed. The log
+        # is not appended. Workers that do not know about lost leases still stop on the cancellation.
+        return TaskStatus(state=state, cancellation_requested=True, lease_lost=True)
+
+    if heartbeat.log_append:
+        TaskLogChunk.append(session, identifier, heartbeat.log_append)
+
+    session.commit()
+    return TaskStatus(state=state, cancellation_requested=state == TaskState.CancellationRequested, lease_lost=False)
+
+
+@auth.requires_auth_with_permission(Permissions.QueueRead)
+def get_task(task_identifier, log=None, user=None):
+    try:
+        return get_task_inner(task_identifier, log, user)
     except Exception as e:
         return handle_exception(e)
 
 
-@auth.requires_auth_with_permission(Permissions.QueueRead)
-def get_task(task_identifier, user=None):
+def get_task_inner(task_identifier, log=None, user=None):
     """Take a task from the queue
 
      # noqa: E501
 
     :param task_identifier:
     :type task_identifier: str
+    :param log: Include the complete log
+    :type log: bool
 
     :rtype: TaskDetailed
     """
+    session = Database.get_session()
+
     try:
-        session = Database.get_session()
+        identifier = int(task_identifier)
+    except ValueError:
+        return Error(code=400, message="Invalid task identifier"), 400
 
-        try:
-            identifier = int(task_identifier)
-        except ValueError:
-            return Error(code=400, message="Invalid task identifier"), 400
-
-        q = session.query(Task).filter(Task.uid == int(identifier))  # type: Query
-        model = q.first()
-        if model:
-            return model.to_swagger_model_detailed(user=user)
-        else:
-            return Error(code=404, message="Task not found"), 404
+    # Archived tasks are read like live ones
+    q = session.query(TaskHistory).filter(TaskHistory.uid == int(identifier))  # type: Query
+    model = q.first()
+    if model:
+        detailed = model.to_swagger_model_detailed(user=user, log=log)
+        if model.state < TaskState.Finished:
+            detailed.expected_runtime = TaskRuntimeEstimate.expected_runtimes(session, [model.uid]).get(model.uid)
+        return detailed
+    else:
+        return Error(code=404, message="Task not found"), 404
 
+
+# Logs can be tens of megabytes, larger parts are read with several requests
+DEFAULT_LOG_READ = 1024 * 1024
+MAX_LOG_READ = 16 * 1024 * 1024
+
+
+@auth.requires_auth_with_permission(Permissions.QueueRead)
+def get_task_log(task_identifier, offset=None, limit=None, user=None):
+    try:
+        return get_task_log_inner(task_identifier, offset, limit, user)
     except Exception as e:
         return handle_exception(e)
 
 
+def get_task_log_inner(task_identifier, offset=None, limit=None, user=None):
+    """Read a part of the log of a task
+
+     # noqa: E501
+
+    :param task_identifier:
+    :type task_identifier: str
+    :param offset: Byte position in the log to start reading, negative to read the end of the log
+    :type offset: int
+    :param limit: Maximum number of bytes to read
+    :type limit: int
+
+    :rtype: TaskLog
+    """
+    session = Database.get_session()
+
+    try:
+        identifier = int(task_identifier)
+    except ValueError:
+        return Error(code=400, message="Invalid task identifier"), 400
+
+    if not has_permission(user, Permissions.QueueResultAccess):
+        return Error(code=403, message="Missing permission to read the log"), 403
+
+    if session.query(TaskHistory.uid).filter(TaskHistory.uid == identifier).first() is None:
+        return Error(code=404, message="Task not found"), 404
+
+    size = TaskLogChunk.size(session, identifier)
+    offset = offset or 0
+    if offset < 0:
+        offset = max(size + offset, 0)
+    offset = min(offset, size)
+
+    # At least one complete character
+    limit = max(min(limit or DEFAULT_LOG_READ, MAX_LOG_READ), 4)
+
+    log, start, end = TaskLogChunk.read(session, identifier, offset, min(offset + limit, size))
+    return TaskLog(offset=start, next_offset=end, size=size, log=log)
+
+
 @auth.requires_auth_with_permission(Permissions.QueueWrite)
 def new_task(task, user=None):
+    try:
+        if connexion.request.is_json:
+            task = TaskDetailed.from_dict(connexion.request.get_json())  # type: TaskDetailed
+
+        return new_task_inner(task, user)
+    except Exception as e:
+        Database.get_session().rollback()
+        return handle_exception(e)
+
+
+def new_task_inner(task, user=None):
     """Create a new task
 
      # noqa: E501
@@ -213,41 +379,50 @@ def new_task(task, user=None):
 
     :rtype: TaskDetailed
     """
-    try:
-        if connexion.request.is_json:
-            task = TaskDetailed.from_dict(connexion.request.get_json())  # type: TaskDetailed
+    session = Database.get_session()
 
-        session = Database.get_session()
-        hash = Task.calculate_hash(task.config)
+    model = Task()
+    model.result = {}
+    model.task_hash = Task.calculate_hash(task.config)
+    model.from_swagger_model(task, user=user)
+    model.uid = None
+    session.add(model)
 
-        q = session.query(Task)\
+    try:
+        # Duplicates of unfinished tasks are rejected by a unique index, also when they are created at the same time
+        session.flush()
+    except IntegrityError as e:
+        session.rollback()
+        if getattr(e.orig.diag, 'constraint_name', None) != Task.UNFINISHED_HASH_INDEX:
+            raise e
+
+        duplicate_uid = session.query(Task.uid)\
             .filter(Task.state < TaskState.Finished)\
-            .filter(Task.task == task.task)\
-            .filter(Task.task_hash == hash)
+            .filter(Task.task == model.task)\
+            .filter(Task.task_hash == model.task_hash)\
+            .scalar()
+        return Error(code=409, message="Duplicate task, %s, queued" % duplicate_uid), 409
 
-        duplicate_task = q.first()
-        if duplicate_task:
-            return Error(code=409, message="Duplicate task, %d, queued" % duplicate_task.uid), 409
+    if task.log and has_permission(user, Permissions.QueueResultAccess):
+        TaskLogChunk.append(session, model.uid, task.log)
 
-        model = Task()
-        model.log = ""
-        model.result = {}
-        model.task_hash = hash
-        model.from_swagger_model(task, user=user)
-        model.uid = None
-        session.add(model)
-        session.commit()
+    session.commit()
+
+    # Return a fresh copy from the DB
+    q = session.query(Task).filter(Task.uid == model.uid)
+    return q.first().to_swagger_model_detailed(user=user), 200
 
-        # Return a fresh copy from the DB
-        q = session.query(Task).filter(Task.uid == model.uid)
-        return q.first().to_swagger_model_detailed(user=user), 200
 
+@auth.requires_auth_with_permission(Permissions.QueueRead)
+def list_queue(limit=None, offset=None, cursor=None, ordering=None, running=None, finished=None, queued=None, user=None):
+    try:
+        return list_queue_inner(limit, offset, cursor, ordering, running, finished, queued, user)
     except Exception as e:
         return handle_exception(e)
 
 
-@auth.requires_auth_with_permission(Permissions.QueueRead)
-def list_queue(limit=None, offset=None, ordering=None, running=None, finished=None, queued=None, user=None):
+def list_queue_inner(limit=None, offset=None, cursor=None, ordering=None, running=None, finished=None, queued=None,
+                     user=None):
     """List task queue
 
      # noqa: E501
@@ -255,52 +430,155 @@ def list_queue(limit=None, offset=None, ordering=None, running=None, finished=No
 
     :rtype: List[TaskSummary]
     """
-    try:
-        session = Database.get_session()
-        q = session.query(Task) #type: Query
+    session = Database.get_session()
+
+    # Only finished tasks are archived, the archive is left out when no finished tasks are listed
+    table = Task if (running or queued) and not finished else TaskHistory
+    q = session.query(table) #type: Query
+
+    filters = []
 
-        filters = []
+    if running:
+        filters.append(table.state == TaskState.Running)
 
-        if running:
-            filters.append(Task.state == TaskState.Running)
+    if finished:
+        filters.append(or_(table.state == TaskState.Cancelled,
+                           table.state == TaskState.Finished,
+                           table.state == TaskState.CancellationRequested))
 
-        if finished:
-            filters.append(or_(Task.state == TaskState.Cancelled,
-                               Task.state == TaskState.Finished,
-                               Task.state == TaskState.CancellationRequested))
+    if queued:
+        filters.append(or_(table.state == TaskState.Queued,
+                           table.state == TaskState.Paused))
+
+    if len(filters) > 0:
+        q = q.filter(reduce((lambda x, y: or_(x, y)), filters))
+
+    column_mapping = {
+        'priority': table.priority,
+        'identifier': table.uid,
+        'last_updated': table.last_updated,
+        'created': table.created,
+        'state': table.state,
+        'success': table.success,
+        'runtime': table.runtime
+    }
+
+    try:
+        q = db_helper.query_pagination_ordering(q, offset, limit, ordering, column_mapping, cursor, table.uid)
+    except db_helper.InvalidCursor as e:
+        return Error(code=400, message=str(e)), 400
 
-        if queued:
-            filters.append(or_(Task.state == TaskState.Queued,
-                               Task.state == TaskState.Paused))
+    tasks = q.all()
+    next_cursor = db_helper.next_page_cursor(tasks, limit, ordering, column_mapping, table.uid)
 
-        if len(filters) > 0:
-            q = q.filter(reduce((lambda x, y: or_(x, y)), filters))
+    expected_runtimes = TaskRuntimeEstimate.expected_runtimes(
+        session, [p.uid for p in tasks if p.state < TaskState.Finished])
 
-        q = db_helper.query_pagination_ordering(q, offset, limit, ordering, {
-            'priority': Task.priority,
-            'identifier': Task.uid,
-            'last_updated': Task.last_updated,
-            'created': Task.created,
-            'state': Task.state,
-            'success': Task.success,
-            'runtime': Task.runtime
-        })
+    models = []
+    for p in tasks:
+        model = p.to_swagger_model_summary(user=user)
+        model.expected_runtime = expected_runtimes.get(p.uid)
+        models.append(model)
 
-        return [p.to_swagger_model_summary(user=user) for p in q]
+    return db_helper.paginated_response(models, next_cursor)
 
+
+@auth.requires_auth_with_permission(Permissions.QueueRead)
+def get_queue_statistics(window=None, user=None):
+    try:
+        return get_queue_statistics_inner(window, user)
     except Exception as e:
         return handle_exception(e)
 
 
+DEFAULT_STATISTICS_WINDOW = 3600
+
+
+def get_queue_statistics_inner(window=None, user=None):
+    """Queue depth, wait time and runtime percentiles per task and throughput per worker
+
+    :param window: Seconds back from now over which the tasks are aggregated
+    :type window: int
+
+    :rtype: QueueStatistics
+    """
+    if window is None:
+        window = DEFAULT_STATISTICS_WINDOW
+
+    if window <= 0:
+        return Error(code=400, message="The window has to be positive"), 400
+
+    session = Database.get_session()
+
+    statistics = QueueStatistics(window=window, depth=[], tasks=[], workers=[], suggested_workers=0)
+    for row in Task.queue_depth(session):
+        statistics.depth.append(QueueDepth(task=row.task, state=row.state, count=row.count))
+
+    runtimes = {}
+    for row in Task.task_statistics(session, window):
+        runtimes[row.task] = (row.busy, row.runs)
+        wait_time = row.wait_time or [None] * 3
+        runtime = row.runtime or [None] * 3
+        statistics.tasks.append(TaskTypeStatistics(
+            task=row.task, finished=row.finished, succeeded=row.succeeded,
+            wait_time_p50=wait_time[0], wait_time_p90=wait_time[1], wait_time_p99=wait_time[2],
+            runtime_mean=row.runtime_mean, runtime_p50=runtime[0], runtime_p90=runtime[1], runtime_p99=runtime[2]))
+
+    for row in Task.worker_statistics(session, window):
+        statistics.workers.append(WorkerStatistics(worker=row.worker, finished=row.finished,
+                                                   succeeded=row.succeeded, busy=row.busy / window))
+
+    statistics.suggested_workers = suggested_worker_count(statistics.depth, runtimes, window)
+    return statistics
+
+
+def suggested_worker_count(depth, runtimes, window):
+    """
+    Workers needed to keep up with the load of the window and to work off the queued tasks within one window. A
+    queued task is estimated with the mean runtime of its task, or of all tasks if the task did not run in the window,
+    and with a whole window if nothing ran. There are never less workers suggested than tasks running.
+
+    :param depth: Number of unfinished tasks per task and state
+    :type depth: List[QueueDepth]
+    :param runtimes: Summed runtime in seconds and number of runs per task in the window
+    :type runtimes: Dict[str, Tuple[float, int]]
+    :param window: Length of the window in seconds
+    :type window: int
+    """
+    busy = sum([x[0] for x in runtimes.values()])
+    runs = sum([x[1] for x in runtimes.values()])
+    mean_runtime = {task: x[0] / x[1] for task, x in runtimes.items() if x[1] > 0}
+    overall_mean_runtime = busy / runs if runs > 0 else window
+
+    backlog = sum([x.count * mean_runtime.get(x.task, overall_mean_runtime) for x in depth
+                   if x.state == TaskState.Queued])
+    running = sum([x.count for x in depth if x.state in (TaskState.Running, TaskState.CancellationRequested)])
+
+    return max(running, int(math.ceil((busy + backlog) / window)))
+
+
 @auth.requires_auth_with_permission(Permissions.QueueWrite)
-def dequeue_task(worker_name, tasks, labels, user=None):
+def dequeue_task(worker_name, tasks, labels, wait=None, user=None):
     try:
-        return dequeue_task_inner(worker_name, tasks, labels, user)
+        return dequeue_task_inner(worker_name, tasks, labels, wait=wait, user=user)
     except Exception as e:
         return handle_exception(e)
 
 
-def dequeue_task_inner(worker_name, tasks, labels, user=None):
+def split_list_argument(value):
+    return [x.strip() for x in value.split(",") if x.strip()] if value else []
+
+
+# Long polling requests occupy a server thread, keep them below the gunicorn worker timeout
+MAX_DEQUEUE_WAIT = 25
+
+# Long polling requests waiting at the same time in this process (RBB_MAX_DEQUEUE_WAITERS), above it a worker gets
+# an immediate answer. Idle workers cannot take all threads of the server away from the other requests.
+MAX_DEQUEUE_WAITERS = int(os.getenv('RBB_MAX_DEQUEUE_WAITERS') or 8)
+_dequeue_waiters = threading.BoundedSemaphore(MAX_DEQUEUE_WAITERS)
+
+
+def dequeue_task_inner(worker_name, tasks, labels, wait=None, user=None):
     """Take a task from the queue
 
      # noqa: E501
@@ -311,9 +589,43 @@ def dequeue_task_inner(worker_name, tasks, labels, user=None):
     :type tasks: str
     :param labels: Labels the worker wants to do
     :type labels: str
+    :param wait: Seconds to wait for a task if the queue is empty
+    :type wait: int
 
     :rtype: TaskDetailed
     """
+    # Comma separated lists, an empty task list or "any" means the worker can do all tasks
+    task_names = split_list_argument(tasks)
+    if not task_names or "any" in task_names:
+        task_names = None
+    label_names = split_list_argument(labels)
+    policy = Task.scheduling_policy(Database.get_session())
+
+    wait = min(max(wait or 0, 0), MAX_DEQUEUE_WAIT)
+    if not wait or not _dequeue_waiters.acquire(blocking=False):
+        task = dequeue_task_attempt(worker_name, task_names, label_names, policy, user)
+    else:
+        try:
+            # Take the generation before trying, so a task queued in between still wakes us up
+            listener = NotificationListener.get("task_queued")
+            deadline = time.time() + wait
+            while True:
+                generation = listener.generation
+                task = dequeue_task_attempt(worker_name, task_names, label_names, policy, user)
+                remaining = deadline - time.time()
+                if task or remaining <= 0:
+                    break
+                listener.wait(generation, remaining)
+        finally:
+            _dequeue_waiters.release()
+
+    if task is None:
+        return Error(code=204, message="No tasks in the queue"), 204
+
+    return task
+
+
+def dequeue_task_attempt(worker_name, task_names, label_names, policy="priority", user=None):
     session = Database.get_session()
 
     # First find already assigned not finished tasks
@@ -322,28 +634,19 @@ def dequeue_task_inner(worker_name, tasks, labels, user=None):
         .filter(Task.state < TaskState.Finished)\
         .order_by(Task.priority.desc()).limit(1)
 
-    if q.count():
-        return q.first().to_swagger_model_detailed(user=user)
-
-    # Get a list of all tasks that can be done by this worker
-    q = session.query(Task)  # type: Query
-    q = q.filter(Task.assigned_to == "")\
-        .filter(Task.state == TaskState.Queued)\
-        .order_by(Task.priority.desc()).limit(5)
-
-    # TODO: Filter label and tasks
-    possible_tasks = []
-    for possible_task in q:
-        possible_tasks.append(possible_task)
-
-    for task in possible_tasks:
-        success = Task.task_assignment_query(session, task.uid, worker_name)
-
-        if success:
-            session.commit()
-            q = session.query(Task).filter(Task.uid == task.uid)
-            return q.first().to_swagger_model_detailed(user=user)
-
+    task = q.first()
+    if task:
+        # The worker restarted, it continues where it was
+        task.renew_lease()
+        session.commit()
+        return task.to_swagger_model_detailed(user=user)
 
-    return Error(code=204, message="No tasks in the queue"), 204
+    task = Task.dequeue_query(session, worker_name, task_names, label_names, policy).first()
+    if task is None:
+        # Do not keep the transaction open while waiting
+        session.rollback()
+        return None
 
+    model = task.to_swagger_model_detailed(user=user)
+    session.commit()
+    return model
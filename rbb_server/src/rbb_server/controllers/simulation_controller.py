@@ -29,7 +29,7 @@ import rbb_server.helper.database as db_helper
 from rbb_server.helper.permissions import Permissions
 from rbb_server.helper.error import handle_exception
 from sqlalchemy import and_
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import Query, subqueryload
 
 from rbb_server import Database
 from rbb_server.model.database import SimulationEnvironment, Simulation, SimulationRun, Rosbag, RosbagStore
@@ -56,6 +56,10 @@ def get_simulation(sim_identifier, expand=None, user=None):  # noqa: E501
         session = Database.get_session()
 
         q = session.query(Simulation).filter(Simulation.uid == sim_identifier)  # type: Query
+        if expand:
+            runs = subqueryload(Simulation.runs)
+            q = q.options(runs, *SimulationRun.summary_query_options(user=user, path=runs))
+
         model = q.first()
         if model:
             return model.to_swagger_model_detailed(user=user, expand=expand)
@@ -110,6 +114,7 @@ def get_simulation_run(sim_identifier, run_identifier, expand=None, user=None):
         session = Database.get_session()
 
         q = session.query(SimulationRun).filter(SimulationRun.uid == run_identifier)  # type: Query
+        q = q.options(*SimulationRun.summary_query_options(user=user, expand=expand))
         model = q.first()
 
         if model and model.simulation_id == sim_identifier:
@@ -153,7 +158,9 @@ def list_simulation_runs(sim_identifier, user=None):  # noqa: E501
     try:
         session = Database.get_session()
 
+        runs = subqueryload(Simulation.runs)
         q = session.query(Simulation).filter(Simulation.uid == sim_identifier)  # type: Query
+        q = q.options(runs, *SimulationRun.summary_query_options(user=user, path=runs))
         model = q.first()
         if model:
             return [p.to_swagger_model_summary(user=user) for p in model.runs]
@@ -165,7 +172,14 @@ def list_simulation_runs(sim_identifier, user=None):  # noqa: E501
 
 
 @auth.requires_auth_with_permission(Permissions.SimulationRead)
-def list_simulations(limit=None, offset=None, ordering=None, user=None):  # noqa: E501
+def list_simulations(limit=None, offset=None, cursor=None, ordering=None, user=None):  # noqa: E501
+    try:
+        return list_simulations_inner(limit, offset, cursor, ordering, user)
+    except Exception as e:
+        return handle_exception(e)
+
+
+def list_simulations_inner(limit=None, offset=None, cursor=None, ordering=None, user=None):
     """List simulations
 
      # noqa: E501
@@ -173,19 +187,23 @@ def list_simulations(limit=None, offset=None, ordering=None, user=None):  # noqa
 
     :rtype: List[SimulationSummary]
     """
-    try:
-        session = Database.get_session()
-        q = session.query(Simulation) #type: Query
+    session = Database.get_session()
+    q = session.query(Simulation) #type: Query
 
-        q = db_helper.query_pagination_ordering(q, offset, limit, ordering, {
-            'created': Simulation.created,
-            'identifier': Simulation.uid
-        })
+    column_mapping = {
+        'created': Simulation.created,
+        'identifier': Simulation.uid
+    }
 
-        return [p.to_swagger_model_summary(user=user) for p in q]
+    try:
+        q = db_helper.query_pagination_ordering(q, offset, limit, ordering, column_mapping, cursor, Simulation.uid)
+    except db_helper.InvalidCursor as e:
+        return Error(code=400, message=str(e)), 400
 
-    except Exception as e:
-        return handle_exception(e)
+    simulations = q.all()
+    next_cursor = db_helper.next_page_cursor(simulations, limit, ordering, column_mapping, Simulation.uid)
+
+    return db_helper.paginated_response([p.to_swagger_model_summary(user=user) for p in simulations], next_cursor)
 
 
 @auth.requires_auth_with_permission(Permissions.SimulationWrite)
@@ -199,12 +217,11 @@ def new_simulation(simulation, trigger=None, user=None):  # noqa: E501
 
     :rtype: SimulationDetailed
     """
+    session = Database.get_session()
     try:
         if connexion.request.is_json:
             simulation = SimulationDetailed.from_dict(connexion.request.get_json())  # noqa: E501
 
-        session = Database.get_session()
-
         q = session.query(SimulationEnvironment).filter(SimulationEnvironment.name == simulation.environment_name)
         if not q.first():
             return Error(code=400, message="Simulation environment '%s' not found" % simulation.environment_name), 400
@@ -214,16 +231,17 @@ def new_simulation(simulation, trigger=None, user=None):  # noqa: E501
         model.environment_id = q.first().uid
         model.uid = None
         session.add(model)
+
+        # The hooks are part of the same transaction as the simulation
+        NewSimulationHook.trigger(model, session, trigger, user)
         session.commit()
 
         # Return a fresh copy from the DB
         q = session.query(Simulation).filter(Simulation.uid == model.uid)
-        m = NewSimulationHook.trigger(q.first(), session, trigger, user)
-
-
-        return m.to_swagger_model_detailed(user=user), 200
+        return q.first().to_swagger_model_detailed(user=user), 200
 
     except Exception as e:
+        session.rollback()
         return handle_exception(e)
 
 
@@ -40,11 +40,9 @@ def check_auth(username, password):
     password combination is valid.
     """
     try:
-        q = Database.get_session().query(User).filter(User.alias == username)
-        if q.count():
-            user = q.first()
-            if user.check_password(password):
-                return user
+        user = Database.get_session().query(User).filter(User.alias == username).first()
+        if user and user.check_password(password):
+            return user
 
     except Exception as e:
         logging.exception(e)
@@ -122,11 +120,9 @@ def get_current_session():
     session_info = get_current_session_id_and_token()
     if not session_info:
         return None
-    q = Database.get_session().query(Session).filter(Session.uid == session_info['id'])
-    if q.count():
-        session = q.first()
-        if session.token == session_info['token']:
-            return session
+    session = Database.get_session().query(Session).get(session_info['id'])
+    if session and session.token == session_info['token']:
+        return session
 
     return None
 
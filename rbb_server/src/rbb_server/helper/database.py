@@ -20,6 +20,15 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import base64
+import datetime
+import json
+import re
+
+from sqlalchemy import and_, or_, false, exists, func, select
+
+from rbb_server.model.database import RosbagTopic, Tag
+from rbb_server.model.rosbag import tag_association_table
 from rbb_swagger_server import util
 
 
@@ -33,6 +42,16 @@ class UnknownOrdering(RuntimeError):
         super(UnknownOrdering, self).__init__("Unknown ordering")
 
 
+class InvalidCursor(RuntimeError):
+    def __init__(self):
+        super(InvalidCursor, self).__init__("Invalid cursor")
+
+
+class UnknownTagsMode(RuntimeError):
+    def __init__(self):
+        super(UnknownTagsMode, self).__init__("Unknown tags mode")
+
+
 def filter_datetime_gte(q, input_field, column):
     if input_field is not None:
         input_field = util.deserialize_datetime(input_field)
@@ -77,7 +96,98 @@ def filter_string(q, input_field, column):
         return q
 
 
-def query_pagination_ordering(q, offset=None, limit=None, ordering=None, column_mapping=None):
+def search_query(input_field):
+    """Full text search query matching the documents that contain all words of the input, also as prefix"""
+    words = re.findall(r"[^\W_]+", input_field)
+    if not words:
+        return None
+
+    return func.to_tsquery('simple', " & ".join([word + ":*" for word in words]))
+
+
+def filter_search(q, input_field, vector_column):
+    if input_field is not None:
+        query = search_query(input_field)
+        if query is not None:
+            return q.filter(vector_column.op('@@')(query))
+
+    return q
+
+
+def filter_tags(q, input_field, mode, bag_column):
+    """
+    Filters on a comma separated list of tag names in a single pass over the bag/tag association table.
+    Mode "all" (default) keeps the bags having all tags, "any" the bags having at least one of them
+    and "none" the bags having none of them.
+    """
+    if mode is None:
+        mode = "all"
+
+    if mode not in ("all", "any", "none"):
+        raise UnknownTagsMode()
+
+    if input_field is None:
+        return q
+
+    tags = set([x.strip().lower() for x in input_field.split(",") if x.strip()])
+    if not tags:
+        return q
+
+    tag_ids = [uid for uid, in q.session.query(Tag.uid).filter(Tag.tag.in_(tags))]
+    bag_id = tag_association_table.c.bag_id
+
+    if mode == "none":
+        if not tag_ids:
+            return q
+        return q.filter(~exists([bag_id]).where(and_(bag_id == bag_column,
+                                                      tag_association_table.c.tag_id.in_(tag_ids))))
+
+    # A tag that does not exist cannot be on any bag
+    if not tag_ids or (mode == "all" and len(tag_ids) < len(tags)):
+        return q.filter(false())
+
+    bags_with_tags = select([bag_id]).where(tag_association_table.c.tag_id.in_(tag_ids))
+    if mode == "all":
+        bags_with_tags = bags_with_tags.group_by(bag_id).having(func.count() == len(tag_ids))
+
+    return q.filter(bag_column.in_(bags_with_tags))
+
+
+def escape_like(value):
+    """Escapes the LIKE wildcards in a literal string, using backslash as escape character"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def filter_topics(q, bag_column, name=None, name_prefix=None, msg_type=None, msg_count_gte=None,
+                  avg_frequency_gte=None):
+    """
+    Keeps the bags containing at least one topic that matches all given conditions. The topic name and message
+    type are looked up in their indexes on rosbag_topic, so bags are found without reading their metadata.
+    """
+    conditions = []
+    if name is not None:
+        conditions.append(RosbagTopic.name == name)
+    if name_prefix is not None:
+        conditions.append(RosbagTopic.name.like(escape_like(name_prefix) + "%", escape="\\"))
+    if msg_type is not None:
+        conditions.append(RosbagTopic.msg_type == msg_type)
+    if msg_count_gte is not None:
+        conditions.append(RosbagTopic.msg_count >= msg_count_gte)
+    if avg_frequency_gte is not None:
+        conditions.append(RosbagTopic.avg_frequency >= avg_frequency_gte)
+
+    if not conditions:
+        return q
+
+    return q.filter(bag_column.in_(select([RosbagTopic.bag_id]).where(and_(*conditions))))
+
+
+def parse_ordering(ordering=None, column_mapping=None, tiebreaker=None):
+    """
+    Parses an ordering string like "discovered:desc,name:asc" into a list of (name, column, descending) tuples.
+    The tiebreaker column (unique, not null) is appended in the direction of the last ordering column.
+    """
+    columns = []
 
     if ordering and column_mapping is not None:
         ordering = [pair.split(":") for pair in ordering.split(",")]
@@ -89,19 +199,150 @@ def query_pagination_ordering(q, offset=None, limit=None, ordering=None, column_
             if column_name not in column_mapping:
                 raise UnknownColumn()
 
-            column = column_mapping[column_name]
-
-            if order == "asc":
-                q = q.order_by(column.asc())
-            elif order == "desc":
-                q = q.order_by(column.desc())
-            else:
+            if order not in ("asc", "desc"):
                 raise UnknownOrdering()
 
-    if offset is not None:
+            columns.append((column_name, column_mapping[column_name], order == "desc"))
+
+    if tiebreaker is not None:
+        descending = columns[-1][2] if columns else False
+        columns.append((tiebreaker.key, tiebreaker, descending))
+
+    return columns
+
+
+def _encode_cursor_value(value):
+    if isinstance(value, datetime.datetime):
+        return {'dt': value.isoformat()}
+    return value
+
+
+def _decode_cursor_value(value):
+    if isinstance(value, dict):
+        return util.deserialize_datetime(value['dt'])
+    return value
+
+
+def encode_cursor(columns, row):
+    """Opaque cursor pointing just after row, for the ordering described by columns"""
+    cursor = {
+        'o': [[name, descending] for name, column, descending in columns],
+        'v': [_encode_cursor_value(getattr(row, column.key)) for name, column, descending in columns]
+    }
+    return base64.urlsafe_b64encode(json.dumps(cursor, separators=(',', ':')).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(columns, cursor):
+    """Returns the ordering values stored in the cursor, the cursor has to be created with the same ordering"""
+    try:
+        cursor = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+        values = [_decode_cursor_value(v) for v in cursor['v']]
+        ordering = cursor['o']
+    except Exception:
+        raise InvalidCursor()
+
+    if ordering != [[name, descending] for name, column, descending in columns] or len(values) != len(columns):
+        raise InvalidCursor()
+
+    return values
+
+
+def _is_nullable(column):
+    return getattr(column.expression, "nullable", True)
+
+
+def _rows_after(columns, values, skip_first_nulls=False):
+    """
+    Condition selecting the rows after the given values. Postgres sorts NULL last when ascending
+    and first when descending, this is taken into account for nullable columns.
+    """
+    after = []
+    equal = []
+
+    for i, ((name, column, descending), value) in enumerate(zip(columns, values)):
+        if value is None:
+            greater = column.isnot(None) if descending else false()
+        elif descending:
+            greater = column < value
+        elif _is_nullable(column) and not (i == 0 and skip_first_nulls):
+            greater = or_(column > value, column.is_(None))
+        else:
+            greater = column > value
+
+        after.append(and_(*(equal + [greater])))
+        equal.append(column.is_(None) if value is None else column == value)
+
+    return or_(*after)
+
+
+def _order_by(q, columns):
+    for name, column, descending in columns:
+        q = q.order_by(column.desc() if descending else column.asc())
+    return q
+
+
+def _query_rows_after(q, columns, values, limit=None):
+    name, first, descending = columns[0]
+    condition = _rows_after(columns, values)
+
+    if values[0] is None:
+        return q.filter(condition)
+
+    # The redundant bound on the first column lets the database start with an index range scan
+    if descending:
+        return q.filter(and_(first <= values[0], condition))
+
+    if not _is_nullable(first):
+        return q.filter(and_(first >= values[0], condition))
+
+    # NULL sorts after every value, reading those rows separately keeps both parts a range scan.
+    # Both parts are limited on their own, otherwise the database reads all of them before sorting.
+    q_values = q.filter(and_(first >= values[0], _rows_after(columns, values, skip_first_nulls=True)))
+    q_nulls = q.filter(first.is_(None))
+
+    if limit is not None:
+        q_values = _order_by(q_values, columns).limit(limit).from_self()
+        q_nulls = _order_by(q_nulls, columns).limit(limit).from_self()
+
+    return q_values.union_all(q_nulls)
+
+
+def query_pagination_ordering(q, offset=None, limit=None, ordering=None, column_mapping=None, cursor=None,
+                              tiebreaker=None):
+    """
+    Applies ordering and pagination to a query. Either offset or cursor based (keyset) pagination is used,
+    the latter requires a unique tiebreaker column (e.g. the primary key) and a cursor from next_page_cursor.
+    """
+    columns = parse_ordering(ordering, column_mapping, tiebreaker)
+
+    if cursor:
+        if tiebreaker is None:
+            raise InvalidCursor()
+
+        q = _query_rows_after(q, columns, decode_cursor(columns, cursor), limit)
+
+    q = _order_by(q, columns)
+
+    if offset is not None and not cursor:
         q = q.offset(offset)
 
     if limit is not None:
         q = q.limit(limit)
 
-    return q
\ No newline at end of file
+    return q
+
+
+def next_page_cursor(rows, limit=None, ordering=None, column_mapping=None, tiebreaker=None):
+    """Cursor for the page following rows, None when rows is the last page"""
+    if not rows or limit is None or len(rows) < limit:
+        return None
+
+    return encode_cursor(parse_ordering(ordering, column_mapping, tiebreaker), rows[-1])
+
+
+def paginated_response(result, cursor):
+    """Response with the next page cursor in the X-Next-Cursor header"""
+    if cursor is None:
+        return result
+
+    return result, 200, {'X-Next-Cursor': cursor}
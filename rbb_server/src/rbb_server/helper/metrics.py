@@ -0,0 +1,311 @@
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import bisect
+import collections
+import glob
+import json
+import logging
+import os
+import threading
+import time
+
+import flask
+from sqlalchemy import event
+
+# Upper bounds of the request latency histogram buckets in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Upper bounds of the SQL statements per request histogram buckets, many statements point to N+1 queries
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# Seconds between writes of the metrics of a process to the metrics directory
+FLUSH_INTERVAL = 1.0
+
+# File in the metrics directory with the added up metrics of the worker processes that exited
+RETIRED_FILE = "retired.json"
+
+DEFAULT_QUERY_BUDGET = 25
+DEFAULT_LATENCY_THRESHOLD = 1.0
+
+
+def operation_name(endpoint):
+    """
+    operationId of a request, connexion names the flask endpoints <blueprint>.<controller module>_<operationId>
+    """
+    if not endpoint:
+        return "none"
+    return endpoint.rsplit('.', 1)[-1].rsplit('_controller_', 1)[-1]
+
+
+def new_histogram(buckets):
+    # Count per bucket, the count above the last bucket and the sum
+    return [0] * (len(buckets) + 1) + [0.0]
+
+
+def observe(histogram, buckets, value):
+    histogram[bisect.bisect_left(buckets, value)] += 1
+    histogram[-1] += value
+
+
+def new_snapshot():
+    return {'requests': {}, 'latency': {}, 'statements': {}, 'sql_time': {}}
+
+
+def add_snapshot(total, process):
+    for name in ('requests', 'sql_time'):
+        for key, value in process[name].items():
+            total[name][key] = total[name].get(key, 0) + value
+    for name in ('latency', 'statements'):
+        for key, value in process[name].items():
+            histogram = total[name].setdefault(key, [0] * len(value))
+            total[name][key] = [a + b for a, b in zip(histogram, value)]
+
+
+def read_snapshot(path):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return None
+
+
+def write_snapshot(path, snapshot):
+    # Replaced atomically, readers never see a partial file
+    temporary_path = path + ".tmp"
+    with open(temporary_path, 'w') as f:
+        json.dump(snapshot, f)
+    os.replace(temporary_path, path)
+
+
+class RequestMetrics(object):
+    """
+    Request and SQL metrics of the requests handled by this process. With a metrics directory, every process writes
+    its metrics to a file there and the metrics endpoint adds up the files of all processes, so it does not matter
+    which gunicorn worker answers the scrape.
+    """
+
+    def __init__(self, directory=None):
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._path = os.path.join(self._directory, "%d.json" % self._pid) if self._directory else None
+        self._last_flush = 0
+        self.requests = {}
+        self.latency = {}
+        self.statements = {}
+        self.sql_time = {}
+
+    def record(self, operation, method, status, duration, statements, sql_time):
+        with self._lock:
+            # Counts of the parent process are not carried into a forked worker
+            if self._pid != os.getpid():
+                self._reset()
+
+            key = "%s %s %d" % (operation, method, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            observe(self.latency.setdefault(operation, new_histogram(LATENCY_BUCKETS)), LATENCY_BUCKETS, duration)
+            observe(self.statements.setdefault(operation, new_histogram(STATEMENT_BUCKETS)), STATEMENT_BUCKETS,
+                    statements)
+            self.sql_time[operation] = self.sql_time.get(operation, 0.0) + sql_time
+
+            flush = self._path and time.time() - self._last_flush >= FLUSH_INTERVAL
+            if flush:
+                self._last_flush = time.time()
+                snapshot = self.snapshot()
+
+        if flush:
+            self._write(snapshot)
+
+    def snapshot(self):
+        return {
+            'requests': dict(self.requests),
+            'latency': {k: list(v) for k, v in self.latency.items()},
+            'statements': {k: list(v) for k, v in self.statements.items()},
+            'sql_time': dict(self.sql_time)
+        }
+
+    def _write(self, snapshot):
+        write_snapshot(self._path, snapshot)
+
+    def collect(self):
+        """Metrics of all processes, or of this process without a metrics directory"""
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset()
+            snapshot = self.snapshot()
+
+        if not self._directory:
+            return snapshot
+
+        self._write(snapshot)
+        total = new_snapshot()
+        for path in glob.glob(os.path.join(self._directory, "*.json")):
+            process = read_snapshot(path)
+            if process:
+                add_snapshot(total, process)
+
+        return total
+
+    @staticmethod
+    def retire(directory, pid):
+        """
+        Adds the metrics of an exited worker process to the retired total and removes its file, called by the
+        gunicorn arbiter so the directory does not grow with every replaced worker
+        """
+        path = os.path.join(directory, "%d.json" % pid)
+        process = read_snapshot(path)
+        if process:
+            retired_path = os.path.join(directory, RETIRED_FILE)
+            total = read_snapshot(retired_path) or new_snapshot()
+            add_snapshot(total, process)
+            write_snapshot(retired_path, total)
+
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def render(snapshot):
+        """Metrics in the Prometheus text exposition format"""
+        lines = ["# HELP rbb_http_requests_total Requests per operation, method and status.",
+                 "# TYPE rbb_http_requests_total counter"]
+        for key in sorted(snapshot['requests']):
+            operation, method, status = key.split(" ")
+            lines.append('rbb_http_requests_total{operation="%s",method="%s",status="%s"} %d'
+                         % (operation, method, status, snapshot['requests'][key]))
+
+        lines += ["# HELP rbb_http_request_duration_seconds Request latency per operation.",
+                  "# TYPE rbb_http_request_duration_seconds histogram"]
+        lines += RequestMetrics._render_histograms("rbb_http_request_duration_seconds", LATENCY_BUCKETS,
+                                                   snapshot['latency'])
+
+        lines += ["# HELP rbb_sql_statements_per_request SQL statements executed per request.",
+                  "# TYPE rbb_sql_statements_per_request histogram"]
+        lines += RequestMetrics._render_histograms("rbb_sql_statements_per_request", STATEMENT_BUCKETS,
+                                                   snapshot['statements'])
+
+        lines += ["# HELP rbb_sql_duration_seconds_total Time spent executing SQL statements per operation.",
+                  "# TYPE rbb_sql_duration_seconds_total counter"]
+        for operation in sorted(snapshot['sql_time']):
+            lines.append('rbb_sql_duration_seconds_total{operation="%s"} %r'
+                         % (operation, float(snapshot['sql_time'][operation])))
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histograms(name, buckets, histograms):
+        lines = []
+        for operation in sorted(histograms):
+            histogram = histograms[operation]
+            cumulative = 0
+            for bound, count in zip(list(buckets) + ["+Inf"], histogram[:-1]):
+                cumulative += count
+                lines.append('%s_bucket{operation="%s",le="%s"} %d' % (name, operation, bound, cumulative))
+            lines.append('%s_sum{operation="%s"} %r' % (name, operation, float(histogram[-1])))
+            lines.append('%s_count{operation="%s"} %d' % (name, operation, cumulative))
+        return lines
+
+
+class RequestState(object):
+    def __init__(self, debug):
+        self.start = time.time()
+        self.statements = 0
+        self.sql_time = 0.0
+        self.statement_counts = collections.Counter() if debug else None
+
+
+def init_app(flask_app, engine, debug=False):
+    """
+    Count the SQL statements of every request and serve the metrics on /metrics. In debug mode (or with the
+    environment variable RBB_REQUEST_DEBUG) requests with more statements than RBB_QUERY_BUDGET or taking longer
+    than RBB_LATENCY_THRESHOLD seconds are logged. The worker processes of the production server share their
+    metrics through files in the directory RBB_METRICS_DIR. The metrics need the system configuration read
+    permission, unless RBB_METRICS_PUBLIC is set (for a scraper that cannot authenticate).
+    """
+    from rbb_server.helper.auth import requires_auth_with_permission
+    from rbb_server.helper.permissions import Permissions
+
+    metrics = RequestMetrics(os.getenv('RBB_METRICS_DIR') or None)
+    debug = debug or bool(os.getenv('RBB_REQUEST_DEBUG'))
+    query_budget = int(os.getenv('RBB_QUERY_BUDGET') or DEFAULT_QUERY_BUDGET)
+    latency_threshold = float(os.getenv('RBB_LATENCY_THRESHOLD') or DEFAULT_LATENCY_THRESHOLD)
+
+    # A request is handled by a single thread, statements of other threads (like cron jobs) are not counted
+    current = threading.local()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        state = getattr(current, 'state', None)
+        if state is not None:
+            conn.info.setdefault('rbb_statement_start', []).append(time.time())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        state = getattr(current, 'state', None)
+        starts = conn.info.get('rbb_statement_start')
+        if state is None or not starts:
+            return
+
+        state.statements += 1
+        state.sql_time += time.time() - starts.pop()
+        if state.statement_counts is not None:
+            state.statement_counts[statement] += 1
+
+    @flask_app.before_request
+    def start_request():
+        current.state = RequestState(debug)
+
+    @flask_app.after_request
+    def finish_request(response):
+        state = getattr(current, 'state', None)
+        if state is None:
+            return response
+        current.state = None
+
+        duration = time.time() - state.start
+        endpoint = flask.request.url_rule.endpoint if flask.request.url_rule else None
+        operation = operation_name(endpoint)
+        metrics.record(operation, flask.request.method, response.status_code, duration, state.statements,
+                       state.sql_time)
+
+        if debug and (state.statements > query_budget or duration > latency_threshold):
+            statement, count = state.statement_counts.most_common(1)[0] if state.statement_counts else ("", 0)
+            logging.warning("Request %s %s (%s) took %.3f s with %d SQL statements in %.3f s, most repeated "
+                            "statement (%d times): %s", flask.request.method, flask.request.path, operation,
+                            duration, state.statements, state.sql_time, count, " ".join(statement.split())[:500])
+
+        return response
+
+    def metrics_endpoint(user=None):
+        return flask.Response(RequestMetrics.render(metrics.collect()),
+                              content_type="text/plain; version=0.0.4; charset=utf-8")
+
+    if not os.getenv('RBB_METRICS_PUBLIC'):
+        metrics_endpoint = requires_auth_with_permission(Permissions.SystemConfigurationRead)(metrics_endpoint)
+
+    flask_app.add_url_rule('/metrics', 'metrics', metrics_endpoint)
+    return metrics
@@ -0,0 +1,107 @@
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import logging
+import os
+import select
+import threading
+import time
+
+from rbb_server.model.database import Database
+
+
+class NotificationListener(object):
+    """
+    Listens to a Postgres NOTIFY channel on a single dedicated connection per process. Requests that wait for a
+    notification block on a condition variable, so they do not hold a database connection while waiting.
+    """
+
+    _listeners = {}
+    _listeners_lock = threading.Lock()
+
+    def __init__(self, channel):
+        self._channel = channel
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._thread = threading.Thread(target=self._run, name="listen-%s" % channel, daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def get(cls, channel):
+        # Keyed by pid as well, threads do not survive a fork of the worker processes
+        key = (os.getpid(), channel)
+        with cls._listeners_lock:
+            if key not in cls._listeners:
+                cls._listeners[key] = cls(channel)
+            return cls._listeners[key]
+
+    @property
+    def generation(self):
+        """Counter that increases on every notification, take it before checking for the awaited condition"""
+        with self._condition:
+            return self._generation
+
+    def wait(self, generation, timeout):
+        """
+        Wait until a notification arrives after the given generation was read
+
+        :return: True if notified, False on timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._generation != generation, timeout)
+
+    def _notify_all(self):
+        with self._condition:
+            self._generation += 1
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            connection = None
+            try:
+                connection = Database.get_engine().raw_connection()
+                connection.detach()
+                dbapi_connection = connection.connection
+                dbapi_connection.autocommit = True
+                with dbapi_connection.cursor() as cursor:
+                    cursor.execute('LISTEN "%s"' % self._channel)
+
+                # Notifications could have been missed while (re)connecting
+                self._notify_all()
+
+                while True:
+                    if select.select([dbapi_connection], [], [], 60) == ([], [], []):
+                        continue
+
+                    dbapi_connection.poll()
+                    if dbapi_connection.notifies:
+                        del dbapi_connection.notifies[:]
+                        self._notify_all()
+
+            except Exception:
+                logging.exception("Listening to channel '%s' failed, reconnecting..." % self._channel)
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+                time.sleep(5)
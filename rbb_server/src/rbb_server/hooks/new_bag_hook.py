@@ -24,14 +24,33 @@ from rbb_server.model.task import TaskState, Task
 
 
 class NewBagHook():
+    """
+    Hooks that run on new bags. Hooks only stage their changes in the session, the caller commits them in
+    the same transaction as the new bags. A hook implements stage for a single bag or stage_batch.
+    """
     _hooks = []
 
     @classmethod
     def trigger(cls, new_bag, store_name, session, trigger=None, user=None):
-        for hook in cls._hooks:
-            new_bag = hook.trigger(new_bag, store_name, session, trigger, user)
+        return cls.trigger_batch([new_bag], store_name, session, trigger, user)[0]
+
+    @classmethod
+    def trigger_batch(cls, new_bags, store_name, session, trigger=None, user=None):
+        # The new bags are written first, statements of the hooks can look them up, e.g. for the task size class
+        session.flush()
+        for hook in NewBagHook._hooks:
+            new_bags = hook.stage_batch(new_bags, store_name, session, trigger, user)
+        return new_bags
+
+    @classmethod
+    def stage(cls, new_bag, store_name, session, trigger=None, user=None):
         return new_bag
 
+    @classmethod
+    def stage_batch(cls, new_bags, store_name, session, trigger=None, user=None):
+        # Hooks without a batch implementation handle the bags one by one
+        return [cls.stage(bag, store_name, session, trigger, user) for bag in new_bags]
+
     @classmethod
     def register(cls):
         if cls != NewBagHook:
@@ -42,34 +61,37 @@ class NewBagHook():
 
 class ScheduleBagExtractionOnNewBag(NewBagHook):
 
-    @classmethod
-    def trigger(cls, new_bag, store_name, session, trigger=None, user=None):
-        task = Task()
-        bag = new_bag  # type: Rosbag
-        task.priority = 100
-        task.description = "Extract discovered bag (%s/%s)" % (store_name, bag.name)
-        task.assigned_to = ""
-        task.created = datetime.utcnow()
-        task.state = TaskState.Queued
-        task.task = "rbb_tools.tasks.bags.extract"
-        task.configuration = {
+    @staticmethod
+    def extraction_task_values(store_name, bag_name):
+        configuration = {
             'store': store_name,
             'configuration': 'auto',
-            'bag': bag.name
+            'bag': bag_name
         }
-        task.result = {}
-        task.success = False
-        task.log = ""
-        task.runtime = None
-        task.worker_labels = ""
-        task.task_hash = Task.calculate_hash(task.configuration)
-
-        session.add(task)
-        session.commit()
 
-        return new_bag
+        return dict(
+            priority=100,
+            description="Extract discovered bag (%s/%s)" % (store_name, bag_name),
+            assigned_to="",
+            created=datetime.utcnow(),
+            state=TaskState.Queued,
+            task="rbb_tools.tasks.bags.extract",
+            configuration=configuration,
+            result={},
+            success=False,
+            runtime=None,
+            worker_labels="",
+            task_hash=Task.calculate_hash(configuration)
+        )
 
+    @classmethod
+    def stage_batch(cls, new_bags, store_name, session, trigger=None, user=None):
+        if new_bags:
+            # All tasks in a single multi-row insert, bags that are already queued for extraction are skipped
+            values = [cls.extraction_task_values(store_name, bag.name) for bag in new_bags]
+            session.execute(Task.insert_unless_queued(values))
 
-ScheduleBagExtractionOnNewBag.register()
+        return new_bags
 
 
+ScheduleBagExtractionOnNewBag.register()
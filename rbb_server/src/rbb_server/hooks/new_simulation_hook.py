@@ -24,14 +24,31 @@ from rbb_server.model.task import TaskState, Task
 
 
 class NewSimulationHook():
+    """
+    Hooks that run on new simulations. Hooks only stage their changes in the session, the caller commits them in
+    the same transaction as the new simulations. A hook implements stage for a single simulation or stage_batch.
+    """
     _hooks = []
 
     @classmethod
     def trigger(cls, new_sim, session, trigger=None, user=None):
-        for hook in cls._hooks:
-            new_sim = hook.trigger(new_sim, session, trigger, user)
+        return cls.trigger_batch([new_sim], session, trigger, user)[0]
+
+    @classmethod
+    def trigger_batch(cls, new_sims, session, trigger=None, user=None):
+        for hook in NewSimulationHook._hooks:
+            new_sims = hook.stage_batch(new_sims, session, trigger, user)
+        return new_sims
+
+    @classmethod
+    def stage(cls, new_sim, session, trigger=None, user=None):
         return new_sim
 
+    @classmethod
+    def stage_batch(cls, new_sims, session, trigger=None, user=None):
+        # Hooks without a batch implementation handle the simulations one by one
+        return [cls.stage(sim, session, trigger, user) for sim in new_sims]
+
     @classmethod
     def register(cls):
         if cls != __class__:
@@ -42,29 +59,44 @@ class NewSimulationHook():
 
 class ScheduleOnNewSimulation(NewSimulationHook):
 
-    @classmethod
-    def trigger(cls, new_sim, session, trigger=None, user=None):
-        task = Task()
-        task.priority = 1000
-        task.description = "Simulate #%d '%s'" % (new_sim.uid, new_sim.description)
-        task.assigned_to = ""
-        task.created = datetime.datetime.utcnow()
-        task.state = TaskState.Queued
-        task.task = "rbb_tools.tasks.sim.simulate"
-        task.configuration = {
+    @staticmethod
+    def simulation_task_values(new_sim):
+        configuration = {
             'simulation': new_sim.uid
         }
-        task.result = {}
-        task.success = False
-        task.log = ""
-        task.runtime = None
-        task.worker_labels = ""
-        task.task_hash = Task.calculate_hash(task.configuration)
-        new_sim.task_in_queue = task
-        session.add(task)
-        session.commit()
 
-        return new_sim
+        return dict(
+            priority=1000,
+            description="Simulate #%d '%s'" % (new_sim.uid, new_sim.description),
+            assigned_to="",
+            created=datetime.datetime.utcnow(),
+            state=TaskState.Queued,
+            task="rbb_tools.tasks.sim.simulate",
+            configuration=configuration,
+            result={},
+            success=False,
+            runtime=None,
+            worker_labels="",
+            task_hash=Task.calculate_hash(configuration)
+        )
+
+    @classmethod
+    def stage_batch(cls, new_sims, session, trigger=None, user=None):
+        if not new_sims:
+            return new_sims
+
+        # The simulations need their uid for the task configuration
+        session.flush()
+
+        # All tasks in a single multi-row insert, linked back through the simulation in their configuration
+        values = [cls.simulation_task_values(sim) for sim in new_sims]
+        q = Task.__table__.insert().values(values).returning(Task.uid, Task.configuration)
+        task_uids = {row.configuration['simulation']: row.uid for row in session.execute(q)}
+
+        for sim in new_sims:
+            sim.task_in_queue_id = task_uids[sim.uid]
+
+        return new_sims
 
 
 ScheduleOnNewSimulation.register()
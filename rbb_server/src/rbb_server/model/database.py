@@ -20,7 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from sqlalchemy import create_engine, engine
+from sqlalchemy import create_engine, engine, event, exc
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.engine import url as engine_url
@@ -33,6 +33,7 @@ from .rosbag_store import RosbagStore
 from .rosbag_product import RosbagProduct
 from .rosbag_product_topic import RosbagProductTopic
 from .rosbag_topic import RosbagTopic
+from .message_definition import MessageDefinition
 from .file import File
 from .file_store import FileStore
 from .rosbag_product_file import RosbagProductFile
@@ -40,6 +41,9 @@ from .session import Session
 from .user import User
 from .rosbag_extraction_configuration import RosbagExtractionConfiguration
 from .task import Task
+from .task_archive import TaskArchive, TaskHistory
+from .task_log_chunk import TaskLogChunk
+from .task_runtime_estimate import TaskRuntimeEstimate
 from .tag import Tag
 from .simulation_environment import SimulationEnvironment
 from .simulation import Simulation
@@ -49,6 +53,25 @@ from .permission import Permission
 from .config_key_value import ConfigKeyValue
 
 
+def _environment_flag(name, default):
+    value = os.getenv(name)
+    if not value:
+        return default
+    return value.lower() not in ('0', 'false', 'no', 'off')
+
+
+def _ping_connection(dbapi_connection, connection_record, connection_proxy):
+    # Connections closed by the database or a firewall while in the pool are replaced before they are used
+    try:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("SELECT 1")
+        cursor.close()
+        # End the transaction the ping started, the connection is handed out like it came from the pool
+        dbapi_connection.rollback()
+    except Exception:
+        raise exc.DisconnectionError()
+
+
 class Database:
     _session = None
     _engine = None
@@ -70,9 +93,41 @@ class Database:
                   'port': os.getenv('RBB_DB_PORT') if os.getenv('RBB_DB_PORT') else 5432,
                   'database': os.getenv('RBB_DB_DB') if os.getenv('RBB_DB_DB') else 'postgres'}
 
-        Database._engine = create_engine(engine_url.URL(**db_url), echo=debug, convert_unicode=True)
+        # Connections per process, every request thread holds at most one (RBB_DB_POOL_SIZE + RBB_DB_MAX_OVERFLOW)
+        pool_size = int(os.getenv('RBB_DB_POOL_SIZE') or 8)
+        max_overflow = int(os.getenv('RBB_DB_MAX_OVERFLOW') or 8)
+        # Seconds after which a pooled connection is replaced, 0 to keep them
+        pool_recycle = int(os.getenv('RBB_DB_POOL_RECYCLE') or 1800)
+        # Seconds a single statement may run, 0 for no limit
+        statement_timeout = float(os.getenv('RBB_DB_STATEMENT_TIMEOUT') or 60)
+
+        # Given like PGOPTIONS, which it would replace otherwise
+        connect_args = {}
+        if statement_timeout > 0:
+            connect_args['options'] = (os.getenv('PGOPTIONS', '') +
+                                       ' -c statement_timeout=%d' % int(statement_timeout * 1000)).strip()
+
+        Database._engine = create_engine(engine_url.URL(**db_url), echo=debug, convert_unicode=True,
+                                         pool_size=pool_size, max_overflow=max_overflow,
+                                         pool_recycle=pool_recycle if pool_recycle > 0 else -1,
+                                         connect_args=connect_args)
+
+        if _environment_flag('RBB_DB_POOL_PRE_PING', True):
+            event.listen(Database._engine, "checkout", _ping_connection)
+
         db_session = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=Database._engine))
 
         Base.query = db_session.query_property()
         Database._session = db_session
 
+    @staticmethod
+    def dispose():
+        """
+        Drop the pooled connections, a forked process must not use the connections of its parent. The engine opens new
+        connections when needed.
+        """
+        if Database._session:
+            Database._session.remove()
+        if Database._engine:
+            Database._engine.dispose()
+
@@ -24,6 +24,7 @@ from flask import url_for
 from rbb_server.helper.permissions import hide, Permissions, has_permission
 from sqlalchemy import *
 from sqlalchemy.orm import relationship
+from werkzeug.urls import url_quote
 
 from rbb_swagger_server.models import FileSummary, FileDetailed
 from .base import Base
@@ -39,20 +40,37 @@ class File(Base):
     # Relationship
     store = relationship("FileStore", back_populates="files")
 
-    def to_swagger_model_summary(self, model=None):
+    @staticmethod
+    def link_template():
+        """
+        Download link with {store_name}, {uid} and {file_name} placeholders. Lists of files are linked with a single
+        url_for call, the placeholders are filled in by link().
+        """
+        link = url_for(
+            "/api/v0.rbb_server_controllers_file_controller_get_file",
+            file_name = "file",
+            store_name = "store",
+            uid = 0,
+            _external=True
+        )
+        return link.rsplit("/", 3)[0] + "/{store_name}/{uid}/{file_name}"
+
+    def link(self, link_template=None):
+        if link_template is None:
+            link_template = File.link_template()
+
+        # Quoted like the url_for path converters do
+        return link_template.format(store_name=url_quote(self.store.name), uid=self.uid,
+                                    file_name=url_quote(self.name))
+
+    def to_swagger_model_summary(self, model=None, link_template=None):
         if model is None:
             model = FileSummary()
         model.detail_type = "FileSummary"
         model.uid = self.uid
         model.store_name = self.store.name
         model.name = self.name
-        model.link = url_for(
-            "/api/v0.rbb_server_controllers_file_controller_get_file",
-            file_name = self.name,
-            store_name = self.store.name,
-            uid = self.uid,
-            _external=True
-        )
+        model.link = self.link(link_template)
         return model
 
     def to_swagger_model_detailed(self, model=None, user=None):
@@ -0,0 +1,53 @@
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from sqlalchemy import *
+from sqlalchemy.dialects.postgresql import insert
+
+from .base import Base
+
+
+class MessageDefinition(Base):
+    __tablename__ = "message_definition"
+    msg_type_hash = Column(String(50), primary_key=True)
+    msg_definition = Column(String)
+
+    @staticmethod
+    def upsert(session, topics):
+        """
+        Stores the definitions of the message types used by the topics in a single statement. A definition is
+        only replaced when no text was known for it yet, as the extractor registers topics with empty definitions.
+        """
+        definitions = {}
+        for topic in topics:
+            if topic.msg_type_hash is not None and definitions.get(topic.msg_type_hash) in (None, ""):
+                definitions[topic.msg_type_hash] = topic.msg_definition if topic.msg_definition else ""
+
+        if not definitions:
+            return
+
+        statement = insert(MessageDefinition.__table__).values(
+            [{'msg_type_hash': key, 'msg_definition': value} for key, value in sorted(definitions.items())])
+        statement = statement.on_conflict_do_update(
+            index_elements=[MessageDefinition.msg_type_hash],
+            set_={'msg_definition': statement.excluded.msg_definition},
+            where=and_(MessageDefinition.msg_definition == "", statement.excluded.msg_definition != ""))
+        session.execute(statement)
@@ -20,12 +20,19 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from rbb_server.helper.permissions import hide, has_permission, Permissions
+from rbb_server.helper.permissions import has_permission, Permissions
 from sqlalchemy import *
-from sqlalchemy.orm import relationship
+from sqlalchemy import event, inspect
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, joinedload, subqueryload, defer, deferred
 
 from rbb_swagger_server.models import BagSummary, BagDetailed
 from .base import Base
+from .file import File
+from .rosbag_product import RosbagProduct
+from .rosbag_product_file import RosbagProductFile
+from .rosbag_topic import RosbagTopic
+from .task import Task
 
 tag_association_table = Table('rosbag_tags', Base.metadata,
     Column('bag_id', Integer, ForeignKey('rosbag.uid')),
@@ -37,10 +44,10 @@ class Rosbag(Base):
     uid = Column(Integer, primary_key=True)
     store_id = Column(Integer, ForeignKey('rosbag_store.uid'))
     store_data = Column(JSON)
-    name = Column(String(255))
+    name = Column(String(255), nullable=False)
     is_extracted = Column(Boolean, server_default="false")
     in_trash = Column(Boolean, server_default="false")
-    discovered = Column(DateTime, server_default="now() AT TIME ZONE 'utc'")
+    discovered = Column(DateTime, nullable=False, server_default="now() AT TIME ZONE 'utc'")
     meta_available = Column(Boolean)
     extraction_failure = Column(Boolean, server_default="false")
     size = Column(Integer)
@@ -49,6 +56,7 @@ class Rosbag(Base):
     duration = Column(Float)
     messages = Column(Integer)
     comment = Column(String)  # This is more of a description
+    search_vector = deferred(Column(TSVECTOR))  # Only used in queries, never loaded
 
     # Relationship
     store = relationship("RosbagStore", back_populates="bags")
@@ -57,13 +65,57 @@ class Rosbag(Base):
     tags = relationship("Tag", secondary=tag_association_table)
     comments = relationship("RosbagComment", cascade="all, delete-orphan")
 
+    @staticmethod
+    def summary_query_options(user=None, path=None):
+        """
+        Loader options that fetch everything to_swagger_model_summary needs in a constant number of queries.
+        When the bags are loaded through a relationship, pass the loader of that relationship as path,
+        e.g. joinedload(SimulationRun.bag).
+        """
+        hide_store_data = not has_permission(user, Permissions.StoreSecretAccess)
+
+        if path is None:
+            options = [joinedload(Rosbag.tags), defer(Rosbag.comment)]
+            if hide_store_data:
+                options.append(defer(Rosbag.store_data))
+        else:
+            options = [path, path.joinedload(Rosbag.tags), path.defer(Rosbag.comment)]
+            if hide_store_data:
+                options.append(path.defer(Rosbag.store_data))
+
+        return options
+
+    @staticmethod
+    def detailed_query_options(user=None, msg_definitions=True, product_data=True):
+        """
+        Loader options that fetch everything to_swagger_model_detailed needs in a constant number of queries,
+        independent of the number of topics, products and files of the bag.
+        """
+        topics = subqueryload(Rosbag.topics)
+        products = subqueryload(Rosbag.products)
+
+        # The topics of the products are many-to-one on the topics of the bag, found in the identity map
+        options = [joinedload(Rosbag.tags), topics, products.subqueryload(RosbagProduct.topics),
+                   products.subqueryload(RosbagProduct.files)
+                       .joinedload(RosbagProductFile.file).joinedload(File.store)]
+        if msg_definitions:
+            options.append(topics.joinedload(RosbagTopic.definition))
+        if product_data:
+            options.append(products.undefer(RosbagProduct.product_data))
+
+        return options
+
     def to_swagger_model_summary(self, model=None, user=None):
         if model is None:
             model = BagSummary()
 
         model.detail_type="BagSummary"
         model.name=self.name
-        model.store_data=hide(self.store_data, user, Permissions.StoreSecretAccess, {"_hidden": True})
+        # Only touch store_data when it is shown, it is deferred for users that cannot see it
+        if has_permission(user, Permissions.StoreSecretAccess):
+            model.store_data = self.store_data
+        else:
+            model.store_data = {"_hidden": True}
         model.discovered=self.discovered
         model.is_extracted=self.is_extracted
         model.in_trash=self.in_trash
@@ -77,21 +129,27 @@ class Rosbag(Base):
         model.tags = [x.to_swagger_model() for x in self.tags]
         return model
 
-    def to_swagger_model_detailed(self, user=None):
+    def to_swagger_model_detailed(self, user=None, msg_definitions=True, product_data=True):
         model = self.to_swagger_model_summary(BagDetailed(), user=user) #type: BagDetailed
         model.detail_type = "BagDetailed"
         model.comment = self.comment
 
         model.topics = []
         for t in self.topics:
-            model.topics.append(t.to_swagger_model_detailed())
+            model.topics.append(t.to_swagger_model_detailed(msg_definitions=msg_definitions))
 
+        link_template = File.link_template() if self.products else None
         model.products = []
         for p in self.products:
-            model.products.append(p.to_swagger_model_detailed())
+            model.products.append(p.to_swagger_model_detailed(link_template=link_template, product_data=product_data))
 
         return model
 
+    def update_search_vector(self):
+        """Recomputes the full text search document from the name, the topic names and the comment"""
+        self.search_vector = func.rosbag_search_vector(self.name, " ".join([t.name for t in self.topics]),
+                                                       self.comment)
+
     def from_swagger_model(self, api_model, user=None):
         model = api_model  # type: BagDetailed
         self.name = model.name
@@ -110,3 +168,20 @@ class Rosbag(Base):
         self.comment = model.comment
 
         return self
+
+
+@event.listens_for(Rosbag, "before_update")
+def _update_search_vector_on_change(mapper, connection, target):
+    # Every write path that renames a bag or changes its comment keeps the search document current, topic changes
+    # call update_search_vector themselves
+    state = inspect(target)
+    if state.attrs.name.history.has_changes() or state.attrs.comment.history.has_changes():
+        target.update_search_vector()
+
+
+@event.listens_for(Rosbag, "after_update")
+def _update_task_size_classes_on_resize(mapper, connection, target):
+    # The tasks of the bag were queued with the size class of the bag at that time, usually the size of a bag is only
+    # known once it is extracted
+    if inspect(target).attrs.size.history.has_changes():
+        connection.execute(Task.size_class_statement(target.store_id, target.name))
@@ -21,7 +21,7 @@
 # SOFTWARE.
 
 from sqlalchemy import *
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred, joinedload, subqueryload, undefer
 
 from rbb_swagger_server.models import Product, TopicMapping, ProductFile
 from .base import Base
@@ -36,7 +36,7 @@ class RosbagProduct(Base):
     bag_id = Column(Integer, ForeignKey('rosbag.uid'))
     plugin = Column(String(100))
     product_type = Column(String(100))
-    product_data = Column(JSON)
+    product_data = deferred(Column(JSON))  # Can be large, only read when requested
     created = Column(DateTime, server_default="now() AT TIME ZONE 'utc'")
     title = Column(String(200))
     configuration_tag = Column(String(100))
@@ -47,12 +47,22 @@ class RosbagProduct(Base):
     topics = relationship("RosbagProductTopic", cascade="all, delete-orphan")
     files = relationship("RosbagProductFile", cascade="all, delete-orphan")
 
-    def to_swagger_model_detailed(self):
+    @staticmethod
+    def detailed_query_options():
+        """
+        Loader options that fetch everything to_swagger_model_detailed needs in a constant number of queries,
+        independent of the number of products, topics and files.
+        """
+        return [undefer(RosbagProduct.product_data),
+                subqueryload(RosbagProduct.topics).joinedload(RosbagProductTopic.topic),
+                subqueryload(RosbagProduct.files).joinedload(RosbagProductFile.file).joinedload(File.store)]
+
+    def to_swagger_model_detailed(self, link_template=None, product_data=True):
         model = Product (
             uid=self.uid,
             plugin=self.plugin,
             product_type=self.product_type,
-            product_data=self.product_data,
+            product_data=self.product_data if product_data else None,
             created=self.created,
             title=self.title,
             configuration_tag=self.configuration_tag,
@@ -70,7 +80,7 @@ class RosbagProduct(Base):
         for f in self.files:
             model.files.append(ProductFile(
                 key=f.key,
-                file=f.file.to_swagger_model_summary()
+                file=f.file.to_swagger_model_summary(link_template=link_template)
             ))
 
         return model
@@ -78,7 +88,11 @@ class RosbagProduct(Base):
     def from_swagger_model(self, api_model):
         model = api_model  # type: Product
         self.plugin = model.plugin
-        self.product_data = model.product_data
+        # Products fetched without their data are sent back without it, the stored data is kept
+        if model.product_data is not None:
+            self.product_data = model.product_data
+        elif self.uid is None:
+            self.product_data = {}
         self.product_type = model.product_type
         self.created = model.created.replace(tzinfo=None)
         self.title = model.title
@@ -87,29 +101,37 @@ class RosbagProduct(Base):
         return self
 
     def topic_mapping_from_swagger_model(self, api_model, topics):
+        """
+        :param topics: Topics of the bag by name
+        :type topics: dict
+        """
         model = api_model  # type: Product
 
         self.topics = []
 
         for topic_mapping in model.topics:
-            topic = list(filter(lambda x: x.name == topic_mapping.original_topic, topics))
+            topic = topics.get(topic_mapping.original_topic)
 
-            if len(topic) == 0:
+            if topic is None:
                 raise ValueError("Topic %s not in topics" % topic_mapping.original_topic)
             else:
                 self.topics.append(RosbagProductTopic(
                     plugin_topic = topic_mapping.plugin_topic,
-                    topic = topic[0],
+                    topic = topic,
                 ))
 
         return self
 
-    def file_mapping_from_swagger_model(self, api_model, session):
+    def file_mapping_from_swagger_model(self, api_model, files):
+        """
+        :param files: Files referenced by the products by uid, see load_files
+        :type files: dict
+        """
         model = api_model  # type: Product
 
         self.files = []
         for file_link in model.files: # type: ProductFile
-            file = session.query(File).get(file_link.file.uid)
+            file = files.get(file_link.file.uid)
 
             if not file or file.name != file_link.file.name:
                 raise ValueError("File %d (%s) not found" % (file_link.file.uid, file_link.file.name))
@@ -121,3 +143,19 @@ class RosbagProduct(Base):
 
         return self
 
+    @staticmethod
+    def load_files(session, api_models):
+        """
+        Load all files referenced by the given products in a single query
+
+        :rtype: dict
+        """
+        uids = set()
+        for model in api_models:  # type: Product
+            for file_link in model.files:
+                uids.add(file_link.file.uid)
+
+        if not uids:
+            return {}
+
+        return {f.uid: f for f in session.query(File).filter(File.uid.in_(uids))}
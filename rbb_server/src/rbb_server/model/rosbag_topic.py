@@ -33,20 +33,20 @@ class RosbagTopic(Base):
     bag_id = Column(Integer, ForeignKey('rosbag.uid'))
     name = Column(String(255))
     msg_type = Column(String(255))
-    msg_type_hash = Column(String(50))
-    msg_definition = Column(String)
+    msg_type_hash = Column(String(50), ForeignKey('message_definition.msg_type_hash'))
     msg_count = Column(Integer)
     avg_frequency = Column(Float)
 
     # Relationships
     bag = relationship("Rosbag", back_populates="topics")
+    definition = relationship("MessageDefinition")
 
-    def to_swagger_model_detailed(self, user=None):
+    def to_swagger_model_detailed(self, user=None, msg_definitions=True):
         return Topic(
             name=self.name,
             msg_type=self.msg_type,
             msg_type_hash=self.msg_type_hash,
-            msg_definition=self.msg_definition,
+            msg_definition=self.definition.msg_definition if msg_definitions and self.definition else None,
             msg_count=self.msg_count,
             avg_frequency=self.avg_frequency
         )
@@ -56,7 +56,6 @@ class RosbagTopic(Base):
         self.name = model.name
         self.msg_type = model.msg_type
         self.msg_type_hash = model.msg_type_hash
-        self.msg_definition = model.msg_definition
         self.msg_count = model.msg_count
         self.avg_frequency = model.avg_frequency
 
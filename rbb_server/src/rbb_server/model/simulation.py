@@ -31,7 +31,7 @@ class Simulation(Base):
     __tablename__ = "simulation"
     uid = Column(Integer, primary_key=True)
     description = Column(String(200))
-    created = Column(DateTime(), server_default="now() AT TIME ZONE 'utc'")
+    created = Column(DateTime(), nullable=False, server_default="now() AT TIME ZONE 'utc'")
     configuration = Column(JSON)
     result = Column(Integer)
     environment_id = Column(Integer, ForeignKey('simulation_environment.uid'))
@@ -21,10 +21,11 @@
 # SOFTWARE.
 
 from sqlalchemy import *
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, joinedload
 
 from rbb_swagger_server.models import SimulationRunSummary, SimulationRunDetailed
 from .base import Base
+from .rosbag import Rosbag
 
 
 class SimulationRun(Base):
@@ -41,6 +42,20 @@ class SimulationRun(Base):
     bag = relationship("Rosbag")
     simulation = relationship("Simulation", back_populates="runs")
 
+    @staticmethod
+    def summary_query_options(user=None, path=None, expand=False):
+        """
+        Loader options that join the bag (and its store) of the runs instead of lazy loading them per run,
+        with expand the bag summary is loaded as well. Pass path when the runs are loaded through a relationship.
+        """
+        bag = path.joinedload(SimulationRun.bag) if path is not None else joinedload(SimulationRun.bag)
+        options = [bag, bag.joinedload(Rosbag.store)]
+
+        if expand:
+            options.extend(Rosbag.summary_query_options(user=user, path=bag))
+
+        return options
+
     def to_swagger_model_summary(self, model=None, user=None):
         if model is None:
             model = SimulationRunSummary()
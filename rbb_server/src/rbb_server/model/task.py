@@ -22,13 +22,19 @@
 
 import base64
 import hashlib
+import json
 
 from rbb_server.helper.permissions import hide, has_permission, Permissions
 from sqlalchemy import *
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import object_session
 
 from rbb_swagger_server.models.task_detailed import TaskDetailed
 from rbb_swagger_server.models.task_summary import TaskSummary
 from .base import Base
+from .config_key_value import ConfigKeyValue
+from .task_log_chunk import TaskLogChunk
+from .task_runtime_estimate import TaskRuntimeEstimate
 
 
 class TaskState(Enum):
@@ -40,44 +46,59 @@ class TaskState(Enum):
     CancellationRequested = 102
 
 
-class Task(Base):
-    __tablename__ = "task_queue"
+# A worker holds its task until the lease expires, unless it renews it (configuration queue.lease_duration)
+LEASE_EXPIRES_SQL = "(now() AT TIME ZONE 'utc') + make_interval(secs => coalesce(" \
+                    "(SELECT CAST(value AS float) FROM configuration WHERE config_key = 'queue.lease_duration'), 60))"
+
+# Running a task is attempted this many times before it fails (configuration queue.max_attempts)
+MAX_ATTEMPTS_SQL = "coalesce(" \
+                   "(SELECT CAST(value AS integer) FROM configuration WHERE config_key = 'queue.max_attempts'), 3)"
+
+# Seconds of waiting or of expected runtime that count as one priority step (configuration queue.aging_period)
+AGING_PERIOD_SQL = "coalesce(" \
+                   "(SELECT CAST(value AS float) FROM configuration WHERE config_key = 'queue.aging_period'), 600)"
+
+# Dequeue orders, see Task.dequeue_query
+SCHEDULING_POLICIES = ("priority", "shortest_expected")
+
+# Number of tasks, the most important by priority, that shortest_expected scheduling ranks by expected runtime
+SCHEDULING_CANDIDATES = 1000
+
+# Start of the window of the queue statistics, :window seconds ago
+WINDOW_START_SQL = "((now() AT TIME ZONE 'utc') - make_interval(secs => :window))"
+
+
+def _normalize_numbers(value):
+    if isinstance(value, dict):
+        return {k: _normalize_numbers(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_numbers(v) for v in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+class TaskColumns(object):
+    """Columns of a task, shared by the queue of live tasks, the archive of old finished tasks and the view over both"""
     uid = Column(Integer, primary_key=True)
-    priority = Column(Integer)
+    priority = Column(Integer, nullable=False)
     description = Column(String(200))
     assigned_to = Column(String(100))
-    created = Column(DateTime, server_default="now() AT TIME ZONE 'utc'")
-    last_updated = Column(DateTime, server_default="now() AT TIME ZONE 'utc'")
-    state = Column(Integer)
+    created = Column(DateTime, nullable=False, server_default="now() AT TIME ZONE 'utc'")
+    last_updated = Column(DateTime, nullable=False, server_default="now() AT TIME ZONE 'utc'")
+    state = Column(Integer, nullable=False)
     task = Column(String(100))
     configuration = Column(JSON)
     result = Column(JSON)
     success = Column(Boolean)
     runtime = Column(Float)
-    log = Column(Text)
     worker_labels = Column(String(255))
     task_hash = Column(String(50))
-
-    @staticmethod
-    def calculate_hash(config):
-        m = hashlib.md5()
-        m.update(repr(config).encode())
-        return base64.b64encode(m.digest()).decode('latin-1')
-
-    @staticmethod
-    def task_assignment_query(session, uid, worker_name):
-        result = session.execute("UPDATE task_queue "
-                               "SET assigned_to=:assigned_to, state=1 "
-                                "WHERE uid=:uid AND assigned_to=''",
-                               {'uid': uid, 'assigned_to': worker_name})
-        return result.rowcount == 1
-
-    @staticmethod
-    def task_prio_up(session, uid):
-        result = session.execute("UPDATE task_queue "
-                               "SET priority=x.new_prio FROM (SELECT max(priority) + 1 as new_prio FROM task_queue) x "
-                                "WHERE uid=:uid",
-                               {'uid': uid })
+    lease_expires = Column(DateTime)
+    attempts = Column(Integer, nullable=False, server_default="0")
+    started = Column(DateTime)
+    finished = Column(DateTime)  # Set by a trigger when the task reaches a final state
+    size_class = Column(Integer, server_default=FetchedValue())  # Set by a trigger on insert, see task_size_class
 
     def to_swagger_model_summary(self, model=None, user=None):
         if model is None:
@@ -97,15 +118,259 @@ class Task(Base):
         model.worker_labels = self.worker_labels
         return model
 
-    def to_swagger_model_detailed(self, user=None):
+    def to_swagger_model_detailed(self, user=None, log=False):
         model = self.to_swagger_model_summary(TaskDetailed(), user=user)  # type: TaskDetailed
         model.detail_type = "TaskDetailed"
         model.config = self.configuration
         model.result = hide(self.result, user, Permissions.QueueResultAccess, {"_hidden": True})
-        model.log = hide(self.log, user, Permissions.QueueResultAccess, "_hidden")
+
+        # The log can be large, it is only included on request
+        if log:
+            if has_permission(user, Permissions.QueueResultAccess):
+                model.log = TaskLogChunk.read(object_session(self), self.uid)[0]
+            else:
+                model.log = "_hidden"
 
         return model
 
+
+class Task(TaskColumns, Base):
+    __tablename__ = "task_queue"
+
+    # Unique index on task and task_hash of the unfinished tasks
+    UNFINISHED_HASH_INDEX = "task_queue_task_task_hash_unfinished_idx"
+
+    @staticmethod
+    def calculate_hash(config):
+        """
+        Hash of a task configuration that is equal for logically equal configurations. Keys are sorted and whole
+        floats are written as integers in the canonical JSON, so {'b': 1.0, 'a': 2} hashes like {'a': 2, 'b': 1}.
+        """
+        canonical = json.dumps(_normalize_numbers(config), sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return base64.b64encode(hashlib.sha256(canonical.encode('utf-8')).digest()).decode('ascii')
+
+    @staticmethod
+    def insert_unless_queued(values):
+        """
+        Multi-row insert of new tasks, a task is skipped if the same task with an equal configuration is not finished
+        yet (see the unique index on task and task_hash)
+        """
+        return postgresql.insert(Task.__table__).values(values)\
+            .on_conflict_do_nothing(index_elements=[Task.task, Task.task_hash],
+                                    index_where=Task.state < TaskState.Finished)
+
+    @staticmethod
+    def scheduling_policy(session):
+        """Order in which the queued tasks are dequeued (configuration queue.scheduling)"""
+        policy = session.query(ConfigKeyValue.value)\
+            .filter(ConfigKeyValue.config_key == "queue.scheduling")\
+            .scalar()
+        return policy if policy in SCHEDULING_POLICIES else "priority"
+
+    @staticmethod
+    def dequeue_query(session, worker_name, tasks=None, labels=(), policy="priority"):
+        """
+        Assign the most important queued task to the worker in a single statement. Rows locked by other
+        workers dequeueing at the same time are skipped instead of waited for.
+
+        With the policy shortest_expected the most important tasks by priority, read from the index of the queued
+        tasks, are ranked again. Every aging period (configuration queue.aging_period) of expected runtime lowers the
+        priority of a task by one and every aging period it waited raises it by one, short tasks go first but long
+        tasks do not starve. The estimate is looked up once per task type and size class of the candidates.
+
+        :param tasks: Task names the worker can do, None for any task
+        :param labels: Labels of the worker, a task is only assigned if the worker has all its labels
+        :param policy: priority or shortest_expected
+        :return: Query for the assigned task, it has no result if nothing could be assigned
+        """
+        dequeueable = (
+            "state = :queued AND assigned_to = ''"
+            "    AND (:any_task OR task = ANY(CAST(:tasks AS varchar[])))"
+            "    AND coalesce(string_to_array(nullif(replace(worker_labels, ' ', ''), ''), ','), '{}')"
+            "        <@ CAST(:labels AS text[])")
+
+        if policy == "shortest_expected":
+            statement = text(
+                "WITH candidates AS ("
+                "  SELECT uid, priority, created, task, size_class FROM task_queue"
+                "  WHERE " + dequeueable +
+                "  ORDER BY priority DESC, uid"
+                "  LIMIT :candidates"
+                "), expected (expected_task, expected_size_class, runtime) AS ("
+                "  SELECT g.task, g.size_class, " + TaskRuntimeEstimate.expected_runtime_sql("g.task", "g.size_class") +
+                "  FROM (SELECT DISTINCT task, size_class FROM candidates) g"
+                ") "
+                "UPDATE task_queue SET assigned_to=:assigned_to, state=:running, attempts=attempts + 1, "
+                "  started=now() AT TIME ZONE 'utc', lease_expires=" + LEASE_EXPIRES_SQL + " "
+                "WHERE uid = ("
+                "  SELECT q.uid FROM task_queue q"
+                "  JOIN candidates c ON c.uid = q.uid"
+                "  JOIN expected e ON e.expected_task = c.task AND e.expected_size_class = c.size_class"
+                "  WHERE q.state = :queued AND q.assigned_to = ''"
+                "  ORDER BY c.priority + (extract(epoch FROM (now() AT TIME ZONE 'utc') - c.created)"
+                "      - coalesce(e.runtime, 0)) / " + AGING_PERIOD_SQL + " DESC, q.uid"
+                "  LIMIT 1"
+                "  FOR UPDATE OF q SKIP LOCKED"
+                ") RETURNING *").bindparams(candidates=SCHEDULING_CANDIDATES)
+        else:
+            statement = text(
+                "UPDATE task_queue SET assigned_to=:assigned_to, state=:running, attempts=attempts + 1, "
+                "  started=now() AT TIME ZONE 'utc', lease_expires=" + LEASE_EXPIRES_SQL + " "
+                "WHERE uid = ("
+                "  SELECT uid FROM task_queue"
+                "  WHERE " + dequeueable +
+                "  ORDER BY priority DESC, uid"
+                "  LIMIT 1"
+                "  FOR UPDATE SKIP LOCKED"
+                ") RETURNING *")
+
+        statement = statement.bindparams(
+            assigned_to=worker_name, running=TaskState.Running, queued=TaskState.Queued,
+            any_task=tasks is None, tasks=list(tasks or []), labels=list(labels))
+
+        return session.query(Task).from_statement(statement)
+
+    @staticmethod
+    def heartbeat_statement(uid, worker_name):
+        """
+        Renew the lease of the worker, this also locks the task for appending to the log
+
+        :return: Statement returning the state of the task, it has no result if the task is not running for the worker
+        """
+        return Task.__table__.update()\
+            .where(Task.uid == uid)\
+            .where(Task.assigned_to == worker_name)\
+            .where(Task.state.in_([TaskState.Running, TaskState.CancellationRequested]))\
+            .values(lease_expires=text(LEASE_EXPIRES_SQL))\
+            .returning(Task.state)
+
+    def is_running_for(self, worker_name):
+        """Whether the task is running and assigned to the worker, which then holds the lease"""
+        return bool(worker_name) and self.assigned_to == worker_name and \
+            self.state in (TaskState.Running, TaskState.CancellationRequested)
+
+    @staticmethod
+    def size_class_statement(store_id, bag_name):
+        """
+        Recompute the size class of the unfinished tasks working on a bag, after the size of the bag changed. The
+        bag is often registered with size 0 and only gets its real size while its extraction task runs.
+        """
+        return text(
+            "UPDATE task_queue SET size_class = task_size_class(configuration) "
+            "FROM rosbag_store s "
+            "WHERE s.uid = :store_id AND task_queue.state < :finished"
+            "  AND configuration->>'store' = s.name AND configuration->>'bag' = :bag_name").bindparams(
+            store_id=store_id, bag_name=bag_name, finished=TaskState.Finished)
+
+    def renew_lease(self):
+        """The assigned worker is still working on the task, its lease is extended from now"""
+        self.lease_expires = text(LEASE_EXPIRES_SQL)
+
+    @staticmethod
+    def reclaim_expired_leases(session):
+        """
+        Take back the running tasks of workers that did not renew their lease in time. The task is queued again,
+        unless all attempts are used up, then it fails. Tasks with a requested cancellation are cancelled.
+
+        :return: Identifiers of the reclaimed tasks
+        """
+        statement = text(
+            "WITH config AS (SELECT " + MAX_ATTEMPTS_SQL + " AS max_attempts), "
+            "expired AS ("
+            "  SELECT uid, assigned_to FROM task_queue"
+            "  WHERE state IN (:running, :cancellation_requested) AND lease_expires < now() AT TIME ZONE 'utc'"
+            "  FOR UPDATE SKIP LOCKED"
+            ") "
+            "UPDATE task_queue SET "
+            "  state = CASE WHEN state = :cancellation_requested THEN :cancelled"
+            "               WHEN attempts < config.max_attempts THEN :queued"
+            "               ELSE :finished END,"
+            "  assigned_to = CASE WHEN state = :running AND attempts < config.max_attempts THEN ''"
+            "                     ELSE task_queue.assigned_to END,"
+            "  success = CASE WHEN state = :running AND attempts < config.max_attempts THEN success"
+            "                 ELSE false END,"
+            "  lease_expires = NULL,"
+            "  last_updated = now() AT TIME ZONE 'utc' "
+            "FROM config, expired "
+            "WHERE task_queue.uid = expired.uid "
+            "RETURNING task_queue.uid, expired.assigned_to, task_queue.state, task_queue.attempts").bindparams(
+            queued=TaskState.Queued, running=TaskState.Running, finished=TaskState.Finished,
+            cancelled=TaskState.Cancelled, cancellation_requested=TaskState.CancellationRequested)
+
+        reclaimed = []
+        for uid, worker_name, state, attempts in session.execute(statement).fetchall():
+            message = "\n\nLEASE OF WORKER %s EXPIRED" % worker_name
+            if state == TaskState.Finished:
+                message += " AFTER %d ATTEMPTS" % attempts
+            TaskLogChunk.append(session, uid, message + "\n")
+            reclaimed.append(uid)
+
+        return reclaimed
+
+    @staticmethod
+    def queue_depth(session):
+        """
+        Number of unfinished tasks per task and state, an index only scan of the unfinished tasks
+
+        :return: Rows of task, state and count
+        """
+        return session.query(Task.task, Task.state, func.count().label("count"))\
+            .filter(Task.state < TaskState.Finished)\
+            .group_by(Task.task, Task.state)\
+            .order_by(Task.task, Task.state)\
+            .all()
+
+    @staticmethod
+    def task_statistics(session, window):
+        """
+        Wait time percentiles of the tasks started and runtime percentiles of the tasks finished in the last window
+        seconds, per task. Only the tasks in the window are scanned, through the indexes on started and finished.
+
+        :return: Rows of task, finished, succeeded, runs (finished with a runtime), busy (summed runtime),
+                 runtime_mean and the arrays wait_time and runtime with the 50th, 90th and 99th percentile
+        """
+        statement = text(
+            "SELECT task,"
+            "  count(*) FILTER (WHERE finished >= " + WINDOW_START_SQL + ") AS finished,"
+            "  count(*) FILTER (WHERE finished >= " + WINDOW_START_SQL + " AND success) AS succeeded,"
+            "  count(runtime) FILTER (WHERE finished >= " + WINDOW_START_SQL + ") AS runs,"
+            "  coalesce(sum(runtime) FILTER (WHERE finished >= " + WINDOW_START_SQL + "), 0) AS busy,"
+            "  avg(runtime) FILTER (WHERE finished >= " + WINDOW_START_SQL + ") AS runtime_mean,"
+            "  percentile_cont(ARRAY[0.5, 0.9, 0.99]) WITHIN GROUP (ORDER BY extract(epoch FROM started - created))"
+            "    FILTER (WHERE started >= " + WINDOW_START_SQL + ") AS wait_time,"
+            "  percentile_cont(ARRAY[0.5, 0.9, 0.99]) WITHIN GROUP (ORDER BY runtime)"
+            "    FILTER (WHERE finished >= " + WINDOW_START_SQL + " AND runtime IS NOT NULL) AS runtime "
+            "FROM task_queue "
+            "WHERE started >= " + WINDOW_START_SQL + " OR finished >= " + WINDOW_START_SQL + " "
+            "GROUP BY task "
+            "ORDER BY task").bindparams(window=window)
+
+        return session.execute(statement).fetchall()
+
+    @staticmethod
+    def worker_statistics(session, window):
+        """
+        Tasks finished per worker in the last window seconds
+
+        :return: Rows of worker, finished, succeeded and busy (summed runtime)
+        """
+        statement = text(
+            "SELECT assigned_to AS worker, count(*) AS finished, count(*) FILTER (WHERE success) AS succeeded,"
+            "  coalesce(sum(runtime), 0) AS busy "
+            "FROM task_queue "
+            "WHERE finished >= " + WINDOW_START_SQL + " AND assigned_to != '' "
+            "GROUP BY assigned_to "
+            "ORDER BY assigned_to").bindparams(window=window)
+
+        return session.execute(statement).fetchall()
+
+    @staticmethod
+    def task_prio_up(session, uid):
+        result = session.execute("UPDATE task_queue "
+                               "SET priority=x.new_prio FROM (SELECT max(priority) + 1 as new_prio FROM task_queue) x "
+                                "WHERE uid=:uid",
+                               {'uid': uid })
+
     def from_swagger_model(self, api_model, user=None):
         model = api_model  # type: TaskDetailed
 
@@ -113,7 +378,6 @@ class Task(Base):
 
         if has_permission(user, Permissions.QueueResultAccess):
             self.result = model.result
-            self.log = model.log
 
         self.priority = model.priority
         self.description = model.description
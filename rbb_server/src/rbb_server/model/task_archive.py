@@ -0,0 +1,72 @@
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from sqlalchemy import *
+
+from .base import Base
+from .task import Task, TaskColumns, TaskState
+from .task_log_chunk import TaskLogChunk
+
+# Days after finishing that a task is moved to the archive, 0 keeps all tasks in the queue
+ARCHIVE_AFTER_SQL = "coalesce(" \
+                    "(SELECT CAST(value AS float) FROM configuration WHERE config_key = 'queue.archive_after_days'), 30)"
+
+
+class TaskArchive(TaskColumns, Base):
+    """
+    Finished tasks moved out of the queue, so the queue only holds the tasks that are worked on and the recent history.
+    Archived tasks keep their identifier and log, they are read only.
+    """
+    __tablename__ = "task_archive"
+    archived = Column(DateTime, nullable=False, server_default="now() AT TIME ZONE 'utc'")
+
+    @staticmethod
+    def archive_finished(session, limit=1000):
+        """
+        Move up to limit tasks that finished longer than the archive period ago from the queue to the archive, the
+        oldest first. Tasks of simulations stay in the queue.
+
+        :return: Identifiers of the archived tasks
+        """
+        columns = ", ".join(column.name for column in Task.__table__.columns)
+        statement = text(
+            "WITH moved AS ("
+            "  DELETE FROM task_queue WHERE uid IN ("
+            "    SELECT uid FROM task_queue"
+            "    WHERE finished < (now() AT TIME ZONE 'utc') - " + ARCHIVE_AFTER_SQL + " * interval '1 day'"
+            "      AND " + ARCHIVE_AFTER_SQL + " > 0 AND state >= :finished"
+            "      AND NOT EXISTS (SELECT 1 FROM simulation s WHERE s.task_in_queue_id = task_queue.uid)"
+            "    ORDER BY finished"
+            "    LIMIT :limit"
+            "    FOR UPDATE SKIP LOCKED"
+            "  ) RETURNING " + columns +
+            ") "
+            "INSERT INTO task_archive (" + columns + ") SELECT " + columns + " FROM moved "
+            "RETURNING uid").bindparams(finished=TaskState.Finished, limit=limit)
+
+        archived = [row.uid for row in session.execute(statement).fetchall()]
+        TaskLogChunk.repack(session, archived)
+        return archived
+
+
+class TaskHistory(TaskColumns, Base):
+    """All tasks, the view task_history combines the queue and the archive"""
+    __tablename__ = "task_history"
@@ -0,0 +1,155 @@
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import codecs
+import zlib
+
+from sqlalchemy import *
+
+from .base import Base
+
+# Large appends are split, so ranged reads only decompress what they need
+CHUNK_SIZE = 256 * 1024
+
+# Smaller chunks are not worth compressing
+COMPRESS_MIN_SIZE = 512
+
+
+class TaskLogChunk(Base):
+    """
+    Piece of the log of a task. Logs are append only, a chunk covers the UTF-8 encoded bytes
+    [position, position + length) of the log. The task is either in the queue or in the archive, the chunks are deleted
+    with the task by a trigger.
+    """
+    __tablename__ = "task_log_chunk"
+    task_id = Column(Integer, primary_key=True)
+    position = Column(BigInteger, primary_key=True)
+    length = Column(Integer, nullable=False)
+    compressed = Column(Boolean, nullable=False)
+    data = Column(LargeBinary, nullable=False)
+
+    def get_bytes(self):
+        return zlib.decompress(self.data) if self.compressed else self.data
+
+    @staticmethod
+    def encode_chunks(data):
+        for start in range(0, len(data), CHUNK_SIZE):
+            chunk = data[start:start + CHUNK_SIZE]
+            compressed = zlib.compress(chunk) if len(chunk) >= COMPRESS_MIN_SIZE else None
+            if compressed is not None and len(compressed) < len(chunk):
+                yield start, len(chunk), True, compressed
+            else:
+                yield start, len(chunk), False, chunk
+
+    @staticmethod
+    def size(session, task_id):
+        """Length of the log in bytes"""
+        return session.query(TaskLogChunk.position + TaskLogChunk.length)\
+            .filter(TaskLogChunk.task_id == task_id)\
+            .order_by(TaskLogChunk.position.desc())\
+            .limit(1).scalar() or 0
+
+    @staticmethod
+    def append(session, task_id, text):
+        """
+        Append to the log of a task. Concurrent appends to the same task must be serialized by the caller, for
+        example by updating the task row first.
+        """
+        data = text.encode('utf-8')
+        if not data:
+            return
+
+        TaskLogChunk.insert_bytes(session, task_id, TaskLogChunk.size(session, task_id), data)
+
+    @staticmethod
+    def insert_bytes(session, task_id, position, data):
+        session.execute(TaskLogChunk.__table__.insert().values([
+            {'task_id': task_id, 'position': position + start, 'length': length, 'compressed': compressed,
+             'data': chunk_data}
+            for start, length, compressed, chunk_data in TaskLogChunk.encode_chunks(data)
+        ]))
+
+    @staticmethod
+    def replace(session, task_id, text):
+        session.query(TaskLogChunk).filter(TaskLogChunk.task_id == task_id).delete(synchronize_session=False)
+        TaskLogChunk.append(session, task_id, text or "")
+
+    @staticmethod
+    def repack(session, task_ids):
+        """
+        Merge the chunks of finished logs into chunks of CHUNK_SIZE bytes, the many small chunks appended while a task
+        ran are too small to be compressed on their own
+        """
+        if not task_ids:
+            return
+
+        fragmented = session.query(TaskLogChunk.task_id)\
+            .filter(TaskLogChunk.task_id.in_(list(task_ids)))\
+            .group_by(TaskLogChunk.task_id)\
+            .having(func.count() > (func.sum(TaskLogChunk.length) + CHUNK_SIZE - 1) / CHUNK_SIZE)\
+            .all()
+
+        # One log at a time, logs can be tens of megabytes
+        for task_id, in fragmented:
+            data = TaskLogChunk.read_bytes(session, task_id)
+            session.query(TaskLogChunk).filter(TaskLogChunk.task_id == task_id).delete(synchronize_session=False)
+            TaskLogChunk.insert_bytes(session, task_id, 0, data)
+
+    @staticmethod
+    def read_bytes(session, task_id, start=0, end=None):
+        q = session.query(TaskLogChunk)\
+            .filter(TaskLogChunk.task_id == task_id)\
+            .filter(TaskLogChunk.position + TaskLogChunk.length > start)\
+            .order_by(TaskLogChunk.position)
+        if end is not None:
+            q = q.filter(TaskLogChunk.position < end)
+
+        chunks = q.all()
+        if not chunks:
+            return b""
+
+        data = b"".join(chunk.get_bytes() for chunk in chunks)
+        data = data[start - chunks[0].position:]
+        return data[:end - start] if end is not None else data
+
+    @staticmethod
+    def read(session, task_id, start=0, end=None):
+        """
+        Read a range of the log. The range is moved to the nearest character boundaries.
+
+        :return: (text, start, end) with the byte positions of the text in the log
+        """
+        data = TaskLogChunk.read_bytes(session, task_id, start, end)
+
+        # Skip the rest of a character that started before the range
+        skip = 0
+        while skip < min(len(data), 3) and (data[skip] & 0xC0) == 0x80:
+            skip += 1
+        data = data[skip:]
+        start += skip
+
+        # Leave a character that is cut off at the end for the next read
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        text = decoder.decode(data)
+        pending = len(decoder.getstate()[0])
+
+        return text, start, start + len(data) - pending
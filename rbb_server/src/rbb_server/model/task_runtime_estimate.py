@@ -0,0 +1,80 @@
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from sqlalchemy import *
+
+from .base import Base
+
+# Weight of a new runtime in the moving average
+RUNTIME_EWMA_ALPHA = 0.2
+
+# Runtime estimate of the task type for the nearest size class that has one
+EXPECTED_RUNTIME_SQL = "(SELECT e.runtime FROM task_runtime_estimate e WHERE e.task = {task} " \
+                       "ORDER BY abs(e.size_class - {size_class}), e.size_class LIMIT 1)"
+
+
+class TaskRuntimeEstimate(Base):
+    """
+    Exponentially weighted moving average of the runtime of the successful runs of a task type, per size class of
+    the bag the tasks work on
+    """
+    __tablename__ = "task_runtime_estimate"
+    task = Column(String(100), primary_key=True)
+    size_class = Column(Integer, primary_key=True)
+    runtime = Column(Float, nullable=False)
+    samples = Column(Integer, nullable=False)
+
+    @staticmethod
+    def expected_runtime_sql(task_column, size_class_column):
+        """
+        SQL expression of the expected runtime in seconds of a task, NULL if the task type never finished. The columns
+        have to be qualified, the expression is a subquery.
+        """
+        return EXPECTED_RUNTIME_SQL.format(task=task_column, size_class=size_class_column)
+
+    @staticmethod
+    def record(session, task, size_class, runtime):
+        """Add the runtime of a successful run to the moving average of its task type and size class"""
+        statement = text(
+            "INSERT INTO task_runtime_estimate AS e (task, size_class, runtime, samples) "
+            "VALUES (:task, :size_class, :runtime, 1) "
+            "ON CONFLICT (task, size_class) DO UPDATE SET "
+            "  runtime = e.runtime + :alpha * (excluded.runtime - e.runtime),"
+            "  samples = e.samples + 1").bindparams(
+            task=task, size_class=size_class, runtime=runtime, alpha=RUNTIME_EWMA_ALPHA)
+
+        session.execute(statement)
+
+    @staticmethod
+    def expected_runtimes(session, uids):
+        """
+        Expected runtimes of tasks in a single query
+
+        :return: Dictionary of task identifier to the expected runtime in seconds, tasks without estimate are left out
+        """
+        if not uids:
+            return {}
+
+        statement = text(
+            "SELECT uid, " + TaskRuntimeEstimate.expected_runtime_sql("t.task", "t.size_class") + " AS runtime "
+            "FROM task_queue t WHERE uid = ANY(:uids)").bindparams(uids=list(uids))
+
+        return {row.uid: row.runtime for row in session.execute(statement) if row.runtime is not None}
@@ -45,6 +45,8 @@ CREATE TABLE "token" (
   valid_for INTEGER DEFAULT 86400
 );
 
+CREATE INDEX token_user_uid_idx ON token (user_uid);
+
 CREATE TABLE "permission" (
   uid VARCHAR(50) PRIMARY KEY,
   name VARCHAR(100) NOT NULL,
@@ -94,6 +96,11 @@ INSERT INTO "configuration" (config_key, value, description) VALUES ('secret.jen
 INSERT INTO "configuration" (config_key, value, description) VALUES ('secret.jenkins.password' , '', '');
 INSERT INTO "configuration" (config_key, value, description) VALUES ('worker.default.poll_interval' , '10', '');
 INSERT INTO "configuration" (config_key, value, description) VALUES ('worker.default.update_interval' , '20', '');
+INSERT INTO "configuration" (config_key, value, description) VALUES ('queue.lease_duration' , '60', 'Seconds a worker holds a task without renewing it');
+INSERT INTO "configuration" (config_key, value, description) VALUES ('queue.max_attempts' , '3', 'Times a task is run before it fails when its worker stops responding');
+INSERT INTO "configuration" (config_key, value, description) VALUES ('queue.scheduling' , 'priority', 'Order of dequeueing, priority or shortest_expected (priority, expected runtime and waiting time)');
+INSERT INTO "configuration" (config_key, value, description) VALUES ('queue.aging_period' , '600', 'Seconds of waiting or of expected runtime that count as one priority step in shortest_expected scheduling');
+INSERT INTO "configuration" (config_key, value, description) VALUES ('queue.archive_after_days' , '30', 'Days after finishing that a task is moved to the archive, 0 to never archive');
 
 -- BAG MANAGEMENT
 
@@ -142,27 +149,59 @@ CREATE TABLE "rosbag" (
   messages BIGINT,
 
   -- Additional
-  comment text NOT NULL
+  comment text NOT NULL,
+
+  -- Full text search over the name, topic names and comment, see rosbag_search_vector
+  search_vector tsvector
 );
 
+-- Orderings available in list_bags, uid is the tiebreaker of the pagination cursor
+CREATE INDEX rosbag_store_id_discovered_uid_idx ON rosbag (store_id, discovered, uid);
+CREATE INDEX rosbag_store_id_start_time_uid_idx ON rosbag (store_id, start_time, uid);
+CREATE INDEX rosbag_store_id_end_time_uid_idx ON rosbag (store_id, end_time, uid);
+CREATE INDEX rosbag_store_id_name_uid_idx ON rosbag (store_id, name, uid);
+CREATE INDEX rosbag_store_id_duration_uid_idx ON rosbag (store_id, duration, uid);
+CREATE INDEX rosbag_store_id_size_uid_idx ON rosbag (store_id, size, uid);
+
+CREATE INDEX rosbag_search_vector_idx ON rosbag USING gin (search_vector);
+
+-- Search document of a bag, words are split on every non alphanumeric character
+-- such that the parts of names like "2019-05-12_autocross.bag" can be found
+CREATE FUNCTION rosbag_search_vector(name TEXT, topic_names TEXT, comment TEXT) RETURNS tsvector AS $$
+  SELECT setweight(to_tsvector('simple', regexp_replace(coalesce(name, ''), '[^[:alnum:]]+', ' ', 'g')), 'A') ||
+         setweight(to_tsvector('simple', regexp_replace(coalesce(topic_names, ''), '[^[:alnum:]]+', ' ', 'g')), 'B') ||
+         setweight(to_tsvector('simple', regexp_replace(coalesce(comment, ''), '[^[:alnum:]]+', ' ', 'g')), 'C')
+$$ LANGUAGE SQL IMMUTABLE;
+
 CREATE TABLE "rosbag_tags" (
   bag_id INTEGER NOT NULL REFERENCES rosbag(uid) ON DELETE CASCADE,
   tag_id INTEGER NOT NULL REFERENCES tags(uid) ON DELETE CASCADE,
   PRIMARY KEY (bag_id, tag_id)
 );
 
+CREATE INDEX rosbag_tags_tag_id_idx ON rosbag_tags (tag_id, bag_id);
+
+-- Message definitions are the same in every bag recording a message type, they are stored once
+CREATE TABLE "message_definition" (
+  msg_type_hash VARCHAR(50) PRIMARY KEY,
+  msg_definition text NOT NULL
+);
+
 CREATE TABLE "rosbag_topic" (
   uid SERIAL PRIMARY KEY,
   bag_id INTEGER NOT NULL REFERENCES rosbag(uid) ON DELETE CASCADE,
   name VARCHAR(255) NOT NULL,
   msg_type VARCHAR(255) NOT NULL,
-  msg_type_hash VARCHAR(50) NOT NULL,
-  msg_definition text NOT NULL,
+  msg_type_hash VARCHAR(50) NOT NULL REFERENCES message_definition(msg_type_hash),
   msg_count INTEGER NOT NULL,
   avg_frequency FLOAT NOT NULL,
   UNIQUE (bag_id, name)
 );
 
+-- Reverse lookups of the bags containing a topic (also by name prefix) or a message type
+CREATE INDEX rosbag_topic_name_bag_id_idx ON rosbag_topic (name varchar_pattern_ops, bag_id);
+CREATE INDEX rosbag_topic_msg_type_bag_id_idx ON rosbag_topic (msg_type, bag_id);
+
 CREATE TABLE "rosbag_product" (
   uid SERIAL PRIMARY KEY,
   bag_id INTEGER NOT NULL REFERENCES rosbag(uid) ON DELETE CASCADE,
@@ -175,6 +214,8 @@ CREATE TABLE "rosbag_product" (
   configuration_rule VARCHAR(100) NOT NULL DEFAULT ''
 );
 
+CREATE INDEX rosbag_product_bag_id_idx ON rosbag_product (bag_id);
+
 CREATE TABLE "rosbag_product_topic" (
   product_id INTEGER NOT NULL REFERENCES rosbag_product(uid) ON DELETE CASCADE,
   topic_id INTEGER NOT NULL REFERENCES rosbag_topic(uid) ON DELETE CASCADE,
@@ -182,6 +223,8 @@ CREATE TABLE "rosbag_product_topic" (
   PRIMARY KEY (product_id, topic_id)
 );
 
+CREATE INDEX rosbag_product_topic_topic_id_idx ON rosbag_product_topic (topic_id);
+
 CREATE TABLE "rosbag_extraction_configuration" (
   uid SERIAL PRIMARY KEY,
   name VARCHAR(255) NOT NULL,
@@ -207,6 +250,8 @@ CREATE TABLE "file" (
   store_data json NOT NULL
 );
 
+CREATE INDEX file_store_id_idx ON file (store_id);
+
 CREATE TABLE "rosbag_product_file" (
   product_id INTEGER NOT NULL REFERENCES rosbag_product(uid) on DELETE CASCADE,
   file_id INTEGER NOT NULL REFERENCES file(uid) on DELETE CASCADE,
@@ -214,6 +259,8 @@ CREATE TABLE "rosbag_product_file" (
   PRIMARY KEY (product_id, file_id)
 );
 
+CREATE INDEX rosbag_product_file_file_id_idx ON rosbag_product_file (file_id);
+
 -- JOB QUEUE
 
 CREATE TABLE "task_queue" (
@@ -229,12 +276,152 @@ CREATE TABLE "task_queue" (
   result json NOT NULL,
   success BOOLEAN,
   runtime FLOAT,
-  log TEXT,
   worker_labels VARCHAR(255),
-  task_hash VARCHAR(50)
+  task_hash VARCHAR(50),
+  lease_expires TIMESTAMP NULL,
+  attempts INTEGER NOT NULL DEFAULT 0,
+  started TIMESTAMP NULL,
+  finished TIMESTAMP NULL,
+  size_class INTEGER NOT NULL
+);
+
+CREATE INDEX task_queue_task_task_hash_idx ON task_queue (task, task_hash);
+-- A task with an equal configuration can only be queued once until it is finished
+CREATE UNIQUE INDEX task_queue_task_task_hash_unfinished_idx ON task_queue (task, task_hash) WHERE state < 100;
+CREATE INDEX task_queue_priority_uid_idx ON task_queue (priority, uid);
+CREATE INDEX task_queue_created_uid_idx ON task_queue (created, uid);
+-- Only the queued tasks that can still be dequeued and the unfinished tasks of the workers
+CREATE INDEX task_queue_queued_priority_uid_idx ON task_queue (priority DESC, uid) WHERE state = 0 AND assigned_to = '';
+CREATE INDEX task_queue_queued_task_size_class_idx ON task_queue (task, size_class) WHERE state = 0 AND assigned_to = '';
+CREATE INDEX task_queue_assigned_to_unfinished_idx ON task_queue (assigned_to) WHERE state < 100;
+CREATE INDEX task_queue_lease_expires_idx ON task_queue (lease_expires) WHERE lease_expires IS NOT NULL;
+-- Queue statistics, the depth of the unfinished tasks and the tasks started or finished in a recent window
+CREATE INDEX task_queue_unfinished_task_state_idx ON task_queue (task, state) WHERE state < 100;
+CREATE INDEX task_queue_started_idx ON task_queue (started) WHERE started IS NOT NULL;
+CREATE INDEX task_queue_finished_idx ON task_queue (finished) WHERE finished IS NOT NULL;
+
+-- Wakes up the workers waiting in dequeue_task whenever a task can be dequeued, once per statement so a multi-row
+-- insert does not notify for every task
+CREATE FUNCTION task_queue_notify_queued() RETURNS trigger AS $$
+BEGIN
+  IF EXISTS (SELECT 1 FROM task_queue WHERE state = 0 AND assigned_to = '') THEN
+    PERFORM pg_notify('task_queued', '');
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_queue_notify_queued AFTER INSERT OR UPDATE OF state, assigned_to ON task_queue
+  FOR EACH STATEMENT EXECUTE PROCEDURE task_queue_notify_queued();
+
+-- Keeps the time a task reached a final state, whichever way its state was changed
+CREATE FUNCTION task_queue_set_finished() RETURNS trigger AS $$
+BEGIN
+  IF NEW.state < 100 THEN
+    NEW.finished := NULL;
+  ELSIF TG_OP = 'INSERT' THEN
+    NEW.finished := coalesce(NEW.finished, now() AT TIME ZONE 'utc');
+  ELSIF OLD.state < 100 THEN
+    NEW.finished := now() AT TIME ZONE 'utc';
+  END IF;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_queue_set_finished BEFORE INSERT OR UPDATE OF state ON task_queue
+  FOR EACH ROW EXECUTE PROCEDURE task_queue_set_finished();
+
+-- Finished tasks older than queue.archive_after_days, moved out of the queue with their identifier
+CREATE TABLE "task_archive" (
+  uid INTEGER PRIMARY KEY,
+  priority INTEGER NOT NULL DEFAULT 0,
+  description VARCHAR(200),
+  assigned_to VARCHAR(100),
+  created TIMESTAMP NOT NULL,
+  last_updated TIMESTAMP NOT NULL,
+  state SMALLINT NOT NULL,
+  task VARCHAR(100) NOT NULL,
+  configuration json NOT NULL,
+  result json NOT NULL,
+  success BOOLEAN,
+  runtime FLOAT,
+  worker_labels VARCHAR(255),
+  task_hash VARCHAR(50),
+  lease_expires TIMESTAMP NULL,
+  attempts INTEGER NOT NULL DEFAULT 0,
+  started TIMESTAMP NULL,
+  finished TIMESTAMP NULL,
+  size_class INTEGER,
+  archived TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
 );
 
-CREATE INDEX ON task_queue (task, task_hash);
+CREATE INDEX task_archive_priority_uid_idx ON task_archive (priority, uid);
+CREATE INDEX task_archive_created_uid_idx ON task_archive (created, uid);
+
+-- All tasks for reading, the live ones in the queue and the archived ones
+CREATE VIEW "task_history" AS
+  SELECT uid, priority, description, assigned_to, created, last_updated, state, task, configuration, result, success,
+    runtime, worker_labels, task_hash, lease_expires, attempts, started, finished, size_class FROM task_queue
+  UNION ALL
+  SELECT uid, priority, description, assigned_to, created, last_updated, state, task, configuration, result, success,
+    runtime, worker_labels, task_hash, lease_expires, attempts, started, finished, size_class FROM task_archive;
+
+-- Append only log of a task, the chunk covers the bytes [position, position + length) of the UTF-8 encoded log. The
+-- task is either in task_queue or in task_archive.
+CREATE TABLE "task_log_chunk" (
+  task_id INTEGER NOT NULL,
+  position BIGINT NOT NULL,
+  length INTEGER NOT NULL,
+  compressed BOOLEAN NOT NULL,
+  data BYTEA NOT NULL,
+  PRIMARY KEY (task_id, position)
+);
+
+-- The log chunks have no foreign key, a task moves from the queue to the archive with its log. The log goes when the
+-- task is deleted and is not in the other table, the archiving statement inserts it there before the trigger runs.
+CREATE FUNCTION task_delete_log() RETURNS trigger AS $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM task_queue WHERE uid = OLD.uid)
+     AND NOT EXISTS (SELECT 1 FROM task_archive WHERE uid = OLD.uid) THEN
+    DELETE FROM task_log_chunk WHERE task_id = OLD.uid;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_queue_delete_log AFTER DELETE ON task_queue
+  FOR EACH ROW EXECUTE PROCEDURE task_delete_log();
+
+CREATE TRIGGER task_archive_delete_log AFTER DELETE ON task_archive
+  FOR EACH ROW EXECUTE PROCEDURE task_delete_log();
+
+-- Moving average of the runtime of the successful runs per task and size class of the bag the task works on
+CREATE TABLE "task_runtime_estimate" (
+  task VARCHAR(100) NOT NULL,
+  size_class INTEGER NOT NULL,
+  runtime FLOAT NOT NULL,
+  samples INTEGER NOT NULL,
+  PRIMARY KEY (task, size_class)
+);
+
+-- Size class of the bag in the configuration of a task, 0 without a bag and 1 + log2(size in MiB) otherwise
+CREATE FUNCTION task_size_class(configuration json) RETURNS integer AS $$
+  SELECT coalesce((
+    SELECT 1 + floor(log(2.0, greatest(b.size, 1048576) / 1048576.0))::integer
+    FROM rosbag b JOIN rosbag_store s ON s.uid = b.store_id
+    WHERE s.name = configuration->>'store' AND b.name = configuration->>'bag'), 0)
+$$ LANGUAGE SQL STABLE;
+
+-- The size class is computed once when the task is queued, scheduling joins the estimates on it
+CREATE FUNCTION task_queue_set_size_class() RETURNS trigger AS $$
+BEGIN
+  NEW.size_class := coalesce(NEW.size_class, task_size_class(NEW.configuration));
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_queue_set_size_class BEFORE INSERT ON task_queue
+  FOR EACH ROW EXECUTE PROCEDURE task_queue_set_size_class();
 
 -- SIMULATION
 
@@ -258,6 +445,10 @@ CREATE TABLE "simulation" (
   on_complete json NULL
 );
 
+CREATE INDEX simulation_environment_id_idx ON simulation (environment_id);
+CREATE INDEX simulation_task_in_queue_id_idx ON simulation (task_in_queue_id);
+CREATE INDEX simulation_created_uid_idx ON simulation (created, uid);
+
 CREATE TABLE "simulation_run" (
   uid SERIAL PRIMARY KEY,
   simulation_id INTEGER NOT NULL REFERENCES simulation(uid) on DELETE CASCADE,
@@ -268,6 +459,9 @@ CREATE TABLE "simulation_run" (
   results json NOT NULL
 );
 
+CREATE INDEX simulation_run_simulation_id_idx ON simulation_run (simulation_id);
+CREATE INDEX simulation_run_bag_id_idx ON simulation_run (bag_id);
+
 -- COMMENTING
 
 CREATE TABLE "rosbag_comment" (
@@ -278,3 +472,5 @@ CREATE TABLE "rosbag_comment" (
   comment_text VARCHAR(1000),
   created TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
 );
+
+CREATE INDEX rosbag_comment_bag_id_idx ON rosbag_comment (bag_id);
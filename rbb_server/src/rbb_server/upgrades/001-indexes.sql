@@ -0,0 +1,50 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+
+-- Adds the secondary indexes of the hot lookups to an existing database,
+-- fresh databases get these from schema.sql.
+--
+-- The indexes are built concurrently so the server can keep running, this
+-- cannot be done inside a transaction. Run it with:
+--   psql -f 001-indexes.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS token_user_uid_idx ON token (user_uid);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_store_id_discovered_idx ON rosbag (store_id, discovered);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_store_id_start_time_idx ON rosbag (store_id, start_time);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_store_id_end_time_idx ON rosbag (store_id, end_time);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_store_id_duration_idx ON rosbag (store_id, duration);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_store_id_size_idx ON rosbag (store_id, size);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_tags_tag_id_idx ON rosbag_tags (tag_id, bag_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_product_bag_id_idx ON rosbag_product (bag_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_product_topic_topic_id_idx ON rosbag_product_topic (topic_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS file_store_id_idx ON file (store_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_product_file_file_id_idx ON rosbag_product_file (file_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS simulation_environment_id_idx ON simulation (environment_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS simulation_task_in_queue_id_idx ON simulation (task_in_queue_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS simulation_run_simulation_id_idx ON simulation_run (simulation_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS simulation_run_bag_id_idx ON simulation_run (bag_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_comment_bag_id_idx ON rosbag_comment (bag_id);
+
+ANALYZE;
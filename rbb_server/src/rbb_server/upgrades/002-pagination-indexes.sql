@@ -0,0 +1,46 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+
+-- Extends the ordering indexes with the uid tiebreaker used by cursor
+-- pagination, such that the next page is read with an index range scan.
+--
+-- Like 001-indexes.sql this cannot run inside a transaction:
+--   psql -f 002-pagination-indexes.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_store_id_discovered_uid_idx ON rosbag (store_id, discovered, uid);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_store_id_start_time_uid_idx ON rosbag (store_id, start_time, uid);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_store_id_end_time_uid_idx ON rosbag (store_id, end_time, uid);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_store_id_name_uid_idx ON rosbag (store_id, name, uid);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_store_id_duration_uid_idx ON rosbag (store_id, duration, uid);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_store_id_size_uid_idx ON rosbag (store_id, size, uid);
+
+DROP INDEX CONCURRENTLY IF EXISTS rosbag_store_id_discovered_idx;
+DROP INDEX CONCURRENTLY IF EXISTS rosbag_store_id_start_time_idx;
+DROP INDEX CONCURRENTLY IF EXISTS rosbag_store_id_end_time_idx;
+DROP INDEX CONCURRENTLY IF EXISTS rosbag_store_id_duration_idx;
+DROP INDEX CONCURRENTLY IF EXISTS rosbag_store_id_size_idx;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS task_queue_priority_uid_idx ON task_queue (priority, uid);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS task_queue_created_uid_idx ON task_queue (created, uid);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS simulation_created_uid_idx ON simulation (created, uid);
+
+ANALYZE;
@@ -0,0 +1,41 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+
+-- Adds full text search over the bag name, topic names and comment.
+--
+-- The index is built concurrently, run it outside of a transaction:
+--   psql -f 003-search.sql
+
+ALTER TABLE rosbag ADD COLUMN IF NOT EXISTS search_vector tsvector;
+
+CREATE OR REPLACE FUNCTION rosbag_search_vector(name TEXT, topic_names TEXT, comment TEXT) RETURNS tsvector AS $$
+  SELECT setweight(to_tsvector('simple', regexp_replace(coalesce(name, ''), '[^[:alnum:]]+', ' ', 'g')), 'A') ||
+         setweight(to_tsvector('simple', regexp_replace(coalesce(topic_names, ''), '[^[:alnum:]]+', ' ', 'g')), 'B') ||
+         setweight(to_tsvector('simple', regexp_replace(coalesce(comment, ''), '[^[:alnum:]]+', ' ', 'g')), 'C')
+$$ LANGUAGE SQL IMMUTABLE;
+
+UPDATE rosbag b SET search_vector = rosbag_search_vector(
+  b.name, (SELECT string_agg(t.name, ' ') FROM rosbag_topic t WHERE t.bag_id = b.uid), b.comment);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_search_vector_idx ON rosbag USING gin (search_vector);
+
+ANALYZE rosbag;
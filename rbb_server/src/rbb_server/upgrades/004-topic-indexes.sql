@@ -0,0 +1,31 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+
+-- Indexes for finding the bags that contain a topic or a message type.
+--
+-- Like 001-indexes.sql this cannot run inside a transaction:
+--   psql -f 004-topic-indexes.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_topic_name_bag_id_idx ON rosbag_topic (name varchar_pattern_ops, bag_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rosbag_topic_msg_type_bag_id_idx ON rosbag_topic (msg_type, bag_id);
+
+ANALYZE rosbag_topic;
@@ -0,0 +1,50 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+
+-- Moves the message definitions out of rosbag_topic into message_definition,
+-- keyed by the message type hash, such that every definition is stored once.
+-- Where bags recorded a definition and others an empty one, the text is kept.
+--
+-- Run with psql, the final VACUUM FULL cannot run inside a transaction and
+-- locks rosbag_topic while it rewrites the table to return the space:
+--   psql -f 005-message-definitions.sql
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS "message_definition" (
+  msg_type_hash VARCHAR(50) PRIMARY KEY,
+  msg_definition text NOT NULL
+);
+
+INSERT INTO message_definition (msg_type_hash, msg_definition)
+  SELECT DISTINCT ON (msg_type_hash) msg_type_hash, msg_definition FROM rosbag_topic
+  ORDER BY msg_type_hash, msg_definition = '', uid
+  ON CONFLICT DO NOTHING;
+
+ALTER TABLE rosbag_topic
+  ADD CONSTRAINT rosbag_topic_msg_type_hash_fkey FOREIGN KEY (msg_type_hash) REFERENCES message_definition(msg_type_hash);
+
+ALTER TABLE rosbag_topic DROP COLUMN msg_definition;
+
+COMMIT;
+
+VACUUM FULL ANALYZE rosbag_topic;
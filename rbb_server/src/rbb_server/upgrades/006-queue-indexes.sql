@@ -0,0 +1,35 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+
+-- Partial indexes for the task queue. Workers dequeue the most important
+-- queued task and look up the unfinished tasks assigned to them, both only
+-- touch a small part of the queue.
+--
+-- Like 001-indexes.sql this cannot run inside a transaction:
+--   psql -f 006-queue-indexes.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS task_queue_queued_priority_uid_idx ON task_queue (priority DESC, uid)
+  WHERE state = 0 AND assigned_to = '';
+CREATE INDEX CONCURRENTLY IF NOT EXISTS task_queue_assigned_to_unfinished_idx ON task_queue (assigned_to)
+  WHERE state < 100;
+
+ANALYZE task_queue;
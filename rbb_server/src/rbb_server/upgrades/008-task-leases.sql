@@ -0,0 +1,38 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+
+-- Workers hold a lease on their running task, tasks of workers that stopped
+-- renewing it are queued again by the cron job 'reclaim_task_leases'.
+
+ALTER TABLE task_queue ADD COLUMN IF NOT EXISTS lease_expires TIMESTAMP NULL;
+ALTER TABLE task_queue ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS task_queue_lease_expires_idx ON task_queue (lease_expires) WHERE lease_expires IS NOT NULL;
+
+INSERT INTO "configuration" (config_key, value, description)
+  VALUES ('queue.lease_duration' , '60', 'Seconds a worker holds a task without renewing it') ON CONFLICT DO NOTHING;
+INSERT INTO "configuration" (config_key, value, description)
+  VALUES ('queue.max_attempts' , '3', 'Times a task is run before it fails when its worker stops responding') ON CONFLICT DO NOTHING;
+
+-- Tasks that are running right now get a first lease
+UPDATE task_queue SET attempts = 1, lease_expires = (now() AT TIME ZONE 'utc') + interval '60 seconds'
+  WHERE state IN (1, 102);
@@ -0,0 +1,44 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+
+-- Task logs move to an append only table of chunks. Every append used to
+-- rewrite the complete log of the task.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS "task_log_chunk" (
+  task_id INTEGER NOT NULL REFERENCES task_queue(uid) ON DELETE CASCADE,
+  position BIGINT NOT NULL,
+  length INTEGER NOT NULL,
+  compressed BOOLEAN NOT NULL,
+  data BYTEA NOT NULL,
+  PRIMARY KEY (task_id, position)
+);
+
+-- Existing logs become a single uncompressed chunk
+INSERT INTO task_log_chunk (task_id, position, length, compressed, data)
+  SELECT uid, 0, octet_length(convert_to(log, 'UTF8')), false, convert_to(log, 'UTF8')
+  FROM task_queue WHERE log IS NOT NULL AND log <> '';
+
+ALTER TABLE task_queue DROP COLUMN log;
+
+COMMIT;
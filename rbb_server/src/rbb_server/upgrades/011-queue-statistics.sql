@@ -0,0 +1,54 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+
+-- Queue statistics: the time a task was assigned to a worker and the time it
+-- reached a final state, with indexes so the statistics over a recent window
+-- only scan the tasks in that window. Tasks that finished before this upgrade
+-- have no finish time and are not part of the statistics.
+--
+-- Like 001-indexes.sql this cannot run inside a transaction:
+--   psql -f 011-queue-statistics.sql
+
+ALTER TABLE task_queue ADD COLUMN IF NOT EXISTS started TIMESTAMP NULL;
+ALTER TABLE task_queue ADD COLUMN IF NOT EXISTS finished TIMESTAMP NULL;
+
+CREATE OR REPLACE FUNCTION task_queue_set_finished() RETURNS trigger AS $$
+BEGIN
+  IF NEW.state < 100 THEN
+    NEW.finished := NULL;
+  ELSIF TG_OP = 'INSERT' THEN
+    NEW.finished := coalesce(NEW.finished, now() AT TIME ZONE 'utc');
+  ELSIF OLD.state < 100 THEN
+    NEW.finished := now() AT TIME ZONE 'utc';
+  END IF;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS task_queue_set_finished ON task_queue;
+CREATE TRIGGER task_queue_set_finished BEFORE INSERT OR UPDATE OF state ON task_queue
+  FOR EACH ROW EXECUTE PROCEDURE task_queue_set_finished();
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS task_queue_unfinished_task_state_idx ON task_queue (task, state)
+  WHERE state < 100;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS task_queue_started_idx ON task_queue (started) WHERE started IS NOT NULL;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS task_queue_finished_idx ON task_queue (finished) WHERE finished IS NOT NULL;
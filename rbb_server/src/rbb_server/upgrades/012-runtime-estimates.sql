@@ -0,0 +1,51 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+
+-- Runtime estimates per task and bag size class, used for the expected runtime
+-- of queued tasks and by the shortest_expected scheduling policy. The
+-- estimates start from the mean runtime of the successful runs so far.
+
+CREATE TABLE IF NOT EXISTS "task_runtime_estimate" (
+  task VARCHAR(100) NOT NULL,
+  size_class INTEGER NOT NULL,
+  runtime FLOAT NOT NULL,
+  samples INTEGER NOT NULL,
+  PRIMARY KEY (task, size_class)
+);
+
+CREATE OR REPLACE FUNCTION task_size_class(configuration json) RETURNS integer AS $$
+  SELECT coalesce((
+    SELECT 1 + floor(log(2.0, greatest(b.size, 1048576) / 1048576.0))::integer
+    FROM rosbag b JOIN rosbag_store s ON s.uid = b.store_id
+    WHERE s.name = configuration->>'store' AND b.name = configuration->>'bag'), 0)
+$$ LANGUAGE SQL STABLE;
+
+INSERT INTO "configuration" (config_key, value, description)
+  VALUES ('queue.scheduling' , 'priority', 'Order of dequeueing, priority or shortest_expected (priority, expected runtime and waiting time)') ON CONFLICT DO NOTHING;
+INSERT INTO "configuration" (config_key, value, description)
+  VALUES ('queue.aging_period' , '600', 'Seconds of waiting or of expected runtime that count as one priority step in shortest_expected scheduling') ON CONFLICT DO NOTHING;
+
+INSERT INTO task_runtime_estimate (task, size_class, runtime, samples)
+  SELECT task, task_size_class(configuration), avg(runtime), count(*) FROM task_queue
+  WHERE state = 100 AND success AND runtime IS NOT NULL
+  GROUP BY 1, 2
+  ON CONFLICT DO NOTHING;
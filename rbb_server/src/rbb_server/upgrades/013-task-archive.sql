@@ -0,0 +1,72 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+-- Archive of finished tasks. Tasks that finished longer than
+-- queue.archive_after_days ago are moved from task_queue to task_archive by the
+-- archive_tasks cron job, the view task_history reads both. Log chunks now
+-- belong to a task in either table, so their foreign key is dropped.
+--
+-- Tasks that finished before 011-queue-statistics.sql have no finish time, it
+-- is taken from their last update. Afterwards archive the existing history with
+--   python -m rbb_server_tools.archive_tasks
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS "task_archive" (
+  uid INTEGER PRIMARY KEY,
+  priority INTEGER NOT NULL DEFAULT 0,
+  description VARCHAR(200),
+  assigned_to VARCHAR(100),
+  created TIMESTAMP NOT NULL,
+  last_updated TIMESTAMP NOT NULL,
+  state SMALLINT NOT NULL,
+  task VARCHAR(100) NOT NULL,
+  configuration json NOT NULL,
+  result json NOT NULL,
+  success BOOLEAN,
+  runtime FLOAT,
+  worker_labels VARCHAR(255),
+  task_hash VARCHAR(50),
+  lease_expires TIMESTAMP NULL,
+  attempts INTEGER NOT NULL DEFAULT 0,
+  started TIMESTAMP NULL,
+  finished TIMESTAMP NULL,
+  archived TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
+);
+
+CREATE INDEX IF NOT EXISTS task_archive_priority_uid_idx ON task_archive (priority, uid);
+CREATE INDEX IF NOT EXISTS task_archive_created_uid_idx ON task_archive (created, uid);
+
+CREATE OR REPLACE VIEW "task_history" AS
+  SELECT uid, priority, description, assigned_to, created, last_updated, state, task, configuration, result, success,
+    runtime, worker_labels, task_hash, lease_expires, attempts, started, finished FROM task_queue
+  UNION ALL
+  SELECT uid, priority, description, assigned_to, created, last_updated, state, task, configuration, result, success,
+    runtime, worker_labels, task_hash, lease_expires, attempts, started, finished FROM task_archive;
+
+ALTER TABLE task_log_chunk DROP CONSTRAINT IF EXISTS task_log_chunk_task_id_fkey;
+
+UPDATE task_queue SET finished = last_updated WHERE state >= 100 AND finished IS NULL;
+
+INSERT INTO "configuration" (config_key, value, description)
+  VALUES ('queue.archive_after_days' , '30', 'Days after finishing that a task is moved to the archive, 0 to never archive') ON CONFLICT DO NOTHING;
+
+COMMIT;
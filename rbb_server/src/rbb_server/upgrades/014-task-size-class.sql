@@ -0,0 +1,59 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+
+-- The size class of the bag a task works on is stored when the task is queued,
+-- shortest_expected scheduling joins the runtime estimates on it instead of
+-- looking up the bag of every queued task on each dequeue. The partial index
+-- finds the task types and size classes of the dequeueable tasks.
+--
+-- Like 001-indexes.sql this cannot run inside a transaction:
+--   psql -f 014-task-size-class.sql
+
+ALTER TABLE task_queue ADD COLUMN IF NOT EXISTS size_class INTEGER;
+ALTER TABLE task_archive ADD COLUMN IF NOT EXISTS size_class INTEGER;
+
+CREATE OR REPLACE FUNCTION task_queue_set_size_class() RETURNS trigger AS $$
+BEGIN
+  NEW.size_class := coalesce(NEW.size_class, task_size_class(NEW.configuration));
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS task_queue_set_size_class ON task_queue;
+CREATE TRIGGER task_queue_set_size_class BEFORE INSERT ON task_queue
+  FOR EACH ROW EXECUTE PROCEDURE task_queue_set_size_class();
+
+UPDATE task_queue SET size_class = task_size_class(configuration) WHERE size_class IS NULL;
+UPDATE task_archive SET size_class = task_size_class(configuration) WHERE size_class IS NULL;
+ALTER TABLE task_queue ALTER COLUMN size_class SET NOT NULL;
+
+CREATE OR REPLACE VIEW "task_history" AS
+  SELECT uid, priority, description, assigned_to, created, last_updated, state, task, configuration, result, success,
+    runtime, worker_labels, task_hash, lease_expires, attempts, started, finished, size_class FROM task_queue
+  UNION ALL
+  SELECT uid, priority, description, assigned_to, created, last_updated, state, task, configuration, result, success,
+    runtime, worker_labels, task_hash, lease_expires, attempts, started, finished, size_class FROM task_archive;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS task_queue_queued_task_size_class_idx ON task_queue (task, size_class)
+  WHERE state = 0 AND assigned_to = '';
+
+ANALYZE task_queue;
@@ -0,0 +1,39 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+
+-- Notify the channel 'task_queued' once per statement instead of once per
+-- row. A statement that inserts or requeues many tasks woke up the waiting
+-- workers for every single task. The trigger function checks whether any task
+-- can be dequeued, through the partial index of the queued tasks.
+
+CREATE OR REPLACE FUNCTION task_queue_notify_queued() RETURNS trigger AS $$
+BEGIN
+  IF EXISTS (SELECT 1 FROM task_queue WHERE state = 0 AND assigned_to = '') THEN
+    PERFORM pg_notify('task_queued', '');
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS task_queue_notify_queued ON task_queue;
+CREATE TRIGGER task_queue_notify_queued AFTER INSERT OR UPDATE OF state, assigned_to ON task_queue
+  FOR EACH STATEMENT EXECUTE PROCEDURE task_queue_notify_queued();
@@ -0,0 +1,55 @@
+-- AMZ-Driverless
+-- Copyright (c) 2019 Authors:
+--   - Huub Hendrikx <hhendrik@ethz.ch>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+-- IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+-- FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+-- AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+-- LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+-- OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+-- SOFTWARE.
+
+-- Delete the log chunks of a task together with the task.
+-- 013-task-archive.sql dropped the foreign key of task_log_chunk because a
+-- task moves from task_queue to task_archive with its log, since then the
+-- chunks of deleted tasks were left behind. The triggers delete the log of a
+-- task once it is in neither table, the archiving statement inserts the task
+-- into the archive before the trigger of its delete from the queue runs.
+-- Logs of tasks deleted before this upgrade are deleted at the end.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION task_delete_log() RETURNS trigger AS $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM task_queue WHERE uid = OLD.uid)
+     AND NOT EXISTS (SELECT 1 FROM task_archive WHERE uid = OLD.uid) THEN
+    DELETE FROM task_log_chunk WHERE task_id = OLD.uid;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS task_queue_delete_log ON task_queue;
+CREATE TRIGGER task_queue_delete_log AFTER DELETE ON task_queue
+  FOR EACH ROW EXECUTE PROCEDURE task_delete_log();
+
+DROP TRIGGER IF EXISTS task_archive_delete_log ON task_archive;
+CREATE TRIGGER task_archive_delete_log AFTER DELETE ON task_archive
+  FOR EACH ROW EXECUTE PROCEDURE task_delete_log();
+
+DELETE FROM task_log_chunk c
+  WHERE NOT EXISTS (SELECT 1 FROM task_queue q WHERE q.uid = c.task_id)
+    AND NOT EXISTS (SELECT 1 FROM task_archive a WHERE a.uid = c.task_id);
+
+COMMIT;
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# This script moves all finished tasks older than queue.archive_after_days to the archive. The archive_tasks cron job
+# does the same in batches, run this script once after upgrades/013-task-archive.sql to archive the existing history.
+
+import argparse
+import logging
+
+from rbb_server.model.database import Database, TaskArchive
+
+
+def archive_tasks(session, batch_size=1000):
+    """
+    :return: Number of archived tasks
+    """
+    archived = 0
+    while True:
+        uids = TaskArchive.archive_finished(session, batch_size)
+        session.commit()
+        if not uids:
+            break
+
+        archived += len(uids)
+        logging.info("Archived {} tasks".format(archived))
+
+    return archived
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(prog="archive_tasks")
+    parser.add_argument('-b', '--batch-size', type=int, default=1000, help="Tasks per transaction")
+    args = parser.parse_args()
+
+    # Connection parameters are read from environment variables
+    Database.init()
+    archived = archive_tasks(Database.get_session(), args.batch_size)
+    logging.info("Archived {} finished tasks".format(archived))
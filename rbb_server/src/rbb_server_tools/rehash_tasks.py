@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# This script recalculates the hashes of all tasks in the queue with the canonical hash of Task.calculate_hash.
+# Run it before creating the unique index of upgrades/010-task-hash-unique.sql. When unfinished tasks turn out
+# to be duplicates of each other, only the oldest one keeps its hash.
+
+import argparse
+import logging
+
+from sqlalchemy import bindparam
+
+from rbb_server.model.database import Database, Task
+from rbb_server.model.task import TaskState
+
+
+def rehash_tasks(session, batch_size=1000, dry_run=False):
+    """
+    :return: (number of changed hashes, number of duplicates)
+    """
+    update = Task.__table__.update()\
+        .where(Task.uid == bindparam('_uid'))\
+        .values(task_hash=bindparam('_task_hash'))
+
+    unfinished = set()
+    changed = 0
+    duplicates = 0
+    last_uid = 0
+    while True:
+        q = session.query(Task.uid, Task.task, Task.state, Task.configuration, Task.task_hash)\
+            .filter(Task.uid > last_uid)\
+            .order_by(Task.uid)\
+            .limit(batch_size)
+        rows = q.all()
+        if not rows:
+            break
+
+        updates = []
+        for uid, task, state, configuration, task_hash in rows:
+            new_hash = Task.calculate_hash(configuration)
+
+            if state < TaskState.Finished:
+                if (task, new_hash) in unfinished:
+                    logging.warning("Task {} is a duplicate of an older unfinished task".format(uid))
+                    duplicates += 1
+                    new_hash = None
+                else:
+                    unfinished.add((task, new_hash))
+
+            if new_hash != task_hash:
+                updates.append({'_uid': uid, '_task_hash': new_hash})
+
+        if updates and not dry_run:
+            session.execute(update, updates)
+            session.commit()
+
+        changed += len(updates)
+        last_uid = rows[-1].uid
+        logging.info("Rehashed tasks up to {}".format(last_uid))
+
+    session.rollback()
+    return changed, duplicates
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(prog="rehash_tasks")
+    parser.add_argument('-b', '--batch-size', type=int, default=1000, help="Tasks per transaction")
+    parser.add_argument('-d', '--dry-run', action="store_true", help="Only count changes. No writing to database")
+    args = parser.parse_args()
+
+    # Connection parameters are read from environment variables
+    Database.init()
+    changed, duplicates = rehash_tasks(Database.get_session(), args.batch_size, args.dry_run)
+    logging.info("Changed {} hashes, found {} duplicates".format(changed, duplicates))
@@ -4,8 +4,12 @@
 from __future__ import absolute_import
 # import models into model package
 from rbb_swagger_server.models.bag_extraction_configuration import BagExtractionConfiguration
+from rbb_swagger_server.models.bag_facets import BagFacets
+from rbb_swagger_server.models.bag_registration import BagRegistration
 from rbb_swagger_server.models.bag_store_summary import BagStoreSummary
 from rbb_swagger_server.models.bag_summary import BagSummary
+from rbb_swagger_server.models.bag_task_template import BagTaskTemplate
+from rbb_swagger_server.models.bag_tasks_result import BagTasksResult
 from rbb_swagger_server.models.comment import Comment
 from rbb_swagger_server.models.error import Error
 from rbb_swagger_server.models.file_store import FileStore
@@ -13,15 +17,24 @@ from rbb_swagger_server.models.file_summary import FileSummary
 from rbb_swagger_server.models.permission import Permission
 from rbb_swagger_server.models.product import Product
 from rbb_swagger_server.models.product_file import ProductFile
+from rbb_swagger_server.models.queue_depth import QueueDepth
+from rbb_swagger_server.models.queue_statistics import QueueStatistics
 from rbb_swagger_server.models.session import Session
 from rbb_swagger_server.models.simulation_environment_summary import SimulationEnvironmentSummary
 from rbb_swagger_server.models.simulation_run_summary import SimulationRunSummary
 from rbb_swagger_server.models.simulation_summary import SimulationSummary
+from rbb_swagger_server.models.stored_file import StoredFile
 from rbb_swagger_server.models.tag import Tag
+from rbb_swagger_server.models.tag_facet import TagFacet
+from rbb_swagger_server.models.task_heartbeat import TaskHeartbeat
+from rbb_swagger_server.models.task_log import TaskLog
+from rbb_swagger_server.models.task_status import TaskStatus
 from rbb_swagger_server.models.task_summary import TaskSummary
+from rbb_swagger_server.models.task_type_statistics import TaskTypeStatistics
 from rbb_swagger_server.models.topic import Topic
 from rbb_swagger_server.models.topic_mapping import TopicMapping
 from rbb_swagger_server.models.user import User
+from rbb_swagger_server.models.worker_statistics import WorkerStatistics
 from rbb_swagger_server.models.bag_detailed import BagDetailed
 from rbb_swagger_server.models.bag_store_detailed import BagStoreDetailed
 from rbb_swagger_server.models.file_detailed import FileDetailed
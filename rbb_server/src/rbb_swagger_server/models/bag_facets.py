@@ -0,0 +1,187 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from rbb_swagger_server.models.base_model_ import Model
+from rbb_swagger_server.models.tag_facet import TagFacet  # noqa: F401,E501
+from rbb_swagger_server import util
+
+
+class BagFacets(Model):
+    """NOTE: This class is auto generated by the swagger code generator program.
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, total: int=None, extracted: int=None, meta_available: int=None, extraction_failure: int=None, tags: List[TagFacet]=None):  # noqa: E501
+        """BagFacets - a model defined in Swagger
+
+        :param total: The total of this BagFacets.  # noqa: E501
+        :type total: int
+        :param extracted: The extracted of this BagFacets.  # noqa: E501
+        :type extracted: int
+        :param meta_available: The meta_available of this BagFacets.  # noqa: E501
+        :type meta_available: int
+        :param extraction_failure: The extraction_failure of this BagFacets.  # noqa: E501
+        :type extraction_failure: int
+        :param tags: The tags of this BagFacets.  # noqa: E501
+        :type tags: List[TagFacet]
+        """
+        self.swagger_types = {
+            'total': int,
+            'extracted': int,
+            'meta_available': int,
+            'extraction_failure': int,
+            'tags': List[TagFacet]
+        }
+
+        self.attribute_map = {
+            'total': 'total',
+            'extracted': 'extracted',
+            'meta_available': 'meta_available',
+            'extraction_failure': 'extraction_failure',
+            'tags': 'tags'
+        }
+
+        self._total = total
+        self._extracted = extracted
+        self._meta_available = meta_available
+        self._extraction_failure = extraction_failure
+        self._tags = tags
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'BagFacets':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The BagFacets of this BagFacets.  # noqa: E501
+        :rtype: BagFacets
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def total(self) -> int:
+        """Gets the total of this BagFacets.
+
+        Number of matching bags  # noqa: E501
+
+        :return: The total of this BagFacets.
+        :rtype: int
+        """
+        return self._total
+
+    @total.setter
+    def total(self, total: int):
+        """Sets the total of this BagFacets.
+
+        Number of matching bags  # noqa: E501
+
+        :param total: The total of this BagFacets.
+        :type total: int
+        """
+        if total is None:
+            raise ValueError("Invalid value for `total`, must not be `None`")  # noqa: E501
+
+        self._total = total
+
+    @property
+    def extracted(self) -> int:
+        """Gets the extracted of this BagFacets.
+
+        Number of matching bags that are extracted  # noqa: E501
+
+        :return: The extracted of this BagFacets.
+        :rtype: int
+        """
+        return self._extracted
+
+    @extracted.setter
+    def extracted(self, extracted: int):
+        """Sets the extracted of this BagFacets.
+
+        Number of matching bags that are extracted  # noqa: E501
+
+        :param extracted: The extracted of this BagFacets.
+        :type extracted: int
+        """
+        if extracted is None:
+            raise ValueError("Invalid value for `extracted`, must not be `None`")  # noqa: E501
+
+        self._extracted = extracted
+
+    @property
+    def meta_available(self) -> int:
+        """Gets the meta_available of this BagFacets.
+
+        Number of matching bags with meta data  # noqa: E501
+
+        :return: The meta_available of this BagFacets.
+        :rtype: int
+        """
+        return self._meta_available
+
+    @meta_available.setter
+    def meta_available(self, meta_available: int):
+        """Sets the meta_available of this BagFacets.
+
+        Number of matching bags with meta data  # noqa: E501
+
+        :param meta_available: The meta_available of this BagFacets.
+        :type meta_available: int
+        """
+        if meta_available is None:
+            raise ValueError("Invalid value for `meta_available`, must not be `None`")  # noqa: E501
+
+        self._meta_available = meta_available
+
+    @property
+    def extraction_failure(self) -> int:
+        """Gets the extraction_failure of this BagFacets.
+
+        Number of matching bags that failed to extract  # noqa: E501
+
+        :return: The extraction_failure of this BagFacets.
+        :rtype: int
+        """
+        return self._extraction_failure
+
+    @extraction_failure.setter
+    def extraction_failure(self, extraction_failure: int):
+        """Sets the extraction_failure of this BagFacets.
+
+        Number of matching bags that failed to extract  # noqa: E501
+
+        :param extraction_failure: The extraction_failure of this BagFacets.
+        :type extraction_failure: int
+        """
+        if extraction_failure is None:
+            raise ValueError("Invalid value for `extraction_failure`, must not be `None`")  # noqa: E501
+
+        self._extraction_failure = extraction_failure
+
+    @property
+    def tags(self) -> List[TagFacet]:
+        """Gets the tags of this BagFacets.
+
+
+        :return: The tags of this BagFacets.
+        :rtype: List[TagFacet]
+        """
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags: List[TagFacet]):
+        """Sets the tags of this BagFacets.
+
+
+        :param tags: The tags of this BagFacets.
+        :type tags: List[TagFacet]
+        """
+        if tags is None:
+            raise ValueError("Invalid value for `tags`, must not be `None`")  # noqa: E501
+
+        self._tags = tags
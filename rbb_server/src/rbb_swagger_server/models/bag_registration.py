@@ -0,0 +1,98 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from rbb_swagger_server.models.base_model_ import Model
+from rbb_swagger_server import util
+
+
+class BagRegistration(Model):
+    """NOTE: This class is auto generated by the swagger code generator program.
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, name: str=None, status: str=None):  # noqa: E501
+        """BagRegistration - a model defined in Swagger
+
+        :param name: The name of this BagRegistration.  # noqa: E501
+        :type name: str
+        :param status: The status of this BagRegistration.  # noqa: E501
+        :type status: str
+        """
+        self.swagger_types = {
+            'name': str,
+            'status': str
+        }
+
+        self.attribute_map = {
+            'name': 'name',
+            'status': 'status'
+        }
+
+        self._name = name
+        self._status = status
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'BagRegistration':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The BagRegistration of this BagRegistration.  # noqa: E501
+        :rtype: BagRegistration
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def name(self) -> str:
+        """Gets the name of this BagRegistration.
+
+        Name of the bag  # noqa: E501
+
+        :return: The name of this BagRegistration.
+        :rtype: str
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        """Sets the name of this BagRegistration.
+
+        Name of the bag  # noqa: E501
+
+        :param name: The name of this BagRegistration.
+        :type name: str
+        """
+        if name is None:
+            raise ValueError("Invalid value for `name`, must not be `None`")  # noqa: E501
+
+        self._name = name
+
+    @property
+    def status(self) -> str:
+        """Gets the status of this BagRegistration.
+
+        created if the bag is new, exists if the store already had a bag with this name  # noqa: E501
+
+        :return: The status of this BagRegistration.
+        :rtype: str
+        """
+        return self._status
+
+    @status.setter
+    def status(self, status: str):
+        """Sets the status of this BagRegistration.
+
+        created if the bag is new, exists if the store already had a bag with this name  # noqa: E501
+
+        :param status: The status of this BagRegistration.
+        :type status: str
+        """
+        if status is None:
+            raise ValueError("Invalid value for `status`, must not be `None`")  # noqa: E501
+
+        self._status = status
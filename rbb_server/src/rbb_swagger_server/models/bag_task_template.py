@@ -0,0 +1,180 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from rbb_swagger_server.models.base_model_ import Model
+from rbb_swagger_server import util
+
+
+class BagTaskTemplate(Model):
+    """NOTE: This class is auto generated by the swagger code generator program.
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, task: str=None, description: str=None, priority: int=None, worker_labels: str=None, config: object=None):  # noqa: E501
+        """BagTaskTemplate - a model defined in Swagger
+
+        :param task: The task of this BagTaskTemplate.  # noqa: E501
+        :type task: str
+        :param description: The description of this BagTaskTemplate.  # noqa: E501
+        :type description: str
+        :param priority: The priority of this BagTaskTemplate.  # noqa: E501
+        :type priority: int
+        :param worker_labels: The worker_labels of this BagTaskTemplate.  # noqa: E501
+        :type worker_labels: str
+        :param config: The config of this BagTaskTemplate.  # noqa: E501
+        :type config: object
+        """
+        self.swagger_types = {
+            'task': str,
+            'description': str,
+            'priority': int,
+            'worker_labels': str,
+            'config': object
+        }
+
+        self.attribute_map = {
+            'task': 'task',
+            'description': 'description',
+            'priority': 'priority',
+            'worker_labels': 'worker_labels',
+            'config': 'config'
+        }
+
+        self._task = task
+        self._description = description
+        self._priority = priority
+        self._worker_labels = worker_labels
+        self._config = config
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'BagTaskTemplate':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The BagTaskTemplate of this BagTaskTemplate.  # noqa: E501
+        :rtype: BagTaskTemplate
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def task(self) -> str:
+        """Gets the task of this BagTaskTemplate.
+
+        Name of the task  # noqa: E501
+
+        :return: The task of this BagTaskTemplate.
+        :rtype: str
+        """
+        return self._task
+
+    @task.setter
+    def task(self, task: str):
+        """Sets the task of this BagTaskTemplate.
+
+        Name of the task  # noqa: E501
+
+        :param task: The task of this BagTaskTemplate.
+        :type task: str
+        """
+        if task is None:
+            raise ValueError("Invalid value for `task`, must not be `None`")  # noqa: E501
+
+        self._task = task
+
+    @property
+    def description(self) -> str:
+        """Gets the description of this BagTaskTemplate.
+
+        Description of the tasks, the store and bag name are appended  # noqa: E501
+
+        :return: The description of this BagTaskTemplate.
+        :rtype: str
+        """
+        return self._description
+
+    @description.setter
+    def description(self, description: str):
+        """Sets the description of this BagTaskTemplate.
+
+        Description of the tasks, the store and bag name are appended  # noqa: E501
+
+        :param description: The description of this BagTaskTemplate.
+        :type description: str
+        """
+
+        self._description = description
+
+    @property
+    def priority(self) -> int:
+        """Gets the priority of this BagTaskTemplate.
+
+        Priority of the tasks  # noqa: E501
+
+        :return: The priority of this BagTaskTemplate.
+        :rtype: int
+        """
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority: int):
+        """Sets the priority of this BagTaskTemplate.
+
+        Priority of the tasks  # noqa: E501
+
+        :param priority: The priority of this BagTaskTemplate.
+        :type priority: int
+        """
+
+        self._priority = priority
+
+    @property
+    def worker_labels(self) -> str:
+        """Gets the worker_labels of this BagTaskTemplate.
+
+        Labels a worker needs to run the tasks  # noqa: E501
+
+        :return: The worker_labels of this BagTaskTemplate.
+        :rtype: str
+        """
+        return self._worker_labels
+
+    @worker_labels.setter
+    def worker_labels(self, worker_labels: str):
+        """Sets the worker_labels of this BagTaskTemplate.
+
+        Labels a worker needs to run the tasks  # noqa: E501
+
+        :param worker_labels: The worker_labels of this BagTaskTemplate.
+        :type worker_labels: str
+        """
+
+        self._worker_labels = worker_labels
+
+    @property
+    def config(self) -> object:
+        """Gets the config of this BagTaskTemplate.
+
+        Configuration of the tasks, the store and bag name are added to it  # noqa: E501
+
+        :return: The config of this BagTaskTemplate.
+        :rtype: object
+        """
+        return self._config
+
+    @config.setter
+    def config(self, config: object):
+        """Sets the config of this BagTaskTemplate.
+
+        Configuration of the tasks, the store and bag name are added to it  # noqa: E501
+
+        :param config: The config of this BagTaskTemplate.
+        :type config: object
+        """
+
+        self._config = config
@@ -0,0 +1,158 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from rbb_swagger_server.models.base_model_ import Model
+from rbb_swagger_server import util
+
+
+class BagTasksResult(Model):
+    """NOTE: This class is auto generated by the swagger code generator program.
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, matched: int=None, created: int=None, skipped: int=None, dry_run: bool=None):  # noqa: E501
+        """BagTasksResult - a model defined in Swagger
+
+        :param matched: The matched of this BagTasksResult.  # noqa: E501
+        :type matched: int
+        :param created: The created of this BagTasksResult.  # noqa: E501
+        :type created: int
+        :param skipped: The skipped of this BagTasksResult.  # noqa: E501
+        :type skipped: int
+        :param dry_run: The dry_run of this BagTasksResult.  # noqa: E501
+        :type dry_run: bool
+        """
+        self.swagger_types = {
+            'matched': int,
+            'created': int,
+            'skipped': int,
+            'dry_run': bool
+        }
+
+        self.attribute_map = {
+            'matched': 'matched',
+            'created': 'created',
+            'skipped': 'skipped',
+            'dry_run': 'dry_run'
+        }
+
+        self._matched = matched
+        self._created = created
+        self._skipped = skipped
+        self._dry_run = dry_run
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'BagTasksResult':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The BagTasksResult of this BagTasksResult.  # noqa: E501
+        :rtype: BagTasksResult
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def matched(self) -> int:
+        """Gets the matched of this BagTasksResult.
+
+        Number of bags matching the filter  # noqa: E501
+
+        :return: The matched of this BagTasksResult.
+        :rtype: int
+        """
+        return self._matched
+
+    @matched.setter
+    def matched(self, matched: int):
+        """Sets the matched of this BagTasksResult.
+
+        Number of bags matching the filter  # noqa: E501
+
+        :param matched: The matched of this BagTasksResult.
+        :type matched: int
+        """
+        if matched is None:
+            raise ValueError("Invalid value for `matched`, must not be `None`")  # noqa: E501
+
+        self._matched = matched
+
+    @property
+    def created(self) -> int:
+        """Gets the created of this BagTasksResult.
+
+        Number of tasks created  # noqa: E501
+
+        :return: The created of this BagTasksResult.
+        :rtype: int
+        """
+        return self._created
+
+    @created.setter
+    def created(self, created: int):
+        """Sets the created of this BagTasksResult.
+
+        Number of tasks created  # noqa: E501
+
+        :param created: The created of this BagTasksResult.
+        :type created: int
+        """
+        if created is None:
+            raise ValueError("Invalid value for `created`, must not be `None`")  # noqa: E501
+
+        self._created = created
+
+    @property
+    def skipped(self) -> int:
+        """Gets the skipped of this BagTasksResult.
+
+        Number of bags skipped because an equal task is not finished yet  # noqa: E501
+
+        :return: The skipped of this BagTasksResult.
+        :rtype: int
+        """
+        return self._skipped
+
+    @skipped.setter
+    def skipped(self, skipped: int):
+        """Sets the skipped of this BagTasksResult.
+
+        Number of bags skipped because an equal task is not finished yet  # noqa: E501
+
+        :param skipped: The skipped of this BagTasksResult.
+        :type skipped: int
+        """
+        if skipped is None:
+            raise ValueError("Invalid value for `skipped`, must not be `None`")  # noqa: E501
+
+        self._skipped = skipped
+
+    @property
+    def dry_run(self) -> bool:
+        """Gets the dry_run of this BagTasksResult.
+
+        No tasks were created, created counts the tasks that would be created  # noqa: E501
+
+        :return: The dry_run of this BagTasksResult.
+        :rtype: bool
+        """
+        return self._dry_run
+
+    @dry_run.setter
+    def dry_run(self, dry_run: bool):
+        """Sets the dry_run of this BagTasksResult.
+
+        No tasks were created, created counts the tasks that would be created  # noqa: E501
+
+        :param dry_run: The dry_run of this BagTasksResult.
+        :type dry_run: bool
+        """
+        if dry_run is None:
+            raise ValueError("Invalid value for `dry_run`, must not be `None`")  # noqa: E501
+
+        self._dry_run = dry_run
@@ -166,7 +166,7 @@ class Product(Model):
     def product_data(self) -> object:
         """Gets the product_data of this Product.
 
-        Product data  # noqa: E501
+        Product data, left out when only the product headers are requested  # noqa: E501
 
         :return: The product_data of this Product.
         :rtype: object
@@ -177,14 +177,11 @@ class Product(Model):
     def product_data(self, product_data: object):
         """Sets the product_data of this Product.
 
-        Product data  # noqa: E501
+        Product data, left out when only the product headers are requested  # noqa: E501
 
         :param product_data: The product_data of this Product.
         :type product_data: object
         """
-        if product_data is None:
-            raise ValueError("Invalid value for `product_data`, must not be `None`")  # noqa: E501
-
         self._product_data = product_data
 
     @property
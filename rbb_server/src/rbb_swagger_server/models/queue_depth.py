@@ -0,0 +1,128 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from rbb_swagger_server.models.base_model_ import Model
+from rbb_swagger_server import util
+
+
+class QueueDepth(Model):
+    """NOTE: This class is auto generated by the swagger code generator program.
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, task: str=None, state: int=None, count: int=None):  # noqa: E501
+        """QueueDepth - a model defined in Swagger
+
+        :param task: The task of this QueueDepth.  # noqa: E501
+        :type task: str
+        :param state: The state of this QueueDepth.  # noqa: E501
+        :type state: int
+        :param count: The count of this QueueDepth.  # noqa: E501
+        :type count: int
+        """
+        self.swagger_types = {
+            'task': str,
+            'state': int,
+            'count': int
+        }
+
+        self.attribute_map = {
+            'task': 'task',
+            'state': 'state',
+            'count': 'count'
+        }
+
+        self._task = task
+        self._state = state
+        self._count = count
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'QueueDepth':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The QueueDepth of this QueueDepth.  # noqa: E501
+        :rtype: QueueDepth
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def task(self) -> str:
+        """Gets the task of this QueueDepth.
+
+        Name of the task  # noqa: E501
+
+        :return: The task of this QueueDepth.
+        :rtype: str
+        """
+        return self._task
+
+    @task.setter
+    def task(self, task: str):
+        """Sets the task of this QueueDepth.
+
+        Name of the task  # noqa: E501
+
+        :param task: The task of this QueueDepth.
+        :type task: str
+        """
+        if task is None:
+            raise ValueError("Invalid value for `task`, must not be `None`")  # noqa: E501
+
+        self._task = task
+
+    @property
+    def state(self) -> int:
+        """Gets the state of this QueueDepth.
+
+        State of the tasks  # noqa: E501
+
+        :return: The state of this QueueDepth.
+        :rtype: int
+        """
+        return self._state
+
+    @state.setter
+    def state(self, state: int):
+        """Sets the state of this QueueDepth.
+
+        State of the tasks  # noqa: E501
+
+        :param state: The state of this QueueDepth.
+        :type state: int
+        """
+        if state is None:
+            raise ValueError("Invalid value for `state`, must not be `None`")  # noqa: E501
+
+        self._state = state
+
+    @property
+    def count(self) -> int:
+        """Gets the count of this QueueDepth.
+
+        Number of tasks  # noqa: E501
+
+        :return: The count of this QueueDepth.
+        :rtype: int
+        """
+        return self._count
+
+    @count.setter
+    def count(self, count: int):
+        """Sets the count of this QueueDepth.
+
+        Number of tasks  # noqa: E501
+
+        :param count: The count of this QueueDepth.
+        :type count: int
+        """
+        if count is None:
+            raise ValueError("Invalid value for `count`, must not be `None`")  # noqa: E501
+
+        self._count = count
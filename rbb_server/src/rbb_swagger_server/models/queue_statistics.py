@@ -0,0 +1,191 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from rbb_swagger_server.models.base_model_ import Model
+from rbb_swagger_server.models.queue_depth import QueueDepth  # noqa: F401,E501
+from rbb_swagger_server.models.task_type_statistics import TaskTypeStatistics  # noqa: F401,E501
+from rbb_swagger_server.models.worker_statistics import WorkerStatistics  # noqa: F401,E501
+from rbb_swagger_server import util
+
+
+class QueueStatistics(Model):
+    """NOTE: This class is auto generated by the swagger code generator program.
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, window: int=None, depth: List[QueueDepth]=None, tasks: List[TaskTypeStatistics]=None, workers: List[WorkerStatistics]=None, suggested_workers: int=None):  # noqa: E501
+        """QueueStatistics - a model defined in Swagger
+
+        :param window: The window of this QueueStatistics.  # noqa: E501
+        :type window: int
+        :param depth: The depth of this QueueStatistics.  # noqa: E501
+        :type depth: List[QueueDepth]
+        :param tasks: The tasks of this QueueStatistics.  # noqa: E501
+        :type tasks: List[TaskTypeStatistics]
+        :param workers: The workers of this QueueStatistics.  # noqa: E501
+        :type workers: List[WorkerStatistics]
+        :param suggested_workers: The suggested_workers of this QueueStatistics.  # noqa: E501
+        :type suggested_workers: int
+        """
+        self.swagger_types = {
+            'window': int,
+            'depth': List[QueueDepth],
+            'tasks': List[TaskTypeStatistics],
+            'workers': List[WorkerStatistics],
+            'suggested_workers': int
+        }
+
+        self.attribute_map = {
+            'window': 'window',
+            'depth': 'depth',
+            'tasks': 'tasks',
+            'workers': 'workers',
+            'suggested_workers': 'suggested_workers'
+        }
+
+        self._window = window
+        self._depth = depth
+        self._tasks = tasks
+        self._workers = workers
+        self._suggested_workers = suggested_workers
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'QueueStatistics':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The QueueStatistics of this QueueStatistics.  # noqa: E501
+        :rtype: QueueStatistics
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def window(self) -> int:
+        """Gets the window of this QueueStatistics.
+
+        Length of the window in seconds  # noqa: E501
+
+        :return: The window of this QueueStatistics.
+        :rtype: int
+        """
+        return self._window
+
+    @window.setter
+    def window(self, window: int):
+        """Sets the window of this QueueStatistics.
+
+        Length of the window in seconds  # noqa: E501
+
+        :param window: The window of this QueueStatistics.
+        :type window: int
+        """
+        if window is None:
+            raise ValueError("Invalid value for `window`, must not be `None`")  # noqa: E501
+
+        self._window = window
+
+    @property
+    def depth(self) -> List[QueueDepth]:
+        """Gets the depth of this QueueStatistics.
+
+        Number of unfinished tasks per task and state  # noqa: E501
+
+        :return: The depth of this QueueStatistics.
+        :rtype: List[QueueDepth]
+        """
+        return self._depth
+
+    @depth.setter
+    def depth(self, depth: List[QueueDepth]):
+        """Sets the depth of this QueueStatistics.
+
+        Number of unfinished tasks per task and state  # noqa: E501
+
+        :param depth: The depth of this QueueStatistics.
+        :type depth: List[QueueDepth]
+        """
+        if depth is None:
+            raise ValueError("Invalid value for `depth`, must not be `None`")  # noqa: E501
+
+        self._depth = depth
+
+    @property
+    def tasks(self) -> List[TaskTypeStatistics]:
+        """Gets the tasks of this QueueStatistics.
+
+        Statistics per task over the window  # noqa: E501
+
+        :return: The tasks of this QueueStatistics.
+        :rtype: List[TaskTypeStatistics]
+        """
+        return self._tasks
+
+    @tasks.setter
+    def tasks(self, tasks: List[TaskTypeStatistics]):
+        """Sets the tasks of this QueueStatistics.
+
+        Statistics per task over the window  # noqa: E501
+
+        :param tasks: The tasks of this QueueStatistics.
+        :type tasks: List[TaskTypeStatistics]
+        """
+        if tasks is None:
+            raise ValueError("Invalid value for `tasks`, must not be `None`")  # noqa: E501
+
+        self._tasks = tasks
+
+    @property
+    def workers(self) -> List[WorkerStatistics]:
+        """Gets the workers of this QueueStatistics.
+
+        Throughput per worker over the window  # noqa: E501
+
+        :return: The workers of this QueueStatistics.
+        :rtype: List[WorkerStatistics]
+        """
+        return self._workers
+
+    @workers.setter
+    def workers(self, workers: List[WorkerStatistics]):
+        """Sets the workers of this QueueStatistics.
+
+        Throughput per worker over the window  # noqa: E501
+
+        :param workers: The workers of this QueueStatistics.
+        :type workers: List[WorkerStatistics]
+        """
+        if workers is None:
+            raise ValueError("Invalid value for `workers`, must not be `None`")  # noqa: E501
+
+        self._workers = workers
+
+    @property
+    def suggested_workers(self) -> int:
+        """Gets the suggested_workers of this QueueStatistics.
+
+        Number of workers needed to keep up with the load of the window and to work off the queued tasks within one window  # noqa: E501
+
+        :return: The suggested_workers of this QueueStatistics.
+        :rtype: int
+        """
+        return self._suggested_workers
+
+    @suggested_workers.setter
+    def suggested_workers(self, suggested_workers: int):
+        """Sets the suggested_workers of this QueueStatistics.
+
+        Number of workers needed to keep up with the load of the window and to work off the queued tasks within one window  # noqa: E501
+
+        :param suggested_workers: The suggested_workers of this QueueStatistics.
+        :type suggested_workers: int
+        """
+        if suggested_workers is None:
+            raise ValueError("Invalid value for `suggested_workers`, must not be `None`")  # noqa: E501
+
+        self._suggested_workers = suggested_workers
@@ -0,0 +1,98 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from rbb_swagger_server.models.base_model_ import Model
+from rbb_swagger_server import util
+
+
+class StoredFile(Model):
+    """NOTE: This class is auto generated by the swagger code generator program.
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, name: str=None, store_data: object=None):  # noqa: E501
+        """StoredFile - a model defined in Swagger
+
+        :param name: The name of this StoredFile.  # noqa: E501
+        :type name: str
+        :param store_data: The store_data of this StoredFile.  # noqa: E501
+        :type store_data: object
+        """
+        self.swagger_types = {
+            'name': str,
+            'store_data': object
+        }
+
+        self.attribute_map = {
+            'name': 'name',
+            'store_data': 'store_data'
+        }
+
+        self._name = name
+        self._store_data = store_data
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'StoredFile':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The StoredFile of this StoredFile.  # noqa: E501
+        :rtype: StoredFile
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def name(self) -> str:
+        """Gets the name of this StoredFile.
+
+        Unique name of the file in the store, this becomes the name of the bag  # noqa: E501
+
+        :return: The name of this StoredFile.
+        :rtype: str
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        """Sets the name of this StoredFile.
+
+        Unique name of the file in the store, this becomes the name of the bag  # noqa: E501
+
+        :param name: The name of this StoredFile.
+        :type name: str
+        """
+        if name is None:
+            raise ValueError("Invalid value for `name`, must not be `None`")  # noqa: E501
+
+        self._name = name
+
+    @property
+    def store_data(self) -> object:
+        """Gets the store_data of this StoredFile.
+
+        Data that is specific to the bag store type.  # noqa: E501
+
+        :return: The store_data of this StoredFile.
+        :rtype: object
+        """
+        return self._store_data
+
+    @store_data.setter
+    def store_data(self, store_data: object):
+        """Sets the store_data of this StoredFile.
+
+        Data that is specific to the bag store type.  # noqa: E501
+
+        :param store_data: The store_data of this StoredFile.
+        :type store_data: object
+        """
+        if store_data is None:
+            raise ValueError("Invalid value for `store_data`, must not be `None`")  # noqa: E501
+
+        self._store_data = store_data
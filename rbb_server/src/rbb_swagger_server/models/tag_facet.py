@@ -0,0 +1,124 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from rbb_swagger_server.models.base_model_ import Model
+from rbb_swagger_server import util
+
+
+class TagFacet(Model):
+    """NOTE: This class is auto generated by the swagger code generator program.
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, tag: str=None, color: str=None, count: int=None):  # noqa: E501
+        """TagFacet - a model defined in Swagger
+
+        :param tag: The tag of this TagFacet.  # noqa: E501
+        :type tag: str
+        :param color: The color of this TagFacet.  # noqa: E501
+        :type color: str
+        :param count: The count of this TagFacet.  # noqa: E501
+        :type count: int
+        """
+        self.swagger_types = {
+            'tag': str,
+            'color': str,
+            'count': int
+        }
+
+        self.attribute_map = {
+            'tag': 'tag',
+            'color': 'color',
+            'count': 'count'
+        }
+
+        self._tag = tag
+        self._color = color
+        self._count = count
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'TagFacet':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The TagFacet of this TagFacet.  # noqa: E501
+        :rtype: TagFacet
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def tag(self) -> str:
+        """Gets the tag of this TagFacet.
+
+
+        :return: The tag of this TagFacet.
+        :rtype: str
+        """
+        return self._tag
+
+    @tag.setter
+    def tag(self, tag: str):
+        """Sets the tag of this TagFacet.
+
+
+        :param tag: The tag of this TagFacet.
+        :type tag: str
+        """
+        if tag is None:
+            raise ValueError("Invalid value for `tag`, must not be `None`")  # noqa: E501
+
+        self._tag = tag
+
+    @property
+    def color(self) -> str:
+        """Gets the color of this TagFacet.
+
+
+        :return: The color of this TagFacet.
+        :rtype: str
+        """
+        return self._color
+
+    @color.setter
+    def color(self, color: str):
+        """Sets the color of this TagFacet.
+
+
+        :param color: The color of this TagFacet.
+        :type color: str
+        """
+        if color is None:
+            raise ValueError("Invalid value for `color`, must not be `None`")  # noqa: E501
+
+        self._color = color
+
+    @property
+    def count(self) -> int:
+        """Gets the count of this TagFacet.
+
+        Number of matching bags with this tag  # noqa: E501
+
+        :return: The count of this TagFacet.
+        :rtype: int
+        """
+        return self._count
+
+    @count.setter
+    def count(self, count: int):
+        """Sets the count of this TagFacet.
+
+        Number of matching bags with this tag  # noqa: E501
+
+        :param count: The count of this TagFacet.
+        :type count: int
+        """
+        if count is None:
+            raise ValueError("Invalid value for `count`, must not be `None`")  # noqa: E501
+
+        self._count = count
@@ -16,7 +16,7 @@ class TaskDetailed(Model):
     Do not edit the class manually.
     """
 
-    def __init__(self, detail_type: str=None, identifier: str=None, priority: float=None, description: str=None, assigned_to: str=None, created: datetime=None, last_updated: datetime=None, state: int=None, task: str=None, success: bool=None, runtime: float=None, worker_labels: str=None, config: object=None, result: object=None, log: str=None):  # noqa: E501
+    def __init__(self, detail_type: str=None, identifier: str=None, priority: float=None, description: str=None, assigned_to: str=None, created: datetime=None, last_updated: datetime=None, state: int=None, task: str=None, success: bool=None, runtime: float=None, worker_labels: str=None, expected_runtime: float=None, config: object=None, result: object=None, log: str=None):  # noqa: E501
         """TaskDetailed - a model defined in Swagger
 
         :param detail_type: The detail_type of this TaskDetailed.  # noqa: E501
@@ -43,6 +43,8 @@ class TaskDetailed(Model):
         :type runtime: float
         :param worker_labels: The worker_labels of this TaskDetailed.  # noqa: E501
         :type worker_labels: str
+        :param expected_runtime: The expected_runtime of this TaskDetailed.  # noqa: E501
+        :type expected_runtime: float
         :param config: The config of this TaskDetailed.  # noqa: E501
         :type config: object
         :param result: The result of this TaskDetailed.  # noqa: E501
@@ -63,6 +65,7 @@ class TaskDetailed(Model):
             'success': bool,
             'runtime': float,
             'worker_labels': str,
+            'expected_runtime': float,
             'config': object,
             'result': object,
             'log': str
@@ -81,6 +84,7 @@ class TaskDetailed(Model):
             'success': 'success',
             'runtime': 'runtime',
             'worker_labels': 'worker_labels',
+            'expected_runtime': 'expected_runtime',
             'config': 'config',
             'result': 'result',
             'log': 'log'
@@ -98,6 +102,7 @@ class TaskDetailed(Model):
         self._success = success
         self._runtime = runtime
         self._worker_labels = worker_labels
+        self._expected_runtime = expected_runtime
         self._config = config
         self._result = result
         self._log = log
@@ -382,7 +387,7 @@ class TaskDetailed(Model):
     def worker_labels(self) -> str:
         """Gets the worker_labels of this TaskDetailed.
 
-        Worker that can take this task.  # noqa: E501
+        Comma separated labels a worker needs to take this task.  # noqa: E501
 
         :return: The worker_labels of this TaskDetailed.
         :rtype: str
@@ -393,7 +398,7 @@ class TaskDetailed(Model):
     def worker_labels(self, worker_labels: str):
         """Sets the worker_labels of this TaskDetailed.
 
-        Worker that can take this task.  # noqa: E501
+        Comma separated labels a worker needs to take this task.  # noqa: E501
 
         :param worker_labels: The worker_labels of this TaskDetailed.
         :type worker_labels: str
@@ -403,6 +408,29 @@ class TaskDetailed(Model):
 
         self._worker_labels = worker_labels
 
+    @property
+    def expected_runtime(self) -> float:
+        """Gets the expected_runtime of this TaskDetailed.
+
+        Expected runtime in seconds, estimated from the earlier runs of the task type. Only for unfinished tasks.  # noqa: E501
+
+        :return: The expected_runtime of this TaskDetailed.
+        :rtype: float
+        """
+        return self._expected_runtime
+
+    @expected_runtime.setter
+    def expected_runtime(self, expected_runtime: float):
+        """Sets the expected_runtime of this TaskDetailed.
+
+        Expected runtime in seconds, estimated from the earlier runs of the task type. Only for unfinished tasks.  # noqa: E501
+
+        :param expected_runtime: The expected_runtime of this TaskDetailed.
+        :type expected_runtime: float
+        """
+
+        self._expected_runtime = expected_runtime
+
     @property
     def config(self) -> object:
         """Gets the config of this TaskDetailed.
@@ -453,7 +481,7 @@ class TaskDetailed(Model):
     def log(self) -> str:
         """Gets the log of this TaskDetailed.
 
-        Standard output of the task  # noqa: E501
+        Standard output of the task, only included on request  # noqa: E501
 
         :return: The log of this TaskDetailed.
         :rtype: str
@@ -464,7 +492,7 @@ class TaskDetailed(Model):
     def log(self, log: str):
         """Sets the log of this TaskDetailed.
 
-        Standard output of the task  # noqa: E501
+        Standard output of the task, only included on request  # noqa: E501
 
         :param log: The log of this TaskDetailed.
         :type log: str
@@ -0,0 +1,96 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from rbb_swagger_server.models.base_model_ import Model
+from rbb_swagger_server import util
+
+
+class TaskHeartbeat(Model):
+    """NOTE: This class is auto generated by the swagger code generator program.
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, worker_name: str=None, log_append: str=None):  # noqa: E501
+        """TaskHeartbeat - a model defined in Swagger
+
+        :param worker_name: The worker_name of this TaskHeartbeat.  # noqa: E501
+        :type worker_name: str
+        :param log_append: The log_append of this TaskHeartbeat.  # noqa: E501
+        :type log_append: str
+        """
+        self.swagger_types = {
+            'worker_name': str,
+            'log_append': str
+        }
+
+        self.attribute_map = {
+            'worker_name': 'worker_name',
+            'log_append': 'log_append'
+        }
+
+        self._worker_name = worker_name
+        self._log_append = log_append
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'TaskHeartbeat':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The TaskHeartbeat of this TaskHeartbeat.  # noqa: E501
+        :rtype: TaskHeartbeat
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def worker_name(self) -> str:
+        """Gets the worker_name of this TaskHeartbeat.
+
+        Name of the worker sending the heartbeat  # noqa: E501
+
+        :return: The worker_name of this TaskHeartbeat.
+        :rtype: str
+        """
+        return self._worker_name
+
+    @worker_name.setter
+    def worker_name(self, worker_name: str):
+        """Sets the worker_name of this TaskHeartbeat.
+
+        Name of the worker sending the heartbeat  # noqa: E501
+
+        :param worker_name: The worker_name of this TaskHeartbeat.
+        :type worker_name: str
+        """
+        if worker_name is None:
+            raise ValueError("Invalid value for `worker_name`, must not be `None`")  # noqa: E501
+
+        self._worker_name = worker_name
+
+    @property
+    def log_append(self) -> str:
+        """Gets the log_append of this TaskHeartbeat.
+
+        Output of the task since the previous heartbeat  # noqa: E501
+
+        :return: The log_append of this TaskHeartbeat.
+        :rtype: str
+        """
+        return self._log_append
+
+    @log_append.setter
+    def log_append(self, log_append: str):
+        """Sets the log_append of this TaskHeartbeat.
+
+        Output of the task since the previous heartbeat  # noqa: E501
+
+        :param log_append: The log_append of this TaskHeartbeat.
+        :type log_append: str
+        """
+
+        self._log_append = log_append
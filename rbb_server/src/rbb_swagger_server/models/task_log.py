@@ -0,0 +1,158 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from rbb_swagger_server.models.base_model_ import Model
+from rbb_swagger_server import util
+
+
+class TaskLog(Model):
+    """NOTE: This class is auto generated by the swagger code generator program.
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, offset: int=None, next_offset: int=None, size: int=None, log: str=None):  # noqa: E501
+        """TaskLog - a model defined in Swagger
+
+        :param offset: The offset of this TaskLog.  # noqa: E501
+        :type offset: int
+        :param next_offset: The next_offset of this TaskLog.  # noqa: E501
+        :type next_offset: int
+        :param size: The size of this TaskLog.  # noqa: E501
+        :type size: int
+        :param log: The log of this TaskLog.  # noqa: E501
+        :type log: str
+        """
+        self.swagger_types = {
+            'offset': int,
+            'next_offset': int,
+            'size': int,
+            'log': str
+        }
+
+        self.attribute_map = {
+            'offset': 'offset',
+            'next_offset': 'next_offset',
+            'size': 'size',
+            'log': 'log'
+        }
+
+        self._offset = offset
+        self._next_offset = next_offset
+        self._size = size
+        self._log = log
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'TaskLog':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The TaskLog of this TaskLog.  # noqa: E501
+        :rtype: TaskLog
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def offset(self) -> int:
+        """Gets the offset of this TaskLog.
+
+        Byte position of the returned text in the log  # noqa: E501
+
+        :return: The offset of this TaskLog.
+        :rtype: int
+        """
+        return self._offset
+
+    @offset.setter
+    def offset(self, offset: int):
+        """Sets the offset of this TaskLog.
+
+        Byte position of the returned text in the log  # noqa: E501
+
+        :param offset: The offset of this TaskLog.
+        :type offset: int
+        """
+        if offset is None:
+            raise ValueError("Invalid value for `offset`, must not be `None`")  # noqa: E501
+
+        self._offset = offset
+
+    @property
+    def next_offset(self) -> int:
+        """Gets the next_offset of this TaskLog.
+
+        Byte position to continue reading  # noqa: E501
+
+        :return: The next_offset of this TaskLog.
+        :rtype: int
+        """
+        return self._next_offset
+
+    @next_offset.setter
+    def next_offset(self, next_offset: int):
+        """Sets the next_offset of this TaskLog.
+
+        Byte position to continue reading  # noqa: E501
+
+        :param next_offset: The next_offset of this TaskLog.
+        :type next_offset: int
+        """
+        if next_offset is None:
+            raise ValueError("Invalid value for `next_offset`, must not be `None`")  # noqa: E501
+
+        self._next_offset = next_offset
+
+    @property
+    def size(self) -> int:
+        """Gets the size of this TaskLog.
+
+        Size of the complete log in bytes  # noqa: E501
+
+        :return: The size of this TaskLog.
+        :rtype: int
+        """
+        return self._size
+
+    @size.setter
+    def size(self, size: int):
+        """Sets the size of this TaskLog.
+
+        Size of the complete log in bytes  # noqa: E501
+
+        :param size: The size of this TaskLog.
+        :type size: int
+        """
+        if size is None:
+            raise ValueError("Invalid value for `size`, must not be `None`")  # noqa: E501
+
+        self._size = size
+
+    @property
+    def log(self) -> str:
+        """Gets the log of this TaskLog.
+
+        Part of the log  # noqa: E501
+
+        :return: The log of this TaskLog.
+        :rtype: str
+        """
+        return self._log
+
+    @log.setter
+    def log(self, log: str):
+        """Sets the log of this TaskLog.
+
+        Part of the log  # noqa: E501
+
+        :param log: The log of this TaskLog.
+        :type log: str
+        """
+        if log is None:
+            raise ValueError("Invalid value for `log`, must not be `None`")  # noqa: E501
+
+        self._log = log
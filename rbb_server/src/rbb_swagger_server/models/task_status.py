@@ -0,0 +1,126 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from rbb_swagger_server.models.base_model_ import Model
+from rbb_swagger_server import util
+
+
+class TaskStatus(Model):
+    """NOTE: This class is auto generated by the swagger code generator program.
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, state: int=None, cancellation_requested: bool=None, lease_lost: bool=None):  # noqa: E501
+        """TaskStatus - a model defined in Swagger
+
+        :param state: The state of this TaskStatus.  # noqa: E501
+        :type state: int
+        :param cancellation_requested: The cancellation_requested of this TaskStatus.  # noqa: E501
+        :type cancellation_requested: bool
+        :param lease_lost: The lease_lost of this TaskStatus.  # noqa: E501
+        :type lease_lost: bool
+        """
+        self.swagger_types = {
+            'state': int,
+            'cancellation_requested': bool,
+            'lease_lost': bool
+        }
+
+        self.attribute_map = {
+            'state': 'state',
+            'cancellation_requested': 'cancellation_requested',
+            'lease_lost': 'lease_lost'
+        }
+
+        self._state = state
+        self._cancellation_requested = cancellation_requested
+        self._lease_lost = lease_lost
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'TaskStatus':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The TaskStatus of this TaskStatus.  # noqa: E501
+        :rtype: TaskStatus
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def state(self) -> int:
+        """Gets the state of this TaskStatus.
+
+        State of the task.  # noqa: E501
+
+        :return: The state of this TaskStatus.
+        :rtype: int
+        """
+        return self._state
+
+    @state.setter
+    def state(self, state: int):
+        """Sets the state of this TaskStatus.
+
+        State of the task.  # noqa: E501
+
+        :param state: The state of this TaskStatus.
+        :type state: int
+        """
+        if state is None:
+            raise ValueError("Invalid value for `state`, must not be `None`")  # noqa: E501
+
+        self._state = state
+
+    @property
+    def cancellation_requested(self) -> bool:
+        """Gets the cancellation_requested of this TaskStatus.
+
+        The worker should stop the task, it was cancelled or given to another worker  # noqa: E501
+
+        :return: The cancellation_requested of this TaskStatus.
+        :rtype: bool
+        """
+        return self._cancellation_requested
+
+    @cancellation_requested.setter
+    def cancellation_requested(self, cancellation_requested: bool):
+        """Sets the cancellation_requested of this TaskStatus.
+
+        The worker should stop the task, it was cancelled or given to another worker  # noqa: E501
+
+        :param cancellation_requested: The cancellation_requested of this TaskStatus.
+        :type cancellation_requested: bool
+        """
+        if cancellation_requested is None:
+            raise ValueError("Invalid value for `cancellation_requested`, must not be `None`")  # noqa: E501
+
+        self._cancellation_requested = cancellation_requested
+
+    @property
+    def lease_lost(self) -> bool:
+        """Gets the lease_lost of this TaskStatus.
+
+        The task was given to another worker or failed, the worker should discard its result and log  # noqa: E501
+
+        :return: The lease_lost of this TaskStatus.
+        :rtype: bool
+        """
+        return self._lease_lost
+
+    @lease_lost.setter
+    def lease_lost(self, lease_lost: bool):
+        """Sets the lease_lost of this TaskStatus.
+
+        The task was given to another worker or failed, the worker should discard its result and log  # noqa: E501
+
+        :param lease_lost: The lease_lost of this TaskStatus.
+        :type lease_lost: bool
+        """
+
+        self._lease_lost = lease_lost
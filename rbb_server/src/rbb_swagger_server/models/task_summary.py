@@ -15,7 +15,7 @@ class TaskSummary(Model):
     Do not edit the class manually.
     """
 
-    def __init__(self, detail_type: str=None, identifier: str=None, priority: float=None, description: str=None, assigned_to: str=None, created: datetime=None, last_updated: datetime=None, state: int=None, task: str=None, success: bool=None, runtime: float=None, worker_labels: str=None):  # noqa: E501
+    def __init__(self, detail_type: str=None, identifier: str=None, priority: float=None, description: str=None, assigned_to: str=None, created: datetime=None, last_updated: datetime=None, state: int=None, task: str=None, success: bool=None, runtime: float=None, worker_labels: str=None, expected_runtime: float=None):  # noqa: E501
         """TaskSummary - a model defined in Swagger
 
         :param detail_type: The detail_type of this TaskSummary.  # noqa: E501
@@ -42,6 +42,8 @@ class TaskSummary(Model):
         :type runtime: float
         :param worker_labels: The worker_labels of this TaskSummary.  # noqa: E501
         :type worker_labels: str
+        :param expected_runtime: The expected_runtime of this TaskSummary.  # noqa: E501
+        :type expected_runtime: float
         """
         self.swagger_types = {
             'detail_type': str,
@@ -55,7 +57,8 @@ class TaskSummary(Model):
             'task': str,
             'success': bool,
             'runtime': float,
-            'worker_labels': str
+            'worker_labels': str,
+            'expected_runtime': float
         }
 
         self.attribute_map = {
@@ -70,7 +73,8 @@ class TaskSummary(Model):
             'task': 'task',
             'success': 'success',
             'runtime': 'runtime',
-            'worker_labels': 'worker_labels'
+            'worker_labels': 'worker_labels',
+            'expected_runtime': 'expected_runtime'
         }
 
         self._detail_type = detail_type
@@ -85,6 +89,7 @@ class TaskSummary(Model):
         self._success = success
         self._runtime = runtime
         self._worker_labels = worker_labels
+        self._expected_runtime = expected_runtime
 
     @classmethod
     def from_dict(cls, dikt) -> 'TaskSummary':
@@ -366,7 +371,7 @@ class TaskSummary(Model):
     def worker_labels(self) -> str:
         """Gets the worker_labels of this TaskSummary.
 
-        Worker that can take this task.  # noqa: E501
+        Comma separated labels a worker needs to take this task.  # noqa: E501
 
         :return: The worker_labels of this TaskSummary.
         :rtype: str
@@ -377,7 +382,7 @@ class TaskSummary(Model):
     def worker_labels(self, worker_labels: str):
         """Sets the worker_labels of this TaskSummary.
 
-        Worker that can take this task.  # noqa: E501
+        Comma separated labels a worker needs to take this task.  # noqa: E501
 
         :param worker_labels: The worker_labels of this TaskSummary.
         :type worker_labels: str
@@ -386,3 +391,26 @@ class TaskSummary(Model):
             raise ValueError("Invalid value for `worker_labels`, must not be `None`")  # noqa: E501
 
         self._worker_labels = worker_labels
+
+    @property
+    def expected_runtime(self) -> float:
+        """Gets the expected_runtime of this TaskSummary.
+
+        Expected runtime in seconds, estimated from the earlier runs of the task type. Only for unfinished tasks.  # noqa: E501
+
+        :return: The expected_runtime of this TaskSummary.
+        :rtype: float
+        """
+        return self._expected_runtime
+
+    @expected_runtime.setter
+    def expected_runtime(self, expected_runtime: float):
+        """Sets the expected_runtime of this TaskSummary.
+
+        Expected runtime in seconds, estimated from the earlier runs of the task type. Only for unfinished tasks.  # noqa: E501
+
+        :param expected_runtime: The expected_runtime of this TaskSummary.
+        :type expected_runtime: float
+        """
+
+        self._expected_runtime = expected_runtime
@@ -0,0 +1,324 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from rbb_swagger_server.models.base_model_ import Model
+from rbb_swagger_server import util
+
+
+class TaskTypeStatistics(Model):
+    """NOTE: This class is auto generated by the swagger code generator program.
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, task: str=None, finished: int=None, succeeded: int=None, wait_time_p50: float=None, wait_time_p90: float=None, wait_time_p99: float=None, runtime_mean: float=None, runtime_p50: float=None, runtime_p90: float=None, runtime_p99: float=None):  # noqa: E501
+        """TaskTypeStatistics - a model defined in Swagger
+
+        :param task: The task of this TaskTypeStatistics.  # noqa: E501
+        :type task: str
+        :param finished: The finished of this TaskTypeStatistics.  # noqa: E501
+        :type finished: int
+        :param succeeded: The succeeded of this TaskTypeStatistics.  # noqa: E501
+        :type succeeded: int
+        :param wait_time_p50: The wait_time_p50 of this TaskTypeStatistics.  # noqa: E501
+        :type wait_time_p50: float
+        :param wait_time_p90: The wait_time_p90 of this TaskTypeStatistics.  # noqa: E501
+        :type wait_time_p90: float
+        :param wait_time_p99: The wait_time_p99 of this TaskTypeStatistics.  # noqa: E501
+        :type wait_time_p99: float
+        :param runtime_mean: The runtime_mean of this TaskTypeStatistics.  # noqa: E501
+        :type runtime_mean: float
+        :param runtime_p50: The runtime_p50 of this TaskTypeStatistics.  # noqa: E501
+        :type runtime_p50: float
+        :param runtime_p90: The runtime_p90 of this TaskTypeStatistics.  # noqa: E501
+        :type runtime_p90: float
+        :param runtime_p99: The runtime_p99 of this TaskTypeStatistics.  # noqa: E501
+        :type runtime_p99: float
+        """
+        self.swagger_types = {
+            'task': str,
+            'finished': int,
+            'succeeded': int,
+            'wait_time_p50': float,
+            'wait_time_p90': float,
+            'wait_time_p99': float,
+            'runtime_mean': float,
+            'runtime_p50': float,
+            'runtime_p90': float,
+            'runtime_p99': float
+        }
+
+        self.attribute_map = {
+            'task': 'task',
+            'finished': 'finished',
+            'succeeded': 'succeeded',
+            'wait_time_p50': 'wait_time_p50',
+            'wait_time_p90': 'wait_time_p90',
+            'wait_time_p99': 'wait_time_p99',
+            'runtime_mean': 'runtime_mean',
+            'runtime_p50': 'runtime_p50',
+            'runtime_p90': 'runtime_p90',
+            'runtime_p99': 'runtime_p99'
+        }
+
+        self._task = task
+        self._finished = finished
+        self._succeeded = succeeded
+        self._wait_time_p50 = wait_time_p50
+        self._wait_time_p90 = wait_time_p90
+        self._wait_time_p99 = wait_time_p99
+        self._runtime_mean = runtime_mean
+        self._runtime_p50 = runtime_p50
+        self._runtime_p90 = runtime_p90
+        self._runtime_p99 = runtime_p99
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'TaskTypeStatistics':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The TaskTypeStatistics of this TaskTypeStatistics.  # noqa: E501
+        :rtype: TaskTypeStatistics
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def task(self) -> str:
+        """Gets the task of this TaskTypeStatistics.
+
+        Name of the task  # noqa: E501
+
+        :return: The task of this TaskTypeStatistics.
+        :rtype: str
+        """
+        return self._task
+
+    @task.setter
+    def task(self, task: str):
+        """Sets the task of this TaskTypeStatistics.
+
+        Name of the task  # noqa: E501
+
+        :param task: The task of this TaskTypeStatistics.
+        :type task: str
+        """
+        if task is None:
+            raise ValueError("Invalid value for `task`, must not be `None`")  # noqa: E501
+
+        self._task = task
+
+    @property
+    def finished(self) -> int:
+        """Gets the finished of this TaskTypeStatistics.
+
+        Number of tasks finished in the window  # noqa: E501
+
+        :return: The finished of this TaskTypeStatistics.
+        :rtype: int
+        """
+        return self._finished
+
+    @finished.setter
+    def finished(self, finished: int):
+        """Sets the finished of this TaskTypeStatistics.
+
+        Number of tasks finished in the window  # noqa: E501
+
+        :param finished: The finished of this TaskTypeStatistics.
+        :type finished: int
+        """
+        if finished is None:
+            raise ValueError("Invalid value for `finished`, must not be `None`")  # noqa: E501
+
+        self._finished = finished
+
+    @property
+    def succeeded(self) -> int:
+        """Gets the succeeded of this TaskTypeStatistics.
+
+        Number of tasks finished successfully in the window  # noqa: E501
+
+        :return: The succeeded of this TaskTypeStatistics.
+        :rtype: int
+        """
+        return self._succeeded
+
+    @succeeded.setter
+    def succeeded(self, succeeded: int):
+        """Sets the succeeded of this TaskTypeStatistics.
+
+        Number of tasks finished successfully in the window  # noqa: E501
+
+        :param succeeded: The succeeded of this TaskTypeStatistics.
+        :type succeeded: int
+        """
+        if succeeded is None:
+            raise ValueError("Invalid value for `succeeded`, must not be `None`")  # noqa: E501
+
+        self._succeeded = succeeded
+
+    @property
+    def wait_time_p50(self) -> float:
+        """Gets the wait_time_p50 of this TaskTypeStatistics.
+
+        Median seconds from creation until a worker started the task, over the tasks started in the window  # noqa: E501
+
+        :return: The wait_time_p50 of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._wait_time_p50
+
+    @wait_time_p50.setter
+    def wait_time_p50(self, wait_time_p50: float):
+        """Sets the wait_time_p50 of this TaskTypeStatistics.
+
+        Median seconds from creation until a worker started the task, over the tasks started in the window  # noqa: E501
+
+        :param wait_time_p50: The wait_time_p50 of this TaskTypeStatistics.
+        :type wait_time_p50: float
+        """
+
+        self._wait_time_p50 = wait_time_p50
+
+    @property
+    def wait_time_p90(self) -> float:
+        """Gets the wait_time_p90 of this TaskTypeStatistics.
+
+        90th percentile of the wait time in seconds  # noqa: E501
+
+        :return: The wait_time_p90 of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._wait_time_p90
+
+    @wait_time_p90.setter
+    def wait_time_p90(self, wait_time_p90: float):
+        """Sets the wait_time_p90 of this TaskTypeStatistics.
+
+        90th percentile of the wait time in seconds  # noqa: E501
+
+        :param wait_time_p90: The wait_time_p90 of this TaskTypeStatistics.
+        :type wait_time_p90: float
+        """
+
+        self._wait_time_p90 = wait_time_p90
+
+    @property
+    def wait_time_p99(self) -> float:
+        """Gets the wait_time_p99 of this TaskTypeStatistics.
+
+        99th percentile of the wait time in seconds  # noqa: E501
+
+        :return: The wait_time_p99 of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._wait_time_p99
+
+    @wait_time_p99.setter
+    def wait_time_p99(self, wait_time_p99: float):
+        """Sets the wait_time_p99 of this TaskTypeStatistics.
+
+        99th percentile of the wait time in seconds  # noqa: E501
+
+        :param wait_time_p99: The wait_time_p99 of this TaskTypeStatistics.
+        :type wait_time_p99: float
+        """
+
+        self._wait_time_p99 = wait_time_p99
+
+    @property
+    def runtime_mean(self) -> float:
+        """Gets the runtime_mean of this TaskTypeStatistics.
+
+        Mean runtime in seconds of the tasks finished in the window  # noqa: E501
+
+        :return: The runtime_mean of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._runtime_mean
+
+    @runtime_mean.setter
+    def runtime_mean(self, runtime_mean: float):
+        """Sets the runtime_mean of this TaskTypeStatistics.
+
+        Mean runtime in seconds of the tasks finished in the window  # noqa: E501
+
+        :param runtime_mean: The runtime_mean of this TaskTypeStatistics.
+        :type runtime_mean: float
+        """
+
+        self._runtime_mean = runtime_mean
+
+    @property
+    def runtime_p50(self) -> float:
+        """Gets the runtime_p50 of this TaskTypeStatistics.
+
+        Median runtime in seconds of the tasks finished in the window  # noqa: E501
+
+        :return: The runtime_p50 of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._runtime_p50
+
+    @runtime_p50.setter
+    def runtime_p50(self, runtime_p50: float):
+        """Sets the runtime_p50 of this TaskTypeStatistics.
+
+        Median runtime in seconds of the tasks finished in the window  # noqa: E501
+
+        :param runtime_p50: The runtime_p50 of this TaskTypeStatistics.
+        :type runtime_p50: float
+        """
+
+        self._runtime_p50 = runtime_p50
+
+    @property
+    def runtime_p90(self) -> float:
+        """Gets the runtime_p90 of this TaskTypeStatistics.
+
+        90th percentile of the runtime in seconds  # noqa: E501
+
+        :return: The runtime_p90 of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._runtime_p90
+
+    @runtime_p90.setter
+    def runtime_p90(self, runtime_p90: float):
+        """Sets the runtime_p90 of this TaskTypeStatistics.
+
+        90th percentile of the runtime in seconds  # noqa: E501
+
+        :param runtime_p90: The runtime_p90 of this TaskTypeStatistics.
+        :type runtime_p90: float
+        """
+
+        self._runtime_p90 = runtime_p90
+
+    @property
+    def runtime_p99(self) -> float:
+        """Gets the runtime_p99 of this TaskTypeStatistics.
+
+        99th percentile of the runtime in seconds  # noqa: E501
+
+        :return: The runtime_p99 of this TaskTypeStatistics.
+        :rtype: float
+        """
+        return self._runtime_p99
+
+    @runtime_p99.setter
+    def runtime_p99(self, runtime_p99: float):
+        """Sets the runtime_p99 of this TaskTypeStatistics.
+
+        99th percentile of the runtime in seconds  # noqa: E501
+
+        :param runtime_p99: The runtime_p99 of this TaskTypeStatistics.
+        :type runtime_p99: float
+        """
+
+        self._runtime_p99 = runtime_p99
@@ -146,7 +146,7 @@ class Topic(Model):
     def msg_definition(self) -> str:
         """Gets the msg_definition of this Topic.
 
-        Definition of custom messages.  # noqa: E501
+        Definition of custom messages. Left out when requested without msg_definitions.  # noqa: E501
 
         :return: The msg_definition of this Topic.
         :rtype: str
@@ -157,7 +157,7 @@ class Topic(Model):
     def msg_definition(self, msg_definition: str):
         """Sets the msg_definition of this Topic.
 
-        Definition of custom messages.  # noqa: E501
+        Definition of custom messages. Left out when requested without msg_definitions.  # noqa: E501
 
         :param msg_definition: The msg_definition of this Topic.
         :type msg_definition: str
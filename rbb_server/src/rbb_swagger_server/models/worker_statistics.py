@@ -0,0 +1,158 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from rbb_swagger_server.models.base_model_ import Model
+from rbb_swagger_server import util
+
+
+class WorkerStatistics(Model):
+    """NOTE: This class is auto generated by the swagger code generator program.
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, worker: str=None, finished: int=None, succeeded: int=None, busy: float=None):  # noqa: E501
+        """WorkerStatistics - a model defined in Swagger
+
+        :param worker: The worker of this WorkerStatistics.  # noqa: E501
+        :type worker: str
+        :param finished: The finished of this WorkerStatistics.  # noqa: E501
+        :type finished: int
+        :param succeeded: The succeeded of this WorkerStatistics.  # noqa: E501
+        :type succeeded: int
+        :param busy: The busy of this WorkerStatistics.  # noqa: E501
+        :type busy: float
+        """
+        self.swagger_types = {
+            'worker': str,
+            'finished': int,
+            'succeeded': int,
+            'busy': float
+        }
+
+        self.attribute_map = {
+            'worker': 'worker',
+            'finished': 'finished',
+            'succeeded': 'succeeded',
+            'busy': 'busy'
+        }
+
+        self._worker = worker
+        self._finished = finished
+        self._succeeded = succeeded
+        self._busy = busy
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'WorkerStatistics':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The WorkerStatistics of this WorkerStatistics.  # noqa: E501
+        :rtype: WorkerStatistics
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def worker(self) -> str:
+        """Gets the worker of this WorkerStatistics.
+
+        Name of the worker  # noqa: E501
+
+        :return: The worker of this WorkerStatistics.
+        :rtype: str
+        """
+        return self._worker
+
+    @worker.setter
+    def worker(self, worker: str):
+        """Sets the worker of this WorkerStatistics.
+
+        Name of the worker  # noqa: E501
+
+        :param worker: The worker of this WorkerStatistics.
+        :type worker: str
+        """
+        if worker is None:
+            raise ValueError("Invalid value for `worker`, must not be `None`")  # noqa: E501
+
+        self._worker = worker
+
+    @property
+    def finished(self) -> int:
+        """Gets the finished of this WorkerStatistics.
+
+        Number of tasks the worker finished in the window  # noqa: E501
+
+        :return: The finished of this WorkerStatistics.
+        :rtype: int
+        """
+        return self._finished
+
+    @finished.setter
+    def finished(self, finished: int):
+        """Sets the finished of this WorkerStatistics.
+
+        Number of tasks the worker finished in the window  # noqa: E501
+
+        :param finished: The finished of this WorkerStatistics.
+        :type finished: int
+        """
+        if finished is None:
+            raise ValueError("Invalid value for `finished`, must not be `None`")  # noqa: E501
+
+        self._finished = finished
+
+    @property
+    def succeeded(self) -> int:
+        """Gets the succeeded of this WorkerStatistics.
+
+        Number of tasks the worker finished successfully in the window  # noqa: E501
+
+        :return: The succeeded of this WorkerStatistics.
+        :rtype: int
+        """
+        return self._succeeded
+
+    @succeeded.setter
+    def succeeded(self, succeeded: int):
+        """Sets the succeeded of this WorkerStatistics.
+
+        Number of tasks the worker finished successfully in the window  # noqa: E501
+
+        :param succeeded: The succeeded of this WorkerStatistics.
+        :type succeeded: int
+        """
+        if succeeded is None:
+            raise ValueError("Invalid value for `succeeded`, must not be `None`")  # noqa: E501
+
+        self._succeeded = succeeded
+
+    @property
+    def busy(self) -> float:
+        """Gets the busy of this WorkerStatistics.
+
+        Fraction of the window the worker spent running the finished tasks  # noqa: E501
+
+        :return: The busy of this WorkerStatistics.
+        :rtype: float
+        """
+        return self._busy
+
+    @busy.setter
+    def busy(self, busy: float):
+        """Sets the busy of this WorkerStatistics.
+
+        Fraction of the window the worker spent running the finished tasks  # noqa: E501
+
+        :param busy: The busy of this WorkerStatistics.
+        :type busy: float
+        """
+        if busy is None:
+            raise ValueError("Invalid value for `busy`, must not be `None`")  # noqa: E501
+
+        self._busy = busy
@@ -23,13 +23,43 @@
 import logging
 import os.path
 
+from sqlalchemy import event
+
 from rbb_server.model.database import Database
 
 
+class QueryCounter(object):
+    """Counts the SQL statements executed on the engine while in the with block"""
+
+    def __init__(self):
+        self.count = 0
+        self.statements = []
+
+    def _callback(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(Database.get_engine(), "before_cursor_execute", self._callback)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        event.remove(Database.get_engine(), "before_cursor_execute", self._callback)
+
+
+def _use_test_schema(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("SET search_path TO unittest")
+    cursor.close()
+    dbapi_connection.commit()
+
+
 def init_database_connection_for_test():
     Database._session = None
     Database._engine = None
     Database.init(debug=False)
+    # Also for the connections of other threads
+    event.listen(Database.get_engine(), "connect", _use_test_schema)
     Database.get_session().execute("SET search_path TO unittest")
 
 
@@ -0,0 +1,136 @@
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# Load benchmark of the development server (python -m rbb_server) and the production server (run-server with
+# gunicorn.conf.py) against the unittest schema of the configured database (RBB_DB_* environment variables).
+# Every client process repeatedly lists the queue and the bags of a store. The clients use a session token like the
+# web interface and the workers, the password hash of basic authentication would dominate the request time.
+#
+#   python -m rbb_server_test.load_benchmark --clients 32 --duration 20
+
+import argparse
+import base64
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+import rbb_server_test.database
+
+SERVER_DIR = os.path.abspath(os.path.dirname(__file__) + "/../../")
+BASE_URL = "http://127.0.0.1:8080"
+REQUESTS = ["/api/v0/queue?limit=20", "/api/v0/stores/test/bags?limit=20"]
+
+
+def start_server(kind):
+    environment = dict(os.environ)
+    environment["PGOPTIONS"] = "-c search_path=unittest"
+    environment["RBB_BIND"] = "127.0.0.1:8080"
+
+    if kind == "dev":
+        command = [sys.executable, "-m", "rbb_server"]
+    else:
+        command = ["gunicorn", "-c", SERVER_DIR + "/gunicorn.conf.py", "rbb_server:app"]
+
+    server = subprocess.Popen(command, env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(BASE_URL + "/metrics", timeout=1).read()
+            return server
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.2)
+
+    server.terminate()
+    raise RuntimeError("The %s server did not start" % kind)
+
+
+def new_session_token():
+    request = urllib.request.Request(BASE_URL + "/api/v0/sessions", method="POST", headers={
+        'Authorization': "Basic " + base64.b64encode(b"admin:admin").decode('ascii')})
+    return json.loads(urllib.request.urlopen(request).read().decode('utf-8'))['token']
+
+
+def run_client(authorization, duration, results):
+    latencies = []
+    errors = 0
+    end = time.time() + duration
+    i = 0
+    while time.time() < end:
+        request = urllib.request.Request(BASE_URL + REQUESTS[i % len(REQUESTS)],
+                                         headers={'Authorization': authorization})
+        i += 1
+        start = time.time()
+        try:
+            urllib.request.urlopen(request, timeout=30).read()
+            latencies.append(time.time() - start)
+        except (urllib.error.URLError, ConnectionError):
+            errors += 1
+
+    results.put((latencies, errors))
+
+
+def benchmark(kind, clients, duration):
+    server = start_server(kind)
+    try:
+        authorization = "Bearer " + new_session_token()
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=run_client, args=(authorization, duration, results))
+                     for _ in range(clients)]
+        for process in processes:
+            process.start()
+
+        latencies = []
+        errors = 0
+        for _ in processes:
+            client_latencies, client_errors = results.get()
+            latencies.extend(client_latencies)
+            errors += client_errors
+        for process in processes:
+            process.join()
+    finally:
+        server.terminate()
+        server.wait()
+
+    latencies.sort()
+    percentile = lambda p: latencies[min(int(p * len(latencies)), len(latencies) - 1)] * 1000 if latencies else 0
+    print("%-10s %8.1f requests/s  p50 %7.1f ms  p99 %7.1f ms  %d errors" %
+          (kind, len(latencies) / duration, percentile(0.5), percentile(0.99), errors))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog="load_benchmark")
+    parser.add_argument('-c', '--clients', type=int, default=32, help="Concurrent client processes")
+    parser.add_argument('-d', '--duration', type=float, default=20, help="Seconds per server")
+    parser.add_argument('-s', '--server', choices=["dev", "production", "both"], default="both")
+    args = parser.parse_args()
+
+    # Fresh unittest schema with the test data
+    rbb_server_test.database.setup_database_for_test()
+    rbb_server_test.database.close_database()
+
+    for kind in (["dev", "production"] if args.server == "both" else [args.server]):
+        benchmark(kind, args.clients, args.duration)
@@ -45,8 +45,11 @@ VALUES (DEFAULT, 1, false, '{}', 'test-bag.bag', false, '2017-12-17 11:39:29.945
 INSERT INTO unittest.rosbag (uid, store_id, extraction_failure, store_data, name, is_extracted, discovered, meta_available, size, start_time, end_time, duration, messages, comment)
 VALUES (DEFAULT, 1, false, '{}', 'empty.bag', false, '2017-12-17 11:39:29.945440', false, 0, '2017-12-17 11:39:15.918000', '2017-12-17 11:39:18.133000', 0, 0, '');
 
-INSERT INTO unittest.rosbag_topic (uid, bag_id, name, msg_type, msg_type_hash, msg_definition, msg_count, avg_frequency) VALUES (DEFAULT, 1, '/camera1', 'Camera', '48utawojt9awu', 'empty', 1000, 50.4);
-INSERT INTO unittest.rosbag_topic (uid, bag_id, name, msg_type, msg_type_hash, msg_definition, msg_count, avg_frequency) VALUES (DEFAULT, 1, '/camera2', 'Camera', 'ao84yytaiejfoij', 'empty', 2000, 100.2);
+INSERT INTO unittest.message_definition (msg_type_hash, msg_definition) VALUES ('48utawojt9awu', 'empty');
+INSERT INTO unittest.message_definition (msg_type_hash, msg_definition) VALUES ('ao84yytaiejfoij', 'empty');
+
+INSERT INTO unittest.rosbag_topic (uid, bag_id, name, msg_type, msg_type_hash, msg_count, avg_frequency) VALUES (DEFAULT, 1, '/camera1', 'Camera', '48utawojt9awu', 1000, 50.4);
+INSERT INTO unittest.rosbag_topic (uid, bag_id, name, msg_type, msg_type_hash, msg_count, avg_frequency) VALUES (DEFAULT, 1, '/camera2', 'Camera', 'ao84yytaiejfoij', 2000, 100.2);
 
 INSERT INTO unittest.rosbag_product (uid, bag_id, plugin, product_type, product_data, created) VALUES (DEFAULT , 1, 'RvizRecorder', 'movie', '{"type":"yolo"}', '2017-12-26 10:51:38.393607');
 INSERT INTO unittest.rosbag_product (uid, bag_id, plugin, product_type, product_data, created) VALUES (DEFAULT , 1, 'RawVideo', 'movie', '{"type":"yolo"}', '2017-12-26 10:51:38.393607');
@@ -88,15 +91,15 @@ INSERT INTO unittest.rosbag_extraction_association ("store_id", "config_id") VAL
 INSERT INTO unittest.rosbag_extraction_configuration ("uid", "name", "description", "config_type", "config")
 VALUES (DEFAULT, 'test-config-2', 'Test configuration', 'git', '{"git":{"url":"https://github.com/hfchendrikx/rbb-visualizations.git","branch":"master","path":"rviz-test"}}');
 
-INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, log, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Success test', '', '2018-06-14 20:41:11.647354', 0, 'rbb_tools.tasks.test.success', '{}', '{}', false, 0, '', '', 'hash');
-INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, log, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Exception test', '', '2018-06-14 20:41:55.727840', 0, 'rbb_tools.tasks.test.causes_exception', '{}', '{}', false, 0, '', '', 'hash');
-INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, log, worker_labels, task_hash) VALUES (DEFAULT, 1001, 'Exit test', '', '2018-06-14 20:41:55.727840', 0, 'rbb_tools.tasks.test.exits', '{}', '{}', false, 0, '', '', 'hash');
-INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, log, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Waiting test', '', '2018-06-14 20:41:55.727840', 0, 'rbb_tools.tasks.test.waits', '{}', '{}', false, 0, '', '', 'hash');
-INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, log, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Extract x.bag', '', '2018-06-14 20:41:55.727840', 1, 'rbb_tools.tasks.test.success', '{}', '{}', false, 0, '', '', 'hash');
-INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, log, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Cancelled example', '', '2018-06-14 20:41:55.727840', 101, 'rbb_tools.tasks.test.success', '{}', '{}', false, 0, '', '', 'hash');
-INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, log, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Success exampe', '', '2018-06-14 20:41:55.727840', 100, 'rbb_tools.tasks.test.success', '{}', '{}', true, 5.239847, '', '', 'hash');
-INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, log, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Failure exampe', '', '2018-06-14 20:41:55.727840', 100, 'rbb_tools.tasks.test.success', '{}', '{}', false, 10.234234, '', '', 'hash');
-INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, log, worker_labels, task_hash) VALUES (DEFAULT, 1000, '10min streaming test', '', '2018-06-14 20:41:55.727840', 0, 'rbb_tools.tasks.test.long_task_streaming', '{}', '{}', false, 0, '', '', 'hash');
+INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Success test', '', '2018-06-14 20:41:11.647354', 0, 'rbb_tools.tasks.test.success', '{}', '{}', false, 0, '', 'RBNvo1WzZ4oRRq0W9+hknpT7T8If536DEMBg9hyq/4o=');
+INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Exception test', '', '2018-06-14 20:41:55.727840', 0, 'rbb_tools.tasks.test.causes_exception', '{}', '{}', false, 0, '', 'RBNvo1WzZ4oRRq0W9+hknpT7T8If536DEMBg9hyq/4o=');
+INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, worker_labels, task_hash) VALUES (DEFAULT, 1001, 'Exit test', '', '2018-06-14 20:41:55.727840', 0, 'rbb_tools.tasks.test.exits', '{}', '{}', false, 0, '', 'RBNvo1WzZ4oRRq0W9+hknpT7T8If536DEMBg9hyq/4o=');
+INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Waiting test', '', '2018-06-14 20:41:55.727840', 0, 'rbb_tools.tasks.test.waits', '{}', '{}', false, 0, '', 'RBNvo1WzZ4oRRq0W9+hknpT7T8If536DEMBg9hyq/4o=');
+INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Extract x.bag', '', '2018-06-14 20:41:55.727840', 1, 'rbb_tools.tasks.test.success', '{"bag": "x.bag"}', '{}', false, 0, '', '4lAlFsqevqh9KUvVRruSpISEjT/254V+EMiqCqArWec=');
+INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Cancelled example', '', '2018-06-14 20:41:55.727840', 101, 'rbb_tools.tasks.test.success', '{}', '{}', false, 0, '', 'RBNvo1WzZ4oRRq0W9+hknpT7T8If536DEMBg9hyq/4o=');
+INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Success exampe', '', '2018-06-14 20:41:55.727840', 100, 'rbb_tools.tasks.test.success', '{}', '{}', true, 5.239847, '', 'RBNvo1WzZ4oRRq0W9+hknpT7T8If536DEMBg9hyq/4o=');
+INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, worker_labels, task_hash) VALUES (DEFAULT, 1000, 'Failure exampe', '', '2018-06-14 20:41:55.727840', 100, 'rbb_tools.tasks.test.success', '{}', '{}', false, 10.234234, '', 'RBNvo1WzZ4oRRq0W9+hknpT7T8If536DEMBg9hyq/4o=');
+INSERT INTO unittest.task_queue (uid, priority, description, assigned_to, created, state, task, configuration, result, success, runtime, worker_labels, task_hash) VALUES (DEFAULT, 1000, '10min streaming test', '', '2018-06-14 20:41:55.727840', 0, 'rbb_tools.tasks.test.long_task_streaming', '{}', '{}', false, 0, '', 'RBNvo1WzZ4oRRq0W9+hknpT7T8If536DEMBg9hyq/4o=');
 
 INSERT INTO unittest.tags (uid, tag, color) VALUES (DEFAULT , 'bad', '#C90707');
 INSERT INTO unittest.tags (uid, tag, color) VALUES (DEFAULT , 'good', '#228B22');
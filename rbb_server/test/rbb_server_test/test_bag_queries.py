@@ -0,0 +1,604 @@
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import datetime
+import unittest
+
+from flask import url_for
+
+import rbb_server_test.test_server
+from rbb_server.controllers.bag_controller import get_bag_facets_inner, get_bag_meta_inner, get_bag_product_inner, \
+    list_bags_inner, new_bag_tasks_inner, patch_bag_meta_inner, patch_bag_products_inner, put_bag_meta_inner, \
+    register_bags_inner
+from rbb_server.model.database import Database, File, FileStore, MessageDefinition, Rosbag, RosbagProduct, \
+    RosbagProductFile, RosbagProductTopic, RosbagStore, RosbagTopic, Simulation, SimulationRun, Tag, Task, User
+from rbb_server.hooks.new_bag_hook import NewBagHook
+from rbb_server_test.database import QueryCounter
+from rbb_swagger_server.models import BagDetailed, BagTaskTemplate, FileSummary, Product, ProductFile, StoredFile, Topic, TopicMapping
+
+
+class TestBagQueries(unittest.TestCase):
+    number_of_bags = 200
+
+    @classmethod
+    def setUpClass(cls):
+        # The app is only used for a request context, links to files are built with url_for
+        cls.app = rbb_server_test.test_server.construct_test_server()
+
+        session = Database.get_session()
+        store = RosbagStore(name="query-count-store", description="", store_type="rbb_storage_static",
+                            store_data={'static': {}})
+        tags = [Tag(tag="query-count-%d" % i, color="") for i in range(3)]
+        session.add(store)
+        session.add_all(tags)
+        session.add(MessageDefinition(msg_type_hash="", msg_definition=""))
+
+        simulation = Simulation(description="Query count", created=datetime.datetime.utcnow(), configuration={},
+                                result=0, environment_id=1, on_complete={})
+        session.add(simulation)
+
+        for i in range(cls.number_of_bags):
+            bag = Rosbag(name="bag-%d.bag" % i, store=store, store_data={}, is_extracted=i % 5 == 0,
+                         in_trash=False, meta_available=i % 2 == 0, extraction_failure=i % 7 == 0,
+                         discovered=datetime.datetime.utcnow(),
+                         size=i, duration=i, comment="Comment %d" % i)
+            bag.tags = [tags[i % 3], tags[(i + 1) % 3]]
+            session.add(bag)
+            simulation.runs.append(SimulationRun(bag=bag, description="Run %d" % i, success=True,
+                                                 duration=1, results={}))
+
+        session.commit()
+        cls.simulation_id = simulation.uid
+
+    @classmethod
+    def tearDownClass(cls):
+        Database.get_session().remove()
+
+    def count_list_bags_queries(self, limit, user):
+        Database.get_session().expire_all()
+        with QueryCounter() as counter:
+            bags, status, headers = list_bags_inner("query-count-store", limit=limit, ordering="name:asc", user=user)
+        self.assertEqual(len(bags), limit)
+        return counter.count
+
+    def test_list_bags_query_count_is_flat(self):
+        session = Database.get_session()
+        for alias in ['admin', 'user']:
+            user = session.query(User).filter(User.alias == alias).first()
+            small_page = self.count_list_bags_queries(5, user)
+            large_page = self.count_list_bags_queries(self.number_of_bags, user)
+            self.assertEqual(small_page, large_page)
+
+    def test_list_bags_summary(self):
+        session = Database.get_session()
+        user = session.query(User).filter(User.alias == 'user').first()
+        bags, status, headers = list_bags_inner("query-count-store", limit=3, ordering="name:asc", user=user)
+
+        self.assertEqual([x.name for x in bags], ["bag-0.bag", "bag-1.bag", "bag-10.bag"])
+        self.assertEqual(set([x.tag for x in bags[0].tags]), {"query-count-0", "query-count-1"})
+        self.assertEqual(bags[0].store_data, {"_hidden": True})
+
+    def test_list_bags_tags_modes(self):
+        session = Database.get_session()
+        user = session.query(User).filter(User.alias == 'admin').first()
+
+        def bag_numbers(tags, tags_mode=None):
+            bags = list_bags_inner("query-count-store", tags=tags, tags_mode=tags_mode, user=user)
+            return set([int(x.name[4:-4]) for x in bags])
+
+        everything = set(range(self.number_of_bags))
+
+        self.assertEqual(bag_numbers("query-count-0,query-count-1"), set([i for i in everything if i % 3 == 0]))
+        self.assertEqual(bag_numbers("query-count-0, Query-Count-1", "all"),
+                         set([i for i in everything if i % 3 == 0]))
+        self.assertEqual(bag_numbers("query-count-0", "any"), set([i for i in everything if i % 3 != 1]))
+        self.assertEqual(bag_numbers("query-count-0,query-count-1", "any"), everything)
+        self.assertEqual(bag_numbers("query-count-0", "none"), set([i for i in everything if i % 3 == 1]))
+        self.assertEqual(bag_numbers("query-count-0,query-count-1", "none"), set())
+
+        # Unknown tags
+        self.assertEqual(bag_numbers("query-count-0,does-not-exist"), set())
+        self.assertEqual(bag_numbers("query-count-0,does-not-exist", "any"), set([i for i in everything if i % 3 != 1]))
+        self.assertEqual(bag_numbers("does-not-exist", "none"), everything)
+
+        error, status = list_bags_inner("query-count-store", tags="query-count-0", tags_mode="some", user=user)
+        self.assertEqual(status, 400)
+
+    def test_bag_facets(self):
+        session = Database.get_session()
+        user = session.query(User).filter(User.alias == 'admin').first()
+
+        filters = [
+            {},
+            {'meta_available': False, 'in_trash': True},
+            {'meta_available': False},
+            {'tags': "query-count-0", 'tags_mode': "none"},
+            {'tags': "query-count-1,query-count-2", 'tags_mode': "any", 'is_extracted': True},
+            {'name': "bag-1%", 'duration_gte': 12},
+            {'tags': "does-not-exist"}
+        ]
+
+        for kwargs in filters:
+            bags = list_bags_inner("query-count-store", user=user, **kwargs)
+
+            tag_counts = {}
+            for bag in bags:
+                for tag in bag.tags:
+                    tag_counts[tag.tag] = tag_counts.get(tag.tag, 0) + 1
+
+            with QueryCounter() as counter:
+                facets = get_bag_facets_inner("query-count-store", user=user, **kwargs)
+
+            self.assertLessEqual(counter.count, 3)
+            self.assertEqual(facets.total, len(bags), kwargs)
+            self.assertEqual(facets.extracted, len([x for x in bags if x.is_extracted]))
+            self.assertEqual(facets.meta_available, len([x for x in bags if x.meta_available]))
+            self.assertEqual(facets.extraction_failure, len([x for x in bags if x.extraction_failure]))
+            self.assertEqual(dict([(x.tag, x.count) for x in facets.tags]), tag_counts)
+
+        error, status = get_bag_facets_inner("does-not-exist", user=user)
+        self.assertEqual(status, 404)
+
+        error, status = get_bag_facets_inner("query-count-store", tags="query-count-0", tags_mode="some", user=user)
+        self.assertEqual(status, 400)
+
+    def test_new_bag_tasks(self):
+        session = Database.get_session()
+        user = session.query(User).filter(User.alias == 'admin').first()
+        template = BagTaskTemplate(task="test.bulk", description="Re-extract", priority=5, config={'rules': [1, 2]})
+        failed = len([i for i in range(self.number_of_bags) if i % 7 == 0])
+
+        def tasks():
+            return session.query(Task).filter(Task.task == "test.bulk")
+
+        result = new_bag_tasks_inner("query-count-store", template, dry_run=True, extraction_failure=True, user=user)
+        self.assertEqual((result.matched, result.created, result.skipped, result.dry_run), (failed, failed, 0, True))
+        self.assertEqual(tasks().count(), 0)
+
+        result = new_bag_tasks_inner("query-count-store", template, extraction_failure=True, user=user)
+        self.assertEqual((result.matched, result.created, result.skipped, result.dry_run), (failed, failed, 0, False))
+
+        task = tasks().filter(Task.description == "Re-extract (query-count-store/bag-7.bag)").one()
+        self.assertEqual(task.configuration, {'rules': [1, 2], 'store': "query-count-store", 'bag': "bag-7.bag"})
+        self.assertEqual(task.task_hash, Task.calculate_hash(task.configuration))
+        self.assertEqual(task.priority, 5)
+
+        # The bags that already have the task queued are skipped, also when counting
+        for dry_run in [True, False]:
+            result = new_bag_tasks_inner("query-count-store", template, dry_run=dry_run, user=user, batch_size=64)
+            self.assertEqual((result.matched, result.created, result.skipped),
+                             (self.number_of_bags, self.number_of_bags - failed, failed))
+        self.assertEqual(tasks().count(), self.number_of_bags)
+
+        error, status = new_bag_tasks_inner("does-not-exist", template, user=user)
+        self.assertEqual(status, 404)
+
+        error, status = new_bag_tasks_inner("query-count-store", template, tags="query-count-0", tags_mode="some",
+                                            user=user)
+        self.assertEqual(status, 400)
+
+    def test_search(self):
+        session = Database.get_session()
+        user = session.query(User).filter(User.alias == 'admin').first()
+        store = RosbagStore(name="search-store", description="", store_type="rbb_storage_static",
+                            store_data={'static': {}})
+        session.add(store)
+
+        bags = [
+            ("2018-06-12_autocross_run1.bag", ["/camera/left", "/lidar/points"], "Sunny day"),
+            ("2018-06-13_skidpad.bag", ["/lidar/points"], "Preparation for the autocross"),
+            ("acceleration.bag", ["/imu"], "")
+        ]
+        for name, topics, comment in bags:
+            bag = Rosbag(name=name, store=store, store_data={}, is_extracted=False, in_trash=False,
+                         meta_available=True, extraction_failure=False, discovered=datetime.datetime.utcnow(),
+                         comment=comment)
+            bag.topics = [RosbagTopic(name=x, msg_type="", msg_type_hash="", msg_count=1, avg_frequency=1)
+                          for x in topics]
+            bag.update_search_vector()
+            session.add(bag)
+        session.commit()
+
+        def search(text, **kwargs):
+            return [x.name for x in list_bags_inner("search-store", search=text, user=user, **kwargs)]
+
+        # Name matches rank above comment matches
+        self.assertEqual(search("autocross"), ["2018-06-12_autocross_run1.bag", "2018-06-13_skidpad.bag"])
+        self.assertEqual(search("AUTOCROSS run1"), ["2018-06-12_autocross_run1.bag"])
+        self.assertEqual(search("lidar points", ordering="name:asc"),
+                         ["2018-06-12_autocross_run1.bag", "2018-06-13_skidpad.bag"])
+        self.assertEqual(search("cam"), ["2018-06-12_autocross_run1.bag"])
+        self.assertEqual(search("skid"), ["2018-06-13_skidpad.bag"])
+        self.assertEqual(search("/imu"), ["acceleration.bag"])
+        self.assertEqual(search("sunny preparation"), [])
+        self.assertEqual(search("endurance"), [])
+        self.assertEqual(len(search("  ")), 3)
+
+        bags, status, headers = list_bags_inner("search-store", limit=1, ordering="name:asc", search="lidar",
+                                                user=user)
+        self.assertEqual([x.name for x in bags], ["2018-06-12_autocross_run1.bag"])
+        self.assertEqual(search("lidar", ordering="name:asc", cursor=headers['X-Next-Cursor']),
+                         ["2018-06-13_skidpad.bag"])
+
+        error, status = list_bags_inner("search-store", search="lidar", cursor=headers['X-Next-Cursor'], user=user)
+        self.assertEqual(status, 400)
+
+        facets = get_bag_facets_inner("search-store", search="autocross", user=user)
+        self.assertEqual(facets.total, 2)
+
+        # A new comment is searchable right away
+        bag = patch_bag_meta_inner("search-store", "acceleration.bag", {'comment': "Endurance practice"}, user=user)
+        self.assertEqual(search("endurance"), ["acceleration.bag"])
+        self.assertEqual(search("/imu"), ["acceleration.bag"])
+
+        # The patch returns the full bag, only the summary on request
+        self.assertEqual([x.name for x in bag.topics], ["/imu"])
+        self.assertEqual(bag.comment, "Endurance practice")
+        bag = patch_bag_meta_inner("search-store", "acceleration.bag", {'in_trash': False}, detailed=False, user=user)
+        self.assertEqual(bag.detail_type, "BagSummary")
+
+    def test_topic_filters(self):
+        session = Database.get_session()
+        user = session.query(User).filter(User.alias == 'admin').first()
+        store = RosbagStore(name="topic-store", description="", store_type="rbb_storage_static",
+                            store_data={'static': {}})
+        session.add(store)
+
+        bags = [
+            ("front.bag", [("/camera_front/image", "sensor_msgs/Image", 300, 30.0),
+                           ("/lidar/points", "sensor_msgs/PointCloud2", 100, 10.0)]),
+            ("rear.bag", [("/camera_rear/image", "sensor_msgs/Image", 150, 15.0)]),
+            ("imu.bag", [("/imu", "sensor_msgs/Imu", 20000, 200.0), ("/camera%/image", "sensor_msgs/Image", 1, 1.0)])
+        ]
+        for name, topics in bags:
+            bag = Rosbag(name=name, store=store, store_data={}, is_extracted=False, in_trash=False,
+                         meta_available=True, extraction_failure=False, discovered=datetime.datetime.utcnow(),
+                         comment="")
+            bag.topics = [RosbagTopic(name=x[0], msg_type=x[1], msg_type_hash="", msg_count=x[2],
+                                      avg_frequency=x[3]) for x in topics]
+            session.add(bag)
+        session.commit()
+
+        def bag_names(**kwargs):
+            return [x.name for x in list_bags_inner("topic-store", ordering="name:asc", user=user, **kwargs)]
+
+        self.assertEqual(bag_names(topic="/lidar/points"), ["front.bag"])
+        self.assertEqual(bag_names(topic="/lidar"), [])
+        self.assertEqual(bag_names(topic_prefix="/camera"), ["front.bag", "imu.bag", "rear.bag"])
+        self.assertEqual(bag_names(topic_prefix="/camera_"), ["front.bag", "rear.bag"])
+        self.assertEqual(bag_names(topic_prefix="/camera%"), ["imu.bag"])
+        self.assertEqual(bag_names(msg_type="sensor_msgs/Image"), ["front.bag", "imu.bag", "rear.bag"])
+        self.assertEqual(bag_names(msg_type="sensor_msgs/Image", topic_msg_count_gte=150), ["front.bag", "rear.bag"])
+        self.assertEqual(bag_names(msg_type="sensor_msgs/Image", topic_avg_frequency_gte=20), ["front.bag"])
+        self.assertEqual(bag_names(topic_avg_frequency_gte=100), ["imu.bag"])
+
+        # All conditions have to hold for the same topic
+        self.assertEqual(bag_names(topic="/lidar/points", topic_msg_count_gte=300), [])
+        self.assertEqual(bag_names(topic_prefix="/camera", msg_type="sensor_msgs/PointCloud2"), [])
+
+        bags, status, headers = list_bags_inner("topic-store", limit=1, ordering="name:asc",
+                                                msg_type="sensor_msgs/Image", user=user)
+        self.assertEqual([x.name for x in bags], ["front.bag"])
+        self.assertEqual(bag_names(msg_type="sensor_msgs/Image", cursor=headers['X-Next-Cursor']),
+                         ["imu.bag", "rear.bag"])
+
+        facets = get_bag_facets_inner("topic-store", topic_prefix="/camera_", user=user)
+        self.assertEqual(facets.total, 2)
+
+        self.assertEqual(list_bags_inner("query-count-store", msg_type="sensor_msgs/Image", user=user), [])
+
+    def test_message_definitions_are_stored_once(self):
+        session = Database.get_session()
+
+        topics = [Topic(name="/camera%d" % i, msg_type="sensor_msgs/Image", msg_type_hash="060021388200f6f0",
+                        msg_definition="uint32 height\nuint32 width") for i in range(10)]
+        topics.append(Topic(name="/imu", msg_type="sensor_msgs/Imu", msg_type_hash="6a62c6daae103f4f",
+                            msg_definition=None))
+
+        with QueryCounter() as counter:
+            MessageDefinition.upsert(session, topics)
+            MessageDefinition.upsert(session, topics)
+            MessageDefinition.upsert(session, [Topic(name="/imu", msg_type="sensor_msgs/Imu",
+                                                     msg_type_hash="6a62c6daae103f4f", msg_definition="float64 x")])
+        session.commit()
+        self.assertEqual(counter.count, 3)
+
+        definitions = session.query(MessageDefinition)\
+            .filter(MessageDefinition.msg_type_hash.in_(["060021388200f6f0", "6a62c6daae103f4f"]))\
+            .order_by(MessageDefinition.msg_type_hash).all()
+        self.assertEqual([(x.msg_type_hash, x.msg_definition) for x in definitions],
+                         [("060021388200f6f0", "uint32 height\nuint32 width"), ("6a62c6daae103f4f", "float64 x")])
+
+    def test_get_bag_meta_query_count_is_flat(self):
+        session = Database.get_session()
+        store = RosbagStore(name="meta-store", description="", store_type="rbb_storage_static",
+                            store_data={'static': {}})
+        file_store = session.query(FileStore).first()
+        session.add(store)
+
+        product_counts = [1, 10, 40]
+        for number_of_products in product_counts:
+            bag = Rosbag(name="products-%d.bag" % number_of_products, store=store, store_data={}, is_extracted=True,
+                         in_trash=False, meta_available=True, extraction_failure=False,
+                         discovered=datetime.datetime.utcnow(), comment="")
+            bag.topics = [RosbagTopic(name="/topic%d" % i, msg_type="", msg_type_hash="", msg_count=1, avg_frequency=1)
+                          for i in range(20)]
+            for i in range(number_of_products):
+                product = RosbagProduct(plugin="Plugin", product_type="video", product_data={'frames': [i] * 100},
+                                        created=datetime.datetime.utcnow(), title="Product %d" % i,
+                                        configuration_tag="", configuration_rule="")
+                product.topics = [RosbagProductTopic(plugin_topic="input", topic=bag.topics[i % 20])]
+                product.files = [RosbagProductFile(key="file%d" % j, file=File(
+                    name="product %d-%d.mp4" % (i, j), store=file_store, store_data={})) for j in range(5)]
+                bag.products.append(product)
+            session.add(bag)
+        session.commit()
+
+        counts = []
+        for number_of_products in product_counts:
+            with self.app.app.test_request_context():
+                session = Database.get_session()
+                user = session.query(User).filter(User.alias == 'admin').first()
+
+                with QueryCounter() as counter:
+                    bag = get_bag_meta_inner("meta-store", "products-%d.bag" % number_of_products,
+                                             msg_definitions=True, user=user)
+                counts.append(counter.count)
+
+                self.assertEqual(len(bag.topics), 20)
+                self.assertEqual(len(bag.products), number_of_products)
+                self.assertEqual(sum([len(x.files) for x in bag.products]), number_of_products * 5)
+                self.assertEqual(bag.products[0].topics[0].original_topic, "/topic0")
+
+                file = bag.products[0].files[0].file
+                self.assertEqual(file.link, url_for("/api/v0.rbb_server_controllers_file_controller_get_file",
+                                                    store_name=file_store.name, uid=file.uid, file_name=file.name,
+                                                    _external=True))
+                self.assertEqual(bag.products[-1].product_data, {'frames': [number_of_products - 1] * 100})
+
+                # Only the product headers, the data is not even read from the database
+                with QueryCounter() as counter:
+                    headers = get_bag_meta_inner("meta-store", "products-%d.bag" % number_of_products,
+                                                 product_data=False, user=user)
+                counts.append(counter.count)
+
+                self.assertNotIn("product_data", " ".join(counter.statements))
+                self.assertEqual([x.product_data for x in headers.products], [None] * number_of_products)
+                self.assertEqual([(x.uid, x.title) for x in headers.products],
+                                 [(x.uid, x.title) for x in bag.products])
+                self.assertEqual([len(x.files) for x in headers.products], [5] * number_of_products)
+
+                product = get_bag_product_inner("meta-store", "products-%d.bag" % number_of_products,
+                                                bag.products[-1].uid, user=user)
+                self.assertEqual(product.product_data, bag.products[-1].product_data)
+                self.assertEqual(product.topics[0].original_topic, bag.products[-1].topics[0].original_topic)
+                self.assertEqual(product.files[0].file.link, bag.products[-1].files[0].file.link)
+
+                if number_of_products > 1:
+                    # Products are only found in their own bag
+                    error, status = get_bag_product_inner("meta-store", "products-1.bag", bag.products[-1].uid,
+                                                          user=user)
+                    self.assertEqual(status, 404)
+
+        print("get_bag_meta queries for %s products: %s" % (product_counts, counts))
+        self.assertEqual(len(set(counts)), 1)
+
+    def test_patch_bag_products_query_count_is_flat(self):
+        session = Database.get_session()
+        store = RosbagStore(name="patch-store", description="", store_type="rbb_storage_static",
+                            store_data={'static': {}})
+        file_store = session.query(FileStore).first()
+        files = [File(name="video%d.mp4" % i, store=file_store, store_data={}) for i in range(6)]
+        session.add(store)
+        session.add_all(files)
+
+        topic_counts = [10, 500]
+        for number_of_topics in topic_counts:
+            bag = Rosbag(name="topics-%d.bag" % number_of_topics, store=store, store_data={}, is_extracted=True,
+                         in_trash=False, meta_available=True, extraction_failure=False,
+                         discovered=datetime.datetime.utcnow(), comment="")
+            bag.topics = [RosbagTopic(name="/topic%d" % i, msg_type="", msg_type_hash="", msg_count=1, avg_frequency=1)
+                          for i in range(number_of_topics)]
+            for tag, rule in [("videos", "front"), ("", "")]:
+                product = RosbagProduct(plugin="Plugin", product_type="video", product_data={},
+                                        created=datetime.datetime.utcnow(), title="Old %s" % rule,
+                                        configuration_tag=tag, configuration_rule=rule)
+                product.topics = [RosbagProductTopic(plugin_topic="input", topic=bag.topics[0])]
+                bag.products.append(product)
+            session.add(bag)
+        session.commit()
+
+        def new_product(rule, i):
+            return Product(uid="", plugin="Plugin", product_type="video", product_data={'frames': i},
+                           created=datetime.datetime.utcnow(), title="New %s" % rule,
+                           configuration_tag="videos", configuration_rule=rule,
+                           topics=[TopicMapping(original_topic="/topic%d" % j, plugin_topic="input%d" % j)
+                                   for j in (i, i + 5)],
+                           files=[ProductFile(key="video%d" % j, file=FileSummary(uid=files[j].uid,
+                                                                                 name=files[j].name))
+                                  for j in (i, i + 3)])
+
+        counts = []
+        for number_of_topics in topic_counts:
+            with self.app.app.test_request_context():
+                session = Database.get_session()
+                user = session.query(User).filter(User.alias == 'admin').first()
+                products = [new_product(rule, i) for i, rule in enumerate(["front", "rear", "left"])]
+
+                with QueryCounter() as counter:
+                    stored = patch_bag_products_inner("patch-store", "topics-%d.bag" % number_of_topics, products,
+                                                      user=user)
+                counts.append(counter.count)
+
+                self.assertEqual([x.title for x in stored], ["New front", "New rear", "New left"])
+                self.assertEqual(sorted([x.original_topic for x in stored[2].topics]), ["/topic2", "/topic7"])
+                self.assertEqual(sorted([x.file.name for x in stored[2].files]), ["video2.mp4", "video5.mp4"])
+                self.assertEqual(stored[0].product_data, {'frames': 0})
+
+                # The product with the same configuration is replaced, unconfigured products are kept
+                bag = get_bag_meta_inner("patch-store", "topics-%d.bag" % number_of_topics, user=user)
+                self.assertEqual(sorted([x.title for x in bag.products]),
+                                 ["New front", "New left", "New rear", "Old "])
+
+                # Nothing is stored if a product references an unknown topic or file
+                broken = new_product("front", 0)
+                broken.topics[0].original_topic = "/unknown"
+                error, status = patch_bag_products_inner("patch-store", "topics-%d.bag" % number_of_topics,
+                                                         [broken], user=user)
+                self.assertEqual(status, 400)
+
+                broken = new_product("front", 0)
+                broken.files[0].file.name = "other.mp4"
+                error, status = patch_bag_products_inner("patch-store", "topics-%d.bag" % number_of_topics,
+                                                         [broken], user=user)
+                self.assertEqual(status, 400)
+
+                bag = get_bag_meta_inner("patch-store", "topics-%d.bag" % number_of_topics, user=user)
+                self.assertEqual(len(bag.products), 4)
+
+        print("patch_bag_products queries for %s topics: %s" % (topic_counts, counts))
+        self.assertEqual(len(set(counts)), 1)
+
+    def test_register_bags_query_count_is_flat(self):
+        session = Database.get_session()
+        user = session.query(User).filter(User.alias == 'admin').first()
+        session.add(RosbagStore(name="register-store", description="", store_type="rbb_storage_static",
+                                store_data={'static': {}}))
+        session.commit()
+
+        counts = []
+        for number_of_bags in [10, 200]:
+            files = [StoredFile(name="batch-%d-%d.bag" % (number_of_bags, i), store_data={'path': "/%d" % i})
+                     for i in range(number_of_bags)]
+            with QueryCounter() as counter:
+                result = register_bags_inner("register-store", files, user=user)
+            counts.append(counter.count)
+
+            self.assertEqual([x.status for x in result], ["created"] * number_of_bags)
+            tasks = session.query(Task).filter(Task.description.like("%%register-store/batch-%d-%%" % number_of_bags))
+            self.assertEqual(tasks.count(), number_of_bags)
+
+        print("register_bags queries for [10, 200] bags: %s" % counts)
+        self.assertEqual(len(set(counts)), 1)
+
+        # Existing bags and duplicates in the batch are reported, not created again
+        files = [StoredFile(name=name, store_data={}) for name in ["batch-10-0.bag", "new.bag", "new.bag"]]
+        result = register_bags_inner("register-store", files, user=user)
+        self.assertEqual([(x.name, x.status) for x in result],
+                         [("batch-10-0.bag", "exists"), ("new.bag", "created"), ("new.bag", "exists")])
+
+        bag = session.query(Rosbag).filter(Rosbag.name == "batch-10-3.bag").one()
+        self.assertEqual(bag.store_data, {'path': "/3"})
+        self.assertEqual(list_bags_inner("register-store", search="batch-200-7.bag", user=user)[0].name,
+                         "batch-200-7.bag")
+
+        error, status = register_bags_inner("unknown-store", files, user=user)
+        self.assertEqual(status, 404)
+
+    def test_new_bag_hooks_share_the_transaction(self):
+        session = Database.get_session()
+        user = session.query(User).filter(User.alias == 'admin').first()
+
+        class FailingHook(NewBagHook):
+            @classmethod
+            def stage(cls, new_bag, store_name, session, trigger=None, user=None):
+                raise RuntimeError("Hook failed")
+
+        FailingHook.register()
+        try:
+            files = [StoredFile(name="hook-%d.bag" % i, store_data={}) for i in range(3)]
+            with self.assertRaises(RuntimeError):
+                register_bags_inner("test-2", files, user=user)
+            session.rollback()
+        finally:
+            NewBagHook._hooks.remove(FailingHook)
+
+        # Neither the bags nor the extraction tasks staged before the failing hook are stored
+        self.assertEqual(session.query(Rosbag).filter(Rosbag.name.like("hook-%")).count(), 0)
+        self.assertEqual(session.query(Task).filter(Task.description.like("%test-2/hook-%")).count(), 0)
+
+        result = register_bags_inner("test-2", files, user=user)
+        self.assertEqual([x.status for x in result], ["created"] * 3)
+        self.assertEqual(session.query(Task).filter(Task.description.like("%test-2/hook-%")).count(), 3)
+
+    def test_task_size_class_follows_bag_size(self):
+        session = Database.get_session()
+        user = session.query(User).filter(User.alias == 'admin').first()
+        session.add(RosbagStore(name="size-store", description="", store_type="rbb_storage_static",
+                                store_data={'static': {}}))
+        session.commit()
+
+        def put_bag(name, size):
+            bag = BagDetailed(name=name, store_data={}, discovered=datetime.datetime.utcnow(), is_extracted=True,
+                              in_trash=False, meta_available=True, extraction_failure=False, size=size, comment="",
+                              topics=[], products=[])
+            with self.app.app.test_request_context():
+                self.assertEqual(put_bag_meta_inner("size-store", name, bag, user=user)[1], 200)
+
+        def size_class(name):
+            return session.query(Task.size_class).filter(Task.description.like("%%size-store/%s)" % name)).scalar()
+
+        # The extraction task of a new bag sees the bag it is queued for
+        put_bag("put.bag", 4 * 1024 * 1024)
+        self.assertEqual(size_class("put.bag"), 3)
+
+        # Registered bags have no size yet, their tasks follow once the real size is known
+        register_bags_inner("size-store", [StoredFile(name="registered.bag", store_data={})], user=user)
+        self.assertEqual(size_class("registered.bag"), 1)
+        put_bag("registered.bag", 1024 * 1024 * 1024)
+        self.assertEqual(size_class("registered.bag"), 11)
+
+    def test_reserved_bag_names(self):
+        session = Database.get_session()
+        user = session.query(User).filter(User.alias == 'admin').first()
+
+        # The names of the static paths next to the bags would make the bag unreachable
+        for name in ["facets", "tasks"]:
+            bag = BagDetailed(name=name, store_data={}, discovered=datetime.datetime.utcnow(), is_extracted=False,
+                              in_trash=False, meta_available=False, extraction_failure=False, size=0, comment="",
+                              topics=[], products=[])
+            with self.app.app.test_request_context():
+                self.assertEqual(put_bag_meta_inner("test-2", name, bag, user=user)[1], 400)
+
+            files = [StoredFile(name="fine.bag", store_data={}), StoredFile(name=name, store_data={})]
+            self.assertEqual(register_bags_inner("test-2", files, user=user)[1], 400)
+
+        self.assertEqual(session.query(Rosbag).filter(Rosbag.name.in_(["facets", "tasks", "fine.bag"])).count(), 0)
+
+    def test_simulation_run_bags_query_count_is_flat(self):
+        session = Database.get_session()
+        user = session.query(User).filter(User.alias == 'admin').first()
+
+        counts = []
+        for limit in [5, self.number_of_bags]:
+            session.expire_all()
+            with QueryCounter() as counter:
+                q = session.query(SimulationRun)\
+                    .filter(SimulationRun.simulation_id == self.simulation_id)\
+                    .options(*SimulationRun.summary_query_options(user=user, expand=True))\
+                    .order_by(SimulationRun.uid).limit(limit)
+                runs = [x.to_swagger_model_detailed(user=user, expand=True) for x in q]
+            self.assertEqual(len(runs), limit)
+            self.assertEqual(runs[0].bag.name, "bag-0.bag")
+            counts.append(counter.count)
+
+        self.assertEqual(counts[0], counts[1])
@@ -66,6 +66,13 @@ class TestConfiguration(ClientServerBaseTestCase):
         config = api_instance.get_configuration_key("*")
 
         self.assertDictEqual(dict(config), {
+            'queue': {
+                'aging_period': '600',
+                'archive_after_days': '30',
+                'lease_duration': '60',
+                'max_attempts': '3',
+                'scheduling': 'priority'
+            },
             'worker': {
                 'default': {
                     'poll_interval': '10',
@@ -0,0 +1,62 @@
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import unittest
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import NullPool
+
+import rbb_server_test.database
+from rbb_server.model.database import Database
+
+
+class TestDatabase(unittest.TestCase):
+
+    def tearDown(self):
+        os.environ.pop('RBB_DB_STATEMENT_TIMEOUT', None)
+        rbb_server_test.database.close_database()
+
+    def test_statement_timeout(self):
+        os.environ['RBB_DB_STATEMENT_TIMEOUT'] = '0.2'
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+
+        self.assertEqual(session.execute("SHOW statement_timeout").scalar(), "200ms")
+        with self.assertRaises(OperationalError):
+            session.execute("SELECT pg_sleep(1)")
+        session.rollback()
+
+    def test_dropped_connection_is_replaced(self):
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+        pid = session.execute("SELECT pg_backend_pid()").scalar()
+        session.commit()
+
+        # The connection of the pool is closed by the database while it is not used
+        other = create_engine(Database.get_engine().url, poolclass=NullPool)
+        other.execute("SELECT pg_terminate_backend(%s)" % pid)
+        other.dispose()
+
+        self.assertNotEqual(Database.get_session().execute("SELECT pg_backend_pid()").scalar(), pid)
+        Database.get_session().rollback()
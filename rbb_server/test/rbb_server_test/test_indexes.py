@@ -0,0 +1,265 @@
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import time
+import unittest
+
+import rbb_server.helper.database as db_helper
+import rbb_server_test.database
+from rbb_server.controllers.bag_controller import find_store_and_bag_in_database
+from rbb_server.model.database import Database, Rosbag, RosbagProduct, RosbagProductFile, RosbagStore, RosbagTopic, \
+    Session, Task
+from rbb_server.model.rosbag import tag_association_table
+from rbb_server.model.task import TaskState
+
+
+class TestIndexes(unittest.TestCase):
+    number_of_bags = 20000
+    large_tables = {'rosbag', 'rosbag_topic', 'rosbag_product', 'rosbag_product_file', 'rosbag_tags', 'token',
+                    'task_queue'}
+
+    @classmethod
+    def setUpClass(cls):
+        rbb_server_test.database.setup_database_for_test()
+
+        fill_start_time = time.time()
+        session = Database.get_session()
+        session.execute("INSERT INTO rosbag_store (name, description, store_type, store_data) "
+                        "VALUES ('index-store', '', 'rbb_storage_static', '{}')")
+        session.execute("INSERT INTO rosbag (store_id, store_data, name, discovered, start_time, end_time, size, "
+                        "duration, comment) "
+                        "SELECT s.uid, '{}', 'bag-' || i || '.bag', now() - i * interval '1 minute', "
+                        "CASE WHEN i % 10 = 0 THEN NULL ELSE now() - i * interval '1 minute' END, "
+                        "CASE WHEN i % 10 = 0 THEN NULL ELSE now() - i * interval '1 minute' + interval '30 s' END, "
+                        "i % 1000, CASE WHEN i % 7 = 0 THEN NULL ELSE i END, '' "
+                        "FROM generate_series(1, :n) i, rosbag_store s WHERE s.name = 'index-store'",
+                        {'n': cls.number_of_bags})
+        session.execute("INSERT INTO message_definition (msg_type_hash, msg_definition) "
+                        "VALUES ('string-hash', 'string data'), ('pointcloud-hash', '')")
+        session.execute("INSERT INTO rosbag_topic (bag_id, name, msg_type, msg_type_hash, msg_count, avg_frequency) "
+                        "SELECT b.uid, '/topic' || t, 'std_msgs/String', 'string-hash', 100, 10 "
+                        "FROM rosbag b, generate_series(1, 5) t WHERE b.name LIKE 'bag-%'")
+        session.execute("INSERT INTO rosbag_topic (bag_id, name, msg_type, msg_type_hash, msg_count, avg_frequency) "
+                        "SELECT b.uid, '/sensors/lidar_' || (b.uid % 3), 'sensor_msgs/PointCloud2', 'pointcloud-hash', "
+                        "b.uid % 500, 10 FROM rosbag b WHERE b.name LIKE 'bag-%' AND b.uid % 100 = 0")
+        session.execute("UPDATE rosbag b SET search_vector = rosbag_search_vector(b.name, "
+                        "(SELECT string_agg(t.name, ' ') FROM rosbag_topic t WHERE t.bag_id = b.uid), b.comment) "
+                        "WHERE b.name LIKE 'bag-%'")
+        session.execute("INSERT INTO rosbag_product (bag_id, plugin, product_type, product_data) "
+                        "SELECT b.uid, 'Plugin', 'type' || p, '{}' FROM rosbag b, generate_series(1, 2) p "
+                        "WHERE b.name LIKE 'bag-%'")
+        session.execute("INSERT INTO file (store_id, name, store_data) "
+                        "SELECT 1, 'file-' || p.uid, '{}' FROM rosbag_product p WHERE p.plugin = 'Plugin'")
+        session.execute("INSERT INTO rosbag_product_file (product_id, file_id, key) "
+                        "SELECT p.uid, f.uid, 'key' FROM rosbag_product p JOIN file f ON f.name = 'file-' || p.uid")
+        session.execute("INSERT INTO tags (tag, color) SELECT 'index-tag-' || i, '' FROM generate_series(1, 100) i")
+        session.execute("INSERT INTO rosbag_tags (bag_id, tag_id) "
+                        "SELECT b.uid, t.uid FROM rosbag b "
+                        "JOIN tags t ON t.uid % 100 = b.uid % 100 OR t.uid % 100 = (b.uid % 10) * 10 "
+                        "WHERE b.name LIKE 'bag-%' AND t.tag LIKE 'index-tag-%'")
+        session.execute("INSERT INTO token (user_uid, token) SELECT 1, md5(i::text) FROM generate_series(1, 20000) i")
+        # Mostly finished tasks, like a queue that has been running for a while
+        session.execute("INSERT INTO task_queue (priority, description, assigned_to, state, task, configuration, "
+                        "result, worker_labels) "
+                        "SELECT i % 10, 'Task ' || i, CASE WHEN i % 100 = 0 THEN '' ELSE 'worker' || i % 30 END, "
+                        "CASE WHEN i % 100 = 0 THEN 0 ELSE 100 END, 'rbb_tools.tasks.bags.extract', '{}', '{}', "
+                        "CASE WHEN i % 200 = 0 THEN 'gpu' ELSE '' END FROM generate_series(1, 50000) i")
+        session.commit()
+        # Move the bulk inserted search entries out of the GIN pending list, like autovacuum would
+        session.execute("SELECT gin_clean_pending_list('rosbag_search_vector_idx')")
+        session.execute("ANALYZE")
+        session.commit()
+
+        print("Filling the database took %f seconds" % (time.time() - fill_start_time))
+
+    @classmethod
+    def tearDownClass(cls):
+        Database.get_session().remove()
+
+    def explain(self, q):
+        compiled = q.statement.compile(dialect=Database.get_session().bind.dialect)
+
+        start_time = time.time()
+        plan = Database.get_session().connection()\
+            .execute("EXPLAIN (ANALYZE, FORMAT JSON) " + str(compiled), compiled.params).scalar()
+        duration = time.time() - start_time
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return plan[0]['Plan'], duration
+
+    def sequential_scans(self, node):
+        scans = []
+        if node['Node Type'] == 'Seq Scan' and node['Relation Name'] in self.large_tables:
+            scans.append(node['Relation Name'])
+
+        for child in node.get('Plans', []):
+            scans.extend(self.sequential_scans(child))
+
+        return scans
+
+    def assertIndexed(self, description, q):
+        plan, duration = self.explain(q)
+        print("%s took %f seconds" % (description, duration))
+        self.assertEqual(self.sequential_scans(plan), [], "%s uses a sequential scan" % description)
+
+    def sorts(self, node):
+        sorts = [node['Node Type']] if node['Node Type'] == 'Sort' else []
+        for child in node.get('Plans', []):
+            sorts.extend(self.sorts(child))
+        return sorts
+
+    def rosbag_rows_read(self, node):
+        rows = 0
+        if node.get('Relation Name') == 'rosbag':
+            rows += node['Actual Rows'] * node['Actual Loops'] + node.get('Rows Removed by Filter', 0)
+
+        for child in node.get('Plans', []):
+            rows += self.rosbag_rows_read(child)
+
+        return rows
+
+    def relation_scans(self, node, relation):
+        scans = 1 if node.get('Relation Name') == relation else 0
+        for child in node.get('Plans', []):
+            scans += self.relation_scans(child, relation)
+        return scans
+
+    def assertOrderedByIndex(self, description, q):
+        plan, duration = self.explain(q)
+        print("%s took %f seconds" % (description, duration))
+        self.assertEqual(self.sequential_scans(plan), [], "%s uses a sequential scan" % description)
+        self.assertEqual(self.sorts(plan), [], "%s sorts the rows" % description)
+        return self.rosbag_rows_read(plan)
+
+    def test_lookups_use_indexes(self):
+        session = Database.get_session()
+        store, bag = find_store_and_bag_in_database(session, 'index-store', 'bag-12345.bag')
+        self.assertEqual(bag.name, 'bag-12345.bag')
+        product = session.query(RosbagProduct).filter(RosbagProduct.bag_id == bag.uid).first()
+
+        self.assertIndexed("Bag lookup", session.query(RosbagStore, Rosbag)
+                           .outerjoin(Rosbag, (Rosbag.store_id == RosbagStore.uid) & (Rosbag.name == 'bag-12345.bag'))
+                           .filter(RosbagStore.name == 'index-store'))
+        self.assertIndexed("Topics by bag", session.query(RosbagTopic).filter(RosbagTopic.bag_id == bag.uid))
+        self.assertIndexed("Products by bag", session.query(RosbagProduct).filter(RosbagProduct.bag_id == bag.uid))
+        self.assertIndexed("Files by product",
+                           session.query(RosbagProductFile).filter(RosbagProductFile.product_id == product.uid))
+        self.assertIndexed("Tags by bag", session.query(tag_association_table)
+                           .filter(tag_association_table.c.bag_id == bag.uid))
+        self.assertIndexed("Bags by tag", session.query(tag_association_table)
+                           .filter(tag_association_table.c.tag_id == 42))
+        self.assertIndexed("Session by uid", session.query(Session).filter(Session.uid == 12345))
+
+    def test_orderings_use_indexes(self):
+        session = Database.get_session()
+        store = session.query(RosbagStore).filter(RosbagStore.name == 'index-store').first()
+        column_mapping = {
+            'discovered': Rosbag.discovered,
+            'start_time': Rosbag.start_time,
+            'end_time': Rosbag.end_time,
+            'name': Rosbag.name,
+            'duration': Rosbag.duration,
+            'size': Rosbag.size
+        }
+        limit = 50
+
+        for column_name in column_mapping:
+            for direction in ['asc', 'desc']:
+                ordering = "%s:%s" % (column_name, direction)
+                q = session.query(Rosbag).filter(Rosbag.store_id == store.uid)
+
+                first_page = db_helper.query_pagination_ordering(q, None, limit, ordering, column_mapping,
+                                                                 tiebreaker=Rosbag.uid)
+                self.assertOrderedByIndex("First page of bags ordered by %s" % ordering, first_page)
+
+                # Deep pages should cost the same as the first one when a cursor is used
+                rows = db_helper.query_pagination_ordering(q, 5000, limit, ordering, column_mapping,
+                                                           tiebreaker=Rosbag.uid).all()
+                cursor = db_helper.next_page_cursor(rows, limit, ordering, column_mapping, Rosbag.uid)
+                deep_page = db_helper.query_pagination_ordering(q, None, limit, ordering, column_mapping, cursor,
+                                                                Rosbag.uid)
+                rows_read = self.assertOrderedByIndex("Deep page of bags ordered by %s" % ordering, deep_page)
+                self.assertLessEqual(rows_read, 4 * limit)
+
+    def test_tag_filter_is_single_pass(self):
+        session = Database.get_session()
+        store = session.query(RosbagStore).filter(RosbagStore.name == 'index-store').first()
+
+        for mode in ['all', 'any', 'none']:
+            for number_of_tags in [1, 2, 4, 8, 16, 32]:
+                tags = ",".join(["index-tag-%d" % (i * 3 + 1) for i in range(number_of_tags)])
+                q = session.query(Rosbag).filter(Rosbag.store_id == store.uid)
+                q = db_helper.filter_tags(q, tags, mode, Rosbag.uid)
+                q = db_helper.query_pagination_ordering(q, None, 50, "discovered:desc", {
+                    'discovered': Rosbag.discovered
+                }, tiebreaker=Rosbag.uid)
+
+                plan, duration = self.explain(q)
+                print("Filtering on %d tags with mode %s took %f seconds" % (number_of_tags, mode, duration))
+                self.assertEqual(self.relation_scans(plan, 'rosbag_tags'), 1)
+
+    def test_search_uses_index(self):
+        session = Database.get_session()
+        store = session.query(RosbagStore).filter(RosbagStore.name == 'index-store').first()
+
+        for search in ["bag-12345", "1234", "topic3 12345"]:
+            q = session.query(Rosbag).filter(Rosbag.store_id == store.uid)
+            q = db_helper.filter_search(q, search, Rosbag.search_vector)
+            self.assertIndexed("Searching for '%s'" % search, q)
+
+    def test_topic_filters_use_indexes(self):
+        session = Database.get_session()
+        store = session.query(RosbagStore).filter(RosbagStore.name == 'index-store').first()
+
+        filters = [
+            {'name': '/sensors/lidar_1'},
+            {'name_prefix': '/sensors/'},
+            {'msg_type': 'sensor_msgs/PointCloud2', 'msg_count_gte': 250},
+            {'name_prefix': '/sensors/lidar', 'avg_frequency_gte': 5}
+        ]
+
+        for kwargs in filters:
+            q = session.query(Rosbag).filter(Rosbag.store_id == store.uid)
+            q = db_helper.filter_topics(q, Rosbag.uid, **kwargs)
+            q = db_helper.query_pagination_ordering(q, None, 50, "discovered:desc", {
+                'discovered': Rosbag.discovered
+            }, tiebreaker=Rosbag.uid)
+
+            # With few matching topics Postgres may still prefer to hash join them to all bags of the store
+            plan, duration = self.explain(q)
+            print("Bags with topics %s took %f seconds" % (kwargs, duration))
+            self.assertNotIn('rosbag_topic', self.sequential_scans(plan))
+
+    def test_dequeue_uses_partial_indexes(self):
+        session = Database.get_session()
+        try:
+            self.assertIndexed("Unfinished tasks of a worker", session.query(Task)
+                               .filter(Task.assigned_to == 'worker7').filter(Task.state < TaskState.Finished))
+            self.assertIndexed("Dequeue", Task.dequeue_query(session, 'index-worker',
+                                                             ['rbb_tools.tasks.bags.extract'], ['gpu']))
+            self.assertIndexed("Dequeue any task", Task.dequeue_query(session, 'index-worker'))
+        finally:
+            # EXPLAIN ANALYZE really assigned the tasks
+            session.rollback()
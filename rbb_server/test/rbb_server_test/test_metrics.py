@@ -0,0 +1,116 @@
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import base64
+import os
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+
+from rbb_server.helper.metrics import LATENCY_BUCKETS, RequestMetrics, operation_name
+from rbb_server_test import ClientServerBaseTestCase
+
+
+class TestMetrics(ClientServerBaseTestCase):
+
+    def read_metrics(self):
+        request = urllib.request.Request("http://localhost:8081/metrics")
+        request.add_header("Authorization", "Basic " + base64.b64encode(b"admin:admin").decode('ascii'))
+        response = urllib.request.urlopen(request)
+        self.assertTrue(response.headers['Content-Type'].startswith("text/plain; version=0.0.4"))
+        return response.read().decode('utf-8')
+
+    def test_request_metrics(self):
+        api_instance = self.get_admin_api()
+        api_instance.list_queue(limit=10)
+        api_instance.list_queue(limit=10)
+        api_instance.get_configuration_key("*")
+
+        metrics = self.read_metrics()
+        self.assertIn('rbb_http_requests_total{operation="list_queue",method="GET",status="200"} 2', metrics)
+        self.assertIn('rbb_http_requests_total{operation="get_configuration_key",method="GET",status="200"} 1',
+                      metrics)
+        self.assertIn('rbb_http_request_duration_seconds_bucket{operation="list_queue",le="+Inf"} 2', metrics)
+        self.assertIn('rbb_http_request_duration_seconds_count{operation="list_queue"} 2', metrics)
+
+        # Authentication and the listing itself run SQL statements
+        self.assertIn('rbb_sql_statements_per_request_bucket{operation="list_queue",le="0"} 0', metrics)
+        self.assertIn('rbb_sql_duration_seconds_total{operation="list_queue"}', metrics)
+
+    def test_requires_authentication(self):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            urllib.request.urlopen("http://localhost:8081/metrics")
+        self.assertEqual(context.exception.code, 401)
+
+
+class TestMetricsAggregation(unittest.TestCase):
+
+    def test_operation_name(self):
+        self.assertEqual(operation_name("/api/v0.rbb_server_controllers_queue_controller_list_queue"), "list_queue")
+        self.assertEqual(operation_name("metrics"), "metrics")
+        self.assertEqual(operation_name(None), "none")
+
+    def test_processes_are_added_up(self):
+        with tempfile.TemporaryDirectory() as directory:
+            first = RequestMetrics(directory)
+            first.record("list_queue", "GET", 200, 0.002, 3, 0.001)
+            first.record("list_queue", "GET", 200, 0.3, 40, 0.2)
+
+            # A second worker process, its file is written on the first request
+            second = RequestMetrics(directory)
+            second._path = os.path.join(directory, "other.json")
+            second.record("list_queue", "GET", 500, 2.0, 1, 0.5)
+
+            total = first.collect()
+            self.assertEqual(total['requests'], {"list_queue GET 200": 2, "list_queue GET 500": 1})
+            self.assertAlmostEqual(total['sql_time']["list_queue"], 0.701)
+
+            latency = total['latency']["list_queue"]
+            self.assertEqual(sum(latency[:-1]), 3)
+            self.assertEqual(latency[LATENCY_BUCKETS.index(0.005)], 1)
+            self.assertAlmostEqual(latency[-1], 2.302)
+
+            text = RequestMetrics.render(total)
+            self.assertIn('rbb_http_request_duration_seconds_bucket{operation="list_queue",le="0.5"} 2', text)
+            self.assertIn('rbb_sql_statements_per_request_bucket{operation="list_queue",le="50"} 3', text)
+            self.assertIn('rbb_sql_statements_per_request_count{operation="list_queue"} 3', text)
+
+    def test_exited_processes_are_retired(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for pid in (101, 102):
+                process = RequestMetrics(directory)
+                process._path = os.path.join(directory, "%d.json" % pid)
+                process.record("list_queue", "GET", 200, 0.002, 3, 0.001)
+
+            RequestMetrics.retire(directory, 101)
+            RequestMetrics.retire(directory, 102)
+            self.assertEqual(sorted(os.listdir(directory)), ["retired.json"])
+
+            # Retiring a process without a file changes nothing
+            RequestMetrics.retire(directory, 103)
+
+            current = RequestMetrics(directory)
+            current.record("list_queue", "GET", 200, 0.002, 3, 0.001)
+            total = current.collect()
+            self.assertEqual(total['requests'], {"list_queue GET 200": 3})
+            self.assertEqual(sum(total['statements']["list_queue"][:-1]), 3)
@@ -0,0 +1,128 @@
+# AMZ-Driverless
+#  Copyright (c) 2019 Authors:
+#   - Huub Hendrikx <hhendrik@ethz.ch>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import datetime
+import unittest
+
+import rbb_server_test.database
+from rbb_server.controllers.bag_controller import list_bags_inner
+from rbb_server.controllers.queue_controller import list_queue_inner
+from rbb_server.controllers.simulation_controller import list_simulations_inner
+from rbb_server.model.database import Database, Rosbag, RosbagStore, Simulation, User
+
+
+class TestPagination(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rbb_server_test.database.setup_database_for_test()
+
+        session = Database.get_session()
+        store = RosbagStore(name="pagination-store", description="", store_type="rbb_storage_static",
+                            store_data={'static': {}})
+        session.add(store)
+
+        discovered = datetime.datetime(2019, 1, 1, 12, 0, 0, 123456)
+        for i in range(37):
+            # Plenty of equal and missing values to exercise the tiebreaker and the NULL handling
+            session.add(Rosbag(name="bag-%02d.bag" % i, store=store, store_data={}, is_extracted=False,
+                               in_trash=False, meta_available=False, extraction_failure=False,
+                               discovered=discovered + datetime.timedelta(seconds=i % 5),
+                               start_time=None if i % 4 == 0 else discovered + datetime.timedelta(minutes=i % 6),
+                               size=None if i % 3 == 0 else i % 4, duration=i, comment=""))
+
+        for i in range(7):
+            session.add(Simulation(description="Pagination %d" % i, created=discovered, configuration={},
+                                   result=0, environment_id=1, on_complete={}))
+
+        session.commit()
+
+        cls.user = session.query(User).filter(User.alias == 'admin').first()
+
+    @classmethod
+    def tearDownClass(cls):
+        Database.get_session().remove()
+
+    def collect_pages(self, list_function, limit, **kwargs):
+        items = []
+        cursor = None
+
+        while True:
+            response = list_function(limit=limit, cursor=cursor, user=self.user, **kwargs)
+            if isinstance(response, tuple):
+                page, status, headers = response
+                self.assertEqual(status, 200)
+                cursor = headers['X-Next-Cursor']
+            else:
+                page = response
+                cursor = None
+
+            self.assertLessEqual(len(page), limit)
+            items.extend(page)
+            self.assertLess(len(items), 1000, "Pagination does not terminate")
+
+            if cursor is None:
+                return items
+
+    def test_bag_cursor_pages(self):
+        orderings = [None, "size:asc", "size:desc", "start_time:asc", "start_time:desc", "name:desc",
+                     "discovered:asc,size:desc", "start_time:desc,size:asc"]
+
+        for ordering in orderings:
+            expected = [x.name for x in list_bags_inner("pagination-store", ordering=ordering, user=self.user)]
+            self.assertEqual(len(expected), 37)
+
+            for limit in [1, 5, 37]:
+                pages = self.collect_pages(list_bags_inner, limit, store_name="pagination-store", ordering=ordering)
+                self.assertEqual([x.name for x in pages], expected, "Ordering %s, limit %d" % (ordering, limit))
+
+    def test_offset_pages_are_stable(self):
+        expected = [x.name for x in list_bags_inner("pagination-store", ordering="size:asc", user=self.user)]
+
+        pages = []
+        for offset in range(0, 37, 10):
+            response = list_bags_inner("pagination-store", limit=10, offset=offset, ordering="size:asc",
+                                       user=self.user)
+            pages.extend(response[0] if isinstance(response, tuple) else response)
+
+        self.assertEqual([x.name for x in pages], expected)
+
+    def test_invalid_cursor(self):
+        error, status = list_bags_inner("pagination-store", limit=5, cursor="garbage", user=self.user)
+        self.assertEqual(status, 400)
+
+        page, status, headers = list_bags_inner("pagination-store", limit=5, ordering="size:asc", user=self.user)
+        error, status = list_bags_inner("pagination-store", limit=5, ordering="name:asc",
+                                        cursor=headers['X-Next-Cursor'], user=self.user)
+        self.assertEqual(status, 400)
+
+    def test_queue_cursor_pages(self):
+        for ordering in [None, "priority:desc", "created:asc,priority:asc", "runtime:desc"]:
+            expected = [x.identifier for x in list_queue_inner(ordering=ordering, user=self.user)]
+            pages = self.collect_pages(list_queue_inner, 2, ordering=ordering)
+            self.assertEqual([x.identifier for x in pages], expected, "Ordering %s" % ordering)
+
+    def test_simulation_cursor_pages(self):
+        for ordering in [None, "created:desc", "identifier:asc"]:
+            expected = [x.identifier for x in list_simulations_inner(ordering=ordering, user=self.user)]
+            pages = self.collect_pages(list_simulations_inner, 3, ordering=ordering)
+            self.assertEqual([x.identifier for x in pages], expected, "Ordering %s" % ordering)
@@ -20,17 +20,27 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import copy
 import datetime
 import unittest
 import multiprocessing
+import threading
 import time
 
 from sqlalchemy.orm import Query
 
 import rbb_server_test.database
-from rbb_server.controllers.queue_controller import dequeue_task_inner, put_task_inner
-from rbb_server.model.database import Database, Task, User
+from rbb_server.controllers import queue_controller
+from rbb_server.controllers.cron_controller import get_cron_endpoint_inner
+from rbb_server.controllers.queue_controller import dequeue_task_inner, get_queue_statistics_inner, \
+    get_task_inner, get_task_log_inner, list_queue_inner, new_task_inner, patch_task_inner, put_task_inner, \
+    suggested_worker_count, task_heartbeat_inner
+from rbb_server.model.database import Database, Task, TaskArchive, TaskLogChunk, TaskRuntimeEstimate, User
+from rbb_server.model.task import SCHEDULING_CANDIDATES
+from rbb_server_tools.rehash_tasks import rehash_tasks
+from rbb_swagger_server.models.queue_depth import QueueDepth
 from rbb_swagger_server.models.task_detailed import TaskDetailed
+from rbb_swagger_server.models.task_heartbeat import TaskHeartbeat
 
 
 class TestQueue(unittest.TestCase):
@@ -43,33 +53,36 @@ class TestQueue(unittest.TestCase):
         if Database.get_session():
             Database.get_session().remove()
 
+    def add_task(self, session, description, task="none", worker_labels="", priority=0):
+        task_model = Task()
+        task_model.priority = priority
+        task_model.description = description
+        task_model.assigned_to = ""
+        task_model.created = datetime.datetime.now()
+        task_model.last_updated = datetime.datetime.now()
+        task_model.state = 0
+        task_model.task = task
+        task_model.success = False
+        task_model.result = {}
+        task_model.runtime = 0
+        task_model.worker_labels = worker_labels
+        task_model.configuration = {}
+        session.add(task_model)
+        return task_model
+
     def test_deque_under_load(self):
         fill_start_time = time.time()
-        number_of_processes = max(2, multiprocessing.cpu_count())
-        number_of_queued_items = 2000 * number_of_processes
+        number_of_processes = 16
+        number_of_queued_items = 100 * number_of_processes
 
         Database.get_session().execute('''TRUNCATE TABLE task_queue CASCADE''')
         Database.get_session().commit()
 
         # Fill queue
         for i in range(number_of_queued_items):
-            task = Task()
-            task.priority = 0
-            task.description = "T%d" % i
-            task.assigned_to = ""
-            task.created = datetime.datetime.now()
-            task.last_updated = datetime.datetime.now()
-            task.state = 0
-            task.task = "none"
-            task.success = False
-            task.result = {}
-            task.runtime = 0
-            task.worker_labels = ""
-            task.configuration = {}
-            Database.get_session().add(task)
+            self.add_task(Database.get_session(), "T%d" % i)
 
         Database.get_session().commit()
-
         admin_user = Database.get_session().query(User).filter(User.alias == 'admin').first()
 
         rbb_server_test.database.close_database()
@@ -86,7 +99,7 @@ class TestQueue(unittest.TestCase):
             tasks = []
             number_of_collisions = 0
             while True:
-                task = dequeue_task_inner(worker_name, "", "", admin_user)
+                task = dequeue_task_inner(worker_name, "", "", user=admin_user)
 
                 if isinstance(task, TaskDetailed):
                     tasks.append(task.description)
@@ -127,9 +140,553 @@ class TestQueue(unittest.TestCase):
               (dequeue_end_time - dequeue_start_time, (dequeue_end_time - dequeue_start_time) / number_of_queued_items))
         print("Number of tasks dequeued per process: ", tasks_per_process)
         print("Number of collisions: ", total_number_of_collisions)
+        print("Dequeue rate: %f tasks per second" % (number_of_queued_items / (dequeue_end_time - dequeue_start_time)))
 
-
+        # Every task is handed out exactly once
         self.assertEqual(len(dequeued_tasks), number_of_queued_items)
+        self.assertEqual(len(set(dequeued_tasks)), number_of_queued_items)
+
+    def test_dequeue_routing(self):
+        # The load test closes the connection of this process
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+        admin_user = session.query(User).filter(User.alias == 'admin').first()
+
+        self.add_task(session, "Render", task="routing.render", worker_labels="gpu, display", priority=10)
+        self.add_task(session, "Extract", task="routing.extract", priority=5)
+        self.add_task(session, "Extract GPU", task="routing.extract", worker_labels="gpu", priority=1)
+        session.commit()
+
+        def dequeue(worker_name, tasks, labels):
+            task = dequeue_task_inner(worker_name, tasks, labels, user=admin_user)
+            if not isinstance(task, TaskDetailed):
+                return None
+            task.state = 100
+            put_task_inner(task.identifier, task, admin_user)
+            return task.description
+
+        # Workers without the labels of a task never get it
+        self.assertEqual(dequeue("cpu-worker", "routing.render,routing.extract", ""), "Extract")
+        self.assertEqual(dequeue("cpu-worker", "routing.render,routing.extract", ""), None)
+        self.assertEqual(dequeue("gpu-worker", "routing.extract", "gpu"), "Extract GPU")
+        self.assertEqual(dequeue("gpu-worker", "routing.render", "gpu"), None)
+        self.assertEqual(dequeue("gpu-worker", "routing.render", "display,gpu,cuda"), "Render")
+
+    def test_dequeue_long_poll(self):
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+        admin_user = session.query(User).filter(User.alias == 'admin').first()
+        session.commit()
+
+        # Nothing queued, the request returns after waiting
+        start_time = time.time()
+        result = dequeue_task_inner("poll-worker", "longpoll.task", "", wait=1, user=admin_user)
+        self.assertEqual(result[1], 204)
+        self.assertGreaterEqual(time.time() - start_time, 1)
+
+        def enqueue_later():
+            time.sleep(1)
+            thread_session = Database.get_session()
+            self.add_task(thread_session, "Long poll", task="longpoll.task")
+            thread_session.commit()
+            Database.get_session().remove()
+
+        # The waiting request is woken up as soon as the task is queued
+        thread = threading.Thread(target=enqueue_later)
+        start_time = time.time()
+        thread.start()
+        task = dequeue_task_inner("poll-worker", "longpoll.task", "", wait=20, user=admin_user)
+        thread.join()
+
+        self.assertIsInstance(task, TaskDetailed)
+        self.assertEqual(task.description, "Long poll")
+        self.assertLess(time.time() - start_time, 2)
+
+        # Above the limit of waiting requests a worker gets an answer right away
+        for i in range(queue_controller.MAX_DEQUEUE_WAITERS):
+            queue_controller._dequeue_waiters.acquire()
+        try:
+            start_time = time.time()
+            result = dequeue_task_inner("other-poll-worker", "longpoll.task", "", wait=5, user=admin_user)
+            self.assertEqual(result[1], 204)
+            self.assertLess(time.time() - start_time, 1)
+        finally:
+            for i in range(queue_controller.MAX_DEQUEUE_WAITERS):
+                queue_controller._dequeue_waiters.release()
+
+    def test_expired_lease_is_reclaimed(self):
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+        admin_user = session.query(User).filter(User.alias == 'admin').first()
+        lease_duration = 2
+        session.execute("UPDATE configuration SET value=:value WHERE config_key='queue.lease_duration'",
+                        {'value': str(lease_duration)})
+        task_model = self.add_task(session, "Lease", task="lease.task")
+        session.commit()
+        task_uid = task_model.uid
+
+        def crashing_worker(q):
+            rbb_server_test.database.init_database_connection_for_test()
+            task = dequeue_task_inner("crashing-worker", "lease.task", "", user=admin_user)
+            q.put(task.identifier)
+            time.sleep(60)
+
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=crashing_worker, args=(queue,))
+        process.start()
+        self.assertEqual(queue.get(timeout=10), str(task_uid))
+        process.terminate()
+        process.join()
+        kill_time = time.time()
+
+        # Another worker gets the task as soon as the lease is reclaimed
+        task = None
+        while task is None and time.time() - kill_time < 2 * lease_duration:
+            get_cron_endpoint_inner("reclaim_task_leases")
+            task = dequeue_task_inner("rescue-worker", "lease.task", "", user=admin_user)
+            if not isinstance(task, TaskDetailed):
+                task = None
+                time.sleep(0.1)
+
+        self.assertIsNotNone(task)
+        self.assertLess(time.time() - kill_time, lease_duration + 0.5)
+        self.assertEqual(task.identifier, str(task_uid))
+        self.assertEqual(task.assigned_to, "rescue-worker")
+
+        # A late result of the crashed worker does not overwrite the new run
+        stale_task = copy.copy(task)
+        stale_task.assigned_to = "crashing-worker"
+        stale_task.state = 100
+        self.assertEqual(put_task_inner(stale_task.identifier, stale_task, admin_user)[1], 409)
+
+        task.state = 100
+        task.success = True
+        self.assertEqual(put_task_inner(task.identifier, task, admin_user)[1], 200)
+
+        model = session.query(Task).filter(Task.uid == task_uid).first()
+        self.assertEqual(model.state, 100)
+        self.assertEqual(model.attempts, 2)
+        self.assertIn("LEASE OF WORKER crashing-worker EXPIRED", TaskLogChunk.read(session, task_uid)[0])
+
+        session.execute("UPDATE configuration SET value='60' WHERE config_key='queue.lease_duration'")
+        session.commit()
+
+    def test_stale_put_after_reclaim(self):
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+        admin_user = session.query(User).filter(User.alias == 'admin').first()
+        self.add_task(session, "Stale", task="stale.task")
+        session.commit()
+
+        task = dequeue_task_inner("worker-a", "stale.task", "", user=admin_user)
+        session.execute("UPDATE task_queue SET lease_expires = lease_expires - interval '1 hour' WHERE uid = :uid",
+                        {'uid': int(task.identifier)})
+        session.commit()
+        get_cron_endpoint_inner("reclaim_task_leases")
+
+        # The task is queued again, the old worker cannot finish or cancel it anymore
+        task.state = 101
+        self.assertEqual(put_task_inner(task.identifier, task, admin_user)[1], 409)
+        self.assertEqual(session.query(Task.state, Task.assigned_to).filter(Task.uid == int(task.identifier)).one(),
+                         (0, ""))
+
+        retry = dequeue_task_inner("worker-b", "stale.task", "", user=admin_user)
+        self.assertEqual(retry.identifier, task.identifier)
+
+        # Neither while another worker runs it
+        self.assertEqual(put_task_inner(task.identifier, task, admin_user)[1], 409)
+        # Only the worker running the task renews its lease when appending to the log
+        lease = session.query(Task.lease_expires).filter(Task.uid == int(task.identifier)).scalar()
+        session.commit()
+        patch_task_inner(task.identifier, {'log_append': "stale\n", 'assigned_to': "worker-a"}, admin_user)
+        self.assertEqual(session.query(Task.lease_expires).filter(Task.uid == int(task.identifier)).scalar(), lease)
+        session.commit()
+        time.sleep(0.01)
+        patch_task_inner(task.identifier, {'log_append': "running\n", 'assigned_to': "worker-b"}, admin_user)
+        self.assertGreater(session.query(Task.lease_expires).filter(Task.uid == int(task.identifier)).scalar(), lease)
+        session.commit()
+
+        retry.state = 100
+        self.assertEqual(put_task_inner(retry.identifier, retry, admin_user)[1], 200)
+
+        # Edits of the finished task keep the worker it ran on, they are not worker updates
+        retry.priority = 7
+        self.assertEqual(put_task_inner(retry.identifier, retry, admin_user)[1], 200)
+        retry.state = 0
+        self.assertEqual(put_task_inner(retry.identifier, retry, admin_user)[1], 200)
+        retry.priority = 8
+        self.assertEqual(put_task_inner(retry.identifier, retry, admin_user)[1], 200)
+        self.assertEqual(session.query(Task.state, Task.priority).filter(Task.uid == int(task.identifier)).one(),
+                         (0, 8))
+        session.commit()
+
+    def test_expired_lease_fails_after_max_attempts(self):
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+
+        task_model = self.add_task(session, "Crashes every worker", task="lease.crashes")
+        task_model.state = 1
+        task_model.assigned_to = "crashing-worker"
+        task_model.attempts = 3
+        task_model.lease_expires = datetime.datetime.utcnow() - datetime.timedelta(seconds=1)
+        session.commit()
+
+        self.assertEqual(get_cron_endpoint_inner("reclaim_task_leases"), (None, 204))
+
+        session.refresh(task_model)
+        self.assertEqual(task_model.state, 100)
+        self.assertFalse(task_model.success)
+        self.assertIsNone(task_model.lease_expires)
+        self.assertIn("EXPIRED AFTER 3 ATTEMPTS", TaskLogChunk.read(session, task_model.uid)[0])
+
+        self.assertEqual(get_cron_endpoint_inner("unknown_job")[1], 400)
+
+    def test_heartbeat(self):
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+        admin_user = session.query(User).filter(User.alias == 'admin').first()
+        task_model = self.add_task(session, "Heartbeat", task="heartbeat.task")
+        session.commit()
+        task_uid = task_model.uid
+
+        task = dequeue_task_inner("beating-worker", "heartbeat.task", "", user=admin_user)
+        self.assertEqual(task.identifier, str(task_uid))
+        session.refresh(task_model)
+        first_lease = task_model.lease_expires
+        session.commit()
+
+        def heartbeat(worker_name, log_append):
+            return task_heartbeat_inner(str(task_uid), TaskHeartbeat(worker_name=worker_name, log_append=log_append))
+
+        status = heartbeat("beating-worker", "line 1\n")
+        self.assertEqual(status.state, 1)
+        self.assertFalse(status.cancellation_requested)
+        self.assertFalse(status.lease_lost)
+        status = heartbeat("beating-worker", "line 2\n")
+        self.assertFalse(status.cancellation_requested)
+
+        # Another worker does not touch the task and is told it lost the lease
+        status = heartbeat("other-worker", "other\n")
+        self.assertTrue(status.lease_lost)
+
+        session.refresh(task_model)
+        self.assertEqual(TaskLogChunk.read(session, task_uid)[0], "line 1\nline 2\n")
+        self.assertGreater(task_model.lease_expires, first_lease)
+
+        task_model.state = 102
+        session.commit()
+        status = heartbeat("beating-worker", "")
+        self.assertTrue(status.cancellation_requested)
+        self.assertFalse(status.lease_lost)
+
+        # A task failed by the reclaim of the lease is not the worker's anymore either
+        task_model.state = 100
+        session.commit()
+        status = heartbeat("beating-worker", "late line\n")
+        self.assertTrue(status.lease_lost)
+        self.assertEqual(TaskLogChunk.read(session, task_uid)[0], "line 1\nline 2\n")
+
+        self.assertEqual(task_heartbeat_inner("0", TaskHeartbeat(worker_name="beating-worker"))[1], 404)
+
+    def test_task_log_chunks(self):
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+        admin_user = session.query(User).filter(User.alias == 'admin').first()
+        task_model = self.add_task(session, "Log", task="log.task")
+        session.commit()
+        task_uid = task_model.uid
+
+        # Multi-byte characters on chunk and read boundaries
+        lines = ["%d: price €%d, temperature %d°C\n" % (i, i * 3, i % 40) for i in range(20000)]
+        TaskLogChunk.append(session, task_uid, "".join(lines[:10000]))
+        for i in range(10000, len(lines), 1000):
+            TaskLogChunk.append(session, task_uid, "".join(lines[i:i + 1000]))
+        session.commit()
+        log = "".join(lines)
+        size = len(log.encode('utf-8'))
+
+        # The large append is split
+        self.assertGreater(session.query(TaskLogChunk).filter(TaskLogChunk.task_id == task_uid).count(), 11)
+        self.assertTrue(all(c.compressed for c in session.query(TaskLogChunk).filter(TaskLogChunk.task_id == task_uid)))
+
+        # Follow the log in small parts
+        parts = []
+        offset = 0
+        while offset < size:
+            part = get_task_log_inner(str(task_uid), offset, 1001, user=admin_user)
+            self.assertEqual(part.offset, offset)
+            self.assertEqual(part.size, size)
+            parts.append(part.log)
+            offset = part.next_offset
+        self.assertEqual("".join(parts), log)
+
+        # Tail, starting on a character boundary
+        tail = get_task_log_inner(str(task_uid), -100, None, user=admin_user)
+        self.assertEqual(tail.next_offset, size)
+        self.assertTrue(log.endswith(tail.log))
+        self.assertEqual(len(tail.log.encode('utf-8')), size - tail.offset)
+
+        # The log is opt-in for the task itself
+        self.assertIsNone(task_model.to_swagger_model_detailed(user=admin_user).log)
+        self.assertEqual(task_model.to_swagger_model_detailed(user=admin_user, log=True).log, log)
+
+        self.assertEqual(get_task_log_inner(str(task_uid), user=None)[1], 403)
+        self.assertEqual(get_task_log_inner("0", user=admin_user)[1], 404)
+
+    def test_task_hash_is_canonical(self):
+        self.assertEqual(Task.calculate_hash({'b': 1.0, 'a': [2, {'y': 'ü', 'x': 2.5}]}),
+                         Task.calculate_hash({'a': [2.0, {'x': 2.5, 'y': 'ü'}], 'b': 1}))
+        self.assertNotEqual(Task.calculate_hash({'a': 1}), Task.calculate_hash({'a': 1.5}))
+        self.assertNotEqual(Task.calculate_hash({'a': 1}), Task.calculate_hash({'a': "1"}))
+        self.assertNotEqual(Task.calculate_hash({'a': 1}), Task.calculate_hash({'a': True}))
+
+    def test_new_task_rejects_concurrent_duplicates(self):
+        rbb_server_test.database.init_database_connection_for_test()
+        admin_user = Database.get_session().query(User).filter(User.alias == 'admin').first()
+        barrier = threading.Barrier(2)
+        results = []
+
+        def create(order):
+            task = TaskDetailed(priority=0, description="Duplicate", assigned_to="", created=datetime.datetime.now(),
+                                last_updated=datetime.datetime.now(), state=0, task="duplicate.task",
+                                success=False, runtime=0, worker_labels="",
+                                config={'a': 1, 'b': 2} if order else {'b': 2.0, 'a': 1})
+            barrier.wait()
+            results.append(new_task_inner(task, user=admin_user)[1])
+            Database.get_session().remove()
+
+        threads = [threading.Thread(target=create, args=(i,)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(results), [200, 409])
+
+    def test_rehash_tasks(self):
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+
+        older = self.add_task(session, "Old hash", task="rehash.task")
+        older.configuration = {'x': 1, 'y': 2}
+        older.task_hash = "old-1"
+        newer = self.add_task(session, "Old hash, other order", task="rehash.task")
+        newer.configuration = {'y': 2, 'x': 1}
+        newer.task_hash = "old-2"
+        finished = self.add_task(session, "Finished", task="rehash.task")
+        finished.configuration = {'y': 2, 'x': 1.0}
+        finished.task_hash = "old-3"
+        finished.state = 100
+        session.commit()
+
+        changed, duplicates = rehash_tasks(session)
+        self.assertGreaterEqual(changed, 3)
+        self.assertEqual(duplicates, 1)
+
+        canonical_hash = Task.calculate_hash({'x': 1, 'y': 2})
+        self.assertEqual(session.query(Task.task_hash).filter(Task.uid == older.uid).scalar(), canonical_hash)
+        self.assertIsNone(session.query(Task.task_hash).filter(Task.uid == newer.uid).scalar())
+        self.assertEqual(session.query(Task.task_hash).filter(Task.uid == finished.uid).scalar(), canonical_hash)
+
+    def test_queue_statistics(self):
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+        admin_user = session.query(User).filter(User.alias == 'admin').first()
+
+        for i in range(3):
+            self.add_task(session, "Statistics %d" % i, task="statistics.a").configuration = {'i': i}
+        self.add_task(session, "Statistics", task="statistics.b")
+        session.commit()
+
+        first = dequeue_task_inner("statistics-worker", "statistics.a", "", user=admin_user)
+        dequeue_task_inner("statistics-worker-2", "statistics.a", "", user=admin_user)
+        first.state = 100
+        first.success = True
+        first.runtime = 10
+        put_task_inner(first.identifier, first, admin_user)
+
+        # The finish time is kept by the database whichever way the state changes
+        self.assertIsNotNone(session.query(Task.finished).filter(Task.uid == int(first.identifier)).scalar())
+
+        statistics = get_queue_statistics_inner(window=3600)
+        self.assertEqual(statistics.window, 3600)
+
+        depth = {(x.task, x.state): x.count for x in statistics.depth}
+        self.assertEqual(depth[("statistics.a", 0)], 1)
+        self.assertEqual(depth[("statistics.a", 1)], 1)
+        self.assertEqual(depth[("statistics.b", 0)], 1)
+        self.assertNotIn(("statistics.a", 100), depth)
+
+        tasks = {x.task: x for x in statistics.tasks}
+        self.assertEqual((tasks["statistics.a"].finished, tasks["statistics.a"].succeeded), (1, 1))
+        self.assertEqual(tasks["statistics.a"].runtime_p50, 10)
+        self.assertEqual(tasks["statistics.a"].runtime_mean, 10)
+        self.assertIsNotNone(tasks["statistics.a"].wait_time_p99)
+        self.assertNotIn("statistics.b", tasks)
+
+        workers = {x.worker: x for x in statistics.workers}
+        self.assertEqual(workers["statistics-worker"].finished, 1)
+        self.assertAlmostEqual(workers["statistics-worker"].busy, 10 / 3600)
+        self.assertGreaterEqual(statistics.suggested_workers, 1)
+
+        error, status = get_queue_statistics_inner(window=0)
+        self.assertEqual(status, 400)
+
+    def test_suggested_worker_count(self):
+        depth = [QueueDepth(task="a", state=0, count=10), QueueDepth(task="a", state=1, count=2),
+                 QueueDepth(task="b", state=0, count=4), QueueDepth(task="b", state=2, count=100)]
+
+        # 900 seconds of runtime in the window, the queued tasks take 10 * 60 and 4 * 90 seconds (mean over all tasks)
+        self.assertEqual(suggested_worker_count(depth, {'a': (600, 10), 'c': (300, 0)}, 1000), 2)
+        self.assertEqual(suggested_worker_count(depth, {'a': (600, 10), 'c': (300, 0)}, 400), 5)
+
+        # Nothing ran in the window, every queued task is estimated to take the whole window
+        self.assertEqual(suggested_worker_count(depth, {}, 1000), 14)
+        self.assertEqual(suggested_worker_count(depth[1:2], {}, 1000), 2)
+
+    def test_runtime_estimates(self):
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+        admin_user = session.query(User).filter(User.alias == 'admin').first()
+
+        for i in range(3):
+            self.add_task(session, "Estimate %d" % i, task="estimate").configuration = {'i': i}
+        session.commit()
+
+        # Successful runs update the moving average, failed runs are ignored
+        for i, (runtime, success) in enumerate([(100, True), (200, True), (1000, False)]):
+            task = dequeue_task_inner("estimate-worker-%d" % i, "estimate", "", user=admin_user)
+            task.state = 100
+            task.success = success
+            task.runtime = runtime
+            put_task_inner(task.identifier, task, admin_user)
+
+        estimate = session.query(TaskRuntimeEstimate).filter(TaskRuntimeEstimate.task == "estimate").one()
+        self.assertEqual(estimate.size_class, 0)
+        self.assertEqual(estimate.samples, 2)
+        self.assertAlmostEqual(estimate.runtime, 120)
+
+        # Queued tasks expose the estimate, also for other size classes of the same task type
+        queued = self.add_task(session, "Estimate bag", task="estimate")
+        queued.configuration = {'store': 'test', 'bag': 'test-bag.bag'}
+        session.commit()
+
+        tasks = {x.identifier: x for x in list_queue_inner(queued=True, user=admin_user)}
+        self.assertAlmostEqual(tasks[str(queued.uid)].expected_runtime, 120)
+
+    def test_shortest_expected_scheduling(self):
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+        admin_user = session.query(User).filter(User.alias == 'admin').first()
+
+        TaskRuntimeEstimate.record(session, "sej.long", 0, 3600)
+        TaskRuntimeEstimate.record(session, "sej.short", 0, 10)
+        session.execute("UPDATE configuration SET value='shortest_expected' WHERE config_key='queue.scheduling'")
+        session.commit()
+
+        try:
+            self.add_task(session, "Long", task="sej.long").configuration = {'i': 0}
+            session.commit()
+            self.add_task(session, "Short", task="sej.short").configuration = {'i': 1}
+            self.add_task(session, "Unknown", task="sej.unknown").configuration = {'i': 2}
+            self.add_task(session, "Important", task="sej.long", priority=10).configuration = {'i': 3}
+            session.commit()
+
+            # Priority still wins, within a priority the shortest expected job goes first and task types without
+            # an estimate are tried right away
+            order = [dequeue_task_inner("sej-worker-%d" % i, "sej.long,sej.short,sej.unknown", "",
+                                        user=admin_user).description for i in range(4)]
+            self.assertEqual(order, ["Important", "Unknown", "Short", "Long"])
+
+            # Waiting tasks age, so long jobs are not starved by a stream of short ones
+            old = self.add_task(session, "Old long", task="sej.long")
+            old.configuration = {'i': 4}
+            old.created = datetime.datetime.utcnow() - datetime.timedelta(hours=2)
+            self.add_task(session, "New short", task="sej.short").configuration = {'i': 5}
+            session.commit()
+
+            task = dequeue_task_inner("sej-worker-4", "sej.long,sej.short", "", user=admin_user)
+            self.assertEqual(task.description, "Old long")
+
+            # Only a window of the most important tasks by priority is ranked, a task outside of it waits until it
+            # moves into the window
+            session.execute(Task.insert_unless_queued([
+                {'priority': 1, 'description': "Busy %d" % i, 'assigned_to': "", 'state': 0, 'task': "sej.long",
+                 'configuration': {'i': 10 + i}, 'result': {}, 'success': False, 'worker_labels': "",
+                 'task_hash': Task.calculate_hash({'i': 10 + i})}
+                for i in range(SCHEDULING_CANDIDATES)]))
+            self.add_task(session, "Short outside", task="sej.short", priority=1).configuration = {'i': 6}
+            old = self.add_task(session, "Old unimportant", task="sej.short")
+            old.configuration = {'i': 7}
+            old.created = datetime.datetime.utcnow() - datetime.timedelta(hours=3)
+            session.commit()
+            self.assertEqual(old.size_class, 0)
+
+            task = dequeue_task_inner("sej-worker-5", "sej.long,sej.short", "", user=admin_user)
+            self.assertEqual(task.description, "Busy 0")
+
+            # Within the window the shortest task goes first
+            session.execute("UPDATE task_queue SET task = 'sej.short' WHERE description = 'Busy 500'")
+            session.commit()
+            task = dequeue_task_inner("sej-worker-6", "sej.long,sej.short", "", user=admin_user)
+            self.assertEqual(task.description, "Busy 500")
+        finally:
+            session.rollback()
+            session.execute("UPDATE configuration SET value='priority' WHERE config_key='queue.scheduling'")
+            session.commit()
+
+    def test_archive_tasks(self):
+        rbb_server_test.database.init_database_connection_for_test()
+        session = Database.get_session()
+        admin_user = session.query(User).filter(User.alias == 'admin').first()
+
+        old = self.add_task(session, "Old", task="archive")
+        old.configuration = {'i': 0}
+        old.state = 100
+        recent = self.add_task(session, "Recent", task="archive")
+        recent.configuration = {'i': 1}
+        recent.state = 100
+        queued = self.add_task(session, "Queued", task="archive")
+        queued.configuration = {'i': 2}
+        session.commit()
+        old_uid, recent_uid, queued_uid = old.uid, recent.uid, queued.uid
+
+        log = "".join("Line %d of the log\n" % i for i in range(100))
+        for line in log.splitlines(True):
+            TaskLogChunk.append(session, old_uid, line)
+        session.execute("UPDATE task_queue SET finished = finished - interval '31 days' WHERE uid = :uid",
+                        {'uid': old_uid})
+        session.commit()
+
+        self.assertEqual(get_cron_endpoint_inner("archive_tasks"), (None, 204))
+
+        # Only the old finished task moved, with its log compressed into a single chunk
+        archived = [x.uid for x in session.query(Task.uid).filter(Task.task == "archive").order_by(Task.uid)]
+        self.assertEqual(archived, [recent_uid, queued_uid])
+        self.assertIsNotNone(session.query(TaskArchive).filter(TaskArchive.uid == old_uid).first())
+
+        chunks = session.query(TaskLogChunk).filter(TaskLogChunk.task_id == old_uid).all()
+        self.assertEqual([(x.position, x.length, x.compressed) for x in chunks], [(0, len(log), True)])
+
+        # Reading is the same for archived tasks
+        task = get_task_inner(str(old_uid), log=True, user=admin_user)
+        self.assertEqual((task.description, task.state, task.log), ("Old", 100, log))
+        self.assertEqual(get_task_log_inner(str(old_uid), user=admin_user).log, log)
+
+        finished = [x.identifier for x in list_queue_inner(finished=True, user=admin_user)]
+        self.assertIn(str(old_uid), finished)
+        self.assertIn(str(recent_uid), finished)
 
+        unfinished = [x.identifier for x in list_queue_inner(queued=True, running=True, user=admin_user)]
+        self.assertEqual([x for x in unfinished if x in (str(old_uid), str(queued_uid))], [str(queued_uid)])
 
+        # Nothing left to archive
+        self.assertEqual(TaskArchive.archive_finished(session), [])
+        session.rollback()
 
+        # Deleting a task deletes its log, in the queue and in the archive
+        TaskLogChunk.append(session, queued_uid, log)
+        session.execute("DELETE FROM task_queue WHERE uid = :uid", {'uid': queued_uid})
+        session.execute("DELETE FROM task_archive WHERE uid = :uid", {'uid': old_uid})
+        session.commit()
+        self.assertEqual(session.query(TaskLogChunk).filter(TaskLogChunk.task_id.in_([old_uid, queued_uid])).count(), 0)
@@ -24,6 +24,7 @@ import connexion
 from flask_cors import CORS
 
 import rbb_server_test.database
+from rbb_server.helper import metrics
 from rbb_server.model.database import Database
 from rbb_swagger_server.encoder import JSONEncoder
 
@@ -44,6 +45,7 @@ def construct_test_server():
 
     # Enable debug
     app.app.config.from_object(TestConfig)
+    metrics.init_app(app.app, Database.get_engine(), debug=True)
 
     @app.app.teardown_appcontext
     def shutdown_session(exception=None):
@@ -73,10 +73,30 @@ class TestSimulation(ClientServerBaseTestCase):
         except ApiException as e:
             self.assertEqual(e.status, 404)
 
+    def test_new_simulation_schedules_task(self):
+        api = self.get_admin_api()
 
+        env = SimulationEnvironmentDetailed()
+        env.detail_type = "SimulationEnvironmentDetailed"
+        env.name = "schedule-test"
+        env.module_name = "something"
+        env.rosbag_store = None
+        env.config = {}
+        env.example_config = ""
+        api.put_simulation_environment(env.name, env)
 
+        sim = SimulationDetailed()
+        sim.identifier = 0
+        sim.detail_type = "SimulationDetailed"
+        sim.environment_name = env.name
+        sim.description = "scheduled"
+        sim.config = {}
+        sim.created = datetime.datetime.now()
+        sim.result = 0
 
+        new_sim = api.new_simulation(sim)
+        self.assertIsNotNone(new_sim.queued_task_identifier)
 
-
-
-
+        task = api.get_task(new_sim.queued_task_identifier)
+        self.assertEqual(task.task, "rbb_tools.tasks.sim.simulate")
+        self.assertEqual(task.config, {'simulation': new_sim.identifier})
@@ -22,7 +22,7 @@
 
 import datetime
 
-from rbb_client import BagDetailed, TopicMapping, Topic, Product, FileSummary, ProductFile, BagStoreDetailed
+from rbb_client import BagDetailed, TopicMapping, Topic, Product, FileSummary, ProductFile, BagStoreDetailed, StoredFile
 from rbb_client.api_client import ApiException
 from rbb_server_test import ClientServerBaseTestCase
 
@@ -34,6 +34,27 @@ class TestStores(ClientServerBaseTestCase):
         stores = api.list_stores()
         self.assertIsNotNone(stores)
 
+    def test_bag_facets(self):
+        api = self.get_admin_api()
+
+        facets = api.get_bag_facets("test-2")
+        self.assertEqual(facets.total, 2)
+        self.assertEqual(sorted([(x.tag, x.count) for x in facets.tags]), [("bad", 1), ("good", 1)])
+
+        facets = api.get_bag_facets("test-2", tags="good")
+        self.assertEqual(facets.total, 1)
+        self.assertEqual([(x.tag, x.count) for x in facets.tags], [("good", 1)])
+
+    def test_list_bags_cursor(self):
+        api = self.get_admin_api()
+
+        bags = api.list_bags("test-2", limit=1, ordering="name:asc")
+        cursor = api.api_client.last_response.getheader("X-Next-Cursor")
+        self.assertIsNotNone(cursor)
+
+        bags += api.list_bags("test-2", limit=1, ordering="name:asc", cursor=cursor)
+        self.assertEqual([x.name for x in bags], ["empty.bag", "test-bag.bag"])
+
     def test_create_store(self):
         api = self.get_api()
 
@@ -254,11 +275,157 @@ class TestStores(ClientServerBaseTestCase):
         self.assertEqual(len(bag.products), len(response_bag.products))
         self.assertProductEqual(bag.products[0], response_bag.products[0])
 
+        found_bags = self.get_api().list_bags('test', search="pointcloud nice")
+        self.assertEqual([x.name for x in found_bags], [bag.name])
 
+        found_bags = self.get_api().list_bags('test', topic="/pointcloud", msg_type="sensor_msgs/Pointcloud2",
+                                              topic_avg_frequency_gte=1000)
+        self.assertEqual([x.name for x in found_bags], [bag.name])
 
+    def test_shared_message_definitions(self):
+        api = self.get_api()
 
+        def put_bag(name, msg_definition):
+            bag = BagDetailed()
+            bag.detail_type = "BagDetailed"
+            bag.name = name
+            bag.store_data = {}
+            bag.is_extracted = False
+            bag.meta_available = True
+            bag.discovered = datetime.datetime.now(datetime.timezone.utc)
+            bag.comment = ""
+            bag.products = []
+
+            topic = Topic()
+            topic.name = "/odometry"
+            topic.msg_type = "nav_msgs/Odometry"
+            topic.msg_type_hash = "cd5e73d190d741a2"
+            topic.msg_definition = msg_definition
+            topic.msg_count = 10
+            topic.avg_frequency = 10
+            bag.topics = [topic]
+            api.put_bag_meta('test', name, bag)
+
+        # The extractor does not send definitions, the first known text is kept
+        put_bag("definition-1.bag", "")
+        put_bag("definition-2.bag", "Header header")
+        put_bag("definition-3.bag", "")
+        put_bag("definition-4.bag", "Something else")
+
+        for name in ["definition-1.bag", "definition-2.bag", "definition-3.bag", "definition-4.bag"]:
+            response_bag = api.get_bag_meta('test', name)
+            self.assertEqual(response_bag.topics[0].msg_type_hash, "cd5e73d190d741a2")
+            self.assertEqual(response_bag.topics[0].msg_definition, "Header header")
+
+            # Clients that do not need the definitions can leave them out
+            response_bag = api.get_bag_meta('test', name, msg_definitions=False)
+            self.assertIsNone(response_bag.topics[0].msg_definition)
+
+    def test_patch_bag_products(self):
+        api = self.get_api()
 
+        bag = BagDetailed()
+        bag.detail_type = "BagDetailed"
+        bag.name = "patch-products.bag"
+        bag.store_data = {}
+        bag.is_extracted = True
+        bag.meta_available = True
+        bag.discovered = datetime.datetime.now(datetime.timezone.utc)
+        bag.comment = ""
+
+        topic = Topic()
+        topic.name = "/camera"
+        topic.msg_type = "sensor_msgs/Image"
+        topic.msg_type_hash = "060021388200f6f0"
+        topic.msg_count = 10
+        topic.avg_frequency = 10
+        bag.topics = [topic]
+        bag.products = []
+        api.put_bag_meta('test', bag.name, bag)
+
+        def new_product(title, rule):
+            tm = TopicMapping()
+            tm.plugin_topic = "video"
+            tm.original_topic = "/camera"
+
+            file_summary = FileSummary()
+            file_summary.detail_type = "FileSummary"
+            file_summary.uid = 2
+            file_summary.name = "video.mp4"
+            file_summary.store_name = "google-cloud"
+            file_summary.link = ""
+
+            pf = ProductFile()
+            pf.file = file_summary
+            pf.key = "video"
+
+            product = Product()
+            product.uid = ""
+            product.plugin = "Test"
+            product.product_type = "Movie"
+            product.product_data = {}
+            product.title = title
+            product.configuration_rule = rule
+            product.configuration_tag = "config-file"
+            product.created = datetime.datetime.now(datetime.timezone.utc)
+            product.topics = [tm]
+            product.files = [pf]
+            return product
+
+        stored = api.patch_bag_products('test', bag.name, [new_product("First", "rule1")])
+        self.assertEqual([x.title for x in stored], ["First"])
+        self.assertEqual(stored[0].files[0].file.name, "video.mp4")
+
+        # Products of the same configuration are replaced
+        api.patch_bag_products('test', bag.name, [new_product("Second", "rule1"), new_product("Other", "rule2")])
+        response_bag = api.get_bag_meta('test', bag.name, product_data=False)
+        self.assertEqual(sorted([x.title for x in response_bag.products]), ["Other", "Second"])
 
+        try:
+            api.patch_bag_products('test', 'unknown.bag', [new_product("First", "rule1")])
+            self.fail("Bag not found exception should be thrown")
+        except ApiException as e:
+            self.assertEqual(e.status, 404)
 
+    def test_register_bags(self):
+        api = self.get_api()
+
+        files = []
+        for name in ["indexed-1.bag", "indexed-2.bag", "test-bag.bag"]:
+            stored_file = StoredFile()
+            stored_file.name = name
+            stored_file.store_data = {'path': "/bags/" + name}
+            files.append(stored_file)
+
+        result = api.register_bags('test-2', files)
+        self.assertEqual([(x.name, x.status) for x in result],
+                         [("indexed-1.bag", "created"), ("indexed-2.bag", "created"), ("test-bag.bag", "exists")])
 
+        bag = api.get_bag_meta('test-2', 'indexed-2.bag')
+        self.assertFalse(bag.meta_available)
+        self.assertEqual(bag.store_data, {'path': "/bags/indexed-2.bag"})
+
+        result = api.register_bags('test-2', files[:1])
+        self.assertEqual([x.status for x in result], ["exists"])
+
+    def test_product_headers(self):
+        api = self.get_api()
 
+        bag = api.get_bag_meta('test-2', 'test-bag.bag', product_data=False)
+        self.assertEqual(len(bag.products), 3)
+        self.assertEqual([x.product_data for x in bag.products], [None] * 3)
+
+        product = api.get_bag_product('test-2', 'test-bag.bag', int(bag.products[0].uid))
+        self.assertEqual(product.uid, bag.products[0].uid)
+        self.assertEqual(product.product_data, {"type": "yolo"})
+
+        # Sending the headers back does not remove the data
+        api.put_bag_meta('test-2', 'test-bag.bag', bag)
+        bag = api.get_bag_meta('test-2', 'test-bag.bag')
+        self.assertEqual([x.product_data for x in bag.products], [{"type": "yolo"}] * 3)
+
+        try:
+            api.get_bag_product('test-2', 'test-bag.bag', 123456)
+            self.fail("Product not found exception should be thrown")
+        except ApiException as e:
+            self.assertEqual(e.status, 404)
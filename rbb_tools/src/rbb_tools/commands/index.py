@@ -20,26 +20,25 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from rbb_client.models.bag_detailed import BagDetailed
-import datetime
+from rbb_client.models.stored_file import StoredFile
 from rbb_tools.common.storage import Storage, StoragePluginNotFound
 
+# Number of bags registered per request
+BATCH_SIZE = 500
 
-def register_bag_file(api, store_name, file):
-    bag = BagDetailed()
-    bag.detail_type="BagDetailed"
-    bag.name=file.get_save_name()
-    bag.store_data=file.get_data()
-    bag.size=0
-    bag.meta_available=False
-    bag.discovered=datetime.datetime.utcnow()
-    bag.is_extracted=False
-    bag.comment=""
-    bag.topics=[]
-    bag.products=[]
-    bag.extraction_failure = False
 
-    api.put_bag_meta(store_name, bag.name, bag)
+def register_bag_files(api, store_name, files):
+    batch = []
+    for file in files:
+        stored_file = StoredFile()
+        stored_file.name = file.get_save_name()
+        stored_file.store_data = file.get_data()
+        batch.append(stored_file)
+
+    registrations = api.register_bags(store_name, batch)
+    for registration in registrations:
+        if registration.status != "created":
+            print("SKIPPED: %s is already registered" % registration.name)
 
 
 def command(store_name, api):
@@ -74,6 +73,7 @@ def command(store_name, api):
         info = store.list_file(bag.store_data)
         bags_by_name[info.get_path()] = bag
 
+    new_files = []
     store_files = store.list_files()
     for file in store_files:
         if file.get_name()[-3:] != "bag":
@@ -81,6 +81,13 @@ def command(store_name, api):
 
         if not file.get_path() in bags_by_name:
             print("NEW: %s at %s" % (file.get_save_name(), file.get_path()))
-            register_bag_file(api, store_info.name, file)
+            new_files.append(file)
+
+        if len(new_files) >= BATCH_SIZE:
+            register_bag_files(api, store_info.name, new_files)
+            new_files = []
+
+    if new_files:
+        register_bag_files(api, store_info.name, new_files)
 
     print("Done!")
\ No newline at end of file
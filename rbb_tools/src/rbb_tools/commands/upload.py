@@ -103,7 +103,7 @@ def command(manifest_path, forced_file_store, api, progress_indicator=True):
 
     # Check if we can reach the bag before we start uploading
     try:
-        bag_meta = api.get_bag_meta(store_name, bag_name)  # type: BagDetailed
+        bag_meta = api.get_bag_meta(store_name, bag_name, product_data=False)  # type: BagDetailed
     except Exception as e:
         print("Cannot list bags from server using host '%s'" % server_url)
         print("Reason: " + str(e))
@@ -175,14 +175,6 @@ def command(manifest_path, forced_file_store, api, progress_indicator=True):
 
         products.append(product_model)
 
-    # Now we update the information
-    try:
-        bag_meta = api.get_bag_meta(store_name, bag_name)  # type: BagDetailed
-    except Exception as e:
-        print("Cannot list bags from server using host '%s'" % server_url)
-        print("Reason: " + str(e))
-        return
-
     if not bag_meta.meta_available:
         # Fill standard info
         bag_info = manifest['bag_info']
@@ -205,32 +197,18 @@ def command(manifest_path, forced_file_store, api, progress_indicator=True):
             topic_model.msg_definition = topic['msg_definition']
             topic_model.avg_frequency = 0 if topic['avg_frequency'] is None else topic['avg_frequency']
             bag_meta.topics.append(topic_model)
-    else:
-        print("Meta information already uploaded to server, skipping meta upload.")
-
-    # Remove old products (naive way, could be made faster in case of many producst)
-    removed = 0
-    for product in products:
-        if not product.configuration_tag or not product.configuration_rule:
-            continue
-
-        len_before = len(bag_meta.products)
-        # Filter out products with same config rule
-        bag_meta.products = [x for x in bag_meta.products if not (
-                x.configuration_tag == product.configuration_tag and
-                x.configuration_rule == product.configuration_rule
-        )]
 
-        removed += len_before - len(bag_meta.products)
+        # Reset the failure flag
+        bag_meta.extraction_failure = False
 
-    print("Removed %d outdated product(s) from the bag information." % removed)
-
-    # Add the new products
-    for product in products:
-        bag_meta.products.append(product)
+        # Save meta info, the products are stored separately below
+        api.put_bag_meta(store_name, bag_name, bag_meta)
+    else:
+        print("Meta information already uploaded to server, skipping meta upload.")
 
-    # Reset the failure flag
-    bag_meta.extraction_failure = False
+        # Reset the failure flag
+        api.patch_bag_meta(store_name, bag_name, {'extraction_failure': False}, detailed=False)
 
-    # Save meta info
-    api.put_bag_meta(store_name, bag_name, bag_meta)
\ No newline at end of file
+    # Only the new products are sent, the server replaces products with the same config tag and rule
+    stored_products = api.patch_bag_products(store_name, bag_name, products)
+    print("Stored %d product(s) in the bag information." % len(stored_products))
\ No newline at end of file
@@ -31,7 +31,8 @@ from Queue import Empty
 from multiprocessing import Process, Queue
 
 from rbb_client.apis.basic_api import BasicApi
-from rbb_client.models import TaskDetailed
+from rbb_client.models import TaskDetailed, TaskHeartbeat, TaskStatus
+from rbb_client.rest import ApiException
 from rbb_tools.common.shell import stream_redirected
 
 try:
@@ -63,7 +64,7 @@ class OutSplitter():
         self.combined_buffer.flush()
 
 
-def get_task(api, name):
+def get_task(api, name, tasks="", labels="", wait=0):
     initial_timeout = 5
     max_timeout = 600
     timeout = initial_timeout
@@ -73,7 +74,7 @@ def get_task(api, name):
 
     while repeat:
         try:
-            task = api.dequeue_task(name, "", "")  # type: TaskDetailed
+            task = api.dequeue_task(name, tasks, labels, wait=wait)  # type: TaskDetailed
             code = api.api_client.last_response.status
             repeat = False
         except KeyboardInterrupt as e:
@@ -88,7 +89,7 @@ def get_task(api, name):
     return task, code
 
 
-def work(api, name, poll_timeout):
+def work(api, name, poll_timeout, tasks="", labels=""):
     logging.basicConfig(level=logging.INFO)
     logging.info("Starting to do work as '%s'." % name)
     api = api   # type: BasicApi
@@ -96,15 +97,20 @@ def work(api, name, poll_timeout):
     config_registry = api.get_configuration_key("worker.default")
     task_update_interval = int(config_registry['worker']['default']['update_interval'])
 
+    # The server holds the request until a task is queued, the server limits the wait to 25 seconds
+    wait = min(poll_timeout, 25)
+
     running = True
     while running:
         try:
-            task, code = get_task(api, name)
+            poll_start = time.time()
+            task, code = get_task(api, name, tasks, labels, wait)
 
             if task and code != 204:
                 spawn_and_monitor_subtask(task, api, update_interval=task_update_interval)
             else:
-                time.sleep(poll_timeout)
+                # Servers without long polling answer immediately, poll those at most once per wait period
+                time.sleep(max(0, wait - (time.time() - poll_start)))
 
             # Exit after current task is finished
             if os.path.isfile("./rbbtools-stop"):
@@ -146,6 +152,7 @@ def spawn_and_monitor_subtask(task, api, update_interval=20):
 
     # Monitor cancellation status and periodically upload logs
     cancelled = False
+    lease_lost = False
     result = None
     running = True
     while running:
@@ -156,27 +163,43 @@ def spawn_and_monitor_subtask(task, api, update_interval=20):
         except Empty as e:
             log_buffer += log_file.read()
 
-            # If writing log to server succeeds we can clear the buffer because we are appending
-            if append_log_to_task(api, task, log_buffer):
+            # If the heartbeat succeeds we can clear the buffer because the server appends it to the log
+            sent, cancellation_requested, lease_lost = send_heartbeat(api, task, log_buffer)
+            if sent:
                 log_buffer = ""
 
-            # Check if the task is cancelled
-            if check_task_cancelled(api, task):
+            # Check if the task is cancelled or not ours anymore
+            if cancellation_requested or lease_lost:
                 cancelled = True
                 running = False
                 p.terminate()
 
     # Wait for process to end
-    log_file.close()
     p.join()
+    log_buffer += log_file.read()
+    log_file.close()
 
-    # We still upload the log completely, to have a complete correct version
-    with open("child_out.log", 'r') as f:
-        log = f.read()
-    print("Log received on main node")
+    if lease_lost:
+        discard_task(task)
+        return
 
     if cancelled:
-        log += "\n\n TASK WAS CANCELLED\n"
+        log_buffer += "\n\n TASK WAS CANCELLED\n"
+
+    # The server appends the rest of the log, only if that fails the complete log is uploaded
+    log = None
+    sent, cancellation_requested, lease_lost = send_heartbeat(api, task, log_buffer)
+    if lease_lost:
+        discard_task(task)
+        return
+
+    if not sent:
+        with open("child_out.log", 'r') as f:
+            log = f.read()
+
+        if cancelled:
+            log += "\n\n TASK WAS CANCELLED\n"
+    print("Log received on main node")
 
     duration = time.time() - start_time
     exit_code = p.exitcode
@@ -185,30 +208,32 @@ def spawn_and_monitor_subtask(task, api, update_interval=20):
     logging.info("Finished task '%s' with code %d." % (task.identifier, exit_code))
 
 
-def append_log_to_task(api, task, log_append):
-    task_patch = {
-        'log_append': log_append
-    }
+def send_heartbeat(api, task, log_append):
+    """
+    Renew the lease on the task and append to its log
+
+    :return: Tuple of whether the log was appended, whether cancellation was requested and whether the lease was lost
+    """
+    heartbeat = TaskHeartbeat()
+    heartbeat.worker_name = task.assigned_to
+    heartbeat.log_append = log_append
 
     try:
-        api.patch_task(task.identifier, task_patch)
-        return True
+        status = api.task_heartbeat(task.identifier, heartbeat)  # type: TaskStatus
     except Exception as e:
-        logging.exception("Exception while saving task")
-        return False
+        logging.exception("Exception while sending heartbeat")
+        return False, False, False
 
+    # Without the lease the server did not append the log
+    if status.lease_lost:
+        return False, False, True
 
-def check_task_cancelled(api, task):
-    try:
-        task = api.get_task(task.identifier)
+    return True, status.cancellation_requested, False
 
-        if task.state >= 100:
-            return True
 
-        return False
-    except Exception as e:
-        logging.exception("Exception while getting task state")
-        return False
+def discard_task(task):
+    # The task was given to another worker or failed, whatever this worker produced is not wanted anymore
+    logging.warning("Lost the lease on task '%s', its result and log are discarded." % task.identifier)
 
 
 def mark_task_as_done(api, task, result, log, exit_code, duration, cancelled):
@@ -239,7 +264,12 @@ def mark_task_as_done(api, task, result, log, exit_code, duration, cancelled):
 
         try:
             api.put_task(task.identifier, task)
+            return
         except Exception as e:
+            if isinstance(e, ApiException) and e.status == 409:
+                # Our lease expired while working on it, the task was given to another worker
+                logging.warning("Task '%s' was reassigned, result is discarded" % task.identifier)
+                return
             if retries == 0:
                 raise e
             logging.exception("Exception while saving task")
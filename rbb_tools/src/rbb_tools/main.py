@@ -224,7 +224,7 @@ def work_cmd(args):
         name = args.name
 
     import rbb_tools.commands.work
-    rbb_tools.commands.work.work(get_api(), name, args.poll_period)
+    rbb_tools.commands.work.work(get_api(), name, args.poll_period, args.tasks, args.label)
 
 
 if __name__ == '__main__':
@@ -367,9 +367,10 @@ if __name__ == '__main__':
     ###
 
     work_parser = subparsers.add_parser('work', help="[C/S] Run tasks in the work queue")
-    work_parser.add_argument("--poll-period", help="Seconds to sleep between polls if no task available", type=int, default=60)
+    work_parser.add_argument("--poll-period", help="Seconds to wait for a task per poll, the server holds the request for at most 25 seconds", type=int, default=60)
     work_parser.add_argument("--name", help="Name of this worker node", default="")
-    work_parser.add_argument("--label", help="Node labels", default="")
+    work_parser.add_argument("--label", help="Node labels, comma separated (e.g. gpu,display)", default="")
+    work_parser.add_argument("--tasks", help="Tasks this node does, comma separated (default: any)", default="")
     work_parser.set_defaults(func=work_cmd)
 
     ###############
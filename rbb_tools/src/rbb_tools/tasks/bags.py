@@ -87,7 +87,7 @@ def extract(config, api):
 
     if len(configurations) == 0:
         logging.fatal("No configurations to use for extraction!")
-        api.patch_bag_meta(store_name, bag_name, {'extraction_failure': True})
+        api.patch_bag_meta(store_name, bag_name, {'extraction_failure': True}, detailed=False)
         exit(1)
 
     logging.info("Downloading/updating configurations...")
@@ -157,7 +157,7 @@ def extract(config, api):
     output_dir.clean()
 
     if failure:
-        api.patch_bag_meta(store_name, bag_name, {'extraction_failure': True})
+        api.patch_bag_meta(store_name, bag_name, {'extraction_failure': True}, detailed=False)
         exit(1)
 
     exit(0)
\ No newline at end of file